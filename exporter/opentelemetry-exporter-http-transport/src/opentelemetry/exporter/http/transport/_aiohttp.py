@@ -0,0 +1,125 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import functools
+import ssl
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+# pylint: disable-next=import-error
+from opentelemetry.exporter.http.transport._base import (
+    AsyncBaseHTTPTransport,
+    BaseHTTPResult,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any
+
+    import aiohttp
+
+
+@functools.cache
+def _get_connection_error_types() -> tuple[type[Exception], ...]:
+    # pylint: disable-next=import-outside-toplevel
+    import aiohttp  # noqa: PLC0415
+
+    return (aiohttp.ClientConnectionError,)
+
+
+@dataclass(frozen=True, slots=True)
+class AiohttpHTTPResult(BaseHTTPResult):
+    # The body is read before the response is released back to the pool.
+    body: bytes = field(default=b"", hash=False, compare=False)
+    response_headers: Mapping[str, str] = field(default_factory=dict, hash=False, compare=False)
+
+    def content(self) -> bytes:
+        return self.body
+
+    def headers(self) -> Mapping[str, str]:
+        return self.response_headers
+
+
+class AiohttpHTTPTransport(AsyncBaseHTTPTransport):
+    """Asyncio HTTP transport built on an ``aiohttp.ClientSession``.
+
+    The session is created on the first request, on the event loop running
+    it: an ``aiohttp.ClientSession`` is bound to the loop it is created on.
+    """
+
+    def __init__(
+        self,
+        *,
+        verify: bool | str = True,
+        cert: str | tuple[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._verify = verify
+        self._cert = cert
+        self._session: aiohttp.ClientSession | None = None
+
+    def _ssl_context(self) -> ssl.SSLContext | bool:
+        if self._verify is False:
+            return False
+        context = ssl.create_default_context(cafile=self._verify if isinstance(self._verify, str) else None)
+        if isinstance(self._cert, tuple):
+            context.load_cert_chain(self._cert[0], self._cert[1])
+        elif isinstance(self._cert, str):
+            context.load_cert_chain(self._cert)
+        return context
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # pylint: disable-next=import-outside-toplevel
+        import aiohttp  # noqa: PLC0415
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=self._ssl_context()),
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        data: bytes | None = None,
+    ) -> BaseHTTPResult:
+        # pylint: disable=import-outside-toplevel
+        import aiohttp  # noqa: PLC0415
+        from multidict import CIMultiDict  # noqa: PLC0415
+
+        try:
+            async with self._get_session().request(
+                method,
+                url,
+                headers=headers,
+                data=data,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                allow_redirects=False,
+            ) as response:
+                body = await response.read()
+        # pylint: disable-next=broad-exception-caught
+        except Exception as error:
+            # pylint: disable-next=unexpected-keyword-arg
+            return AiohttpHTTPResult(error=error)
+
+        # pylint: disable-next=unexpected-keyword-arg
+        return AiohttpHTTPResult(
+            status_code=response.status,
+            reason=response.reason,
+            body=body,
+            response_headers=CIMultiDict({name: ", ".join(response.headers.getall(name)) for name in response.headers}),
+        )
+
+    # pylint: disable-next=no-self-use
+    def is_connection_error(self, exception: Exception | None) -> bool:
+        return isinstance(exception, _get_connection_error_types())
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
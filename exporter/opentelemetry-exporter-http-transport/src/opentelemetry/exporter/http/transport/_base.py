@@ -89,3 +89,39 @@ class BaseHTTPTransport(ABC):
     @abstractmethod
     def is_connection_error(self, exception: Exception | None) -> bool:
         """Return ``True`` if the exception is a transport-level connection error."""
+
+
+class AsyncBaseHTTPTransport(ABC):
+    """Abstract asyncio HTTP transport interface used by asyncio HTTP exporters.
+
+    The asyncio counterpart of :class:`BaseHTTPTransport`, its requests are
+    made on the running event loop instead of blocking the calling thread.
+    """
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        data: bytes | None = None,
+    ) -> BaseHTTPResult:
+        """Send an HTTP request and return the result.
+
+        :param method: HTTP method (e.g. ``"POST"``).
+        :param url: Target URL.
+        :param headers: Optional HTTP headers to include in the request.
+        :param timeout: Optional request timeout in seconds.
+        :param data: Optional request body.
+        :returns: A :class:`BaseHTTPResult` describing the outcome.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release any resources held by the transport."""
+
+    @abstractmethod
+    def is_connection_error(self, exception: Exception | None) -> bool:
+        """Return ``True`` if the exception is a transport-level connection error."""
@@ -0,0 +1,161 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import ssl
+import unittest
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import test_utils, web
+
+# pylint: disable-next=import-error
+from opentelemetry.exporter.http.transport._aiohttp import (
+    AiohttpHTTPResult,
+    AiohttpHTTPTransport,
+)
+
+
+# pylint: disable=protected-access,attribute-defined-outside-init
+class TestAiohttpHTTPTransport(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+        app = web.Application()
+        app.router.add_post("/v1/traces", self._handle)
+        app.router.add_post("/redirect", self._redirect)
+        app.router.add_post("/slow", self._slow)
+        self.server = test_utils.TestServer(app)
+        await self.server.start_server()
+        self.transport = AiohttpHTTPTransport()
+
+    async def asyncTearDown(self):
+        await self.transport.close()
+        await self.server.close()
+
+    async def _handle(self, request):
+        self.requests.append((request.method, request.headers.copy(), await request.read()))
+        response = web.Response(status=503, reason="Service Unavailable", body=b'{"key": "val"}')
+        response.headers.add("X-Multi", "value1")
+        response.headers.add("X-Multi", "value2")
+        return response
+
+    @staticmethod
+    async def _redirect(request):
+        raise web.HTTPFound("/v1/traces")
+
+    @staticmethod
+    async def _slow(request):
+        await asyncio.sleep(10)
+        return web.Response()
+
+    async def test_request_returns_response(self):
+        result = await self.transport.request("POST", str(self.server.make_url("/v1/traces")))
+
+        self.assertEqual(result.status_code, 503)
+        self.assertEqual(result.reason, "Service Unavailable")
+        self.assertIsNone(result.error)
+        self.assertEqual(result.content(), b'{"key": "val"}')
+        self.assertEqual(result.json(), {"key": "val"})
+
+    async def test_headers_are_case_insensitive_and_comma_separated(self):
+        result = await self.transport.request("POST", str(self.server.make_url("/v1/traces")))
+
+        self.assertEqual(result.headers()["x-multi"], "value1, value2")
+        self.assertEqual(result.headers()["X-MULTI"], "value1, value2")
+
+    async def test_request_forwards_headers_and_data(self):
+        await self.transport.request(
+            "POST",
+            str(self.server.make_url("/v1/traces")),
+            headers={"content-type": "application/x-protobuf", "x-custom": "value"},
+            data=b"payload",
+        )
+
+        self.assertEqual(len(self.requests), 1)
+        method, headers, body = self.requests[0]
+        self.assertEqual(method, "POST")
+        self.assertEqual(headers["Content-Type"], "application/x-protobuf")
+        self.assertEqual(headers["X-Custom"], "value")
+        self.assertEqual(body, b"payload")
+
+    async def test_redirects_not_followed(self):
+        result = await self.transport.request("POST", str(self.server.make_url("/redirect")))
+
+        self.assertEqual(result.status_code, 302)
+        self.assertEqual(self.requests, [])
+
+    async def test_request_catches_connection_error(self):
+        url = str(self.server.make_url("/v1/traces"))
+        await self.server.close()
+
+        result = await self.transport.request("POST", url)
+
+        self.assertIsNone(result.status_code)
+        self.assertIsInstance(result.error, aiohttp.ClientConnectionError)
+        self.assertTrue(self.transport.is_connection_error(result.error))
+
+    async def test_request_times_out(self):
+        result = await self.transport.request("POST", str(self.server.make_url("/slow")), timeout=0.01)
+
+        self.assertIsNone(result.status_code)
+        self.assertIsInstance(result.error, asyncio.TimeoutError)
+
+    async def test_request_cancelled(self):
+        request = asyncio.ensure_future(self.transport.request("POST", str(self.server.make_url("/slow"))))
+        await asyncio.sleep(0.01)
+        request.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await request
+
+    async def test_is_connection_error(self):
+        cases = [
+            (aiohttp.ClientConnectionError(), True),
+            (aiohttp.ServerDisconnectedError(), True),
+            (aiohttp.ClientResponseError(None, ()), False),
+            (RuntimeError("error"), False),
+            (None, False),
+        ]
+        for exception, expected in cases:
+            with self.subTest(error_type=type(exception).__name__):
+                self.assertEqual(self.transport.is_connection_error(exception), expected)
+
+    async def test_session_reopened_after_close(self):
+        url = str(self.server.make_url("/v1/traces"))
+        await self.transport.request("POST", url)
+        session = self.transport._session
+
+        await self.transport.close()
+        self.assertTrue(session.closed)
+
+        result = await self.transport.request("POST", url)
+        self.assertEqual(result.status_code, 503)
+        self.assertIsNot(self.transport._session, session)
+
+
+class TestAiohttpHTTPResult(unittest.TestCase):
+    def test_result_without_response(self):
+        result = AiohttpHTTPResult(error=RuntimeError("error"))
+
+        self.assertEqual(result.content(), b"")
+        self.assertEqual(result.text(), "")
+        self.assertEqual(result.headers(), {})
+
+    def test_ssl_context(self):
+        self.assertIs(AiohttpHTTPTransport(verify=False)._ssl_context(), False)
+
+        context = AiohttpHTTPTransport()._ssl_context()
+        self.assertIsInstance(context, ssl.SSLContext)
+        self.assertEqual(context.verify_mode, ssl.CERT_REQUIRED)
+
+    def test_ssl_context_loads_certificates(self):
+        cases = [
+            ("/path/to/cert.pem", ("/path/to/cert.pem",)),
+            (("/path/to/cert.pem", "/path/to/key.pem"), ("/path/to/cert.pem", "/path/to/key.pem")),
+        ]
+        for cert, expected_args in cases:
+            with self.subTest(cert=cert):
+                with patch("ssl.create_default_context") as create_default_context:
+                    AiohttpHTTPTransport(verify="/path/to/ca.pem", cert=cert)._ssl_context()
+                create_default_context.assert_called_once_with(cafile="/path/to/ca.pem")
+                create_default_context.return_value.load_cert_chain.assert_called_once_with(*expected_args)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import gzip
 import logging
@@ -17,10 +18,11 @@ from datetime import timezone
 from email.utils import parsedate_to_datetime
 from http import HTTPStatus
 from io import BytesIO
-from typing import TYPE_CHECKING, Final, Literal
+from typing import TYPE_CHECKING, Final, Generic, Literal, TypeVar
 
 if TYPE_CHECKING:
     from opentelemetry.exporter.http.transport._base import (
+        AsyncBaseHTTPTransport,
         BaseHTTPResult,
         BaseHTTPTransport,
     )
@@ -31,6 +33,8 @@ _MAX_RETRIES: Final[int] = 6
 _DEFAULT_TIMEOUT: Final[float] = 10.0
 _DEFAULT_JITTER: Final[float] = 0.2
 
+_TransportT = TypeVar("_TransportT", "BaseHTTPTransport", "AsyncBaseHTTPTransport")
+
 
 _RETRYABLE_STATUS_CODES: Final[frozenset[int]] = frozenset(
     {
@@ -103,16 +107,14 @@ class _ExportResult:
     error: Exception | None
 
 
-class _OTLPHTTPClient:
-    """Sends serialized OTLP payloads over HTTP with retry logic.
+class _BaseOTLPHTTPClient(Generic[_TransportT]):
+    """Compression, backoff and retry decisions shared by the OTLP HTTP clients."""
 
-    Compression, backoff, and connection-error recovery are handled internally.
-    Callers interact through the :meth:`export` and :meth:`close` methods.
-    """
+    _shutdown_event: threading.Event | asyncio.Event
 
     def __init__(
         self,
-        transport: BaseHTTPTransport,
+        transport: _TransportT,
         endpoint: str,
         kind: Literal["spans", "logs", "metrics"],
         timeout: float = _DEFAULT_TIMEOUT,
@@ -134,7 +136,6 @@ class _OTLPHTTPClient:
         self._jitter = min(max(jitter, 0.0), 1.0)
         self._logger = logger if logger is not None else _logger
         self._shutdown = False
-        self._shutdown_event = threading.Event()
 
     def _compute_backoff(self, retry: int) -> float:
         return 2**retry * random.uniform(1 - self._jitter, 1 + self._jitter)
@@ -149,6 +150,81 @@ class _OTLPHTTPClient:
             return zlib.compress(serialized_data)
         return serialized_data
 
+    def _handle_attempt(
+        self,
+        retry: int,
+        deadline: float,
+        result: BaseHTTPResult | None,
+        error: Exception | None = None,
+    ) -> _ExportResult | float:
+        """Returns the outcome of an export whose attempt number ``retry``
+        returned ``result`` or raised ``error``, or the backoff in seconds
+        before the next attempt if the export is retried."""
+        backoff = self._compute_backoff(retry)
+        status_code: int | None = None
+        reason: str | None = None
+        export_error: Exception | None
+        retryable: bool
+
+        if result is None:
+            export_error = error
+            retryable = False
+        else:
+            status_code = result.status_code
+            reason = result.reason
+            if status_code is not None and 200 <= status_code < 400:
+                return _ExportResult(True, status_code, reason, None)
+            export_error = result.error
+            retryable = _is_retryable(status_code) if status_code else self._transport.is_connection_error(result.error)
+            if retryable and status_code is not None and (retry_after := _extract_retry_after(result)) is not None:
+                backoff = retry_after
+
+        if not retryable:
+            self._logger.error(
+                "Failed to export %s batch code: %s, reason: %s",
+                self._kind,
+                status_code,
+                reason or export_error or "unknown",
+            )
+            return _ExportResult(False, status_code, reason, export_error)
+
+        if retry + 1 == _MAX_RETRIES or backoff > (deadline - time.time()) or self._shutdown_event.is_set():
+            self._logger.error(
+                "Failed to export %s batch due to timeout, max retries or shutdown.",
+                self._kind,
+            )
+            return _ExportResult(False, status_code, reason, export_error)
+
+        self._logger.warning(
+            "Transient error %s encountered while exporting %s batch, retrying in %.2fs.",
+            reason or export_error,
+            self._kind,
+            backoff,
+        )
+        return backoff
+
+
+class _OTLPHTTPClient(_BaseOTLPHTTPClient["BaseHTTPTransport"]):
+    """Sends serialized OTLP payloads over HTTP with retry logic.
+
+    Compression, backoff, and connection-error recovery are handled internally.
+    Callers interact through the :meth:`export` and :meth:`close` methods.
+    """
+
+    def __init__(
+        self,
+        transport: BaseHTTPTransport,
+        endpoint: str,
+        kind: Literal["spans", "logs", "metrics"],
+        timeout: float = _DEFAULT_TIMEOUT,
+        compression: Compression = Compression.NONE,
+        headers: Mapping[str, str] | None = None,
+        jitter: float = _DEFAULT_JITTER,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        super().__init__(transport, endpoint, kind, timeout, compression, headers, jitter, logger)
+        self._shutdown_event = threading.Event()
+
     def _submit(self, data: bytes, timeout: float) -> BaseHTTPResult:
         deadline = time.time() + timeout
         result = self._transport.request(
@@ -185,53 +261,17 @@ class _OTLPHTTPClient:
         deadline = time.time() + self._timeout
 
         for retry in range(_MAX_RETRIES):
-            backoff = self._compute_backoff(retry)
-            status_code: int | None = None
-            reason: str | None = None
-            export_error: Exception | None
-            retryable: bool
-
             try:
                 result = self._submit(data, max(deadline - time.time(), 0.0))
             # pylint: disable-next=broad-exception-caught
             except Exception as error:
-                export_error = error
-                retryable = False
+                outcome = self._handle_attempt(retry, deadline, None, error)
             else:
-                status_code = result.status_code
-                reason = result.reason
-                if status_code is not None and 200 <= status_code < 400:
-                    return _ExportResult(True, status_code, reason, None)
-                export_error = result.error
-                retryable = (
-                    _is_retryable(status_code) if status_code else self._transport.is_connection_error(result.error)
-                )
-                if retryable and status_code is not None and (retry_after := _extract_retry_after(result)) is not None:
-                    backoff = retry_after
-
-            if not retryable:
-                self._logger.error(
-                    "Failed to export %s batch code: %s, reason: %s",
-                    self._kind,
-                    status_code,
-                    reason or export_error or "unknown",
-                )
-                return _ExportResult(False, status_code, reason, export_error)
-
-            if retry + 1 == _MAX_RETRIES or backoff > (deadline - time.time()) or self._shutdown_event.is_set():
-                self._logger.error(
-                    "Failed to export %s batch due to timeout, max retries or shutdown.",
-                    self._kind,
-                )
-                return _ExportResult(False, status_code, reason, export_error)
-
-            self._logger.warning(
-                "Transient error %s encountered while exporting %s batch, retrying in %.2fs.",
-                reason or export_error,
-                self._kind,
-                backoff,
-            )
-            shutdown = self._shutdown_event.wait(backoff)
+                outcome = self._handle_attempt(retry, deadline, result)
+            if isinstance(outcome, _ExportResult):
+                return outcome
+
+            shutdown = self._shutdown_event.wait(outcome)
             if shutdown:
                 self._logger.warning("Shutdown in progress, aborting retry.")
                 break
@@ -246,3 +286,89 @@ class _OTLPHTTPClient:
         self._shutdown = True
         self._shutdown_event.set()
         self._transport.close()
+
+
+class _AsyncOTLPHTTPClient(_BaseOTLPHTTPClient["AsyncBaseHTTPTransport"]):
+    """Asyncio counterpart of :class:`_OTLPHTTPClient`.
+
+    Requests and retry backoffs are awaited on the running event loop instead
+    of blocking a thread, with the same compression, retry and Retry-After
+    handling. Cancelling an export cancels its in-flight request, and
+    :meth:`shutdown` interrupts the backoff of a pending retry.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncBaseHTTPTransport,
+        endpoint: str,
+        kind: Literal["spans", "logs", "metrics"],
+        timeout: float = _DEFAULT_TIMEOUT,
+        compression: Compression = Compression.NONE,
+        headers: Mapping[str, str] | None = None,
+        jitter: float = _DEFAULT_JITTER,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        super().__init__(transport, endpoint, kind, timeout, compression, headers, jitter, logger)
+        self._shutdown_event = asyncio.Event()
+
+    async def _submit(self, data: bytes, timeout: float) -> BaseHTTPResult:
+        deadline = time.time() + timeout
+        result = await self._transport.request(
+            "POST",
+            self._endpoint,
+            headers=self._headers,
+            data=data,
+            timeout=timeout,
+        )
+        if (
+            result.error is not None
+            and self._transport.is_connection_error(result.error)
+            and (remaining := deadline - time.time()) > 0
+        ):
+            # Like _OTLPHTTPClient, retry connection errors once without backoff.
+            result = await self._transport.request(
+                "POST",
+                self._endpoint,
+                headers=self._headers,
+                data=data,
+                timeout=remaining,
+            )
+        return result
+
+    async def export(self, data: bytes) -> _ExportResult:
+        """Export a serialized payload, retrying on transient failures.
+
+        :param data: Serialized bytes to send.
+        :returns: An :class:`ExportResult` indicating success or the reason for failure.
+        """
+        data = self._compress(data)
+        deadline = time.time() + self._timeout
+
+        for retry in range(_MAX_RETRIES):
+            try:
+                result = await self._submit(data, max(deadline - time.time(), 0.0))
+            # pylint: disable-next=broad-exception-caught
+            except Exception as error:
+                outcome = self._handle_attempt(retry, deadline, None, error)
+            else:
+                outcome = self._handle_attempt(retry, deadline, result)
+            if isinstance(outcome, _ExportResult):
+                return outcome
+
+            try:
+                await asyncio.wait_for(self._shutdown_event.wait(), outcome)
+            except asyncio.TimeoutError:
+                continue
+            self._logger.warning("Shutdown in progress, aborting retry.")
+            break
+
+        return _ExportResult(False, None, None, None)
+
+    async def shutdown(self) -> None:
+        """Shutdown the client."""
+        if self._shutdown:
+            self._logger.warning("OTLP client already shutdown, ignoring call")
+            return
+        self._shutdown = True
+        self._shutdown_event.set()
+        await self._transport.close()
@@ -3,6 +3,7 @@
 
 # pylint: disable=unexpected-keyword-arg
 
+import asyncio
 import gzip
 import threading
 import unittest
@@ -16,6 +17,7 @@ from unittest.mock import Mock, patch
 
 # pylint: disable-next=import-error
 from opentelemetry.exporter.http.transport._base import (
+    AsyncBaseHTTPTransport,
     BaseHTTPResult,
     BaseHTTPTransport,
 )
@@ -23,6 +25,7 @@ from opentelemetry.exporter.http.transport._base import (
 # pylint: disable-next=import-error
 from opentelemetry.exporter.otlp.common.http import (
     Compression,
+    _AsyncOTLPHTTPClient,
     _extract_retry_after,
     _OTLPHTTPClient,
 )
@@ -106,6 +109,33 @@ class _TestHTTPTransport(BaseHTTPTransport):
         self.closed = True
 
 
+class _TestAsyncHTTPTransport(AsyncBaseHTTPTransport):
+    def __init__(self, *results, connection_errors=()):
+        self._transport = _TestHTTPTransport(*results, connection_errors=connection_errors)
+        self.requests = self._transport.requests
+        self.closed = False
+
+    async def request(
+        self,
+        method,
+        url,
+        *,
+        headers=None,
+        timeout=None,
+        data=None,
+    ):
+        result = self._transport.request(method, url, headers=headers, timeout=timeout, data=data)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    def is_connection_error(self, exception):
+        return self._transport.is_connection_error(exception)
+
+    async def close(self):
+        self.closed = True
+
+
 class TestOTLPHTTPClient(unittest.TestCase):
     @staticmethod
     def _client(
@@ -538,3 +568,148 @@ class TestOTLPHTTPClient(unittest.TestCase):
 
         with self.subTest(value="absent"):
             self.assertIsNone(_extract_retry_after(_TestHTTPResult()))
+
+
+class TestAsyncOTLPHTTPClient(unittest.IsolatedAsyncioTestCase):
+    @staticmethod
+    def _client(transport, *, timeout=5.0, compression=Compression.NONE):
+        client = _AsyncOTLPHTTPClient(
+            transport=transport,
+            endpoint="http://example.test/v1/traces",
+            timeout=timeout,
+            compression=compression,
+            headers={"content-type": "application/x-protobuf"},
+            kind="spans",
+            jitter=0.0,
+        )
+        # Keeps the backoffs of the retries short.
+        client._compute_backoff = lambda retry: 0.01 * 2**retry  # pylint: disable=protected-access
+        return client
+
+    async def test_export_success(self):
+        transport = _TestAsyncHTTPTransport(_TestHTTPResult(status_code=200, reason="OK"))
+        client = self._client(transport, compression=Compression.GZIP)
+
+        result = await client.export(b"payload")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(gzip.decompress(transport.requests[0]["data"]), b"payload")
+        self.assertEqual(transport.requests[0]["headers"]["Content-Encoding"], "gzip")
+        self.assertAlmostEqual(transport.requests[0]["timeout"], 5.0, 2)
+
+    async def test_export_retryable_status_code(self):
+        transport = _TestAsyncHTTPTransport(
+            _TestHTTPResult(status_code=503, reason="Service Unavailable"),
+            _TestHTTPResult(
+                status_code=429,
+                reason="Too Many Requests",
+                response_headers={"retry-after": "0"},
+            ),
+            _TestHTTPResult(status_code=200, reason="OK"),
+        )
+        client = self._client(transport)
+
+        with self.assertLogs(level="WARNING"):
+            result = await client.export(b"payload")
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(transport.requests), 3)
+
+    async def test_export_connection_error_retried_immediately(self):
+        error = RuntimeError("connection failed")
+        transport = _TestAsyncHTTPTransport(
+            _TestHTTPResult(error=error),
+            _TestHTTPResult(status_code=200, reason="OK"),
+            connection_errors={error},
+        )
+        client = self._client(transport)
+
+        result = await client.export(b"payload")
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(transport.requests), 2)
+
+    async def test_export_non_retryable_errors(self):
+        error = RuntimeError("request failed")
+        cases = (
+            (_TestHTTPResult(status_code=400, reason="Bad Request"), 400, None),
+            (lambda: error, None, error),
+        )
+        for response, expected_status_code, expected_error in cases:
+            with self.subTest(status_code=expected_status_code):
+                transport = _TestAsyncHTTPTransport(response)
+                client = self._client(transport)
+
+                with self.assertLogs(level="ERROR"):
+                    result = await client.export(b"payload")
+
+                self.assertFalse(result.success)
+                self.assertEqual(result.status_code, expected_status_code)
+                self.assertIs(result.error, expected_error)
+                self.assertEqual(len(transport.requests), 1)
+
+    async def test_export_exhausts_timeout(self):
+        transport = _TestAsyncHTTPTransport(
+            _TestHTTPResult(
+                status_code=503,
+                reason="Service Unavailable",
+                response_headers={"retry-after": "10"},
+            )
+        )
+        client = self._client(transport)
+
+        with self.assertLogs(level="ERROR"):
+            result = await client.export(b"payload")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.status_code, 503)
+        self.assertEqual(len(transport.requests), 1)
+
+    async def test_shutdown_interrupts_backoff(self):
+        transport = _TestAsyncHTTPTransport(
+            _TestHTTPResult(
+                status_code=503,
+                reason="Service Unavailable",
+                response_headers={"retry-after": "30"},
+            )
+        )
+        client = self._client(transport, timeout=60.0)
+
+        export = asyncio.ensure_future(client.export(b"payload"))
+        await asyncio.sleep(0)
+        await client.shutdown()
+        with self.assertLogs(level="WARNING") as logs:
+            result = await asyncio.wait_for(export, 1)
+
+        self.assertFalse(result.success)
+        self.assertIn("Shutdown in progress, aborting retry.", logs.output[0])
+        self.assertEqual(len(transport.requests), 1)
+        self.assertTrue(transport.closed)
+
+    async def test_export_cancelled_during_request(self):
+        request_started = asyncio.Event()
+
+        async def _hang():
+            request_started.set()
+            await asyncio.sleep(30)
+
+        transport = _TestAsyncHTTPTransport(_hang)
+        client = self._client(transport)
+
+        export = asyncio.ensure_future(client.export(b"payload"))
+        await request_started.wait()
+        export.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await export
+
+    async def test_shutdown_twice(self):
+        transport = _TestAsyncHTTPTransport()
+        client = self._client(transport)
+
+        await client.shutdown()
+        with self.assertLogs(level="WARNING"):
+            await client.shutdown()
+
+        self.assertTrue(transport.closed)
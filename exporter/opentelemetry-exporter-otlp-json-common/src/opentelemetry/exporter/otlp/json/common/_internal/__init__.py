@@ -6,8 +6,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping, Sequence
-from typing import Any
+import weakref
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, Generic, TypeVar
 
 from opentelemetry.proto_json.common.v1.common import AnyValue as JSONAnyValue
 from opentelemetry.proto_json.common.v1.common import (
@@ -29,6 +30,39 @@ from opentelemetry.util.types import Attributes
 
 _logger = logging.getLogger(__name__)
 
+_SDKObjectT = TypeVar("_SDKObjectT")
+_EncodedT = TypeVar("_EncodedT")
+
+
+class _EncodingCache(Generic[_SDKObjectT, _EncodedT]):
+    """Caches the encoding of immutable SDK objects by object identity.
+
+    Resources and instrumentation scopes are immutable and shared by all the
+    telemetry of a provider, they only need to be encoded once. An entry is
+    dropped when its object is garbage collected, for example the resource
+    replaced by ``TracerProvider._update_resource``. Objects that cannot be
+    weakly referenced are encoded on every call.
+
+    The cached encodings are shared, callers must not modify them.
+    """
+
+    def __init__(self, encode: Callable[[_SDKObjectT], _EncodedT]) -> None:
+        self._encode = encode
+        self._encodings: dict[int, _EncodedT] = {}
+
+    def __call__(self, sdk_object: _SDKObjectT) -> _EncodedT:
+        key = id(sdk_object)
+        encoded = self._encodings.get(key)
+        if encoded is None:
+            encoded = self._encode(sdk_object)
+            try:
+                finalizer = weakref.finalize(sdk_object, self._encodings.pop, key, None)
+            except TypeError:
+                return encoded
+            finalizer.atexit = False
+            self._encodings[key] = encoded
+        return encoded
+
 
 def _encode_instrumentation_scope(
     instrumentation_scope: InstrumentationScope | None,
@@ -48,6 +82,11 @@ def _encode_resource(resource: Resource) -> JSONResource:
     return JSONResource(attributes=_encode_attributes(resource.attributes))
 
 
+# The JSON messages holding the cached ones only read them.
+_encode_resource_cached = _EncodingCache(_encode_resource)
+_encode_instrumentation_scope_cached = _EncodingCache(_encode_instrumentation_scope)
+
+
 # pylint: disable-next=too-many-return-statements
 def _encode_value(value: Any) -> JSONAnyValue:
     if value is None:
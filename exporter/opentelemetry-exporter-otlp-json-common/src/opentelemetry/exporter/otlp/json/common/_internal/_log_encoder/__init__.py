@@ -11,8 +11,8 @@ from typing import cast
 
 from opentelemetry.exporter.otlp.json.common._internal import (
     _encode_attributes,
-    _encode_instrumentation_scope,
-    _encode_resource,
+    _encode_instrumentation_scope_cached,
+    _encode_resource_cached,
     _encode_span_id,
     _encode_trace_id,
     _encode_value,
@@ -73,14 +73,14 @@ def _encode_resource_logs(
         for sdk_instrumentation, json_logs in sdk_instrumentations.items():
             scope_logs.append(
                 JSONScopeLogs(
-                    scope=(_encode_instrumentation_scope(sdk_instrumentation)),
+                    scope=_encode_instrumentation_scope_cached(sdk_instrumentation),
                     log_records=json_logs,
                     schema_url=sdk_instrumentation.schema_url if sdk_instrumentation else None,
                 )
             )
         json_resource_logs.append(
             JSONResourceLogs(
-                resource=_encode_resource(sdk_resource),
+                resource=_encode_resource_cached(sdk_resource),
                 scope_logs=scope_logs,
                 schema_url=sdk_resource.schema_url,
             )
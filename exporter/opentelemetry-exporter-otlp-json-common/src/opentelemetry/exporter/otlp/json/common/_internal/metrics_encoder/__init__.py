@@ -13,7 +13,8 @@ from typing import TYPE_CHECKING
 
 from opentelemetry.exporter.otlp.json.common._internal import (
     _encode_attributes,
-    _encode_instrumentation_scope,
+    _encode_instrumentation_scope_cached,
+    _encode_resource_cached,
     _encode_span_id,
     _encode_trace_id,
 )
@@ -47,9 +48,6 @@ from opentelemetry.proto_json.metrics.v1.metrics import (
     ScopeMetrics as JSONScopeMetrics,
 )
 from opentelemetry.proto_json.metrics.v1.metrics import Sum as JSONSum
-from opentelemetry.proto_json.resource.v1.resource import (
-    Resource as JSONResource,
-)
 from opentelemetry.sdk.metrics import (
     Exemplar,
 )
@@ -208,7 +206,7 @@ def _encode_resource_metrics(
     rm: ResourceMetrics,
 ) -> JSONResourceMetrics:
     return JSONResourceMetrics(
-        resource=JSONResource(attributes=_encode_attributes(rm.resource.attributes)),
+        resource=_encode_resource_cached(rm.resource),
         scope_metrics=[_encode_scope_metrics(sm) for sm in rm.scope_metrics],
         schema_url=rm.resource.schema_url,
     )
@@ -218,7 +216,7 @@ def _encode_scope_metrics(
     sm: ScopeMetrics,
 ) -> JSONScopeMetrics:
     return JSONScopeMetrics(
-        scope=_encode_instrumentation_scope(sm.scope),
+        scope=_encode_instrumentation_scope_cached(sm.scope),
         schema_url=sm.scope.schema_url,
         metrics=[_encode_metric(m) for m in sm.metrics],
     )
@@ -11,8 +11,8 @@ from collections.abc import Collection
 
 from opentelemetry.exporter.otlp.json.common._internal import (
     _encode_attributes,
-    _encode_instrumentation_scope,
-    _encode_resource,
+    _encode_instrumentation_scope_cached,
+    _encode_resource_cached,
     _encode_span_id,
     _encode_trace_id,
 )
@@ -68,14 +68,14 @@ def _encode_resource_spans(
         for sdk_instrumentation, json_spans in sdk_instrumentations.items():
             scope_spans.append(
                 JSONScopeSpans(
-                    scope=(_encode_instrumentation_scope(sdk_instrumentation)),
+                    scope=_encode_instrumentation_scope_cached(sdk_instrumentation),
                     spans=json_spans,
                     schema_url=sdk_instrumentation.schema_url if sdk_instrumentation else None,
                 )
             )
         json_resource_spans.append(
             JSONResourceSpans(
-                resource=_encode_resource(sdk_resource),
+                resource=_encode_resource_cached(sdk_resource),
                 scope_spans=scope_spans,
                 schema_url=sdk_resource.schema_url,
             )
@@ -10,8 +10,10 @@ from logging import ERROR
 from opentelemetry.exporter.otlp.json.common._internal import (
     _encode_attributes,
     _encode_instrumentation_scope,
+    _encode_instrumentation_scope_cached,
     _encode_key_value,
     _encode_resource,
+    _encode_resource_cached,
     _encode_span_id,
     _encode_trace_id,
     _encode_value,
@@ -314,3 +316,17 @@ class TestCommonEncoder(unittest.TestCase):
         result = _encode_instrumentation_scope(None)
         self.assertEqual(result, JSONInstrumentationScope())
         self.assertEqual(result.to_dict(), {})
+
+    def test_encode_resource_cached(self):
+        resource = Resource({"key": "val"})
+        result = _encode_resource_cached(resource)
+        self.assertEqual(result, _encode_resource(resource))
+        self.assertIs(_encode_resource_cached(resource), result)
+        self.assertIsNot(_encode_resource_cached(Resource({"key": "val"})), result)
+
+    def test_encode_instrumentation_scope_cached(self):
+        scope = InstrumentationScope(name="my_lib", attributes={"k": 1})
+        result = _encode_instrumentation_scope_cached(scope)
+        self.assertEqual(result, _encode_instrumentation_scope(scope))
+        self.assertIs(_encode_instrumentation_scope_cached(scope), result)
+        self.assertEqual(_encode_instrumentation_scope_cached(None), JSONInstrumentationScope())
@@ -0,0 +1,105 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from unittest.mock import patch
+
+import pytest
+
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _encode_key_value,
+    _new_attribute_cache,
+)
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _wire_format as wire_format,
+)
+from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder._process_pool import (
+    _ProcessPoolSpanSerializer,
+    _to_span_data,
+)
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans,
+    serialize_spans,
+)
+from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import Event, SpanContext, _Span
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import SpanKind
+
+_RESOURCE = Resource({"service.name": "checkout", "service.version": "1.2.3", "host.name": "checkout-1"})
+_SCOPE = InstrumentationScope("opentelemetry.instrumentation.flask", "0.50b0")
+_ROUTES = ("/", "/api/cart", "/api/checkout", "/api/users/{id}")
+
+
+def _http_server_spans(count):
+    spans = []
+    for index in range(count):
+        span = _Span(
+            name=f"GET {_ROUTES[index % len(_ROUTES)]}",
+            context=SpanContext(index + 1, index + 1, is_remote=False),
+            kind=SpanKind.SERVER,
+            resource=_RESOURCE,
+            instrumentation_scope=_SCOPE,
+            attributes={
+                "http.request.method": "GET",
+                "http.route": _ROUTES[index % len(_ROUTES)],
+                "http.response.status_code": 500 if index % 10 == 0 else 200,
+                "url.scheme": "https",
+                "url.path": f"/api/users/{index}",
+                "server.address": "checkout.example.com",
+                "server.port": 443,
+                "network.protocol.version": "1.1",
+                "client.address": f"10.0.{index % 4}.{index % 250}",
+                "user_agent.original": "Mozilla/5.0 (X11; Linux x86_64)",
+            },
+            events=[Event("exception", {"exception.type": "ValueError", "exception.escaped": False})]
+            if index % 10 == 0
+            else (),
+        )
+        span.start(start_time=index * 10**6)
+        span.end(end_time=index * 10**6 + 10**5)
+        spans.append(span)
+    return spans
+
+
+@pytest.mark.parametrize("cache_size", [0, 1024])
+@pytest.mark.parametrize("encode", [encode_spans, serialize_spans], ids=["pb2", "wire_format"])
+def test_benchmark_encode_http_server_spans(benchmark, encode, cache_size):
+    with patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE: str(cache_size)}):
+        pb2_cache = _new_attribute_cache(_encode_key_value)
+        wire_cache = _new_attribute_cache(wire_format._encode_key_value)
+    spans = _http_server_spans(512)
+    with (
+        patch(
+            "opentelemetry.exporter.otlp.proto.common._internal._encode_key_value_cached",
+            pb2_cache,
+        ),
+        patch.object(wire_format, "_encode_key_value_cached", wire_cache),
+    ):
+        benchmark(encode, spans)
+    cache = pb2_cache if encode is encode_spans else wire_cache
+    if cache is not None:
+        benchmark.extra_info["cache_hits"] = cache.cache_info().hits
+        benchmark.extra_info["cache_misses"] = cache.cache_info().misses
+
+
+# The spans left to the exporting thread to copy, compare with the
+# serialize_spans results above.
+def test_benchmark_copy_span_data(benchmark):
+    benchmark(_to_span_data, _http_server_spans(512))
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_benchmark_process_pool_serialize_spans(benchmark, max_workers):
+    spans = _http_server_spans(512)
+    serializer = _ProcessPoolSpanSerializer(max_workers)
+    try:
+        # Starts the worker processes.
+        serializer(spans)
+        benchmark(serializer, spans)
+    finally:
+        serializer.shutdown()
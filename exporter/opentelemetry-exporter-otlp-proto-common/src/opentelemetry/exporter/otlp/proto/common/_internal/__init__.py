@@ -5,9 +5,13 @@
 from __future__ import annotations
 
 import logging
+import weakref
 from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from os import environ
 from typing import (
     Any,
+    Generic,
     TypeVar,
 )
 
@@ -25,6 +29,9 @@ from opentelemetry.proto.common.v1.common_pb2 import (
 from opentelemetry.proto.resource.v1.resource_pb2 import (
     Resource as PB2Resource,
 )
+from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE,
+)
 from opentelemetry.sdk.trace import Resource
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 from opentelemetry.util.types import Attributes
@@ -33,6 +40,68 @@ _logger = logging.getLogger(__name__)
 
 _TypingResourceT = TypeVar("_TypingResourceT")
 _ResourceDataT = TypeVar("_ResourceDataT")
+_SDKObjectT = TypeVar("_SDKObjectT")
+_EncodedT = TypeVar("_EncodedT")
+
+# Only the attributes with these value types are cached: they are hashable and
+# usually have a low cardinality. Floats are left out, they are mostly
+# measurements and -0.0 == 0.0 although they are encoded differently.
+_CACHED_ATTRIBUTE_VALUE_TYPES = frozenset((str, bool, int, bytes))
+
+
+class _EncodingCache(Generic[_SDKObjectT, _EncodedT]):
+    """Caches the encoding of immutable SDK objects by object identity.
+
+    Resources and instrumentation scopes are immutable and shared by all the
+    telemetry of a provider, they only need to be encoded once. An entry is
+    dropped when its object is garbage collected, for example the resource
+    replaced by ``TracerProvider._update_resource``. Objects that cannot be
+    weakly referenced are encoded on every call.
+
+    The cached encodings are shared, callers must not modify them.
+    """
+
+    def __init__(self, encode: Callable[[_SDKObjectT], _EncodedT]) -> None:
+        self._encode = encode
+        self._encodings: dict[int, _EncodedT] = {}
+
+    def __call__(self, sdk_object: _SDKObjectT) -> _EncodedT:
+        key = id(sdk_object)
+        encoded = self._encodings.get(key)
+        if encoded is None:
+            encoded = self._encode(sdk_object)
+            try:
+                finalizer = weakref.finalize(sdk_object, self._encodings.pop, key, None)
+            except TypeError:
+                return encoded
+            finalizer.atexit = False
+            self._encodings[key] = encoded
+        return encoded
+
+
+def _new_attribute_cache(
+    encode: Callable[..., _EncodedT],
+) -> Callable[..., _EncodedT] | None:
+    """Returns ``encode`` wrapped in a LRU cache of the size set by
+    :envvar:`OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE`, or None if the
+    cache is disabled.
+
+    The arguments of ``encode`` are the cache key, callers must only pass
+    values of `_CACHED_ATTRIBUTE_VALUE_TYPES`. Value types are part of the key
+    because True == 1. The hits and misses are counted by ``cache_info()``.
+    The cached encodings are shared, callers must not modify them.
+    """
+    try:
+        max_size = int(environ.get(_OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE, 0))
+    except ValueError:
+        _logger.warning(
+            "Unable to parse value for %s as integer. Disabling the attribute cache.",
+            _OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE,
+        )
+        return None
+    if max_size <= 0:
+        return None
+    return lru_cache(maxsize=max_size, typed=True)(encode)
 
 
 def _encode_instrumentation_scope(
@@ -51,6 +120,12 @@ def _encode_resource(resource: Resource) -> PB2Resource:
     return PB2Resource(attributes=_encode_attributes(resource.attributes))
 
 
+# PB2 messages copy the messages they are given, the cached ones are not
+# modified by the encoders.
+_encode_resource_cached = _EncodingCache(_encode_resource)
+_encode_instrumentation_scope_cached = _EncodingCache(_encode_instrumentation_scope)
+
+
 def _encode_value(value: Any) -> PB2AnyValue:
     if value is None:
         return PB2AnyValue()
@@ -77,6 +152,9 @@ def _encode_key_value(key: str, value: Any) -> PB2KeyValue:
     return PB2KeyValue(key=key, value=_encode_value(value))
 
 
+_encode_key_value_cached = _new_attribute_cache(_encode_key_value)
+
+
 def _encode_span_id(span_id: int) -> bytes:
     return span_id.to_bytes(length=8, byteorder="big", signed=False)
 
@@ -88,11 +166,15 @@ def _encode_trace_id(trace_id: int) -> bytes:
 def _encode_attributes(attributes: Attributes) -> list[PB2KeyValue]:
     if not attributes:
         return []
+    encode_key_value_cached = _encode_key_value_cached
     pb2_attributes = []
     for key, value in attributes.items():
         # pylint: disable=broad-exception-caught
         try:
-            pb2_attributes.append(_encode_key_value(key, value))
+            if encode_key_value_cached is not None and type(value) in _CACHED_ATTRIBUTE_VALUE_TYPES:
+                pb2_attributes.append(encode_key_value_cached(key, value))
+            else:
+                pb2_attributes.append(_encode_key_value(key, value))
         except Exception as error:
             _logger.exception("Failed to encode key %s: %s", key, error)
     return pb2_attributes
@@ -109,11 +191,10 @@ def _get_resource_data(
         sdk_resource,
         scope_data,
     ) in sdk_resource_scope_data.items():
-        collector_resource = PB2Resource(attributes=_encode_attributes(sdk_resource.attributes))
         resource_data.append(
             resource_class(
                 **{
-                    "resource": collector_resource,
+                    "resource": _encode_resource_cached(sdk_resource),
                     f"scope_{name}": scope_data.values(),
                 }
             )
@@ -5,8 +5,8 @@ from collections.abc import Sequence
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _encode_attributes,
-    _encode_instrumentation_scope,
-    _encode_resource,
+    _encode_instrumentation_scope_cached,
+    _encode_resource_cached,
     _encode_span_id,
     _encode_trace_id,
     _encode_value,
@@ -71,14 +71,14 @@ def _encode_resource_logs(
         for sdk_instrumentation, pb2_logs in sdk_instrumentations.items():
             scope_logs.append(
                 ScopeLogs(
-                    scope=(_encode_instrumentation_scope(sdk_instrumentation)),
+                    scope=_encode_instrumentation_scope_cached(sdk_instrumentation),
                     log_records=pb2_logs,
                     schema_url=sdk_instrumentation.schema_url if sdk_instrumentation else None,
                 )
             )
         pb2_resource_logs.append(
             ResourceLogs(
-                resource=_encode_resource(sdk_resource),
+                resource=_encode_resource_cached(sdk_resource),
                 scope_logs=scope_logs,
                 schema_url=sdk_resource.schema_url,
             )
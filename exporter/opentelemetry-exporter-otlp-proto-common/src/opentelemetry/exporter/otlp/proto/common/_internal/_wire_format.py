@@ -0,0 +1,228 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Protobuf wire format writers.
+
+These helpers append protobuf encoded fields straight to a ``bytearray``
+without building the intermediate PB2 message objects. Their output is
+byte for byte the serialization of the messages built by the PB2 based
+encoders of this package: fields are written in field number order, proto3
+scalar fields holding their default value are omitted and the fields set by
+the PB2 based encoders are the ones written here.
+
+An embedded message is written by appending its tag, its fields and then
+inserting its length right after the tag with `_end_message`, so that a whole
+request is written into a single buffer. Small messages such as attributes
+are rather built as ``bytes`` first, their length is then known upfront.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping, Sequence
+from struct import Struct
+from typing import Any
+
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _CACHED_ATTRIBUTE_VALUE_TYPES,
+    _EncodingCache,
+    _new_attribute_cache,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.util.types import Attributes
+
+_logger = logging.getLogger(__name__)
+
+_FIXED32 = Struct("<I")
+_FIXED64 = Struct("<Q")
+_DOUBLE = Struct("<d")
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_SMALL_VARINTS = tuple(bytes((value,)) for value in range(0x80))
+
+
+def _tag(field_number: int, wire_type: int) -> bytes:
+    return _encode_varint(field_number << 3 | wire_type)
+
+
+def _encode_varint(value: int) -> bytes:
+    if value < 0x80:
+        if value < 0:
+            # Negative int64 values are written as their 64 bit two's complement.
+            value += 1 << 64
+        else:
+            return _SMALL_VARINTS[value]
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+_VARINT = 0
+_I64 = 1
+_LEN = 2
+_I32 = 5
+
+# KeyValue
+_KEY_VALUE_KEY = _tag(1, _LEN)
+_KEY_VALUE_VALUE = _tag(2, _LEN)
+
+# AnyValue
+_ANY_VALUE_STRING = _tag(1, _LEN)
+_ANY_VALUE_TRUE = _tag(2, _VARINT) + b"\x01"
+_ANY_VALUE_FALSE = _tag(2, _VARINT) + b"\x00"
+_ANY_VALUE_INT = _tag(3, _VARINT)
+_ANY_VALUE_DOUBLE = _tag(4, _I64)
+_ANY_VALUE_ARRAY = _tag(5, _LEN)
+_ANY_VALUE_KVLIST = _tag(6, _LEN)
+_ANY_VALUE_BYTES = _tag(7, _LEN)
+
+# ArrayValue and KeyValueList
+_VALUES = _tag(1, _LEN)
+
+# InstrumentationScope
+_SCOPE_NAME = _tag(1, _LEN)
+_SCOPE_VERSION = _tag(2, _LEN)
+_SCOPE_ATTRIBUTES = _tag(3, _LEN)
+
+# Resource
+_RESOURCE_ATTRIBUTES = _tag(1, _LEN)
+
+
+def _end_message(buffer: bytearray, start: int) -> None:
+    """Inserts the length of the embedded message written from ``start``."""
+    size = len(buffer) - start
+    if size < 0x80:
+        buffer.insert(start, size)
+    else:
+        buffer[start:start] = _encode_varint(size)
+
+
+def _write_string(buffer: bytearray, tag: bytes, value: str | None) -> None:
+    if value:
+        encoded = value.encode("utf-8")
+        buffer += tag
+        buffer += _encode_varint(len(encoded))
+        buffer += encoded
+
+
+def _write_varint(buffer: bytearray, tag: bytes, value: int | None) -> None:
+    if value:
+        buffer += tag
+        buffer += _encode_varint(value)
+
+
+def _write_fixed32(buffer: bytearray, tag: bytes, value: int | None) -> None:
+    if value:
+        buffer += tag
+        buffer += _FIXED32.pack(value)
+
+
+def _write_fixed64(buffer: bytearray, tag: bytes, value: int | None) -> None:
+    if value:
+        buffer += tag
+        buffer += _FIXED64.pack(value)
+
+
+def _encode_length_delimited(tag: bytes, value: bytes) -> bytes:
+    return tag + _encode_varint(len(value)) + value
+
+
+def _encode_any_value(value: Any) -> bytes:
+    """Returns the serialized AnyValue fields of ``value``."""
+    # Mirrors the type checks of _encode_value, the oneof fields of AnyValue
+    # are written even when they hold their default value.
+    if value is None:
+        return b""
+    if isinstance(value, bool):
+        return _ANY_VALUE_TRUE if value else _ANY_VALUE_FALSE
+    if isinstance(value, str):
+        return _encode_length_delimited(_ANY_VALUE_STRING, value.encode("utf-8"))
+    if isinstance(value, int):
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            raise ValueError(f"Value out of range: {value}")
+        return _ANY_VALUE_INT + _encode_varint(value)
+    if isinstance(value, float):
+        return _ANY_VALUE_DOUBLE + _DOUBLE.pack(value)
+    if isinstance(value, bytes):
+        return _encode_length_delimited(_ANY_VALUE_BYTES, value)
+    if isinstance(value, Sequence):
+        return _encode_length_delimited(
+            _ANY_VALUE_ARRAY,
+            b"".join([_encode_length_delimited(_VALUES, _encode_any_value(item)) for item in value]),
+        )
+    if isinstance(value, Mapping):
+        return _encode_length_delimited(
+            _ANY_VALUE_KVLIST,
+            b"".join([_encode_key_value(_VALUES, str(key), item) for key, item in value.items()]),
+        )
+    raise Exception(f"Invalid type {type(value)} of value {value}")
+
+
+def _encode_key_value(tag: bytes, key: str, value: Any) -> bytes:
+    """Returns the KeyValue field ``tag`` holding ``key`` and ``value``."""
+    any_value = _encode_any_value(value)
+    key_value = _KEY_VALUE_VALUE + _encode_varint(len(any_value)) + any_value
+    if key:
+        key_value = _encode_length_delimited(_KEY_VALUE_KEY, key.encode("utf-8")) + key_value
+    return tag + _encode_varint(len(key_value)) + key_value
+
+
+_encode_key_value_cached = _new_attribute_cache(_encode_key_value)
+
+
+def _write_attributes(buffer: bytearray, tag: bytes, attributes: Attributes) -> None:
+    if not attributes:
+        return
+    encode_key_value_cached = _encode_key_value_cached
+    for key, value in attributes.items():
+        # pylint: disable=broad-exception-caught
+        try:
+            if encode_key_value_cached is not None and type(value) in _CACHED_ATTRIBUTE_VALUE_TYPES:
+                buffer += encode_key_value_cached(tag, key, value)
+            else:
+                buffer += _encode_key_value(tag, key, value)
+        except Exception as error:
+            _logger.exception("Failed to encode key %s: %s", key, error)
+
+
+def _serialize_instrumentation_scope(instrumentation_scope: InstrumentationScope | None) -> bytes:
+    buffer = bytearray()
+    if instrumentation_scope is not None:
+        _write_string(buffer, _SCOPE_NAME, instrumentation_scope.name)
+        _write_string(buffer, _SCOPE_VERSION, instrumentation_scope.version)
+        _write_attributes(buffer, _SCOPE_ATTRIBUTES, instrumentation_scope.attributes)
+    return bytes(buffer)
+
+
+def _serialize_resource(resource: Resource) -> bytes:
+    buffer = bytearray()
+    _write_attributes(buffer, _RESOURCE_ATTRIBUTES, resource.attributes)
+    return bytes(buffer)
+
+
+_serialize_instrumentation_scope_cached = _EncodingCache(_serialize_instrumentation_scope)
+_serialize_resource_cached = _EncodingCache(_serialize_resource)
+
+
+def _write_instrumentation_scope(
+    buffer: bytearray,
+    tag: bytes,
+    instrumentation_scope: InstrumentationScope | None,
+) -> None:
+    scope = _serialize_instrumentation_scope_cached(instrumentation_scope)
+    buffer += tag
+    buffer += _encode_varint(len(scope))
+    buffer += scope
+
+
+def _write_resource(buffer: bytearray, tag: bytes, resource: Resource) -> None:
+    serialized_resource = _serialize_resource_cached(resource)
+    buffer += tag
+    buffer += _encode_varint(len(serialized_resource))
+    buffer += serialized_resource
@@ -7,7 +7,8 @@ from os import environ
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _encode_attributes,
-    _encode_instrumentation_scope,
+    _encode_instrumentation_scope_cached,
+    _encode_resource_cached,
     _encode_span_id,
     _encode_trace_id,
 )
@@ -15,9 +16,6 @@ from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
     ExportMetricsServiceRequest,
 )
 from opentelemetry.proto.metrics.v1 import metrics_pb2 as pb2
-from opentelemetry.proto.resource.v1.resource_pb2 import (
-    Resource as PB2Resource,
-)
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_OTLP_METRICS_DEFAULT_HISTOGRAM_AGGREGATION,
     OTEL_EXPORTER_OTLP_METRICS_TEMPORALITY_PREFERENCE,
@@ -175,7 +173,7 @@ def encode_metrics(data: MetricsData) -> ExportMetricsServiceRequest:
     ) in resource_metrics_dict.items():
         resource_data.append(
             pb2.ResourceMetrics(
-                resource=PB2Resource(attributes=_encode_attributes(sdk_resource.attributes)),
+                resource=_encode_resource_cached(sdk_resource),
                 scope_metrics=scope_data.values(),
                 schema_url=sdk_resource.schema_url,
             )
@@ -196,7 +194,7 @@ def _encode_resource_metrics(resource_metrics, resource_metrics_dict):
         # there is no need to check for existing instrumentation scopes
         # here.
         pb2_scope_metrics = pb2.ScopeMetrics(
-            scope=_encode_instrumentation_scope(instrumentation_scope),
+            scope=_encode_instrumentation_scope_cached(instrumentation_scope),
             schema_url=instrumentation_scope.schema_url,
         )
 
@@ -7,11 +7,28 @@ from collections.abc import Sequence
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _encode_attributes,
-    _encode_instrumentation_scope,
-    _encode_resource,
+    _encode_instrumentation_scope_cached,
+    _encode_resource_cached,
     _encode_span_id,
     _encode_trace_id,
 )
+from opentelemetry.exporter.otlp.proto.common._internal._wire_format import (
+    _FIXED32,
+    _FIXED64,
+    _I32,
+    _I64,
+    _LEN,
+    _VARINT,
+    _encode_varint,
+    _end_message,
+    _tag,
+    _write_attributes,
+    _write_fixed64,
+    _write_instrumentation_scope,
+    _write_resource,
+    _write_string,
+    _write_varint,
+)
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest as PB2ExportTraceServiceRequest,
 )
@@ -35,6 +52,55 @@ _SPAN_KIND_MAP = {
     SpanKind.CONSUMER: PB2SPan.SpanKind.SPAN_KIND_CONSUMER,
 }
 
+
+# ExportTraceServiceRequest
+_REQUEST_RESOURCE_SPANS = _tag(1, _LEN)
+
+# ResourceSpans
+_RESOURCE_SPANS_RESOURCE = _tag(1, _LEN)
+_RESOURCE_SPANS_SCOPE_SPANS = _tag(2, _LEN)
+_RESOURCE_SPANS_SCHEMA_URL = _tag(3, _LEN)
+
+# ScopeSpans
+_SCOPE_SPANS_SCOPE = _tag(1, _LEN)
+_SCOPE_SPANS_SPANS = _tag(2, _LEN)
+_SCOPE_SPANS_SCHEMA_URL = _tag(3, _LEN)
+
+# Span, the ids are written with their length folded in their tag.
+_SPAN_TRACE_ID = _tag(1, _LEN) + b"\x10"
+_SPAN_SPAN_ID = _tag(2, _LEN) + b"\x08"
+_SPAN_TRACE_STATE = _tag(3, _LEN)
+_SPAN_PARENT_SPAN_ID = _tag(4, _LEN) + b"\x08"
+_SPAN_NAME = _tag(5, _LEN)
+_SPAN_START_TIME = _tag(7, _I64)
+_SPAN_END_TIME = _tag(8, _I64)
+_SPAN_ATTRIBUTES = _tag(9, _LEN)
+_SPAN_DROPPED_ATTRIBUTES = _tag(10, _VARINT)
+_SPAN_EVENTS = _tag(11, _LEN)
+_SPAN_DROPPED_EVENTS = _tag(12, _VARINT)
+_SPAN_LINKS = _tag(13, _LEN)
+_SPAN_DROPPED_LINKS = _tag(14, _VARINT)
+_SPAN_STATUS = _tag(15, _LEN)
+_SPAN_FLAGS = _tag(16, _I32)
+_SPAN_KIND_VALUES = {kind: _tag(6, _VARINT) + _encode_varint(pb2_kind) for kind, pb2_kind in _SPAN_KIND_MAP.items()}
+
+# Span.Event
+_EVENT_TIME = _tag(1, _I64)
+_EVENT_NAME = _tag(2, _LEN)
+_EVENT_ATTRIBUTES = _tag(3, _LEN)
+_EVENT_DROPPED_ATTRIBUTES = _tag(4, _VARINT)
+
+# Span.Link, the ids are written with their length folded in their tag.
+_LINK_TRACE_ID = _tag(1, _LEN) + b"\x10"
+_LINK_SPAN_ID = _tag(2, _LEN) + b"\x08"
+_LINK_ATTRIBUTES = _tag(4, _LEN)
+_LINK_DROPPED_ATTRIBUTES = _tag(5, _VARINT)
+_LINK_FLAGS = _tag(6, _I32)
+
+# Status
+_STATUS_MESSAGE = _tag(2, _LEN)
+_STATUS_CODE = _tag(3, _VARINT)
+
 _logger = logging.getLogger(__name__)
 
 
@@ -44,6 +110,99 @@ def encode_spans(
     return PB2ExportTraceServiceRequest(resource_spans=_encode_resource_spans(sdk_spans))
 
 
+def serialize_spans(sdk_spans: Sequence[ReadableSpan]) -> bytes:
+    """Serializes spans into an OTLP ``ExportTraceServiceRequest``.
+
+    The result is the same as ``encode_spans(sdk_spans).SerializeToString()``
+    but the spans are written straight into the wire format, without building
+    the PB2 messages first.
+    """
+    sdk_resource_spans = defaultdict(lambda: defaultdict(list))
+
+    for sdk_span in sdk_spans:
+        sdk_resource_spans[sdk_span.resource][sdk_span.instrumentation_scope or None].append(sdk_span)
+
+    buffer = bytearray()
+
+    for sdk_resource, sdk_instrumentations in sdk_resource_spans.items():
+        buffer += _REQUEST_RESOURCE_SPANS
+        resource_spans_start = len(buffer)
+        _write_resource(buffer, _RESOURCE_SPANS_RESOURCE, sdk_resource)
+        for sdk_instrumentation, scope_sdk_spans in sdk_instrumentations.items():
+            buffer += _RESOURCE_SPANS_SCOPE_SPANS
+            scope_spans_start = len(buffer)
+            _write_instrumentation_scope(buffer, _SCOPE_SPANS_SCOPE, sdk_instrumentation)
+            for sdk_span in scope_sdk_spans:
+                _write_span(buffer, sdk_span)
+            if sdk_instrumentation is not None:
+                _write_string(buffer, _SCOPE_SPANS_SCHEMA_URL, sdk_instrumentation.schema_url)
+            _end_message(buffer, scope_spans_start)
+        _write_string(buffer, _RESOURCE_SPANS_SCHEMA_URL, sdk_resource.schema_url)
+        _end_message(buffer, resource_spans_start)
+
+    return bytes(buffer)
+
+
+def _write_span(buffer: bytearray, sdk_span: ReadableSpan) -> None:
+    # The fields are written inline rather than through the _wire_format
+    # helpers, this is the hot loop of the serialization.
+    span_context = sdk_span.get_span_context()
+    parent = sdk_span.parent
+    buffer += _SCOPE_SPANS_SPANS
+    start = len(buffer)
+    buffer += _SPAN_TRACE_ID
+    buffer += _encode_trace_id(span_context.trace_id)
+    buffer += _SPAN_SPAN_ID
+    buffer += _encode_span_id(span_context.span_id)
+    if span_context.trace_state:
+        _write_string(buffer, _SPAN_TRACE_STATE, _encode_trace_state(span_context.trace_state))
+    if parent:
+        buffer += _SPAN_PARENT_SPAN_ID
+        buffer += _encode_span_id(parent.span_id)
+    _write_string(buffer, _SPAN_NAME, sdk_span.name)
+    buffer += _SPAN_KIND_VALUES[sdk_span.kind]
+    if sdk_span.start_time:
+        buffer += _SPAN_START_TIME
+        buffer += _FIXED64.pack(sdk_span.start_time)
+    if sdk_span.end_time:
+        buffer += _SPAN_END_TIME
+        buffer += _FIXED64.pack(sdk_span.end_time)
+    _write_attributes(buffer, _SPAN_ATTRIBUTES, sdk_span.attributes)
+    _write_varint(buffer, _SPAN_DROPPED_ATTRIBUTES, sdk_span.dropped_attributes)
+    for event in sdk_span.events:
+        buffer += _SPAN_EVENTS
+        event_start = len(buffer)
+        _write_fixed64(buffer, _EVENT_TIME, event.timestamp)
+        _write_string(buffer, _EVENT_NAME, event.name)
+        _write_attributes(buffer, _EVENT_ATTRIBUTES, event.attributes)
+        _write_varint(buffer, _EVENT_DROPPED_ATTRIBUTES, event.dropped_attributes)
+        _end_message(buffer, event_start)
+    _write_varint(buffer, _SPAN_DROPPED_EVENTS, sdk_span.dropped_events)
+    for link in sdk_span.links:
+        buffer += _SPAN_LINKS
+        link_start = len(buffer)
+        buffer += _LINK_TRACE_ID
+        buffer += _encode_trace_id(link.context.trace_id)
+        buffer += _LINK_SPAN_ID
+        buffer += _encode_span_id(link.context.span_id)
+        _write_attributes(buffer, _LINK_ATTRIBUTES, link.attributes)
+        _write_varint(buffer, _LINK_DROPPED_ATTRIBUTES, link.dropped_attributes)
+        buffer += _LINK_FLAGS
+        buffer += _FIXED32.pack(_span_flags(link.context))
+        _end_message(buffer, link_start)
+    _write_varint(buffer, _SPAN_DROPPED_LINKS, sdk_span.dropped_links)
+    status = sdk_span.status
+    if status is not None:
+        buffer += _SPAN_STATUS
+        status_start = len(buffer)
+        _write_string(buffer, _STATUS_MESSAGE, status.description)
+        _write_varint(buffer, _STATUS_CODE, status.status_code.value)
+        _end_message(buffer, status_start)
+    buffer += _SPAN_FLAGS
+    buffer += _FIXED32.pack(_span_flags(parent))
+    _end_message(buffer, start)
+
+
 def _encode_resource_spans(
     sdk_spans: Sequence[ReadableSpan],
 ) -> list[PB2ResourceSpans]:
@@ -74,14 +233,14 @@ def _encode_resource_spans(
         for sdk_instrumentation, pb2_spans in sdk_instrumentations.items():
             scope_spans.append(
                 PB2ScopeSpans(
-                    scope=(_encode_instrumentation_scope(sdk_instrumentation)),
+                    scope=_encode_instrumentation_scope_cached(sdk_instrumentation),
                     spans=pb2_spans,
                     schema_url=sdk_instrumentation.schema_url if sdk_instrumentation else None,
                 )
             )
         pb2_resource_spans.append(
             PB2ResourceSpans(
-                resource=_encode_resource(sdk_resource),
+                resource=_encode_resource_cached(sdk_resource),
                 scope_spans=scope_spans,
                 schema_url=sdk_resource.schema_url,
             )
@@ -0,0 +1,279 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Serialization of spans in a pool of worker processes.
+
+Serializing a batch of spans is CPU bound Python code, on builds with a GIL
+it slows down the threads of the application while the batch worker thread
+serializes. `_ProcessPoolSpanSerializer` copies the spans into picklable
+`_SpanData` tuples instead and serializes them in worker processes. The
+requests returned by the workers are concatenated, a serialized
+``ExportTraceServiceRequest`` only has repeated fields.
+
+Fork safety follows the batch processors: the worker processes and the
+threads managing them are not copied into a forked child, so the pool is
+dropped in the child at fork and a new one is started on the next export.
+The workers themselves are never forked from the exporting process, they are
+started with the ``forkserver`` method, or ``spawn`` where it is not
+available. Like for any ``ProcessPoolExecutor``, the ``__main__`` module of
+the application must then be importable without side effects.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+import weakref
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from time import time
+from typing import Any, NamedTuple
+
+from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder import (
+    serialize_spans,
+)
+from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import SpanKind
+from opentelemetry.trace.span import SpanContext
+from opentelemetry.trace.status import Status
+
+_logger = logging.getLogger(__name__)
+
+# Spans are sent to the workers in tasks of at least this many spans, the
+# copying and pickling of smaller tasks costs more than it saves.
+_MIN_SPANS_PER_TASK = 128
+
+
+class _EventData(NamedTuple):
+    name: str
+    timestamp: int
+    attributes: dict[str, Any] | None
+    dropped_attributes: int
+
+
+class _LinkData(NamedTuple):
+    context: SpanContext
+    attributes: dict[str, Any] | None
+    dropped_attributes: int
+
+
+class _SpanData(NamedTuple):
+    """Picklable copy of the span fields read by `serialize_spans`.
+
+    The resource and the instrumentation scope are copied into plain tuples
+    shared by the spans they belong to, pickle writes them once per task.
+    """
+
+    resource: Any
+    instrumentation_scope: Any
+    context: SpanContext
+    parent: SpanContext | None
+    name: str
+    kind: SpanKind
+    start_time: int | None
+    end_time: int | None
+    attributes: dict[str, Any] | None
+    dropped_attributes: int
+    events: tuple[_EventData, ...]
+    dropped_events: int
+    links: tuple[_LinkData, ...]
+    dropped_links: int
+    status: Status
+
+    def get_span_context(self) -> SpanContext:
+        return self.context
+
+
+def _copy_attributes(attributes: Mapping[str, Any] | None) -> dict[str, Any] | None:
+    return dict(attributes) if attributes else None
+
+
+def _to_span_data(sdk_spans: Sequence[ReadableSpan]) -> list[_SpanData]:
+    resources = {}
+    scopes = {}
+    spans = []
+    for sdk_span in sdk_spans:
+        sdk_resource = sdk_span.resource
+        resource = resources.get(id(sdk_resource))
+        if resource is None:
+            resource = resources[id(sdk_resource)] = (
+                _copy_attributes(sdk_resource.attributes),
+                sdk_resource.schema_url,
+            )
+        sdk_scope = sdk_span.instrumentation_scope or None
+        scope = scopes.get(id(sdk_scope))
+        if scope is None and sdk_scope is not None:
+            scope = scopes[id(sdk_scope)] = (
+                sdk_scope.name,
+                sdk_scope.version,
+                sdk_scope.schema_url,
+                _copy_attributes(sdk_scope.attributes),
+            )
+        spans.append(
+            _SpanData(
+                resource,
+                scope,
+                sdk_span.get_span_context(),
+                sdk_span.parent,
+                sdk_span.name,
+                sdk_span.kind,
+                sdk_span.start_time,
+                sdk_span.end_time,
+                _copy_attributes(sdk_span.attributes),
+                sdk_span.dropped_attributes,
+                tuple(
+                    _EventData(
+                        event.name,
+                        event.timestamp,
+                        _copy_attributes(event.attributes),
+                        event.dropped_attributes,
+                    )
+                    for event in sdk_span.events
+                ),
+                sdk_span.dropped_events,
+                tuple(
+                    _LinkData(link.context, _copy_attributes(link.attributes), link.dropped_attributes)
+                    for link in sdk_span.links
+                ),
+                sdk_span.dropped_links,
+                sdk_span.status,
+            )
+        )
+    return spans
+
+
+def _serialize_span_data(spans: list[_SpanData]) -> bytes:
+    """Serializes spans copied by `_to_span_data`, runs in the worker processes."""
+    resources = {}
+    scopes = {}
+    sdk_spans = []
+    for span in spans:
+        resource = resources.get(id(span.resource))
+        if resource is None:
+            attributes, schema_url = span.resource
+            resource = resources[id(span.resource)] = Resource(attributes or {}, schema_url)
+        scope = None
+        if span.instrumentation_scope is not None:
+            scope = scopes.get(id(span.instrumentation_scope))
+            if scope is None:
+                scope = scopes[id(span.instrumentation_scope)] = InstrumentationScope(*span.instrumentation_scope)
+        sdk_spans.append(span._replace(resource=resource, instrumentation_scope=scope))
+    return serialize_spans(sdk_spans)
+
+
+class _ProcessPoolSpanSerializer:
+    """Serializes spans like `serialize_spans` in a pool of worker processes.
+
+    Args:
+        max_workers: The number of worker processes.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        # The pool is only restarted when it breaks after serializing a
+        # batch, workers that cannot start would break it again.
+        self._restart_broken_pool = False
+        self._shutdown = False
+        if hasattr(os, "register_at_fork"):
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+
+            def _after_in_child() -> None:
+                if reinit := weak_reinit():
+                    reinit()
+
+            os.register_at_fork(after_in_child=_after_in_child)
+        self._pid = os.getpid()
+
+    def _at_fork_reinit(self) -> None:
+        # The worker processes and the threads managing them belong to the parent.
+        self._lock = threading.Lock()
+        self._executor = None
+        self._restart_broken_pool = False
+        self._pid = os.getpid()
+
+    def _get_executor(self) -> ProcessPoolExecutor | None:
+        if self._pid != os.getpid():
+            self._at_fork_reinit()
+        with self._lock:
+            if self._executor is None and not self._shutdown:
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context(start_method),
+                )
+            return self._executor
+
+    def __call__(self, sdk_spans: Sequence[ReadableSpan], timeout: float | None = None) -> bytes:
+        """Serializes ``sdk_spans``, in the exporting thread if the workers have
+        not returned them after ``timeout`` seconds."""
+        executor = self._get_executor() if sdk_spans else None
+        if executor is None:
+            return serialize_spans(sdk_spans)
+        spans = _to_span_data(sdk_spans)
+        task_size = max(_MIN_SPANS_PER_TASK, -(-len(spans) // self._max_workers))
+        deadline = None if timeout is None else time() + timeout
+        futures = []
+        try:
+            futures = [
+                executor.submit(_serialize_span_data, spans[start : start + task_size])
+                for start in range(0, len(spans), task_size)
+            ]
+            serialized_spans = b"".join(
+                [future.result(timeout=None if deadline is None else max(0, deadline - time())) for future in futures]
+            )
+        except FutureTimeoutError:
+            _logger.warning("The span encoder processes timed out, serializing spans in the exporting thread.")
+            for future in futures:
+                future.cancel()
+            return serialize_spans(sdk_spans)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+                    if self._restart_broken_pool:
+                        _logger.warning("A span encoder process exited unexpectedly, restarting the encoder processes.")
+                    else:
+                        _logger.warning("The span encoder processes failed, serializing spans in the exporting thread.")
+                        self._shutdown = True
+                    self._restart_broken_pool = False
+            executor.shutdown(wait=False)
+            return serialize_spans(sdk_spans)
+        with self._lock:
+            self._restart_broken_pool = True
+        return serialized_spans
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._shutdown = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+def _new_process_pool_span_serializer() -> _ProcessPoolSpanSerializer | None:
+    """Returns a `_ProcessPoolSpanSerializer` with the number of processes set
+    by :envvar:`OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES`, or None if spans
+    are serialized in the exporting thread.
+    """
+    try:
+        max_workers = int(os.environ.get(_OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES, 0))
+    except ValueError:
+        _logger.warning(
+            "Unable to parse value for %s as integer. Serializing spans in the exporting thread.",
+            _OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES,
+        )
+        return None
+    if max_workers <= 0:
+        return None
+    return _ProcessPoolSpanSerializer(max_workers)
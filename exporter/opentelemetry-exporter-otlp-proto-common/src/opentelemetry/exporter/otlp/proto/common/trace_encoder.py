@@ -4,6 +4,7 @@
 
 from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder import (
     encode_spans,
+    serialize_spans,
 )
 
-__all__ = ["encode_spans"]
+__all__ = ["encode_spans", "serialize_spans"]
@@ -1,17 +1,25 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+# pylint: disable=protected-access
+
 import unittest
 from logging import ERROR
+from unittest.mock import patch
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
     _encode_attributes,
+    _encode_key_value,
+    _new_attribute_cache,
 )
 from opentelemetry.proto.common.v1.common_pb2 import AnyValue as PB2AnyValue
 from opentelemetry.proto.common.v1.common_pb2 import (
     ArrayValue as PB2ArrayValue,
 )
 from opentelemetry.proto.common.v1.common_pb2 import KeyValue as PB2KeyValue
+from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE,
+)
 
 
 class CallingStrRaisesException:
@@ -95,3 +103,75 @@ class TestOTLPAttributeEncoder(unittest.TestCase):
                 PB2KeyValue(key="b", value=PB2AnyValue(int_value=2)),
             ],
         )
+
+
+class TestOTLPAttributeCache(unittest.TestCase):
+    @staticmethod
+    def _patch_cache(size):
+        with patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE: str(size)}):
+            cache = _new_attribute_cache(_encode_key_value)
+        return cache, patch(
+            "opentelemetry.exporter.otlp.proto.common._internal._encode_key_value_cached",
+            cache,
+        )
+
+    @patch.dict("os.environ", clear=True)
+    def test_attribute_cache_disabled_by_default(self):
+        self.assertIsNone(_new_attribute_cache(_encode_key_value))
+
+    @patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE: "many"})
+    def test_invalid_attribute_cache_size(self):
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(_new_attribute_cache(_encode_key_value))
+
+    def test_encode_attributes_cached(self):
+        attributes = {
+            "http.request.method": "GET",
+            "error": True,
+            "http.response.status_code": 200,
+            "data": b"\x00",
+            "duration": 1.5,
+            "tags": ["a", "b"],
+            "none": None,
+        }
+        expected = _encode_attributes(attributes)
+        cache, patch_cache = self._patch_cache(16)
+        with patch_cache:
+            self.assertEqual(_encode_attributes(attributes), expected)
+            self.assertEqual(_encode_attributes(attributes), expected)
+
+        # Floats, sequences and None are not cached.
+        self.assertEqual(cache.cache_info().misses, 4)
+        self.assertEqual(cache.cache_info().hits, 4)
+
+    def test_equal_values_of_different_types_cached_separately(self):
+        _, patch_cache = self._patch_cache(16)
+        with patch_cache:
+            self.assertEqual(
+                [_encode_attributes({"key": value})[0].value for value in (1, True, 0, False)],
+                [
+                    PB2AnyValue(int_value=1),
+                    PB2AnyValue(bool_value=True),
+                    PB2AnyValue(int_value=0),
+                    PB2AnyValue(bool_value=False),
+                ],
+            )
+
+    def test_least_recently_used_attribute_evicted(self):
+        cache, patch_cache = self._patch_cache(2)
+        with patch_cache:
+            _encode_attributes({"a": 1, "b": 2})
+            _encode_attributes({"a": 1, "c": 3})
+            self.assertEqual(cache.cache_info().hits, 1)
+            self.assertEqual(cache.cache_info().currsize, 2)
+
+            _encode_attributes({"b": 2})
+            self.assertEqual(cache.cache_info().hits, 1)
+
+    def test_encode_attributes_cached_error_logs_key(self):
+        _, patch_cache = self._patch_cache(16)
+        with patch_cache, self.assertLogs(level=ERROR) as error:
+            for _ in range(2):
+                self.assertEqual(_encode_attributes({"out_of_range": 2**64}), [])
+
+        self.assertEqual(len(error.records), 2)
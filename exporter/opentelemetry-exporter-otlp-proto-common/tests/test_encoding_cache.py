@@ -0,0 +1,70 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+import gc
+import unittest
+from unittest.mock import Mock
+
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _encode_instrumentation_scope,
+    _encode_instrumentation_scope_cached,
+    _encode_resource,
+    _encode_resource_cached,
+    _EncodingCache,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+
+class TestEncodingCache(unittest.TestCase):
+    def test_encodes_once_per_object(self):
+        encode = Mock(side_effect=lambda resource: object())
+        cache = _EncodingCache(encode)
+        resource = Resource({"key": "value"})
+
+        encoded = cache(resource)
+        self.assertIs(cache(resource), encoded)
+        encode.assert_called_once_with(resource)
+
+        # Equal objects are cached separately.
+        self.assertIsNot(cache(Resource({"key": "value"})), encoded)
+
+    def test_entry_dropped_with_object(self):
+        cache = _EncodingCache(_encode_resource)
+        resource = Resource({"key": "value"})
+        cache(resource)
+        self.assertEqual(len(cache._encodings), 1)
+
+        del resource
+        gc.collect()
+        self.assertEqual(cache._encodings, {})
+
+    def test_objects_without_weak_references_not_cached(self):
+        encode = Mock(side_effect=lambda scope: object())
+        cache = _EncodingCache(encode)
+
+        self.assertIsNot(cache(None), cache(None))
+        self.assertEqual(encode.call_count, 2)
+        self.assertEqual(cache._encodings, {})
+
+    def test_updated_resource_encoded(self):
+        tracer_provider = TracerProvider(resource=Resource({"key": "value"}), shutdown_on_exit=False)
+        self.assertEqual(
+            _encode_resource_cached(tracer_provider.resource),
+            _encode_resource(Resource({"key": "value"})),
+        )
+
+        tracer_provider._update_resource(Resource({"process.pid": 1}))
+        self.assertEqual(
+            _encode_resource_cached(tracer_provider.resource),
+            _encode_resource(Resource({"key": "value", "process.pid": 1})),
+        )
+
+    def test_encode_instrumentation_scope_cached(self):
+        scope = InstrumentationScope("name", "version", attributes={"key": "value"})
+        encoded = _encode_instrumentation_scope_cached(scope)
+        self.assertEqual(encoded, _encode_instrumentation_scope(scope))
+        self.assertIs(_encode_instrumentation_scope_cached(scope), encoded)
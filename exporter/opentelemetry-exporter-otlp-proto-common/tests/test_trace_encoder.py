@@ -4,16 +4,25 @@
 # pylint: disable=protected-access
 
 import unittest
+from unittest.mock import patch
 
 from opentelemetry.exporter.otlp.proto.common._internal import (
+    _encode_key_value,
     _encode_span_id,
     _encode_trace_id,
+    _new_attribute_cache,
+)
+from opentelemetry.exporter.otlp.proto.common._internal import (
+    _wire_format as wire_format,
 )
 from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder import (
     _SPAN_KIND_MAP,
     _encode_status,
 )
-from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    encode_spans,
+    serialize_spans,
+)
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest as PB2ExportTraceServiceRequest,
 )
@@ -31,6 +40,9 @@ from opentelemetry.proto.trace.v1.trace_pb2 import (
 from opentelemetry.proto.trace.v1.trace_pb2 import ScopeSpans as PB2ScopeSpans
 from opentelemetry.proto.trace.v1.trace_pb2 import Span as PB2SPan
 from opentelemetry.proto.trace.v1.trace_pb2 import Status as PB2Status
+from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE,
+)
 from opentelemetry.sdk.trace import Event as SDKEvent
 from opentelemetry.sdk.trace import Resource as SDKResource
 from opentelemetry.sdk.trace import SpanContext as SDKSpanContext
@@ -41,6 +53,7 @@ from opentelemetry.sdk.util.instrumentation import (
 from opentelemetry.trace import Link as SDKLink
 from opentelemetry.trace import SpanKind as SDKSpanKind
 from opentelemetry.trace import TraceFlags as SDKTraceFlags
+from opentelemetry.trace.span import TraceState as SDKTraceState
 from opentelemetry.trace.status import Status as SDKStatus
 from opentelemetry.trace.status import StatusCode as SDKStatusCode
 
@@ -50,6 +63,115 @@ class TestOTLPTraceEncoder(unittest.TestCase):
         otel_spans, expected_encoding = self.get_exhaustive_test_spans()
         self.assertEqual(encode_spans(otel_spans), expected_encoding)
 
+    def assertSerializesLikeEncodeSpans(self, otel_spans):  # pylint: disable=invalid-name
+        self.assertEqual(
+            serialize_spans(otel_spans),
+            encode_spans(otel_spans).SerializeToString(),
+        )
+
+    def test_serialize_spans(self):
+        self.assertSerializesLikeEncodeSpans(self.get_exhaustive_otel_span_list())
+        self.assertSerializesLikeEncodeSpans([])
+
+    def test_serialize_spans_attribute_values(self):
+        attributes = {
+            "": "empty key",
+            "empty_string": "",
+            "long_string": "ü" * 200,
+            "false": False,
+            "zero": 0,
+            "negative": -1,
+            "int64_min": -(2**63),
+            "int64_max": 2**63 - 1,
+            "zero_float": 0.0,
+            "negative_float": -1.5,
+            "nan": float("nan"),
+            "bytes": b"\x00\x01",
+            "empty_bytes": b"",
+            "none": None,
+            "array": ["a", 1, 2.5, True, None, ["nested"], {"key": "value"}],
+            "empty_array": (),
+            "kvlist": {"a": 1, 2: [b"b"], "empty": {}},
+        }
+        span = SDKSpan(
+            name="",
+            context=SDKSpanContext(1, 1, is_remote=False, trace_state=SDKTraceState([("key", "value")])),
+            parent=SDKSpanContext(1, 2, is_remote=True),
+            kind=SDKSpanKind.CONSUMER,
+            attributes=attributes,
+            events=(SDKEvent(name="", timestamp=0, attributes=attributes),),
+            links=(SDKLink(context=SDKSpanContext(1, 3, is_remote=True), attributes=attributes),),
+            resource=SDKResource({"negative": -1, "empty_string": ""}),
+            instrumentation_scope=SDKInstrumentationScope(name="", attributes=attributes),
+        )
+        span.start(start_time=1)
+        span.set_status(SDKStatus(SDKStatusCode.OK))
+        self.assertSerializesLikeEncodeSpans([span])
+
+    def test_serialize_spans_drops_invalid_attribute_values(self):
+        span = SDKSpan(
+            name="span",
+            context=SDKSpanContext(1, 1, is_remote=False),
+            attributes={"valid": 1},
+        )
+        span.start(start_time=1)
+        span.end(end_time=2)
+        # Invalid values are rejected by the span itself, set them afterwards.
+        span._attributes = {
+            "before": "value",
+            "out_of_range": 2**63,
+            "nested_out_of_range": [1, -(2**63) - 1],
+            "invalid_type": object(),
+            "surrogate": "\ud800",
+            "after": "value",
+        }
+        with self.assertLogs(level="ERROR") as encode_logs:
+            encoded = encode_spans([span]).SerializeToString()
+        with self.assertLogs(level="ERROR") as serialize_logs:
+            self.assertEqual(serialize_spans([span]), encoded)
+        self.assertEqual(len(serialize_logs.records), len(encode_logs.records))
+
+    def test_serialize_spans_large_batch(self):
+        resources = [SDKResource({"service.name": f"service_{index}"}) for index in range(3)]
+        scopes = [None, SDKInstrumentationScope("scope", "1.0", "schema_url", {"scope": "attribute"})]
+        otel_spans = []
+        for index in range(512):
+            span = SDKSpan(
+                name=f"span_{index}" * 20,
+                context=SDKSpanContext(index + 1, index + 1, is_remote=False),
+                parent=SDKSpanContext(index + 1, index + 2, is_remote=bool(index % 2)) if index % 3 else None,
+                kind=list(SDKSpanKind)[index % len(SDKSpanKind)],
+                resource=resources[index % len(resources)],
+                instrumentation_scope=scopes[index % len(scopes)],
+                attributes={"index": index, "value": index / 3, "tags": [str(index)] * (index % 5)},
+                events=[SDKEvent(f"event_{event}", {"event": event}, timestamp=event) for event in range(index % 4)],
+                links=[SDKLink(SDKSpanContext(index + 1, link + 1, is_remote=True)) for link in range(index % 3)],
+            )
+            span.start(start_time=index * 10**9)
+            span.set_status(list(SDKStatusCode)[index % len(SDKStatusCode)], "description" if index % 2 else None)
+            span.end(end_time=(index + 1) * 10**9)
+            otel_spans.append(span)
+        self.assertSerializesLikeEncodeSpans(otel_spans)
+
+    @patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE: "4"})
+    def test_serialize_spans_cached_attributes(self):
+        otel_spans, expected_encoding = self.get_exhaustive_test_spans()
+        pb2_cache = _new_attribute_cache(_encode_key_value)
+        wire_cache = _new_attribute_cache(wire_format._encode_key_value)
+        with (
+            patch(
+                "opentelemetry.exporter.otlp.proto.common._internal._encode_key_value_cached",
+                pb2_cache,
+            ),
+            patch.object(wire_format, "_encode_key_value_cached", wire_cache),
+        ):
+            for _ in range(2):
+                self.assertEqual(encode_spans(otel_spans), expected_encoding)
+                self.assertSerializesLikeEncodeSpans(otel_spans)
+
+        self.assertGreater(pb2_cache.cache_info().hits, 0)
+        self.assertGreater(wire_cache.cache_info().hits, 0)
+
     @staticmethod
     def get_exhaustive_otel_span_list() -> list[SDKSpan]:
         trace_id = 0x3E0C63257DE34C926F9EFCD03927272E
@@ -0,0 +1,183 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+import os
+import pickle
+import unittest
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock, patch
+
+from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder import (
+    _process_pool,
+)
+from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder._process_pool import (
+    _new_process_pool_span_serializer,
+    _ProcessPoolSpanSerializer,
+    _serialize_span_data,
+    _to_span_data,
+)
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
+    serialize_spans,
+)
+from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import Event, SpanContext, SpanLimits, _Span
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import Link, SpanKind
+from opentelemetry.trace.span import TraceState
+from opentelemetry.trace.status import Status, StatusCode
+
+
+def _spans(count):
+    resources = [Resource({"service.name": "a"}, "resource_schema"), Resource({"service.name": "b"})]
+    scopes = [None, InstrumentationScope("scope", "1.0", "scope_schema", {"key": "value"})]
+    spans = []
+    for index in range(count):
+        span = _Span(
+            name=f"span_{index}",
+            context=SpanContext(index + 1, index + 1, is_remote=False, trace_state=TraceState([("key", "value")])),
+            parent=SpanContext(index + 1, index + 2, is_remote=bool(index % 2)) if index % 3 else None,
+            kind=list(SpanKind)[index % len(SpanKind)],
+            resource=resources[index % len(resources)],
+            instrumentation_scope=scopes[index % len(scopes)],
+            attributes={"index": index, "tags": ("a", "b"), "dropped": True},
+            events=[Event("event", {"event": index}, timestamp=index)],
+            links=[Link(SpanContext(index + 1, 3, is_remote=True), {"link": index})],
+            limits=SpanLimits(max_span_attributes=2),
+        )
+        span.start(start_time=index)
+        span.set_status(Status(StatusCode.ERROR, "description"))
+        span.end(end_time=index + 1)
+        spans.append(span)
+    return spans
+
+
+class TestProcessPoolSpanSerializer(unittest.TestCase):
+    def test_span_data_serialized_like_spans(self):
+        spans = _spans(10)
+        self.assertEqual(spans[0].dropped_attributes, 1)
+
+        span_data = pickle.loads(pickle.dumps(_to_span_data(spans)))
+        self.assertEqual(_serialize_span_data(span_data), serialize_spans(spans))
+
+    def test_serialize_spans_in_worker_processes(self):
+        spans = _spans(10)
+        serializer = _ProcessPoolSpanSerializer(2)
+        try:
+            self.assertEqual(serializer(spans), serialize_spans(spans))
+
+            # Each task is serialized as a request of its own.
+            with patch.object(_process_pool, "_MIN_SPANS_PER_TASK", 3):
+                self.assertEqual(
+                    serializer(spans),
+                    b"".join(serialize_spans(spans[start : start + 5]) for start in (0, 5)),
+                )
+        finally:
+            serializer.shutdown()
+
+    def test_empty_batch_serialized_in_thread(self):
+        serializer = _ProcessPoolSpanSerializer(2)
+        self.assertEqual(serializer([]), b"")
+        self.assertIsNone(serializer._executor)
+
+    def test_serialize_spans_in_thread_after_shutdown(self):
+        serializer = _ProcessPoolSpanSerializer(2)
+        executor = Mock()
+        serializer._executor = executor
+        serializer.shutdown()
+        executor.shutdown.assert_called_once_with()
+
+        spans = _spans(2)
+        self.assertEqual(serializer(spans), serialize_spans(spans))
+        self.assertIsNone(serializer._executor)
+
+    def test_broken_process_pool_restarted(self):
+        serializer = _ProcessPoolSpanSerializer(2)
+        executor = Mock()
+        executor.submit.return_value.result.side_effect = [b"", BrokenProcessPool()]
+        serializer._executor = executor
+
+        spans = _spans(2)
+        serializer(spans)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(serializer(spans), serialize_spans(spans))
+        executor.shutdown.assert_called_once_with(wait=False)
+        self.assertIsNone(serializer._executor)
+
+        with patch.object(_process_pool, "ProcessPoolExecutor") as process_pool_executor:
+            self.assertIs(serializer._get_executor(), process_pool_executor.return_value)
+
+    def test_process_pool_broken_before_serializing_not_restarted(self):
+        serializer = _ProcessPoolSpanSerializer(2)
+        executor = Mock()
+        executor.submit.return_value.result.side_effect = BrokenProcessPool()
+        serializer._executor = executor
+
+        spans = _spans(2)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(serializer(spans), serialize_spans(spans))
+        with patch.object(_process_pool, "ProcessPoolExecutor") as process_pool_executor:
+            self.assertEqual(serializer(spans), serialize_spans(spans))
+        process_pool_executor.assert_not_called()
+
+    def test_serialize_spans_in_thread_after_timeout(self):
+        serializer = _ProcessPoolSpanSerializer(2)
+        executor = Mock()
+        future = executor.submit.return_value
+        future.result.side_effect = FutureTimeoutError()
+        serializer._executor = executor
+
+        spans = _spans(2)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(serializer(spans, timeout=0.5), serialize_spans(spans))
+        self.assertLessEqual(future.result.call_args.kwargs["timeout"], 0.5)
+        future.cancel.assert_called_once_with()
+        # The workers are slow, not broken, the pool is kept.
+        self.assertIs(serializer._executor, executor)
+
+    @unittest.skipUnless(
+        hasattr(os, "fork") and hasattr(os, "register_at_fork"),
+        "needs fork and register_at_fork",
+    )
+    def test_process_pool_dropped_in_forked_child(self):
+        serializer = _ProcessPoolSpanSerializer(2)
+        serializer._executor = Mock()
+
+        pid = os.fork()
+        if pid == 0:
+            # os.fork() has already run the at_fork hooks.
+            os._exit(0 if serializer._executor is None else 1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertIsNotNone(serializer._executor)
+
+    def test_process_pool_dropped_on_pid_change(self):
+        serializer = _ProcessPoolSpanSerializer(2)
+        executor = Mock()
+        serializer._executor = executor
+        serializer._pid = -1
+
+        with patch.object(_process_pool, "ProcessPoolExecutor") as process_pool_executor:
+            self.assertIs(serializer._get_executor(), process_pool_executor.return_value)
+        executor.shutdown.assert_not_called()
+
+    @patch.dict("os.environ", clear=True)
+    def test_process_pool_disabled_by_default(self):
+        self.assertIsNone(_new_process_pool_span_serializer())
+
+    @patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES: "2"})
+    def test_process_pool_enabled(self):
+        serializer = _new_process_pool_span_serializer()
+        self.assertIsInstance(serializer, _ProcessPoolSpanSerializer)
+        self.assertEqual(serializer._max_workers, 2)
+
+    @patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES: "all"})
+    def test_invalid_process_count(self):
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(_new_process_pool_span_serializer())
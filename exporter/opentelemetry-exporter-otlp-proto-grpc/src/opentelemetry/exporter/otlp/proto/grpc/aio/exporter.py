@@ -0,0 +1,139 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""OTLP Exporter for asyncio
+
+This module provides the asyncio counterpart of
+`opentelemetry.exporter.otlp.proto.grpc.exporter.OTLPExporterMixin`, which
+exports over a ``grpc.aio`` channel from the event loop of the application.
+The configuration and the retry policy are shared with the synchronous mixin.
+"""
+
+import asyncio
+from time import time
+
+from grpc import RpcError, StatusCode, aio
+from opentelemetry.exporter.otlp.proto.grpc.exporter import (
+    _MAX_RETRYS,
+    ExportResultT,
+    ExportServiceRequestT,
+    ExportStubT,
+    SDKDataT,
+    _OTLPExporterBase,
+    logger,
+)
+
+
+# pylint: disable=no-member
+class OTLPExporterMixin(_OTLPExporterBase[SDKDataT, ExportServiceRequestT, ExportResultT, ExportStubT]):
+    """OTLP gRPC exporter mixin for asyncio.
+
+    Takes the arguments of
+    `opentelemetry.exporter.otlp.proto.grpc.exporter.OTLPExporterMixin`. Its
+    exports and its shutdown are coroutines, which have to be awaited on the
+    same event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._shutdown_event = asyncio.Event()
+        super().__init__(*args, **kwargs)
+
+    def _initialize_channel_and_stub(self):
+        # A grpc.aio channel is bound to the event loop it is created on, so
+        # it is created by the first export, on the event loop of the exports.
+        self._channel = None
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            if self._insecure:
+                self._channel = aio.insecure_channel(
+                    self._endpoint,
+                    compression=self._compression,
+                    options=self._channel_options,
+                )
+            else:
+                assert self._credentials is not None
+                self._channel = aio.secure_channel(
+                    self._endpoint,
+                    self._credentials,
+                    compression=self._compression,
+                    options=self._channel_options,
+                )
+            self._client = self._stub(self._channel)  # type: ignore [reportCallIssue]
+        return self._client
+
+    async def _close_channel(self) -> None:
+        channel = self._channel
+        self._channel = None
+        self._client = None
+        if channel is None:
+            return
+        try:
+            await channel.close()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logger.debug(
+                "Error closing channel for %s exporter to %s: %s",
+                self._exporting,
+                self._endpoint,
+                str(error),
+            )
+
+    async def _export(
+        self,
+        data: SDKDataT,
+    ) -> ExportResultT:
+        if self._shutdown:
+            logger.warning("Exporter already shutdown, ignoring batch")
+            return self._result.FAILURE  # type: ignore [reportReturnType]
+
+        with self._metrics.export_operation(self._count_data(data)) as result:
+            deadline_sec = time() + self._timeout
+            for retry_num in range(_MAX_RETRYS):
+                try:
+                    await self._get_client().Export(
+                        request=self._export_request(data, deadline_sec - time()),
+                        metadata=self._headers,
+                        timeout=deadline_sec - time(),
+                    )
+                    return self._result.SUCCESS  # type: ignore [reportReturnType]
+                except asyncio.CancelledError as error:
+                    # Closing the channel at shutdown cancels the call in progress.
+                    if not self._shutdown:
+                        raise
+                    logger.warning("Shutdown in progress, export of %s cancelled.", self._exporting)
+                    result.error = error  # type: ignore [reportAttributeAccessIssue]
+                    return self._result.FAILURE  # type: ignore [reportReturnType]
+                except RpcError as error:
+                    # For UNAVAILABLE errors, close the channel to reconnect on the next attempt
+                    if error.code() == StatusCode.UNAVAILABLE and retry_num == 0:  # type: ignore
+                        logger.debug(
+                            "Reinitializing gRPC channel for %s exporter due to UNAVAILABLE error",
+                            self._exporting,
+                        )
+                        await self._close_channel()
+
+                    backoff_seconds = self._retry_backoff(error, retry_num, deadline_sec, result)
+                    if backoff_seconds is None:
+                        return self._result.FAILURE  # type: ignore [reportReturnType]
+                try:
+                    await asyncio.wait_for(self._shutdown_event.wait(), backoff_seconds)
+                except asyncio.TimeoutError:
+                    continue
+                logger.warning("Shutdown in progress, aborting retry.")
+                break
+            return self._result.FAILURE  # type: ignore [reportReturnType]
+
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        """
+        Shut down the exporter, cancelling the export in progress if any.
+
+        Args:
+            timeout_millis: Timeout in milliseconds for shutting down the exporter.
+        """
+        if self._shutdown:
+            logger.warning("Exporter already shutdown, ignoring call")
+            return
+        self._shutdown = True
+        self._shutdown_event.set()
+        await self._close_channel()
@@ -0,0 +1,174 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from collections.abc import Sequence as TypingSequence
+from os import environ
+
+from grpc import ChannelCredentials, Compression, StatusCode
+from opentelemetry.exporter.otlp.proto.common._internal.metrics_encoder import (
+    OTLPMetricExporterMixin,
+)
+from opentelemetry.exporter.otlp.proto.common.metrics_encoder import (
+    encode_metrics,
+)
+from opentelemetry.exporter.otlp.proto.grpc.aio.exporter import (
+    OTLPExporterMixin,
+)
+from opentelemetry.exporter.otlp.proto.grpc.exporter import (
+    _get_credentials,
+    environ_to_compression,
+)
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import (
+    _count_data_points,
+    _split_metrics_data,
+)
+from opentelemetry.metrics import MeterProvider
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceRequest,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import (
+    MetricsServiceStub,
+)
+from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_GRPC_METRICS_CREDENTIAL_PROVIDER,
+    OTEL_EXPORTER_OTLP_METRICS_CERTIFICATE,
+    OTEL_EXPORTER_OTLP_METRICS_CLIENT_CERTIFICATE,
+    OTEL_EXPORTER_OTLP_METRICS_CLIENT_KEY,
+    OTEL_EXPORTER_OTLP_METRICS_COMPRESSION,
+    OTEL_EXPORTER_OTLP_METRICS_ENDPOINT,
+    OTEL_EXPORTER_OTLP_METRICS_HEADERS,
+    OTEL_EXPORTER_OTLP_METRICS_INSECURE,
+    OTEL_EXPORTER_OTLP_METRICS_TIMEOUT,
+)
+from opentelemetry.sdk.metrics._internal.aggregation import Aggregation
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    AsyncMetricExporter,
+    MetricExportResult,
+    MetricsData,
+)
+from opentelemetry.semconv._incubating.attributes.otel_attributes import (
+    OtelComponentTypeValues,
+)
+
+
+class OTLPMetricExporter(
+    AsyncMetricExporter,
+    OTLPExporterMixin[
+        MetricsData,
+        ExportMetricsServiceRequest,
+        MetricExportResult,
+        MetricsServiceStub,
+    ],
+    OTLPMetricExporterMixin,
+):
+    """OTLP metric exporter for asyncio, to be used with an
+    `opentelemetry.sdk.metrics.export.AsyncPeriodicExportingMetricReader`.
+
+    Args:
+        endpoint: Target URL to which the exporter is going to send metrics
+        max_export_batch_size: Maximum number of data points to export in a single request. This is to deal with
+            gRPC's 4MB message size limit. If not set there is no limit to the number of data points in a request.
+            If it is set and the number of data points exceeds the max, the request will be split.
+    """
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        insecure: bool | None = None,
+        credentials: ChannelCredentials | None = None,
+        headers: TypingSequence[tuple[str, str]] | dict[str, str] | str | None = None,
+        timeout: float | None = None,
+        compression: Compression | None = None,
+        preferred_temporality: dict[type, AggregationTemporality] | None = None,
+        preferred_aggregation: dict[type, Aggregation] | None = None,
+        max_export_batch_size: int | None = None,
+        channel_options: tuple[tuple[str, str]] | None = None,
+        retryable_error_codes: Iterable[StatusCode] | None = None,
+        *,
+        meter_provider: MeterProvider | None = None,
+    ):
+        insecure_metrics = environ.get(OTEL_EXPORTER_OTLP_METRICS_INSECURE)
+        if insecure is None and insecure_metrics is not None:
+            insecure = insecure_metrics.lower() == "true"
+
+        if not insecure and environ.get(OTEL_EXPORTER_OTLP_METRICS_CERTIFICATE) is not None:
+            credentials = _get_credentials(
+                credentials,
+                _OTEL_PYTHON_EXPORTER_OTLP_GRPC_METRICS_CREDENTIAL_PROVIDER,
+                OTEL_EXPORTER_OTLP_METRICS_CERTIFICATE,
+                OTEL_EXPORTER_OTLP_METRICS_CLIENT_KEY,
+                OTEL_EXPORTER_OTLP_METRICS_CLIENT_CERTIFICATE,
+            )
+
+        environ_timeout = environ.get(OTEL_EXPORTER_OTLP_METRICS_TIMEOUT)
+        environ_timeout = float(environ_timeout) if environ_timeout is not None else None
+
+        compression = (
+            environ_to_compression(OTEL_EXPORTER_OTLP_METRICS_COMPRESSION) if compression is None else compression
+        )
+
+        AsyncMetricExporter.__init__(
+            self,
+            preferred_temporality=self._get_temporality(preferred_temporality),
+            preferred_aggregation=self._get_aggregation(preferred_aggregation),
+        )
+
+        OTLPExporterMixin.__init__(
+            self,
+            stub=MetricsServiceStub,
+            result=MetricExportResult,
+            endpoint=endpoint or environ.get(OTEL_EXPORTER_OTLP_METRICS_ENDPOINT),
+            insecure=insecure,
+            credentials=credentials,
+            headers=headers or environ.get(OTEL_EXPORTER_OTLP_METRICS_HEADERS),
+            timeout=timeout or environ_timeout,
+            compression=compression,
+            channel_options=channel_options,
+            retryable_error_codes=retryable_error_codes,
+            component_type=OtelComponentTypeValues.OTLP_GRPC_METRIC_EXPORTER,
+            signal="metrics",
+            meter_provider=meter_provider,
+        )
+
+        self._max_export_batch_size: int | None = max_export_batch_size
+
+    def _translate_data(  # type: ignore [reportIncompatibleMethodOverride]
+        self, data: MetricsData
+    ) -> ExportMetricsServiceRequest:
+        return encode_metrics(data)
+
+    def _count_data(self, data: MetricsData):
+        return _count_data_points(data)
+
+    async def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        if self._max_export_batch_size is None:
+            return await self._export(data=metrics_data)
+
+        export_result = MetricExportResult.SUCCESS
+
+        for split_metrics_data in _split_metrics_data(metrics_data, self._max_export_batch_size):
+            split_export_result = await self._export(data=split_metrics_data)
+
+            if split_export_result is MetricExportResult.FAILURE:
+                export_result = MetricExportResult.FAILURE
+        return export_result
+
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        await OTLPExporterMixin.shutdown(self, timeout_millis=timeout_millis)
+
+    @property
+    def _exporting(self) -> str:
+        return "metrics"
+
+    async def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        """Nothing is buffered in this exporter, so this method does nothing."""
+        return True
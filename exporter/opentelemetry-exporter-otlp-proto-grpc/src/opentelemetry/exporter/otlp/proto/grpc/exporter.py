@@ -45,6 +45,7 @@ from grpc import (
     ssl_channel_credentials,
 )
 from opentelemetry.exporter.otlp.proto.common._exporter_metrics import (
+    ExportResult,
     create_exporter_metrics,
 )
 from opentelemetry.exporter.otlp.proto.common._internal import (
@@ -245,22 +246,11 @@ def _get_credentials(
 
 
 # pylint: disable=no-member
-class OTLPExporterMixin(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResultT, ExportStubT]):
-    """OTLP gRPC exporter mixin.
-
-    This class provides the base functionality for OTLP exporters that send
-    telemetry data (spans or metrics) to an OTLP-compatible receiver via gRPC.
-    It includes a configurable reconnection mechanism to handle transient
-    receiver outages.
+class _OTLPExporterBase(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResultT, ExportStubT]):
+    """Configuration and retry policy shared by the synchronous and the asyncio
+    OTLP gRPC exporter mixins, which implement the channel and the exports.
 
-    Args:
-        endpoint: OTLP-compatible receiver endpoint
-        insecure: Connection type
-        credentials: ChannelCredentials object for server authentication
-        headers: Headers to send when exporting
-        timeout: Backend request timeout in seconds
-        compression: gRPC compression method to use
-        channel_options: gRPC channel options
+    Takes the arguments documented on `OTLPExporterMixin`.
     """
 
     def __init__(
@@ -344,7 +334,6 @@ class OTLPExporterMixin(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResu
         self._channel = None
         self._client = None
 
-        self._shutdown_in_progress = threading.Event()
         self._shutdown = False
 
         if not self._insecure:
@@ -369,6 +358,125 @@ class OTLPExporterMixin(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResu
 
         self._initialize_channel_and_stub()
 
+    @abstractmethod
+    def _initialize_channel_and_stub(self):
+        pass
+
+    @abstractmethod
+    def _translate_data(
+        self,
+        data: SDKDataT,
+    ) -> ExportServiceRequestT:
+        pass
+
+    def _export_request(
+        self,
+        data: SDKDataT,
+        timeout: float,  # pylint: disable=unused-argument
+    ) -> ExportServiceRequestT | bytes:
+        """Returns the request passed to the stub, which may be serialized
+        already. ``timeout`` is the number of seconds left before the export
+        deadline."""
+        return self._translate_data(data)
+
+    @abstractmethod
+    def _count_data(
+        self,
+        data: SDKDataT,
+    ) -> int:
+        pass
+
+    def _retry_backoff(
+        self,
+        error: RpcError,
+        retry_num: int,
+        deadline_sec: float,
+        result: ExportResult,
+    ) -> float | None:
+        """
+        Returns the seconds to wait before retrying an export that failed with
+        error, or None if the export is given up, in which case the failure is
+        logged and recorded in result.
+        """
+        retry_info_bin = dict(error.trailing_metadata()).get(  # type: ignore [reportAttributeAccessIssue]
+            "google.rpc.retryinfo-bin"  # type: ignore [reportArgumentType]
+        )
+        # multiplying by a random number between .8 and 1.2 introduces a +/20% jitter to each backoff.
+        backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
+        if retry_info_bin is not None:
+            retry_info = RetryInfo()
+            retry_info.ParseFromString(retry_info_bin)
+            backoff_seconds = retry_info.retry_delay.seconds + retry_info.retry_delay.nanos / 1.0e9
+
+        if (
+            error.code() not in self._retryable_error_codes  # type: ignore [reportAttributeAccessIssue]
+            or retry_num + 1 == _MAX_RETRYS
+            or backoff_seconds > (deadline_sec - time())
+            or self._shutdown
+        ):
+            logger.error(
+                "Failed to export %s to %s, error code: %s, error details: %s",
+                self._exporting,
+                self._endpoint,
+                error.code(),  # type: ignore [reportAttributeAccessIssue]
+                error.details(),
+                exc_info=error.code() == StatusCode.UNKNOWN,  # type: ignore [reportAttributeAccessIssue]
+            )
+            result.error = error
+            result.error_attrs = {RPC_RESPONSE_STATUS_CODE: error.code().name}
+            return None
+        logger.warning(
+            "Transient error %s encountered while exporting %s to %s, retrying in %.2fs. Error details: %s",
+            error.code(),  # type: ignore [reportAttributeAccessIssue]
+            self._exporting,
+            self._endpoint,
+            backoff_seconds,
+            error.details(),
+        )
+        return backoff_seconds
+
+    @property
+    @abstractmethod
+    def _exporting(self) -> str:
+        """
+        Returns a string that describes the overall exporter, to be used in
+        warning messages.
+        """
+        pass
+
+    def _set_meter_provider(self, meter_provider: MeterProvider) -> None:
+        self._metrics = create_exporter_metrics(
+            self._component_type,
+            self._signal,
+            self._parsed_url,
+            meter_provider,
+            os.environ.get(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED, "").strip().lower() == "true",
+        )
+
+
+# pylint: disable=no-member
+class OTLPExporterMixin(_OTLPExporterBase[SDKDataT, ExportServiceRequestT, ExportResultT, ExportStubT]):
+    """OTLP gRPC exporter mixin.
+
+    This class provides the base functionality for OTLP exporters that send
+    telemetry data (spans or metrics) to an OTLP-compatible receiver via gRPC.
+    It includes a configurable reconnection mechanism to handle transient
+    receiver outages.
+
+    Args:
+        endpoint: OTLP-compatible receiver endpoint
+        insecure: Connection type
+        credentials: ChannelCredentials object for server authentication
+        headers: Headers to send when exporting
+        timeout: Backend request timeout in seconds
+        compression: gRPC compression method to use
+        channel_options: gRPC channel options
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._shutdown_in_progress = threading.Event()
+        super().__init__(*args, **kwargs)
+
     def _initialize_channel_and_stub(self):
         """
         Create a new gRPC channel and stub.
@@ -392,20 +500,6 @@ class OTLPExporterMixin(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResu
             )
         self._client = self._stub(self._channel)  # type: ignore [reportCallIssue]
 
-    @abstractmethod
-    def _translate_data(
-        self,
-        data: SDKDataT,
-    ) -> ExportServiceRequestT:
-        pass
-
-    @abstractmethod
-    def _count_data(
-        self,
-        data: SDKDataT,
-    ) -> int:
-        pass
-
     def _export(
         self,
         data: SDKDataT,
@@ -424,22 +518,12 @@ class OTLPExporterMixin(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResu
                     if self._client is None:
                         return self._result.FAILURE
                     self._client.Export(
-                        request=self._translate_data(data),
+                        request=self._export_request(data, deadline_sec - time()),
                         metadata=self._headers,
                         timeout=deadline_sec - time(),
                     )
                     return self._result.SUCCESS  # type: ignore [reportReturnType]
                 except RpcError as error:
-                    retry_info_bin = dict(error.trailing_metadata()).get(  # type: ignore [reportAttributeAccessIssue]
-                        "google.rpc.retryinfo-bin"  # type: ignore [reportArgumentType]
-                    )
-                    # multiplying by a random number between .8 and 1.2 introduces a +/20% jitter to each backoff.
-                    backoff_seconds = 2**retry_num * random.uniform(0.8, 1.2)
-                    if retry_info_bin is not None:
-                        retry_info = RetryInfo()
-                        retry_info.ParseFromString(retry_info_bin)
-                        backoff_seconds = retry_info.retry_delay.seconds + retry_info.retry_delay.nanos / 1.0e9
-
                     # For UNAVAILABLE errors, reinitialize the channel to force reconnection
                     if error.code() == StatusCode.UNAVAILABLE and retry_num == 0:  # type: ignore
                         logger.debug(
@@ -459,31 +543,9 @@ class OTLPExporterMixin(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResu
                         # Enable channel reconnection for subsequent calls
                         self._initialize_channel_and_stub()
 
-                    if (
-                        error.code() not in self._retryable_error_codes  # type: ignore [reportAttributeAccessIssue]
-                        or retry_num + 1 == _MAX_RETRYS
-                        or backoff_seconds > (deadline_sec - time())
-                        or self._shutdown
-                    ):
-                        logger.error(
-                            "Failed to export %s to %s, error code: %s, error details: %s",
-                            self._exporting,
-                            self._endpoint,
-                            error.code(),  # type: ignore [reportAttributeAccessIssue]
-                            error.details(),
-                            exc_info=error.code() == StatusCode.UNKNOWN,  # type: ignore [reportAttributeAccessIssue]
-                        )
-                        result.error = error
-                        result.error_attrs = {RPC_RESPONSE_STATUS_CODE: error.code().name}
+                    backoff_seconds = self._retry_backoff(error, retry_num, deadline_sec, result)
+                    if backoff_seconds is None:
                         return self._result.FAILURE  # type: ignore [reportReturnType]
-                    logger.warning(
-                        "Transient error %s encountered while exporting %s to %s, retrying in %.2fs. Error details: %s",
-                        error.code(),  # type: ignore [reportAttributeAccessIssue]
-                        self._exporting,
-                        self._endpoint,
-                        backoff_seconds,
-                        error.details(),
-                    )
                 shutdown = self._shutdown_in_progress.wait(backoff_seconds)
                 if shutdown:
                     logger.warning("Shutdown in progress, aborting retry.")
@@ -505,21 +567,3 @@ class OTLPExporterMixin(ABC, Generic[SDKDataT, ExportServiceRequestT, ExportResu
         self._shutdown_in_progress.set()
         if self._channel:
             self._channel.close()
-
-    @property
-    @abstractmethod
-    def _exporting(self) -> str:
-        """
-        Returns a string that describes the overall exporter, to be used in
-        warning messages.
-        """
-        pass
-
-    def _set_meter_provider(self, meter_provider: MeterProvider) -> None:
-        self._metrics = create_exporter_metrics(
-            self._component_type,
-            self._signal,
-            self._parsed_url,
-            meter_provider,
-            os.environ.get(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED, "").strip().lower() == "true",
-        )
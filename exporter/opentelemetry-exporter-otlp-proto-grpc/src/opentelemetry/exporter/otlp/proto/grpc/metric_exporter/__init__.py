@@ -70,6 +70,99 @@ from opentelemetry.semconv._incubating.attributes.otel_attributes import (
 _logger = getLogger(__name__)
 
 
+def _count_data_points(data: MetricsData) -> int:
+    num_items = 0
+
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                num_items += len(metric.data.data_points)
+
+    return num_items
+
+
+def _split_metrics_data(
+    metrics_data: MetricsData,
+    max_export_batch_size: int,
+) -> Iterable[MetricsData]:
+    batch_size: int = 0
+    split_resource_metrics: list[ResourceMetrics] = []
+
+    for resource_metrics in metrics_data.resource_metrics:
+        split_scope_metrics: list[ScopeMetrics] = []
+        split_resource_metrics.append(
+            replace(
+                resource_metrics,
+                scope_metrics=split_scope_metrics,
+            )
+        )
+        for scope_metrics in resource_metrics.scope_metrics:
+            split_metrics: list[Metric] = []
+            split_scope_metrics.append(
+                replace(
+                    scope_metrics,
+                    metrics=split_metrics,
+                )
+            )
+            for metric in scope_metrics.metrics:
+                split_data_points: list[DataPointT] = []
+                split_metrics.append(
+                    replace(
+                        metric,
+                        data=replace(
+                            metric.data,
+                            data_points=split_data_points,
+                        ),
+                    )
+                )
+
+                for data_point in metric.data.data_points:
+                    split_data_points.append(data_point)
+                    batch_size += 1
+
+                    if batch_size >= max_export_batch_size:
+                        yield MetricsData(resource_metrics=split_resource_metrics)
+                        # Reset all the variables
+                        batch_size = 0
+                        split_data_points = []
+                        split_metrics = [
+                            replace(
+                                metric,
+                                data=replace(
+                                    metric.data,
+                                    data_points=split_data_points,
+                                ),
+                            )
+                        ]
+                        split_scope_metrics = [
+                            replace(
+                                scope_metrics,
+                                metrics=split_metrics,
+                            )
+                        ]
+                        split_resource_metrics = [
+                            replace(
+                                resource_metrics,
+                                scope_metrics=split_scope_metrics,
+                            )
+                        ]
+
+                if not split_data_points:
+                    # If data_points is empty remove the whole metric
+                    split_metrics.pop()
+
+            if not split_metrics:
+                # If metrics is empty remove the whole scope_metrics
+                split_scope_metrics.pop()
+
+        if not split_scope_metrics:
+            # If scope_metrics is empty remove the whole resource_metrics
+            split_resource_metrics.pop()
+
+    if batch_size > 0:
+        yield MetricsData(resource_metrics=split_resource_metrics)
+
+
 class OTLPMetricExporter(
     MetricExporter,
     OTLPExporterMixin[
@@ -152,14 +245,7 @@ class OTLPMetricExporter(
         return encode_metrics(data)
 
     def _count_data(self, data: MetricsData):
-        num_items = 0
-
-        for resource_metrics in data.resource_metrics:
-            for scope_metrics in resource_metrics.scope_metrics:
-                for metric in scope_metrics.metrics:
-                    num_items += len(metric.data.data_points)
-
-        return num_items
+        return _count_data_points(data)
 
     def export(
         self,
@@ -185,82 +271,7 @@ class OTLPMetricExporter(
         metrics_data: MetricsData,
     ) -> Iterable[MetricsData]:
         assert self._max_export_batch_size is not None
-        batch_size: int = 0
-        split_resource_metrics: list[ResourceMetrics] = []
-
-        for resource_metrics in metrics_data.resource_metrics:
-            split_scope_metrics: list[ScopeMetrics] = []
-            split_resource_metrics.append(
-                replace(
-                    resource_metrics,
-                    scope_metrics=split_scope_metrics,
-                )
-            )
-            for scope_metrics in resource_metrics.scope_metrics:
-                split_metrics: list[Metric] = []
-                split_scope_metrics.append(
-                    replace(
-                        scope_metrics,
-                        metrics=split_metrics,
-                    )
-                )
-                for metric in scope_metrics.metrics:
-                    split_data_points: list[DataPointT] = []
-                    split_metrics.append(
-                        replace(
-                            metric,
-                            data=replace(
-                                metric.data,
-                                data_points=split_data_points,
-                            ),
-                        )
-                    )
-
-                    for data_point in metric.data.data_points:
-                        split_data_points.append(data_point)
-                        batch_size += 1
-
-                        if batch_size >= self._max_export_batch_size:
-                            yield MetricsData(resource_metrics=split_resource_metrics)
-                            # Reset all the variables
-                            batch_size = 0
-                            split_data_points = []
-                            split_metrics = [
-                                replace(
-                                    metric,
-                                    data=replace(
-                                        metric.data,
-                                        data_points=split_data_points,
-                                    ),
-                                )
-                            ]
-                            split_scope_metrics = [
-                                replace(
-                                    scope_metrics,
-                                    metrics=split_metrics,
-                                )
-                            ]
-                            split_resource_metrics = [
-                                replace(
-                                    resource_metrics,
-                                    scope_metrics=split_scope_metrics,
-                                )
-                            ]
-
-                    if not split_data_points:
-                        # If data_points is empty remove the whole metric
-                        split_metrics.pop()
-
-                if not split_metrics:
-                    # If metrics is empty remove the whole scope_metrics
-                    split_scope_metrics.pop()
-
-            if not split_scope_metrics:
-                # If scope_metrics is empty remove the whole resource_metrics
-                split_resource_metrics.pop()
-
-        if batch_size > 0:
-            yield MetricsData(resource_metrics=split_resource_metrics)
+        return _split_metrics_data(metrics_data, self._max_export_batch_size)
 
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
         OTLPExporterMixin.shutdown(self, timeout_millis=timeout_millis)
@@ -9,8 +9,12 @@ from collections.abc import Sequence as TypingSequence
 from os import environ
 
 from grpc import ChannelCredentials, Compression, StatusCode
+from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder._process_pool import (
+    _new_process_pool_span_serializer,
+)
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
     encode_spans,
+    serialize_spans,
 )
 from opentelemetry.exporter.otlp.proto.grpc.exporter import (  # noqa: F401
     OTLPExporterMixin,
@@ -21,8 +25,9 @@ from opentelemetry.exporter.otlp.proto.grpc.exporter import (  # noqa: F401
 from opentelemetry.metrics import MeterProvider
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
+    ExportTraceServiceResponse,
 )
-from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (  # noqa: F401
     TraceServiceStub,
 )
 from opentelemetry.proto.common.v1.common_pb2 import (  # noqa: F401
@@ -56,6 +61,17 @@ from opentelemetry.semconv._incubating.attributes.otel_attributes import (
 logger = logging.getLogger(__name__)
 
 
+class _SerializedTraceServiceStub:
+    """TraceServiceStub exporting requests that are serialized already."""
+
+    def __init__(self, channel):
+        self.Export = channel.unary_unary(  # pylint: disable=invalid-name
+            "/opentelemetry.proto.collector.trace.v1.TraceService/Export",
+            response_deserializer=ExportTraceServiceResponse.FromString,
+            _registered_method=True,
+        )
+
+
 # pylint: disable=no-member
 class OTLPSpanExporter(
     SpanExporter,
@@ -63,7 +79,7 @@ class OTLPSpanExporter(
         Sequence[ReadableSpan],
         ExportTraceServiceRequest,
         SpanExportResult,
-        TraceServiceStub,
+        _SerializedTraceServiceStub,
     ],
 ):
     # pylint: disable=unsubscriptable-object
@@ -113,7 +129,7 @@ class OTLPSpanExporter(
 
         OTLPExporterMixin.__init__(
             self,
-            stub=TraceServiceStub,
+            stub=_SerializedTraceServiceStub,
             result=SpanExportResult,
             endpoint=endpoint or environ.get(OTEL_EXPORTER_OTLP_TRACES_ENDPOINT),
             insecure=insecure,
@@ -127,10 +143,16 @@ class OTLPSpanExporter(
             signal="traces",
             meter_provider=meter_provider,
         )
+        self._process_pool_serializer = _new_process_pool_span_serializer()
 
     def _translate_data(self, data: Sequence[ReadableSpan]) -> ExportTraceServiceRequest:
         return encode_spans(data)
 
+    def _export_request(self, data: Sequence[ReadableSpan], timeout: float) -> bytes:
+        if self._process_pool_serializer is not None:
+            return self._process_pool_serializer(data, timeout)
+        return serialize_spans(data)
+
     def _count_data(self, data: Sequence[ReadableSpan]):
         return len(data)
 
@@ -139,6 +161,8 @@ class OTLPSpanExporter(
 
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
         OTLPExporterMixin.shutdown(self, timeout_millis=timeout_millis)
+        if self._process_pool_serializer is not None:
+            self._process_pool_serializer.shutdown()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Nothing is buffered in this exporter, so this method does nothing."""
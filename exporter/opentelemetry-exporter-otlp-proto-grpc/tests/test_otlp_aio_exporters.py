@@ -0,0 +1,276 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access,invalid-name
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import grpc
+from google.protobuf.duration_pb2 import (  # pylint: disable=no-name-in-module
+    Duration,
+)
+from google.rpc.error_details_pb2 import (  # pylint: disable=no-name-in-module
+    RetryInfo,
+)
+
+from opentelemetry._logs import LogRecord
+from opentelemetry.exporter.otlp.proto.grpc.aio._log_exporter import (
+    OTLPLogExporter,
+)
+from opentelemetry.exporter.otlp.proto.grpc.aio.metric_exporter import (
+    OTLPMetricExporter,
+)
+from opentelemetry.exporter.otlp.proto.grpc.aio.trace_exporter import (
+    OTLPSpanExporter,
+)
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+    ExportLogsServiceResponse,
+)
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2_grpc import (
+    LogsServiceServicer,
+    add_LogsServiceServicer_to_server,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceResponse,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2_grpc import (
+    MetricsServiceServicer,
+    add_MetricsServiceServicer_to_server,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceResponse,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
+    TraceServiceServicer,
+    add_TraceServiceServicer_to_server,
+)
+from opentelemetry.sdk._logs import ReadWriteLogRecord
+from opentelemetry.sdk._logs.export import AsyncBatchLogRecordProcessor
+from opentelemetry.sdk.metrics.export import (
+    AsyncPeriodicExportingMetricReader,
+    MetricExportResult,
+    MetricsData,
+    ResourceMetrics,
+    ScopeMetrics,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    AsyncBatchSpanProcessor,
+    SimpleSpanProcessor,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.test.metrictestutil import _generate_sum
+
+# The servicers of the three signals share the name of their Export method,
+# the response is picked from the type of the request.
+_RESPONSES = {
+    "ExportTraceServiceRequest": ExportTraceServiceResponse(),
+    "ExportMetricsServiceRequest": ExportMetricsServiceResponse(),
+    "ExportLogsServiceRequest": ExportLogsServiceResponse(),
+}
+
+
+class ServicerForTesting(TraceServiceServicer, MetricsServiceServicer, LogsServiceServicer):
+    def __init__(self):
+        self.requests = []
+        self.metadata = []
+        # Each entry is the status code of a request and the retry delay sent
+        # with it, if any.
+        self.errors = []
+        self.sleep = 0
+
+    # grpc.aio runs coroutine handlers, unlike the generated servicer bases.
+    async def Export(self, request, context):  # pylint: disable=invalid-overridden-method
+        self.requests.append(request)
+        self.metadata.append(dict(context.invocation_metadata()))
+        await asyncio.sleep(self.sleep)
+        if self.errors:
+            code, retry_delay = self.errors.pop(0)
+            if retry_delay is not None:
+                context.set_trailing_metadata(
+                    (
+                        (
+                            "google.rpc.retryinfo-bin",
+                            RetryInfo(retry_delay=retry_delay).SerializeToString(),
+                        ),
+                    )
+                )
+            context.set_code(code)
+        return _RESPONSES[type(request).__name__]
+
+
+def _metrics_data(num_metrics: int) -> MetricsData:
+    return MetricsData(
+        resource_metrics=[
+            ResourceMetrics(
+                resource=Resource({"a": 1}),
+                scope_metrics=[
+                    ScopeMetrics(
+                        scope=InstrumentationScope("first_name"),
+                        metrics=[_generate_sum(f"sum_int_{idx}", 33) for idx in range(num_metrics)],
+                        schema_url="",
+                    )
+                ],
+                schema_url="",
+            )
+        ]
+    )
+
+
+class TestAsyncOTLPExporters(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        # pylint: disable=attribute-defined-outside-init
+        environ_patcher = patch.dict("os.environ", {}, clear=True)
+        environ_patcher.start()
+        self.addCleanup(environ_patcher.stop)
+
+        self.servicer = ServicerForTesting()
+        self.server = grpc.aio.server()
+        add_TraceServiceServicer_to_server(self.servicer, self.server)
+        add_MetricsServiceServicer_to_server(self.servicer, self.server)
+        add_LogsServiceServicer_to_server(self.servicer, self.server)
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        self.endpoint = f"http://127.0.0.1:{port}"
+        await self.server.start()
+        self.addAsyncCleanup(self.server.stop, None)
+
+    @staticmethod
+    def _spans():
+        in_memory = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(in_memory))
+        with provider.get_tracer(__name__).start_as_current_span("span"):
+            pass
+        return in_memory.get_finished_spans()
+
+    async def test_channel_created_on_first_export(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint)
+        self.assertIsNone(exporter._channel)
+
+        self.assertEqual(await exporter.export(self._spans()), SpanExportResult.SUCCESS)
+
+        self.assertIsInstance(exporter._channel, grpc.aio.Channel)
+        await exporter.shutdown()
+        self.assertIsNone(exporter._channel)
+
+    async def test_batch_span_processor_exports_spans(self):
+        processor = AsyncBatchSpanProcessor(OTLPSpanExporter(endpoint=self.endpoint, headers={"key": "value"}))
+        provider = TracerProvider()
+        provider.add_span_processor(processor)
+        with provider.get_tracer(__name__).start_as_current_span("span"):
+            pass
+
+        await processor.shutdown_async()
+
+        self.assertEqual(len(self.servicer.requests), 1)
+        request = self.servicer.requests[0]
+        self.assertEqual(request.resource_spans[0].scope_spans[0].spans[0].name, "span")
+        self.assertEqual(self.servicer.metadata[0]["key"], "value")
+
+    async def test_batch_log_record_processor_exports_logs(self):
+        processor = AsyncBatchLogRecordProcessor(OTLPLogExporter(endpoint=self.endpoint))
+        processor.on_emit(
+            ReadWriteLogRecord(
+                LogRecord(body="log"),
+                resource=Resource({}),
+                instrumentation_scope=InstrumentationScope("scope"),
+            )
+        )
+
+        await processor.shutdown_async()
+
+        self.assertEqual(len(self.servicer.requests), 1)
+        request = self.servicer.requests[0]
+        self.assertEqual(request.resource_logs[0].scope_logs[0].log_records[0].body.string_value, "log")
+
+    async def test_metric_reader_exports_metrics(self):
+        reader = AsyncPeriodicExportingMetricReader(OTLPMetricExporter(endpoint=self.endpoint))
+        reader._set_collect_callback(lambda reader, timeout_millis: _metrics_data(1))
+
+        await reader.shutdown_async()
+
+        self.assertEqual(len(self.servicer.requests), 1)
+        request = self.servicer.requests[0]
+        self.assertEqual(request.resource_metrics[0].scope_metrics[0].metrics[0].name, "sum_int_0")
+
+    async def test_metric_export_split_in_batches(self):
+        exporter = OTLPMetricExporter(endpoint=self.endpoint, max_export_batch_size=2)
+
+        self.assertEqual(await exporter.export(_metrics_data(5)), MetricExportResult.SUCCESS)
+
+        self.assertEqual(
+            [len(request.resource_metrics[0].scope_metrics[0].metrics) for request in self.servicer.requests],
+            [2, 2, 1],
+        )
+        await exporter.shutdown()
+
+    async def test_unavailable_retried_on_new_channel(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint)
+        self.assertEqual(await exporter.export(self._spans()), SpanExportResult.SUCCESS)
+        channel = exporter._channel
+
+        self.servicer.errors = [(grpc.StatusCode.UNAVAILABLE, Duration(nanos=10_000_000))]
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(await exporter.export(self._spans()), SpanExportResult.SUCCESS)
+
+        self.assertIn("Transient error StatusCode.UNAVAILABLE", logs.output[0])
+        self.assertEqual(len(self.servicer.requests), 3)
+        self.assertIsNot(exporter._channel, channel)
+        await exporter.shutdown()
+
+    async def test_non_retryable_error(self):
+        self.servicer.errors = [(grpc.StatusCode.INVALID_ARGUMENT, None)]
+        exporter = OTLPSpanExporter(endpoint=self.endpoint)
+
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(await exporter.export(self._spans()), SpanExportResult.FAILURE)
+
+        self.assertIn("error code: StatusCode.INVALID_ARGUMENT", logs.output[0])
+        self.assertEqual(len(self.servicer.requests), 1)
+        await exporter.shutdown()
+
+    async def test_shutdown_interrupts_retry_backoff(self):
+        self.servicer.errors = [(grpc.StatusCode.UNAVAILABLE, Duration(seconds=5))]
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, timeout=30)
+        export = asyncio.create_task(exporter.export(self._spans()))
+        while not self.servicer.requests:
+            await asyncio.sleep(0.01)
+
+        with self.assertLogs(level="WARNING") as logs:
+            await exporter.shutdown()
+            self.assertEqual(await asyncio.wait_for(export, 1), SpanExportResult.FAILURE)
+
+        self.assertIn("Shutdown in progress, aborting retry.", logs.output[-1])
+        self.assertEqual(len(self.servicer.requests), 1)
+
+    async def test_shutdown_cancels_export_in_progress(self):
+        self.servicer.sleep = 10
+        exporter = OTLPSpanExporter(endpoint=self.endpoint, timeout=30)
+        export = asyncio.create_task(exporter.export(self._spans()))
+        while not self.servicer.requests:
+            await asyncio.sleep(0.01)
+
+        with self.assertLogs(level="WARNING") as logs:
+            await exporter.shutdown()
+            self.assertEqual(await asyncio.wait_for(export, 1), SpanExportResult.FAILURE)
+
+        self.assertIn("Shutdown in progress, export of traces cancelled.", logs.output[0])
+
+    async def test_export_after_shutdown(self):
+        exporter = OTLPSpanExporter(endpoint=self.endpoint)
+        await exporter.shutdown()
+
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(await exporter.export(self._spans()), SpanExportResult.FAILURE)
+            await exporter.shutdown()
+
+        self.assertIn("Exporter already shutdown, ignoring batch", logs.output[0])
+        self.assertIn("Exporter already shutdown, ignoring call", logs.output[1])
+        self.assertEqual(self.servicer.requests, [])
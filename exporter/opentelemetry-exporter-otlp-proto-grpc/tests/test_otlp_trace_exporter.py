@@ -4,10 +4,11 @@
 # pylint: disable=too-many-lines
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import Mock, PropertyMock, patch
 
-from grpc import ChannelCredentials, Compression
+from grpc import ChannelCredentials, Compression, server
 
 from opentelemetry.attributes import BoundedAttributes
 from opentelemetry.exporter.otlp.proto.common._internal import (
@@ -19,6 +20,11 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
 from opentelemetry.exporter.otlp.proto.grpc.version import __version__
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
+    ExportTraceServiceResponse,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
+    TraceServiceServicer,
+    add_TraceServiceServicer_to_server,
 )
 from opentelemetry.proto.common.v1.common_pb2 import (
     AnyValue,
@@ -38,6 +44,7 @@ from opentelemetry.proto.trace.v1.trace_pb2 import (
 )
 from opentelemetry.proto.trace.v1.trace_pb2 import Span as OTLPSpan
 from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES,
     OTEL_EXPORTER_OTLP_COMPRESSION,
     OTEL_EXPORTER_OTLP_TRACES_CERTIFICATE,
     OTEL_EXPORTER_OTLP_TRACES_CLIENT_CERTIFICATE,
@@ -54,6 +61,7 @@ from opentelemetry.sdk.trace import StatusCode as SDKStatusCode
 from opentelemetry.sdk.trace import TracerProvider, _Span
 from opentelemetry.sdk.trace.export import (
     SimpleSpanProcessor,
+    SpanExportResult,
 )
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 from opentelemetry.test.spantestutil import (
@@ -664,6 +672,46 @@ class TestOTLPSpanExporter(TestCase):
             translated.resource_spans[0].scope_spans[0].spans[0].events[0].dropped_attributes_count,
         )
 
+    def _start_recording_server(self):
+        requests = []
+
+        class TraceServiceServicerRecordingRequests(TraceServiceServicer):
+            # pylint: disable=invalid-name,unused-argument
+            def Export(self, request, context):
+                requests.append(request)
+                return ExportTraceServiceResponse()
+
+        grpc_server = server(ThreadPoolExecutor(max_workers=1))
+        add_TraceServiceServicer_to_server(TraceServiceServicerRecordingRequests(), grpc_server)
+        port = grpc_server.add_insecure_port("127.0.0.1:0")
+        grpc_server.start()
+        self.addCleanup(grpc_server.stop, None)
+        return port, requests
+
+    def test_export_serialized_spans(self):
+        port, requests = self._start_recording_server()
+
+        exporter = OTLPSpanExporter(endpoint=f"127.0.0.1:{port}", insecure=True)
+        self.addCleanup(exporter.shutdown)
+        spans = [get_span_with_dropped_attributes_events_links(), self.span2, self.span3]
+        self.assertEqual(exporter.export(spans), SpanExportResult.SUCCESS)
+        # pylint: disable=protected-access
+        self.assertEqual(requests, [exporter._translate_data(spans)])
+
+    @patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES: "1"})
+    def test_export_spans_serialized_in_process_pool(self):
+        port, requests = self._start_recording_server()
+
+        exporter = OTLPSpanExporter(endpoint=f"127.0.0.1:{port}", insecure=True)
+        spans = [get_span_with_dropped_attributes_events_links()]
+        self.assertEqual(exporter.export(spans), SpanExportResult.SUCCESS)
+        # pylint: disable=protected-access
+        self.assertEqual(requests, [exporter._translate_data(spans)])
+        self.assertIsNotNone(exporter._process_pool_serializer._executor)
+
+        exporter.shutdown()
+        self.assertIsNone(exporter._process_pool_serializer._executor)
+
 
 def _create_span_with_status(status: SDKStatus):
     span = _Span(
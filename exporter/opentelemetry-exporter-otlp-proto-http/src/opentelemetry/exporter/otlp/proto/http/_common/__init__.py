@@ -9,6 +9,9 @@ from collections.abc import Mapping
 from os import environ
 from typing import TYPE_CHECKING, Literal
 
+from opentelemetry.exporter.http.transport._aiohttp import (
+    AiohttpHTTPTransport,
+)
 from opentelemetry.exporter.http.transport._requests import (
     RequestsHTTPTransport,
 )
@@ -36,7 +39,10 @@ from opentelemetry.util.re import parse_env_headers
 if TYPE_CHECKING:
     import requests
 
-    from opentelemetry.exporter.http.transport._base import BaseHTTPTransport
+    from opentelemetry.exporter.http.transport._base import (
+        AsyncBaseHTTPTransport,
+        BaseHTTPTransport,
+    )
 
     _CredentialEnvVar = Literal[
         "OTEL_PYTHON_EXPORTER_OTLP_HTTP_LOGS_CREDENTIAL_PROVIDER",
@@ -183,15 +189,14 @@ def _resolve_compression(compression_env_var: str) -> _http.Compression:
         return _http.Compression.NONE
 
 
-def _build_transport(
+def _resolve_tls(
     certificate_file: str | None,
     client_key_file: str | None,
     client_certificate_file: str | None,
     certificate_env_var: str,
     client_key_env_var: str,
     client_certificate_env_var: str,
-    session: requests.Session | None,
-) -> BaseHTTPTransport:
+) -> tuple[bool | str, str | tuple[str, str] | None]:
     verify: bool | str = (
         certificate_file
         or os.environ.get(certificate_env_var)
@@ -211,9 +216,48 @@ def _build_transport(
         if client_certificate_file and client_key_file
         else client_certificate_file
     )
+    return verify, cert
+
+
+def _build_transport(
+    certificate_file: str | None,
+    client_key_file: str | None,
+    client_certificate_file: str | None,
+    certificate_env_var: str,
+    client_key_env_var: str,
+    client_certificate_env_var: str,
+    session: requests.Session | None,
+) -> BaseHTTPTransport:
+    verify, cert = _resolve_tls(
+        certificate_file,
+        client_key_file,
+        client_certificate_file,
+        certificate_env_var,
+        client_key_env_var,
+        client_certificate_env_var,
+    )
 
     return (
         RequestsHTTPTransport(verify=verify, cert=cert, session=session)
         if session
         else Urllib3HTTPTransport(verify=verify, cert=cert)
     )
+
+
+def _build_async_transport(
+    certificate_file: str | None,
+    client_key_file: str | None,
+    client_certificate_file: str | None,
+    certificate_env_var: str,
+    client_key_env_var: str,
+    client_certificate_env_var: str,
+) -> AsyncBaseHTTPTransport:
+    verify, cert = _resolve_tls(
+        certificate_file,
+        client_key_file,
+        client_certificate_file,
+        certificate_env_var,
+        client_key_env_var,
+        client_certificate_env_var,
+    )
+    return AiohttpHTTPTransport(verify=verify, cert=cert)
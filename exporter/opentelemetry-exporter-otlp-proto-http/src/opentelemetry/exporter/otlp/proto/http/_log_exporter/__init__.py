@@ -132,11 +132,12 @@ class OTLPLogExporter(LogRecordExporter):
                 measured before compression. A request exceeding this size is
                 dropped before being sent. Defaults to 64 MiB; a value of 0 (or
                 any non-positive value) disables the limit. Batch processors
-                group log records by count rather than serialized size, so a
-                batch whose serialized request exceeds this limit is dropped as
-                a whole and recorded as a failed export; reduce the processor's
-                ``max_export_batch_size`` (or raise/disable this limit) if
-                batches may approach it.
+                group log records by count unless given
+                ``max_export_batch_bytes``, so a batch whose serialized request
+                exceeds this limit is dropped as a whole and recorded as a
+                failed export; set the processor's ``max_export_batch_bytes``
+                comfortably below this limit, or reduce its
+                ``max_export_batch_size``, if batches may approach it.
             meter_provider: MeterProvider used for the exporter's own metrics.
         """
         self._endpoint = endpoint or _resolve_endpoint(OTEL_EXPORTER_OTLP_LOGS_ENDPOINT, DEFAULT_LOGS_EXPORT_PATH)
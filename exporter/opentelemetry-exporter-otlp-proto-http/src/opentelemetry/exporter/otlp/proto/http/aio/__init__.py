@@ -0,0 +1,44 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+
+"""
+OTLP over HTTP exporters for asyncio applications.
+
+The exporters of this package have the names and the configuration of the
+exporters of `opentelemetry.exporter.otlp.proto.http`, but their methods are
+coroutines sending the requests from the event loop of the application with
+``aiohttp``, installed by the ``aiohttp`` extra of this package:
+
+.. code:: sh
+
+    pip install opentelemetry-exporter-otlp-proto-http[aiohttp]
+
+They are used with the asyncio processors and metric reader of the SDK, whose
+exports run as tasks on the event loop. Their shutdown has to be awaited
+before the event loop stops for the telemetry still queued to be exported:
+
+.. code:: python
+
+    import asyncio
+
+    from opentelemetry import trace
+    from opentelemetry.exporter.otlp.proto.http.aio.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import AsyncBatchSpanProcessor
+
+
+    async def main():
+        span_processor = AsyncBatchSpanProcessor(OTLPSpanExporter())
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(span_processor)
+        trace.set_tracer_provider(tracer_provider)
+
+        with trace.get_tracer(__name__).start_as_current_span("foo"):
+            print("Hello world!")
+
+        await span_processor.shutdown_async()
+
+
+    asyncio.run(main())
+"""
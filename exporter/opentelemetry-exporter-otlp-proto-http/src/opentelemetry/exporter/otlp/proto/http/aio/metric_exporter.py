@@ -0,0 +1,261 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, overload
+from urllib.parse import urlparse
+
+from opentelemetry.exporter.otlp.common import http as _http
+from opentelemetry.exporter.otlp.common._aggregation import (
+    _get_aggregation,
+    _get_temporality,
+)
+from opentelemetry.exporter.otlp.proto.common._exporter_metrics import (
+    create_exporter_metrics,
+)
+from opentelemetry.exporter.otlp.proto.common.metrics_encoder import (
+    encode_metrics,
+)
+from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.exporter.otlp.proto.http._common import (
+    _DEFAULT_MAX_REQUEST_SIZE,
+    RequestPayloadTooLargeError,
+    _build_async_transport,
+    _is_request_too_large,
+    _normalize_compression,
+    _resolve_compression,
+    _resolve_endpoint,
+    _resolve_headers,
+    _resolve_timeout,
+)
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import (
+    DEFAULT_METRICS_EXPORT_PATH,
+    _count_data_points,
+    _split_metrics_data,
+)
+from opentelemetry.metrics import MeterProvider
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceRequest,
+)
+from opentelemetry.sdk.environment_variables import (
+    OTEL_EXPORTER_OTLP_METRICS_CERTIFICATE,
+    OTEL_EXPORTER_OTLP_METRICS_CLIENT_CERTIFICATE,
+    OTEL_EXPORTER_OTLP_METRICS_CLIENT_KEY,
+    OTEL_EXPORTER_OTLP_METRICS_COMPRESSION,
+    OTEL_EXPORTER_OTLP_METRICS_ENDPOINT,
+    OTEL_EXPORTER_OTLP_METRICS_HEADERS,
+    OTEL_EXPORTER_OTLP_METRICS_TIMEOUT,
+    OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED,
+)
+from opentelemetry.sdk.metrics._internal.aggregation import Aggregation
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    AsyncMetricExporter,
+    MetricExportResult,
+    MetricsData,
+)
+from opentelemetry.semconv._incubating.attributes.otel_attributes import (
+    OtelComponentTypeValues,
+)
+from opentelemetry.semconv.attributes.http_attributes import (
+    HTTP_RESPONSE_STATUS_CODE,
+)
+
+if TYPE_CHECKING:
+    from opentelemetry.exporter.http.transport._base import (
+        AsyncBaseHTTPTransport,
+    )
+
+_logger = logging.getLogger(__name__)
+
+
+class OTLPMetricExporter(AsyncMetricExporter):
+    @overload
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        certificate_file: str | None = None,
+        client_key_file: str | None = None,
+        client_certificate_file: str | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        compression: Compression | _http.Compression | None = None,
+        preferred_temporality: dict[type, AggregationTemporality] | None = None,
+        preferred_aggregation: dict[type, Aggregation] | None = None,
+        max_export_batch_size: int | None = None,
+        *,
+        max_request_size: int | None = None,
+        meter_provider: MeterProvider | None = None,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        certificate_file: None = None,
+        client_key_file: None = None,
+        client_certificate_file: None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        compression: Compression | _http.Compression | None = None,
+        preferred_temporality: dict[type, AggregationTemporality] | None = None,
+        preferred_aggregation: dict[type, Aggregation] | None = None,
+        max_export_batch_size: int | None = None,
+        *,
+        max_request_size: int | None = None,
+        meter_provider: MeterProvider | None = None,
+        _transport: AsyncBaseHTTPTransport,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        certificate_file: str | None = None,
+        client_key_file: str | None = None,
+        client_certificate_file: str | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        compression: Compression | _http.Compression | None = None,
+        preferred_temporality: dict[type, AggregationTemporality] | None = None,
+        preferred_aggregation: dict[type, Aggregation] | None = None,
+        max_export_batch_size: int | None = None,
+        *,
+        max_request_size: int | None = None,
+        meter_provider: MeterProvider | None = None,
+        _transport: AsyncBaseHTTPTransport | None = None,
+    ) -> None:
+        """OTLP HTTP metrics exporter for asyncio applications, to be used with an
+        `opentelemetry.sdk.metrics.export.AsyncPeriodicExportingMetricReader`.
+
+        Args:
+            endpoint: Target URL to which the exporter is going to send metrics
+            certificate_file: Path to the certificate file to use for any TLS
+            client_key_file: Path to the client key file to use for any TLS
+            client_certificate_file: Path to the client certificate file to use for any TLS
+            headers: Headers to be sent with HTTP requests at export
+            timeout: Timeout in seconds for export
+            compression: Compression to use; one of none, gzip, deflate
+            preferred_temporality: Map of preferred temporality for each metric type.
+                See `opentelemetry.sdk.metrics.export.MetricReader` for more details on what
+                preferred temporality is.
+            preferred_aggregation: Map of preferred aggregation for each metric type.
+                See `opentelemetry.sdk.metrics.export.MetricReader` for more details on what
+                preferred aggregation is.
+            max_export_batch_size: Maximum number of data points to export in a single request.
+                If not set there is no limit to the number of data points in a request.
+                If it is set and the number of data points exceeds the max, the request will be split.
+            max_request_size: Maximum size in bytes of a serialized request, measured before
+                compression. A request exceeding this size is dropped before being sent. Defaults
+                to 64 MiB; a value of 0 (or any non-positive value) disables the limit.
+            meter_provider: MeterProvider used for the exporter's own metrics.
+        """
+        AsyncMetricExporter.__init__(
+            self,
+            preferred_temporality=_get_temporality(preferred_temporality),
+            preferred_aggregation=_get_aggregation(preferred_aggregation),
+        )
+        self._endpoint = endpoint or _resolve_endpoint(OTEL_EXPORTER_OTLP_METRICS_ENDPOINT, DEFAULT_METRICS_EXPORT_PATH)
+        self._compression = _normalize_compression(compression) or _resolve_compression(
+            OTEL_EXPORTER_OTLP_METRICS_COMPRESSION
+        )
+        transport = _transport or _build_async_transport(
+            certificate_file,
+            client_key_file,
+            client_certificate_file,
+            OTEL_EXPORTER_OTLP_METRICS_CERTIFICATE,
+            OTEL_EXPORTER_OTLP_METRICS_CLIENT_KEY,
+            OTEL_EXPORTER_OTLP_METRICS_CLIENT_CERTIFICATE,
+        )
+        self._client = _http._AsyncOTLPHTTPClient(
+            transport=transport,
+            endpoint=self._endpoint,
+            kind="metrics",
+            timeout=timeout if timeout is not None else _resolve_timeout(OTEL_EXPORTER_OTLP_METRICS_TIMEOUT),
+            compression=self._compression,
+            headers=_resolve_headers(headers, OTEL_EXPORTER_OTLP_METRICS_HEADERS),
+            logger=_logger,
+        )
+        self._max_export_batch_size: int | None = max_export_batch_size
+        self._max_request_size = _DEFAULT_MAX_REQUEST_SIZE if max_request_size is None else max_request_size
+        self._shutdown = False
+
+        self._metrics = create_exporter_metrics(
+            OtelComponentTypeValues.OTLP_HTTP_METRIC_EXPORTER,
+            "metrics",
+            urlparse(self._endpoint),
+            meter_provider,
+            os.environ.get(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED, "").strip().lower() == "true",
+        )
+
+    async def _export_batch(
+        self,
+        export_request: ExportMetricsServiceRequest,
+    ) -> MetricExportResult:
+        with self._metrics.export_operation(_count_data_points(export_request)) as result:
+            serialized_data = export_request.SerializeToString()
+            if _is_request_too_large(serialized_data, self._max_request_size):
+                _logger.warning(
+                    "Dropping metrics batch: serialized size %d bytes exceeds max_request_size %d bytes.",
+                    len(serialized_data),
+                    self._max_request_size,
+                )
+                result.error = RequestPayloadTooLargeError(
+                    f"Serialized metrics request size {len(serialized_data)} "
+                    f"bytes exceeds max_request_size "
+                    f"{self._max_request_size} bytes."
+                )
+                return MetricExportResult.FAILURE
+            export_result = await self._client.export(serialized_data)
+            if not export_result.success:
+                result.error = export_result.error
+                result.error_attrs = (
+                    {HTTP_RESPONSE_STATUS_CODE: export_result.status_code}
+                    if export_result.status_code is not None
+                    else None
+                )
+                return MetricExportResult.FAILURE
+        return MetricExportResult.SUCCESS
+
+    async def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float | None = 10000,
+        **kwargs,
+    ) -> MetricExportResult:
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring batch")
+            return MetricExportResult.FAILURE
+
+        try:
+            export_request = encode_metrics(metrics_data)
+        # pylint: disable-next=broad-exception-caught
+        except Exception as error:
+            _logger.error("Failed to encode metrics batch: %s", error)
+            return MetricExportResult.FAILURE
+
+        # If no batch size configured, export as single batch with retries as configured
+        if self._max_export_batch_size is None:
+            return await self._export_batch(export_request)
+
+        for batch in _split_metrics_data(export_request, self._max_export_batch_size):
+            export_result = await self._export_batch(batch)
+            if export_result != MetricExportResult.SUCCESS:
+                return MetricExportResult.FAILURE
+
+        # Only returns SUCCESS if all batches succeeded
+        return MetricExportResult.SUCCESS
+
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        if self._shutdown:
+            _logger.warning("Exporter already shutdown, ignoring call")
+            return
+        self._shutdown = True
+        await self._client.shutdown()
+
+    async def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        """Nothing is buffered in this exporter, so this method does nothing."""
+        return True
@@ -13,8 +13,11 @@ from opentelemetry.exporter.otlp.common import http as _http
 from opentelemetry.exporter.otlp.proto.common._exporter_metrics import (
     create_exporter_metrics,
 )
+from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder._process_pool import (
+    _new_process_pool_span_serializer,
+)
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
-    encode_spans,
+    serialize_spans,
 )
 from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http._common import (
@@ -128,11 +131,12 @@ class OTLPSpanExporter(SpanExporter):
                 measured before compression. A request exceeding this size is
                 dropped before being sent. Defaults to 64 MiB; a value of 0 (or
                 any non-positive value) disables the limit. Batch processors
-                group spans by count rather than serialized size, so a batch
-                whose serialized request exceeds this limit is dropped as a
-                whole and recorded as a failed export; reduce the processor's
-                ``max_export_batch_size`` (or raise/disable this limit) if
-                batches may approach it.
+                group spans by count unless given ``max_export_batch_bytes``,
+                so a batch whose serialized request exceeds this limit is
+                dropped as a whole and recorded as a failed export; set the
+                processor's ``max_export_batch_bytes`` comfortably below this
+                limit, or reduce its ``max_export_batch_size``, if batches may
+                approach it.
             meter_provider: MeterProvider used for the exporter's own metrics.
         """
         self._endpoint = endpoint or _resolve_endpoint(OTEL_EXPORTER_OTLP_TRACES_ENDPOINT, DEFAULT_TRACES_EXPORT_PATH)
@@ -149,16 +153,18 @@ class OTLPSpanExporter(SpanExporter):
             session=session or _load_session_from_envvar(_OTEL_PYTHON_EXPORTER_OTLP_HTTP_TRACES_CREDENTIAL_PROVIDER),
         )
         self._max_request_size = _DEFAULT_MAX_REQUEST_SIZE if max_request_size is None else max_request_size
+        self._timeout = timeout if timeout is not None else _resolve_timeout(OTEL_EXPORTER_OTLP_TRACES_TIMEOUT)
         self._client = _http._OTLPHTTPClient(
             transport=transport,
             endpoint=self._endpoint,
             kind="spans",
-            timeout=timeout if timeout is not None else _resolve_timeout(OTEL_EXPORTER_OTLP_TRACES_TIMEOUT),
+            timeout=self._timeout,
             compression=self._compression,
             headers=_resolve_headers(headers, OTEL_EXPORTER_OTLP_TRACES_HEADERS),
             logger=_logger,
         )
         self._shutdown = False
+        self._process_pool_serializer = _new_process_pool_span_serializer()
 
         self._metrics = create_exporter_metrics(
             OtelComponentTypeValues.OTLP_HTTP_SPAN_EXPORTER,
@@ -175,7 +181,10 @@ class OTLPSpanExporter(SpanExporter):
 
         with self._metrics.export_operation(len(spans)) as result:
             try:
-                serialized_data = encode_spans(spans).SerializePartialToString()
+                if self._process_pool_serializer is not None:
+                    serialized_data = self._process_pool_serializer(spans, self._timeout)
+                else:
+                    serialized_data = serialize_spans(spans)
             # pylint: disable-next=broad-exception-caught
             except Exception as error:
                 _logger.error("Failed to encode span batch: %s", error)
@@ -212,6 +221,8 @@ class OTLPSpanExporter(SpanExporter):
             return
         self._shutdown = True
         self._client.shutdown()
+        if self._process_pool_serializer is not None:
+            self._process_pool_serializer.shutdown()
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
         """Nothing is buffered in this exporter, so this method does nothing."""
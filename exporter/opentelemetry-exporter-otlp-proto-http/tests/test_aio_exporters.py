@@ -0,0 +1,262 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access,attribute-defined-outside-init
+
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from aiohttp import test_utils, web
+
+from opentelemetry._logs import LogRecord
+from opentelemetry.exporter.http.transport._aiohttp import (
+    AiohttpHTTPTransport,
+)
+from opentelemetry.exporter.otlp.proto.http.aio._log_exporter import (
+    OTLPLogExporter,
+)
+from opentelemetry.exporter.otlp.proto.http.aio.metric_exporter import (
+    OTLPMetricExporter,
+)
+from opentelemetry.exporter.otlp.proto.http.aio.trace_exporter import (
+    OTLPSpanExporter,
+)
+from opentelemetry.proto.collector.logs.v1.logs_service_pb2 import (
+    ExportLogsServiceRequest,
+)
+from opentelemetry.proto.collector.metrics.v1.metrics_service_pb2 import (
+    ExportMetricsServiceRequest,
+)
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
+from opentelemetry.sdk._logs import ReadWriteLogRecord
+from opentelemetry.sdk._logs.export import (
+    AsyncBatchLogRecordProcessor,
+    LogRecordExportResult,
+)
+from opentelemetry.sdk.environment_variables import (
+    OTEL_EXPORTER_OTLP_ENDPOINT,
+    OTEL_EXPORTER_OTLP_METRICS_ENDPOINT,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    AsyncPeriodicExportingMetricReader,
+    MetricExportResult,
+    MetricsData,
+    ResourceMetrics,
+    ScopeMetrics,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import (
+    AsyncBatchSpanProcessor,
+    SimpleSpanProcessor,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.test.metrictestutil import _generate_sum
+
+
+def _metrics_data(num_metrics: int) -> MetricsData:
+    return MetricsData(
+        resource_metrics=[
+            ResourceMetrics(
+                resource=Resource({"a": 1}),
+                scope_metrics=[
+                    ScopeMetrics(
+                        scope=InstrumentationScope("first_name"),
+                        metrics=[_generate_sum(f"sum_int_{idx}", 33) for idx in range(num_metrics)],
+                        schema_url="",
+                    )
+                ],
+                schema_url="",
+            )
+        ]
+    )
+
+
+class TestAsyncOTLPExporters(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        env_patcher = patch.dict(os.environ, {}, clear=True)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+        self.requests = []
+        self.status = 200
+        app = web.Application()
+        app.router.add_post("/v1/{signal}", self._handle)
+        self.server = test_utils.TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+
+    async def _handle(self, request):
+        self.requests.append((request.match_info["signal"], await request.read()))
+        return web.Response(status=self.status)
+
+    def _url(self, signal: str) -> str:
+        return str(self.server.make_url(f"/v1/{signal}"))
+
+    @staticmethod
+    def _spans():
+        in_memory = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(in_memory))
+        with provider.get_tracer(__name__).start_as_current_span("span"):
+            pass
+        return in_memory.get_finished_spans()
+
+    def _span_exporter(self, **kwargs) -> OTLPSpanExporter:
+        return OTLPSpanExporter(endpoint=self._url("traces"), **kwargs)
+
+    async def test_default_transport_is_aiohttp(self):
+        exporter = OTLPSpanExporter()
+        self.assertIsInstance(exporter._client._transport, AiohttpHTTPTransport)
+        self.assertEqual(exporter._endpoint, "http://localhost:4318/v1/traces")
+        await exporter.shutdown()
+
+    async def test_endpoint_from_environment(self):
+        with patch.dict(
+            os.environ,
+            {
+                OTEL_EXPORTER_OTLP_ENDPOINT: "http://collector:4318",
+                OTEL_EXPORTER_OTLP_METRICS_ENDPOINT: "http://metrics:4318/metrics",
+            },
+        ):
+            log_exporter = OTLPLogExporter()
+            metric_exporter = OTLPMetricExporter()
+        self.assertEqual(log_exporter._endpoint, "http://collector:4318/v1/logs")
+        self.assertEqual(metric_exporter._endpoint, "http://metrics:4318/metrics")
+        await log_exporter.shutdown()
+        await metric_exporter.shutdown()
+
+    async def test_batch_span_processor_exports_spans(self):
+        processor = AsyncBatchSpanProcessor(self._span_exporter())
+        provider = TracerProvider()
+        provider.add_span_processor(processor)
+        with provider.get_tracer(__name__).start_as_current_span("span"):
+            pass
+
+        await processor.shutdown_async()
+
+        self.assertEqual(len(self.requests), 1)
+        signal, body = self.requests[0]
+        self.assertEqual(signal, "traces")
+        request = ExportTraceServiceRequest.FromString(body)
+        self.assertEqual(request.resource_spans[0].scope_spans[0].spans[0].name, "span")
+
+    async def test_batch_log_record_processor_exports_logs(self):
+        exporter = OTLPLogExporter(endpoint=self._url("logs"))
+        processor = AsyncBatchLogRecordProcessor(exporter)
+        processor.on_emit(
+            ReadWriteLogRecord(
+                LogRecord(body="log"),
+                resource=Resource({}),
+                instrumentation_scope=InstrumentationScope("scope"),
+            )
+        )
+
+        await processor.shutdown_async()
+
+        self.assertEqual(len(self.requests), 1)
+        signal, body = self.requests[0]
+        self.assertEqual(signal, "logs")
+        request = ExportLogsServiceRequest.FromString(body)
+        self.assertEqual(request.resource_logs[0].scope_logs[0].log_records[0].body.string_value, "log")
+
+    async def test_metric_reader_exports_metrics(self):
+        exporter = OTLPMetricExporter(endpoint=self._url("metrics"))
+        reader = AsyncPeriodicExportingMetricReader(exporter)
+        self.assertEqual(
+            set(reader._instrument_class_temporality.values()),
+            {AggregationTemporality.CUMULATIVE},
+        )
+        reader._set_collect_callback(lambda reader, timeout_millis: _metrics_data(1))
+
+        await reader.shutdown_async()
+
+        self.assertEqual(len(self.requests), 1)
+        signal, body = self.requests[0]
+        self.assertEqual(signal, "metrics")
+        request = ExportMetricsServiceRequest.FromString(body)
+        self.assertEqual(request.resource_metrics[0].scope_metrics[0].metrics[0].name, "sum_int_0")
+
+    async def test_metric_export_split_in_batches(self):
+        exporter = OTLPMetricExporter(endpoint=self._url("metrics"), max_export_batch_size=2)
+
+        self.assertEqual(await exporter.export(_metrics_data(5)), MetricExportResult.SUCCESS)
+
+        self.assertEqual(
+            [
+                len(ExportMetricsServiceRequest.FromString(body).resource_metrics[0].scope_metrics[0].metrics)
+                for _, body in self.requests
+            ],
+            [2, 2, 1],
+        )
+        await exporter.shutdown()
+
+    async def test_export_failure(self):
+        self.status = 400
+        exporter = self._span_exporter()
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertEqual(await exporter.export(self._spans()), SpanExportResult.FAILURE)
+        self.assertIn("Failed to export spans batch code: 400", logs.output[0])
+        await exporter.shutdown()
+
+    async def test_oversized_payload_dropped_before_send(self):
+        exporters = [
+            (self._span_exporter(max_request_size=1), self._spans(), SpanExportResult.FAILURE),
+            (
+                OTLPMetricExporter(endpoint=self._url("metrics"), max_request_size=1),
+                _metrics_data(1),
+                MetricExportResult.FAILURE,
+            ),
+            (
+                OTLPLogExporter(endpoint=self._url("logs"), max_request_size=1),
+                [ReadWriteLogRecord(LogRecord(body="log"), instrumentation_scope=InstrumentationScope("scope"))],
+                LogRecordExportResult.FAILURE,
+            ),
+        ]
+        for exporter, batch, failure in exporters:
+            with self.subTest(exporter=type(exporter).__name__):
+                with self.assertLogs(level="WARNING"):
+                    self.assertEqual(await exporter.export(batch), failure)
+                await exporter.shutdown()
+        self.assertEqual(self.requests, [])
+
+    async def test_export_after_shutdown(self):
+        exporter = self._span_exporter()
+        await exporter.shutdown()
+
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(await exporter.export(self._spans()), SpanExportResult.FAILURE)
+            await exporter.shutdown()
+        self.assertIn("Exporter already shutdown, ignoring batch", logs.output[0])
+        self.assertIn("Exporter already shutdown, ignoring call", logs.output[1])
+        self.assertEqual(self.requests, [])
+
+    async def test_shutdown_closes_transport(self):
+        exporter = self._span_exporter()
+        self.assertEqual(await exporter.export(self._spans()), SpanExportResult.SUCCESS)
+        session = exporter._client._transport._session
+
+        await exporter.shutdown()
+
+        self.assertTrue(session.closed)
+
+    async def test_shutdown_interrupts_retry_backoff(self):
+        self.status = 503
+        exporter = self._span_exporter(timeout=30)
+        export = asyncio.create_task(exporter.export(self._spans()))
+        while not self.requests:
+            await asyncio.sleep(0.01)
+
+        await exporter.shutdown()
+
+        self.assertEqual(await asyncio.wait_for(export, 5), SpanExportResult.FAILURE)
+        self.assertEqual(len(self.requests), 1)
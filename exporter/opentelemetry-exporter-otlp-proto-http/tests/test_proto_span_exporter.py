@@ -25,8 +25,12 @@ from opentelemetry.exporter.http.transport._urllib3 import (
     Urllib3HTTPTransport,
 )
 from opentelemetry.exporter.otlp.common import http as _http
+from opentelemetry.exporter.otlp.proto.common._internal.trace_encoder._process_pool import (
+    _ProcessPoolSpanSerializer,
+)
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import (
     encode_spans,
+    serialize_spans,
 )
 from opentelemetry.exporter.otlp.proto.http import Compression
 from opentelemetry.exporter.otlp.proto.http._common import (
@@ -43,6 +47,7 @@ from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
 )
 from opentelemetry.sdk.environment_variables import (
+    _OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES,
     _OTEL_PYTHON_EXPORTER_OTLP_HTTP_TRACES_CREDENTIAL_PROVIDER,
     OTEL_EXPORTER_OTLP_COMPRESSION,
     OTEL_EXPORTER_OTLP_ENDPOINT,
@@ -274,6 +279,27 @@ class TestOTLPSpanExporter(unittest.TestCase):
         sent_data = mock_request.call_args.kwargs["data"]
         self.assertEqual(_decode_body(sent_data), encode_spans(spans))
 
+    @mocketize
+    @patch.dict("os.environ", {_OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES: "2"})
+    def test_export_spans_serialized_in_process_pool(self):
+        Entry.single_register(Entry.POST, _TEST_ENDPOINT, status=200)
+        exporter = OTLPSpanExporter(endpoint=_TEST_ENDPOINT)
+        self.assertIsInstance(exporter._process_pool_serializer, _ProcessPoolSpanSerializer)
+        spans = self._make_span("my-span")
+        serializer = exporter._process_pool_serializer = Mock(return_value=serialize_spans(spans))
+        transport = exporter._client._transport
+
+        with patch.object(transport, "request", wraps=transport.request) as mock_request:
+            result = exporter.export(spans)
+
+        self.assertEqual(result, SpanExportResult.SUCCESS)
+        serializer.assert_called_once_with(spans, exporter._timeout)
+        sent_data = mock_request.call_args.kwargs["data"]
+        self.assertEqual(_decode_body(sent_data), encode_spans(spans))
+
+        exporter.shutdown()
+        serializer.shutdown.assert_called_once_with()
+
     @mocketize
     def test_export_spans_different_resources(self):
         Entry.single_register(Entry.POST, _TEST_ENDPOINT, status=200)
@@ -759,10 +785,10 @@ class TestOTLPSpanExporter(unittest.TestCase):
 
     @mocketize
     @patch(
-        "opentelemetry.exporter.otlp.proto.http.trace_exporter.encode_spans",
+        "opentelemetry.exporter.otlp.proto.http.trace_exporter.serialize_spans",
         side_effect=ValueError("boom"),
     )
-    def test_export_encoding_failure(self, mock_encode_spans):
+    def test_export_encoding_failure(self, mock_serialize_spans):
         exporter = OTLPSpanExporter(endpoint=_TEST_ENDPOINT)
 
         with self.assertLogs(_LOGGER_NAME, level="ERROR"):
@@ -7,6 +7,7 @@ import copy
 import logging
 import threading
 from collections.abc import Mapping, MutableMapping, Sequence
+from contextlib import nullcontext
 from types import NoneType
 from typing import TYPE_CHECKING, Any, overload
 
@@ -67,24 +68,10 @@ def _clean_attribute_value(
     if isinstance(value, Mapping):
         cleaned_mapping: dict[str, types.AnyValue] = {}
         for key, val in value.items():
-            if not key:
-                _logger.warning(
-                    "invalid attribute key `%s`. must be non-empty string. Dropping key from attributes.",
-                    key,
-                )
+            cleaned_key = _clean_attribute_key(key)
+            if cleaned_key is None:
                 continue
-            # Spec says to convert unknown types to strings if possible (here and below too).
-            if not isinstance(key, str):
-                _logger.warning(
-                    "Invalid type `%s` for attribute key `%s`, must be a str. Key's `__str__/__repr__` method will be called if it exists, otherwise the key/value pair will be dropped.",
-                    type(key),
-                    key,
-                )
-                if _is_non_custom_str(key):
-                    key = str(key)
-                else:
-                    continue
-            cleaned_mapping[key] = _clean_attribute_value(val, max_string_value_length)
+            cleaned_mapping[cleaned_key] = _clean_attribute_value(val, max_string_value_length)
         return cleaned_mapping
     if TYPE_CHECKING:
         assert_never(value)
@@ -98,6 +85,27 @@ def _clean_attribute_value(
     return None
 
 
+def _clean_attribute_key(key: Any) -> str | None:
+    """Checks if an attribute key is valid, returns the key to use for it or None if it has to be dropped."""
+    if not key:
+        _logger.warning(
+            "invalid attribute key `%s`. must be non-empty string. Dropping key from attributes.",
+            key,
+        )
+        return None
+    # Spec says to convert unknown types to strings if possible.
+    if not isinstance(key, str):
+        _logger.warning(
+            "Invalid type `%s` for attribute key `%s`, must be a str. Key's `__str__/__repr__` method will be called if it exists, otherwise the key/value pair will be dropped.",
+            type(key),
+            key,
+        )
+        if _is_non_custom_str(key):
+            return str(key)
+        return None
+    return key
+
+
 class BoundedAttributes(MutableMapping[str, types.AnyValue]):
     """A dict with a fixed max capacity which cleans and potentially drops values to ensure they are valid attribute values.
 
@@ -239,3 +247,133 @@ class BoundedAttributes(MutableMapping[str, types.AnyValue]):
 
     def copy(self) -> MutableMapping[str, types.AnyValue]:
         return self._dict.copy()
+
+
+# The types of the attribute values that can't be changed after they are
+# recorded, see _LazyBoundedAttributes.
+_SCALAR_VALUE_TYPES = frozenset((NoneType, bool, int, float, str, bytes))
+
+
+class _LazyBoundedAttributes(BoundedAttributes):
+    """A `BoundedAttributes` that defers the bookkeeping of its initial attributes.
+
+    The initial attributes are only cleaned and limited when they are first read, so that telemetry
+    which is dropped before export never pays for it. Warnings about invalid keys and values and full
+    attributes are therefore logged on first read instead of on creation. Values that are not of an
+    immutable scalar type are the exception: they are cleaned on creation, so later changes to a
+    mutable value of the caller are not seen.
+
+    Immutable instances do not allocate a lock: once cleaned they are never written to again, and
+    cleaning the same pending attributes twice from racing readers yields the same result.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        maxlen: int | None = None,
+        attributes: types.Attributes = None,
+        immutable: bool = True,
+        max_value_len: int | None = None,
+    ) -> None:
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be valid int greater or equal to 0")
+        self._dict = {}
+        self._pending: dict[str, types.AnyValue] | None = None
+        if attributes:
+            self._pending = pending = dict(attributes)
+            if maxlen != 0:
+                for key, value in pending.items():
+                    if type(value) not in _SCALAR_VALUE_TYPES:
+                        pending[key] = _clean_attribute_value(value, max_value_len)
+        self._dropped = 0
+        self.maxlen = maxlen
+        self.max_value_len = max_value_len
+        self._lock = None if immutable else threading.Lock()  # type: ignore[assignment]
+        self._immutable = immutable
+
+    @property
+    def dropped(self) -> int:  # type: ignore[override]
+        self._materialize()
+        return self._dropped
+
+    @dropped.setter
+    def dropped(self, value: int) -> None:
+        self._dropped = value
+
+    def _materialize(self) -> None:
+        pending = self._pending
+        if pending is None:
+            return
+        if self._lock is None:
+            self._clean_pending(pending)
+            return
+        with self._lock:
+            if self._pending is not None:
+                self._clean_pending(pending)
+
+    def _clean_pending(self, pending: dict[str, types.AnyValue]) -> None:
+        cleaned_dict: dict[str, types.AnyValue] = {}
+        if self.maxlen == 0:
+            dropped = len(pending)
+        else:
+            cleaned_attributes: dict[str, types.AnyValue] = {}
+            for key, value in pending.items():
+                cleaned_key = _clean_attribute_key(key)
+                if cleaned_key is not None:
+                    cleaned_attributes[cleaned_key] = _clean_attribute_value(value, self.max_value_len)
+            dropped = len(pending) - len(cleaned_attributes)
+            for key, value in cleaned_attributes.items():
+                if self.maxlen is not None and len(cleaned_dict) >= self.maxlen:
+                    _logger.warning(
+                        "Attributes dict is full. Dropping the oldest key-value pair from attributes to make space for the new key-value pair.",
+                    )
+                    del cleaned_dict[next(iter(cleaned_dict.keys()))]
+                    dropped += 1
+                cleaned_dict[key] = value
+        self._dict = cleaned_dict
+        self._dropped = dropped
+        self._pending = None
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return super().__repr__()
+
+    def __getitem__(self, key: str) -> types.AnyValue:
+        self._materialize()
+        return self._dict[key]
+
+    def __setitem__(self, key: str, value: types.AnyValue) -> None:
+        self._materialize()
+        super().__setitem__(key, value)
+
+    def _set_items(self, attributes: Mapping[str, types.AnyValue]) -> None:
+        self._materialize()
+        super()._set_items(attributes)
+
+    def __delitem__(self, key: str) -> None:
+        self._materialize()
+        super().__delitem__(key)
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._materialize()
+        return len(self._dict)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "BoundedAttributes":
+        self._materialize()
+        copy_ = BoundedAttributes(
+            maxlen=self.maxlen,
+            immutable=self._immutable,
+            max_value_len=self.max_value_len,
+        )
+        memo[id(self)] = copy_
+        with self._lock or nullcontext():
+            copy_._dict = copy.deepcopy(self._dict, memo)
+            copy_.dropped = self._dropped
+        return copy_
+
+    def copy(self) -> MutableMapping[str, types.AnyValue]:
+        self._materialize()
+        return self._dict.copy()
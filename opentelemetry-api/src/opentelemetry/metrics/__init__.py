@@ -39,6 +39,8 @@ from opentelemetry.metrics._internal import (
 )
 from opentelemetry.metrics._internal.instrument import (
     Asynchronous,
+    BoundCounter,
+    BoundHistogram,
     CallbackOptions,
     CallbackT,
     Counter,
@@ -61,6 +63,8 @@ from opentelemetry.metrics._internal.instrument import NoOpGauge as _NoOpGauge
 from opentelemetry.metrics._internal.observation import Observation
 
 for obj in [
+    BoundCounter,
+    BoundHistogram,
     Counter,
     Synchronous,
     Asynchronous,
@@ -96,12 +100,14 @@ __all__ = [
     "NoOpMeterProvider",
     "Meter",
     "Counter",
+    "BoundCounter",
     "_Gauge",
     "_NoOpGauge",
     "NoOpCounter",
     "UpDownCounter",
     "NoOpUpDownCounter",
     "Histogram",
+    "BoundHistogram",
     "NoOpHistogram",
     "ObservableCounter",
     "NoOpObservableCounter",
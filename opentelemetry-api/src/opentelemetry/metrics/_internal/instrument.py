@@ -151,6 +151,57 @@ class Asynchronous(Instrument):
         super().__init__(name, unit=unit, description=description)
 
 
+class BoundCounter(ABC):
+    """A `Counter` bound to a fixed set of attributes, see `Counter.bind`."""
+
+    @abstractmethod
+    def add(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ) -> None:
+        """Records an increment to the counter with the bound attributes.
+
+        Args:
+            amount: The amount to increment the counter by. Must be non-negative.
+            context: Optional context to associate with the measurement. If not
+                provided, the current context is used.
+        """
+
+
+class _DefaultBoundCounter(BoundCounter):
+    def __init__(self, counter: "Counter", attributes: Attributes) -> None:
+        self._counter = counter
+        self._attributes = attributes
+
+    def add(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ) -> None:
+        self._counter.add(amount, self._attributes, context)
+
+
+class _ProxyBoundCounter(BoundCounter):
+    def __init__(self, counter: "_ProxyCounter", attributes: Attributes) -> None:
+        self._counter = counter
+        self._attributes = attributes
+        self._real_bound_counter: BoundCounter | None = None
+
+    def add(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ) -> None:
+        if self._real_bound_counter is None:
+            # pylint: disable=protected-access
+            real_instrument = self._counter._real_instrument
+            if not real_instrument:
+                return
+            self._real_bound_counter = real_instrument.bind(self._attributes)
+        self._real_bound_counter.add(amount, context)
+
+
 class Counter(Synchronous):
     """A Counter is a synchronous `Instrument` which supports non-negative increments."""
 
@@ -170,6 +221,18 @@ class Counter(Synchronous):
                 provided, the current context is used.
         """
 
+    def bind(self, attributes: Attributes = None) -> BoundCounter:
+        """Returns a handle that adds to this counter with a fixed set of attributes.
+
+        Adding through the handle is equivalent to calling `add` with
+        ``attributes``, but lets the SDK resolve the attributes once instead of
+        on every measurement.
+
+        Args:
+            attributes: Optional set of attributes to associate with every measurement.
+        """
+        return _DefaultBoundCounter(self, dict(attributes) if attributes else attributes)
+
 
 class NoOpCounter(Counter):
     """No-op implementation of `Counter`."""
@@ -201,6 +264,9 @@ class _ProxyCounter(_ProxyInstrument[Counter], Counter):
         if self._real_instrument:
             self._real_instrument.add(amount, attributes, context)
 
+    def bind(self, attributes: Attributes = None) -> BoundCounter:
+        return _ProxyBoundCounter(self, dict(attributes) if attributes else attributes)
+
     def _create_real_instrument(self, meter: "metrics.Meter") -> Counter:
         return meter.create_counter(
             self._name,
@@ -343,6 +409,57 @@ class _ProxyObservableUpDownCounter(
         )
 
 
+class BoundHistogram(ABC):
+    """A `Histogram` bound to a fixed set of attributes, see `Histogram.bind`."""
+
+    @abstractmethod
+    def record(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ) -> None:
+        """Records a measurement with the bound attributes.
+
+        Args:
+            amount: The measurement to record.
+            context: Optional context to associate with the measurement. If not
+                provided, the current context is used.
+        """
+
+
+class _DefaultBoundHistogram(BoundHistogram):
+    def __init__(self, histogram: "Histogram", attributes: Attributes) -> None:
+        self._histogram = histogram
+        self._attributes = attributes
+
+    def record(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ) -> None:
+        self._histogram.record(amount, self._attributes, context)
+
+
+class _ProxyBoundHistogram(BoundHistogram):
+    def __init__(self, histogram: "_ProxyHistogram", attributes: Attributes) -> None:
+        self._histogram = histogram
+        self._attributes = attributes
+        self._real_bound_histogram: BoundHistogram | None = None
+
+    def record(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ) -> None:
+        if self._real_bound_histogram is None:
+            # pylint: disable=protected-access
+            real_instrument = self._histogram._real_instrument
+            if not real_instrument:
+                return
+            self._real_bound_histogram = real_instrument.bind(self._attributes)
+        self._real_bound_histogram.record(amount, context)
+
+
 class Histogram(Synchronous):
     """Histogram is a synchronous `Instrument` which can be used to report arbitrary values
     that are likely to be statistically meaningful. It is intended for statistics such as
@@ -381,6 +498,18 @@ class Histogram(Synchronous):
                 provided, the current context is used.
         """
 
+    def bind(self, attributes: Attributes = None) -> BoundHistogram:
+        """Returns a handle that records to this histogram with a fixed set of attributes.
+
+        Recording through the handle is equivalent to calling `record` with
+        ``attributes``, but lets the SDK resolve the attributes once instead of
+        on every measurement.
+
+        Args:
+            attributes: Optional set of attributes to associate with every measurement.
+        """
+        return _DefaultBoundHistogram(self, dict(attributes) if attributes else attributes)
+
 
 class NoOpHistogram(Histogram):
     """No-op implementation of `Histogram`."""
@@ -428,6 +557,9 @@ class _ProxyHistogram(_ProxyInstrument[Histogram], Histogram):
         if self._real_instrument:
             self._real_instrument.record(amount, attributes, context)
 
+    def bind(self, attributes: Attributes = None) -> BoundHistogram:
+        return _ProxyBoundHistogram(self, dict(attributes) if attributes else attributes)
+
     def _create_real_instrument(self, meter: "metrics.Meter") -> Histogram:
         return meter.create_histogram(
             self._name,
@@ -11,7 +11,9 @@ import unittest.mock
 
 from opentelemetry.attributes import (
     BoundedAttributes,
+    _clean_attribute_key,
     _clean_attribute_value,
+    _LazyBoundedAttributes,
 )
 
 
@@ -257,3 +259,65 @@ class TestBoundedAttributes(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             bdict_copy["invalid"] = "invalid"
+
+
+class TestLazyBoundedAttributes(unittest.TestCase):
+    def test_key_cleaning_deferred_to_first_read(self):
+        attributes = {"key": "value", "long": "x" * 10, "": "empty", "list": [1, 2]}
+        with unittest.mock.patch("opentelemetry.attributes._clean_attribute_key") as clean_mock:
+            clean_mock.side_effect = _clean_attribute_key
+            bdict = _LazyBoundedAttributes(maxlen=2, attributes=attributes, max_value_len=4)
+            clean_mock.assert_not_called()
+
+            self.assertEqual(dict(bdict), {"long": "xxxx", "list": (1, 2)})
+            call_count = clean_mock.call_count
+            self.assertEqual(bdict.dropped, 2)
+            self.assertEqual(len(bdict), 2)
+            self.assertEqual(clean_mock.call_count, call_count)
+
+    def test_initial_attributes_copied(self):
+        attributes = {"key": "value"}
+        bdict = _LazyBoundedAttributes(attributes=attributes)
+        attributes["other"] = "value"
+
+        self.assertEqual(dict(bdict), {"key": "value"})
+
+    def test_initial_values_frozen(self):
+        values = [1, 2]
+        mapping = {"nested": [1, 2]}
+        bdict = _LazyBoundedAttributes(attributes={"list": values, "mapping": mapping})
+        values.append(3)
+        mapping["nested"].append(3)
+        mapping["other"] = "value"
+
+        self.assertEqual(dict(bdict), {"list": (1, 2), "mapping": {"nested": (1, 2)}})
+
+    def test_scalar_values_cleaned_on_first_read(self):
+        with self.assertNoLogs("opentelemetry", level="WARNING"):
+            bdict = _LazyBoundedAttributes(attributes={"long": "x" * 10}, max_value_len=4)
+
+        with self.assertLogs("opentelemetry", level="WARNING") as logs:
+            self.assertEqual(dict(bdict), {"long": "xxxx"})
+
+        self.assertIn("String attribute value exceeds max length", logs.output[0])
+
+    def test_immutable_has_no_lock(self):
+        bdict = _LazyBoundedAttributes(attributes={"key": "value"})
+
+        self.assertIsNone(bdict._lock)  # pylint: disable=protected-access
+        self.assertEqual(bdict["key"], "value")
+        with self.assertRaises(TypeError):
+            bdict["key"] = "other"
+        self.assertIsInstance(copy.deepcopy(bdict), BoundedAttributes)
+
+    def test_mutable_writes_after_pending_attributes(self):
+        bdict = _LazyBoundedAttributes(maxlen=2, attributes={"a": 1, "b": 2}, immutable=False)
+        bdict["c"] = 3
+        bdict._set_items({"a": 4})  # pylint: disable=protected-access
+
+        self.assertEqual(dict(bdict), {"c": 3, "a": 4})
+        self.assertEqual(bdict.dropped, 2)
+
+    def test_negative_maxlen_not_allowed(self):
+        with self.assertRaises(ValueError):
+            _LazyBoundedAttributes(-1)
@@ -4,8 +4,11 @@
 
 from inspect import Signature, isabstract, signature
 from unittest import TestCase
+from unittest.mock import patch
 
 from opentelemetry.metrics import (
+    BoundCounter,
+    BoundHistogram,
     Counter,
     Histogram,
     Instrument,
@@ -87,6 +90,23 @@ class TestCounter(TestCase):
         self.assertIn("amount", add_signature.parameters.keys())
         self.assertIs(add_signature.parameters["amount"].default, Signature.empty)
 
+    def test_counter_bind_method(self):
+        """
+        Test that binding a counter returns a BoundCounter.
+        Test that the bound counter adds with the bound attributes.
+        Test that the bound attributes are copied at bind time.
+        """
+
+        counter = NoOpCounter("name")
+        attributes = {"key": "value"}
+        bound_counter = counter.bind(attributes)
+        self.assertIsInstance(bound_counter, BoundCounter)
+        attributes["key"] = "other"
+
+        with patch.object(counter, "add") as add:
+            self.assertIsNone(bound_counter.add(1))
+            add.assert_called_once_with(1, {"key": "value"}, None)
+
 
 class TestObservableCounter(TestCase):
     def test_create_observable_counter(self):
@@ -221,6 +241,20 @@ class TestHistogram(TestCase):
 
         self.assertIsNone(NoOpHistogram("name").record(1))
 
+    def test_histogram_bind_method(self):
+        """
+        Test that binding a histogram returns a BoundHistogram.
+        Test that the bound histogram records with the bound attributes.
+        """
+
+        histogram = NoOpHistogram("name")
+        bound_histogram = histogram.bind({"key": "value"})
+        self.assertIsInstance(bound_histogram, BoundHistogram)
+
+        with patch.object(histogram, "record") as record:
+            self.assertIsNone(bound_histogram.record(1))
+            record.assert_called_once_with(1, {"key": "value"}, None)
+
 
 class TestGauge(TestCase):
     def test_create_gauge(self):
@@ -5,7 +5,7 @@
 # pylint: disable=protected-access
 
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 from pytest import fixture
 
@@ -258,6 +258,40 @@ class TestProxy(MetricsGlobalsTest, TestCase):
         proxy_gauge.set(amount, attributes=attributes)
         real_gauge.set.assert_called_once_with(amount, attributes, None)
 
+    def test_proxy_bound_instruments(self) -> None:
+        proxy_meter: _ProxyMeter = _ProxyMeterProvider().get_meter("foo")
+        proxy_counter = proxy_meter.create_counter("counter")
+        proxy_histogram = proxy_meter.create_histogram("histogram")
+
+        attributes = {"foo": "bar"}
+        bound_counter = proxy_counter.bind(attributes)
+        bound_histogram = proxy_histogram.bind(attributes)
+
+        # Bound proxy instruments are usable before a real meter provider is set
+        bound_counter.add(1)
+        bound_histogram.record(1)
+
+        real_meter_provider = Mock()
+        proxy_meter.on_set_meter_provider(real_meter_provider)
+        real_meter: Mock = real_meter_provider.get_meter()
+        real_counter: Mock = real_meter.create_counter()
+        real_histogram: Mock = real_meter.create_histogram()
+        real_counter.bind.assert_not_called()
+        real_histogram.bind.assert_not_called()
+
+        # Once set, bound proxy instruments bind the real instruments once and
+        # record through the real handles
+        bound_counter.add(2)
+        bound_counter.add(3)
+        bound_histogram.record(4)
+        real_counter.bind.assert_called_once_with(attributes)
+        real_histogram.bind.assert_called_once_with(attributes)
+        self.assertEqual(
+            real_counter.bind().add.call_args_list,
+            [call(2, None), call(3, None)],
+        )
+        real_histogram.bind().record.assert_called_once_with(4, None)
+
     def test_proxy_meter_with_real_meter(self) -> None:
         # Creating new instruments on the _ProxyMeter with a real meter set
         # should create real instruments instead of proxies
@@ -0,0 +1,77 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=invalid-name
+import tracemalloc
+from array import array
+
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import (
+    ExplicitBucketHistogramAggregation,
+    ExponentialBucketHistogramAggregation,
+    View,
+)
+
+MAX_BOUND_VALUE = 10000
+SERIES_COUNT = 50
+# Python caches the int objects up to 256, bucket counts above it take an int
+# object each unless they are stored in an array.
+RECORDS_PER_BUCKET = 257
+
+
+def _generate_bounds(bound_count):
+    return [i * MAX_BOUND_VALUE / bound_count for i in range(bound_count)]
+
+
+def _record_series(aggregation, values):
+    provider = MeterProvider(
+        metric_readers=[InMemoryMetricReader()],
+        exemplar_filter=AlwaysOffExemplarFilter(),
+        views=[View(instrument_name="histogram", aggregation=aggregation)],
+    )
+    histogram = provider.get_meter("sdk_meter_provider").create_histogram("histogram")
+    values = array("d", values) * RECORDS_PER_BUCKET
+    for series in range(SERIES_COUNT):
+        histogram.record_many(values, {"series": series})
+    return provider
+
+
+def _bytes_per_series(aggregation, values):
+    tracemalloc.start()
+    try:
+        provider = _record_series(aggregation, values)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    provider.shutdown()
+    return allocated // SERIES_COUNT
+
+
+# Every series records values in each of its buckets.
+@pytest.mark.parametrize(
+    "aggregation,values",
+    [
+        (
+            ExplicitBucketHistogramAggregation(_generate_bounds(10)),
+            [*_generate_bounds(10), MAX_BOUND_VALUE],
+        ),
+        (
+            ExplicitBucketHistogramAggregation(_generate_bounds(50)),
+            [*_generate_bounds(50), MAX_BOUND_VALUE],
+        ),
+        (
+            ExponentialBucketHistogramAggregation(),
+            [2 ** (exponent / 8) for exponent in range(40)],
+        ),
+    ],
+    ids=["explicit_10_bound", "explicit_50_bound", "exponential"],
+)
+def test_histogram_memory_per_series(benchmark, aggregation, values):
+    benchmark.extra_info["bytes_per_series"] = _bytes_per_series(aggregation, values)
+    benchmark.pedantic(_record_series, args=(aggregation, values), rounds=3)
@@ -0,0 +1,107 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=invalid-name
+import itertools
+from array import array
+
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+reader = InMemoryMetricReader()
+provider = MeterProvider(metric_readers=[reader])
+meter = provider.get_meter("sdk_meter_provider")
+counter = meter.create_counter("test_counter")
+histogram = meter.create_histogram("test_histogram")
+
+no_exemplars_provider = MeterProvider(
+    metric_readers=[InMemoryMetricReader()],
+    exemplar_filter=AlwaysOffExemplarFilter(),
+)
+no_exemplars_meter = no_exemplars_provider.get_meter("sdk_meter_provider")
+no_exemplars_counter = no_exemplars_meter.create_counter("test_counter")
+no_exemplars_histogram = no_exemplars_meter.create_histogram("test_histogram")
+
+
+def _attribute_sets(num_sets, num_labels):
+    return [{f"Key{label}": f"Value{label}.{index}" for label in range(num_labels)} for index in range(num_sets)]
+
+
+# A steady state hot path: the same few attribute sets are recorded over and
+# over, a fresh dict is built on every call just like an instrumented request
+# handler does.
+@pytest.mark.parametrize("num_labels", [1, 3, 10])
+@pytest.mark.parametrize("num_sets", [1, 10, 100])
+def test_counter_add_steady(benchmark, num_sets, num_labels):
+    attribute_sets = itertools.cycle(_attribute_sets(num_sets, num_labels))
+
+    def benchmark_counter_add():
+        counter.add(1, dict(next(attribute_sets)))
+
+    benchmark(benchmark_counter_add)
+
+
+@pytest.mark.parametrize("num_labels", [1, 3, 10])
+def test_histogram_record_steady(benchmark, num_labels):
+    attribute_sets = itertools.cycle(_attribute_sets(10, num_labels))
+
+    def benchmark_histogram_record():
+        histogram.record(1, dict(next(attribute_sets)))
+
+    benchmark(benchmark_histogram_record)
+
+
+@pytest.mark.parametrize("num_labels", [1, 3, 10])
+def test_bound_counter_add(benchmark, num_labels):
+    bound_counter = counter.bind(_attribute_sets(1, num_labels)[0])
+
+    def benchmark_bound_counter_add():
+        bound_counter.add(1)
+
+    benchmark(benchmark_bound_counter_add)
+
+
+@pytest.mark.parametrize("num_labels", [1, 3, 10])
+def test_bound_histogram_record(benchmark, num_labels):
+    bound_histogram = histogram.bind(_attribute_sets(1, num_labels)[0])
+
+    def benchmark_bound_histogram_record():
+        bound_histogram.record(1)
+
+    benchmark(benchmark_bound_histogram_record)
+
+
+# Without exemplars measurements skip the timestamp, context and Measurement.
+@pytest.mark.parametrize("num_labels", [1, 3, 10])
+def test_counter_add_steady_without_exemplars(benchmark, num_labels):
+    attribute_sets = itertools.cycle(_attribute_sets(10, num_labels))
+
+    def benchmark_counter_add():
+        no_exemplars_counter.add(1, dict(next(attribute_sets)))
+
+    benchmark(benchmark_counter_add)
+
+
+@pytest.mark.parametrize("num_labels", [1, 3, 10])
+def test_histogram_record_steady_without_exemplars(benchmark, num_labels):
+    attribute_sets = itertools.cycle(_attribute_sets(10, num_labels))
+
+    def benchmark_histogram_record():
+        no_exemplars_histogram.record(1, dict(next(attribute_sets)))
+
+    benchmark(benchmark_histogram_record)
+
+
+@pytest.mark.parametrize("num_values", [10, 1000])
+def test_histogram_record_many(benchmark, num_values):
+    values = array("d", (float(index) for index in range(num_values)))
+
+    def benchmark_histogram_record_many():
+        histogram.record_many(values, {"Key0": "Value0"})
+
+    benchmark(benchmark_histogram_record_many)
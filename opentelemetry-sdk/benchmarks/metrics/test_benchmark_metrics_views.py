@@ -0,0 +1,29 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=invalid-name
+import pytest
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import View
+
+_INSTRUMENT_COUNT = 1000
+
+
+def _views(view_count):
+    return [View(instrument_name=f"instrument_{index}") for index in range(view_count)] + [
+        View(instrument_name=f"service_{index}.*") for index in range(10)
+    ]
+
+
+@pytest.mark.parametrize("view_count", [10, 300])
+def test_create_instruments_with_views(benchmark, view_count):
+    views = _views(view_count)
+
+    def benchmark_create_instruments():
+        meter = MeterProvider(metric_readers=[InMemoryMetricReader()], views=views).get_meter("sdk_meter_provider")
+        for index in range(_INSTRUMENT_COUNT):
+            meter.create_counter(f"instrument_{index}").add(1)
+
+    benchmark.pedantic(benchmark_create_instruments, rounds=3)
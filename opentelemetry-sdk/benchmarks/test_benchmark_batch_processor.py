@@ -0,0 +1,49 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+import threading
+
+import pytest
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+_SPAN = ReadableSpan(
+    "benchmarkedSpan",
+    instrumentation_scope=InstrumentationScope("bench", "bench"),
+)
+# Total emit work is fixed regardless of thread count, so flat wall-clock time
+# across thread counts means emit scales, an increase reveals contention.
+_TOTAL_EMITS = 8192
+
+
+@pytest.mark.parametrize("queue_shards", [None, 4, 8])
+@pytest.mark.parametrize("num_threads", [1, 2, 4, 8])
+def test_batch_processor_emit_scaling(benchmark, num_threads, queue_shards):
+    processor = BatchSpanProcessor(
+        InMemorySpanExporter(),
+        max_queue_size=_TOTAL_EMITS,
+        max_export_batch_size=512,
+        queue_shards=queue_shards,
+    )
+    emit = processor._batch_processor.emit
+    emits_per_thread = _TOTAL_EMITS // num_threads
+
+    def worker():
+        for _ in range(emits_per_thread):
+            emit(_SPAN)
+
+    def benchmark_emit():
+        threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    benchmark(benchmark_emit)
+    processor.shutdown()
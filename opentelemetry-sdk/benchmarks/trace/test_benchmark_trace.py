@@ -220,6 +220,47 @@ def test_read_links(benchmark, num_links):
     benchmark(benchmark_read_links)
 
 
+class _RetainingProcessor(SpanProcessor):
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self.spans.append(span)
+
+
+_RETAINED_SPANS = 1000
+
+
+@pytest.mark.parametrize("num_events", [0, 1])
+def test_span_allocations(benchmark, num_events):
+    processor = _RetainingProcessor()
+    provider = TracerProvider(sampler=sampling.DEFAULT_ON)
+    provider.add_span_processor(processor)
+    tp = provider.get_tracer("bench")
+
+    def create_span():
+        span = tp.start_span("benchmarkedSpan", attributes={"key": "value", "number": 1})
+        for event in range(num_events):
+            span.add_event(f"event{event}", {"k": "v"})
+        span.end()
+
+    # Spans are kept alive by the processor, so the snapshot difference is the
+    # resident cost of an ended span, not just what was transiently allocated.
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(_RETAINED_SPANS):
+        create_span()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    benchmark.extra_info["allocs_per_span"] = sum(stat.count_diff for stat in stats) / _RETAINED_SPANS
+    benchmark.extra_info["bytes_per_span"] = sum(stat.size_diff for stat in stats) / _RETAINED_SPANS
+    processor.spans.clear()
+
+    benchmark(create_span)
+    processor.spans.clear()
+
+
 @pytest.mark.parametrize("num_attrs", [1, 10, 50, 128])
 def test_bounded_attribute_iterator(benchmark, num_attrs):
     attrs = BoundedAttributes(attributes={f"key{i}": f"value{i}" for i in range(num_attrs)})
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import copy
 import enum
 import logging
@@ -32,11 +33,20 @@ from opentelemetry.sdk._shared_internal import (
     BatchProcessor,
     DuplicateFilter,
 )
+from opentelemetry.sdk._shared_internal._async import (
+    AsyncBatchProcessor,
+)
 from opentelemetry.sdk._shared_internal._processor_metrics import (
     create_processor_metrics,
 )
+from opentelemetry.sdk._shared_internal._size_estimate import (
+    estimate_attributes_size,
+    estimate_string_size,
+    estimate_value_size,
+)
 from opentelemetry.sdk.environment_variables import (
     OTEL_BLRP_EXPORT_TIMEOUT,
+    OTEL_BLRP_MAX_CONCURRENT_EXPORTS,
     OTEL_BLRP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BLRP_MAX_QUEUE_SIZE,
     OTEL_BLRP_SCHEDULE_DELAY,
@@ -54,10 +64,46 @@ _DEFAULT_SCHEDULE_DELAY_MILLIS = 1000
 _DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
 _DEFAULT_EXPORT_TIMEOUT_MILLIS = 30000
 _DEFAULT_MAX_QUEUE_SIZE = 2048
+_DEFAULT_MAX_CONCURRENT_EXPORTS = 1
 _ENV_VAR_INT_VALUE_ERROR_MESSAGE = "Unable to parse value for %s as integer. Defaulting to %s."
+# Estimated encoded size of the fixed-size fields of a log record: timestamps,
+# severity, flags and trace context.
+_LOG_RECORD_FIXED_SIZE = 64
 _logger = logging.getLogger(__name__)
 _logger.addFilter(DuplicateFilter())
 
+
+def _estimate_log_record_size(log_record: ReadableLogRecord) -> int:
+    """Cheap estimate of the OTLP encoded size of a log record, excluding its
+    resource and instrumentation scope which are shared by the whole batch."""
+    record = log_record.log_record
+    size = _LOG_RECORD_FIXED_SIZE + estimate_attributes_size(record.attributes)
+    if record.body is not None:
+        size += estimate_value_size(record.body)
+    if record.severity_text:
+        size += estimate_string_size(record.severity_text)
+    if record.event_name:
+        size += estimate_string_size(record.event_name)
+    return size
+
+
+def _to_readable_log_record(log_record: ReadWriteLogRecord) -> ReadableLogRecord:
+    """Converts a log record to the ``ReadableLogRecord`` queued by the batch processors."""
+    # Note: resource should not be None at this point as it's set during Logger.emit()
+    resource = log_record.resource if log_record.resource is not None else Resource.create({})
+    # Shallow copy the API log record to break the reference to the potentially large context
+    # while keeping the original context intact for other processors.
+    api_log_record = copy.copy(log_record.log_record)
+    api_log_record.context = Context()
+
+    return ReadableLogRecord(
+        log_record=api_log_record,
+        resource=resource,
+        instrumentation_scope=log_record.instrumentation_scope,
+        limits=log_record.limits,
+    )
+
+
 _propagate_false_logger = logging.getLogger(__name__ + ".propagate.false")
 _propagate_false_logger.propagate = False
 
@@ -136,6 +182,50 @@ class LogExporter(LogRecordExporter):
     pass
 
 
+class AsyncLogRecordExporter(abc.ABC):
+    """Interface for exporting logs from an asyncio event loop.
+
+    The asyncio counterpart of `LogRecordExporter`, its methods are
+    coroutines awaited on the event loop of the application.
+
+    To export data this MUST be registered to the :class:`opentelemetry.sdk._logs.Logger`
+    using an `AsyncBatchLogRecordProcessor`.
+    """
+
+    @abc.abstractmethod
+    async def export(self, batch: Sequence[ReadableLogRecord]) -> LogRecordExportResult:
+        """Exports a batch of logs.
+
+        Args:
+            batch: The list of ``ReadableLogRecord`` objects to be exported.
+
+        Returns:
+            The result of the export.
+        """
+
+    @abc.abstractmethod
+    async def shutdown(self):
+        """Shuts down the exporter.
+
+        Called when the SDK is shut down.
+        """
+
+    @abc.abstractmethod
+    async def force_flush(self, timeout_millis: int = 10_000) -> bool:
+        """Hint to ensure that the export of any ``ReadableLogRecord`` objects
+        the exporter has received prior to the call to ``force_flush`` SHOULD be
+        completed as soon as possible, preferably before returning from this method.
+
+        Args:
+            timeout_millis: The maximum amount of time to wait for the flush to
+                complete, in milliseconds.
+
+        Returns:
+            ``True`` if the flush completed successfully within the timeout,
+            ``False`` otherwise.
+        """
+
+
 class ConsoleLogRecordExporter(LogRecordExporter):
     """Implementation of :class:`LogRecordExporter` that prints log records to the
     console.
@@ -257,8 +347,17 @@ class BatchLogRecordProcessor(LogRecordProcessor):
     - :envvar:`OTEL_BLRP_MAX_QUEUE_SIZE`
     - :envvar:`OTEL_BLRP_MAX_EXPORT_BATCH_SIZE`
     - :envvar:`OTEL_BLRP_EXPORT_TIMEOUT`
+    - :envvar:`OTEL_BLRP_MAX_CONCURRENT_EXPORTS`
 
     All the logic for emitting logs, shutting down etc. resides in the BatchProcessor class.
+
+    Passing ``queue_shards`` greater than 1 splits the queue into that many
+    bounded shards, each emitting thread appending to its own shard, which
+    reduces contention when many threads emit logs concurrently.
+
+    Passing ``max_export_batch_bytes`` additionally splits each batch into chunks
+    whose estimated OTLP encoded size stays within that many bytes, to keep
+    export requests under the receiver's message size limits.
     """
 
     def __init__(
@@ -270,6 +369,9 @@ class BatchLogRecordProcessor(LogRecordProcessor):
         max_queue_size: int | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        queue_shards: int | None = None,
+        max_concurrent_exports: int | None = None,
+        max_export_batch_bytes: int | None = None,
     ):
         if max_queue_size is None:
             max_queue_size = BatchLogRecordProcessor._default_max_queue_size()
@@ -279,11 +381,20 @@ class BatchLogRecordProcessor(LogRecordProcessor):
 
         if max_export_batch_size is None:
             max_export_batch_size = BatchLogRecordProcessor._default_max_export_batch_size()
-        # Not used. No way currently to pass timeout to export.
         if export_timeout_millis is None:
             export_timeout_millis = BatchLogRecordProcessor._default_export_timeout_millis()
 
-        BatchLogRecordProcessor._validate_arguments(max_queue_size, schedule_delay_millis, max_export_batch_size)
+        if max_concurrent_exports is None:
+            max_concurrent_exports = BatchLogRecordProcessor._default_max_concurrent_exports()
+
+        BatchLogRecordProcessor._validate_arguments(
+            max_queue_size,
+            schedule_delay_millis,
+            max_export_batch_size,
+            queue_shards,
+            max_concurrent_exports,
+            max_export_batch_bytes,
+        )
         # Initializes BatchProcessor
         self._batch_processor = BatchProcessor(
             exporter,
@@ -299,24 +410,15 @@ class BatchLogRecordProcessor(LogRecordProcessor):
                 capacity=max_queue_size,
                 enabled=parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
             ),
+            queue_shards=queue_shards,
+            max_concurrent_exports=max_concurrent_exports,
+            max_export_batch_bytes=max_export_batch_bytes,
+            size_estimator=_estimate_log_record_size,
         )
 
     def on_emit(self, log_record: ReadWriteLogRecord) -> None:
         # Convert ReadWriteLogRecord to ReadableLogRecord before passing to BatchProcessor
-        # Note: resource should not be None at this point as it's set during Logger.emit()
-        resource = log_record.resource if log_record.resource is not None else Resource.create({})
-        # Shallow copy the API log record to break the reference to the potentially large context
-        # while keeping the original context intact for other processors.
-        api_log_record = copy.copy(log_record.log_record)
-        api_log_record.context = Context()
-
-        readable_log_record = ReadableLogRecord(
-            log_record=api_log_record,
-            resource=resource,
-            instrumentation_scope=log_record.instrumentation_scope,
-            limits=log_record.limits,
-        )
-        return self._batch_processor.emit(readable_log_record)
+        return self._batch_processor.emit(_to_readable_log_record(log_record))
 
     def shutdown(self):
         return self._batch_processor.shutdown()
@@ -378,7 +480,31 @@ class BatchLogRecordProcessor(LogRecordProcessor):
             return _DEFAULT_EXPORT_TIMEOUT_MILLIS
 
     @staticmethod
-    def _validate_arguments(max_queue_size, schedule_delay_millis, max_export_batch_size):
+    def _default_max_concurrent_exports():
+        try:
+            return int(
+                environ.get(
+                    OTEL_BLRP_MAX_CONCURRENT_EXPORTS,
+                    _DEFAULT_MAX_CONCURRENT_EXPORTS,
+                )
+            )
+        except ValueError:
+            _logger.exception(
+                _ENV_VAR_INT_VALUE_ERROR_MESSAGE,
+                OTEL_BLRP_MAX_CONCURRENT_EXPORTS,
+                _DEFAULT_MAX_CONCURRENT_EXPORTS,
+            )
+            return _DEFAULT_MAX_CONCURRENT_EXPORTS
+
+    @staticmethod
+    def _validate_arguments(
+        max_queue_size,
+        schedule_delay_millis,
+        max_export_batch_size,
+        queue_shards=None,
+        max_concurrent_exports=1,
+        max_export_batch_bytes=None,
+    ):
         if max_queue_size <= 0:
             raise ValueError("max_queue_size must be a positive integer.")
 
@@ -390,3 +516,84 @@ class BatchLogRecordProcessor(LogRecordProcessor):
 
         if max_export_batch_size > max_queue_size:
             raise ValueError("max_export_batch_size must be less than or equal to max_queue_size.")
+
+        if queue_shards is not None and queue_shards <= 0:
+            raise ValueError("queue_shards must be a positive integer.")
+
+        if max_concurrent_exports <= 0:
+            raise ValueError("max_concurrent_exports must be a positive integer.")
+
+        if max_export_batch_bytes is not None and max_export_batch_bytes <= 0:
+            raise ValueError("max_export_batch_bytes must be a positive integer.")
+
+
+class AsyncBatchLogRecordProcessor(LogRecordProcessor):
+    """This is an implementation of LogRecordProcessor for asyncio applications
+    which creates batches of received logs and sends them to the configured
+    AsyncLogRecordExporter from a task on the event loop ``loop``, the running
+    event loop by default. It is configured by the same environment variables
+    as `BatchLogRecordProcessor`.
+
+    Logs can be emitted on any thread. `shutdown` and `force_flush` wait for
+    the event loop, on the thread running it they only schedule the work:
+    await `shutdown_async` and `force_flush_async` there instead. Logs still
+    queued when the event loop stops are lost, await `shutdown_async` before
+    it stops to export them.
+
+    All the logic for emitting logs, shutting down etc. resides in the AsyncBatchProcessor class.
+    """
+
+    def __init__(
+        self,
+        exporter: AsyncLogRecordExporter,
+        schedule_delay_millis: float | None = None,
+        max_export_batch_size: int | None = None,
+        export_timeout_millis: float | None = None,
+        max_queue_size: int | None = None,
+        *,
+        meter_provider: MeterProvider | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        if max_queue_size is None:
+            max_queue_size = BatchLogRecordProcessor._default_max_queue_size()
+
+        if schedule_delay_millis is None:
+            schedule_delay_millis = BatchLogRecordProcessor._default_schedule_delay_millis()
+
+        if max_export_batch_size is None:
+            max_export_batch_size = BatchLogRecordProcessor._default_max_export_batch_size()
+        if export_timeout_millis is None:
+            export_timeout_millis = BatchLogRecordProcessor._default_export_timeout_millis()
+
+        BatchLogRecordProcessor._validate_arguments(max_queue_size, schedule_delay_millis, max_export_batch_size)
+        self._batch_processor = AsyncBatchProcessor(
+            exporter,
+            schedule_delay_millis,
+            max_export_batch_size,
+            export_timeout_millis,
+            max_queue_size,
+            "Log",
+            create_processor_metrics(
+                "logs",
+                OtelComponentTypeValues.BATCHING_LOG_PROCESSOR,
+                meter_provider or get_meter_provider(),
+                capacity=max_queue_size,
+                enabled=parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
+            ),
+            loop=loop,
+        )
+
+    def on_emit(self, log_record: ReadWriteLogRecord) -> None:
+        return self._batch_processor.emit(_to_readable_log_record(log_record))
+
+    def shutdown(self):
+        return self._batch_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int | None = None) -> bool:
+        return self._batch_processor.force_flush(timeout_millis)
+
+    async def shutdown_async(self) -> None:
+        await self._batch_processor.shutdown_async()
+
+    async def force_flush_async(self, timeout_millis: int | None = None) -> bool:
+        return await self._batch_processor.force_flush_async(timeout_millis)
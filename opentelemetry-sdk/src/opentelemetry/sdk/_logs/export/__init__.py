@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from opentelemetry.sdk._logs._internal.export import (
+    AsyncBatchLogRecordProcessor,
+    AsyncLogRecordExporter,
     BatchLogRecordProcessor,
     ConsoleLogExporter,
     ConsoleLogRecordExporter,
@@ -19,6 +21,8 @@ from opentelemetry.sdk._logs._internal.export.in_memory_log_exporter import (
 )
 
 __all__ = [
+    "AsyncBatchLogRecordProcessor",
+    "AsyncLogRecordExporter",
     "BatchLogRecordProcessor",
     "ConsoleLogExporter",
     "ConsoleLogRecordExporter",
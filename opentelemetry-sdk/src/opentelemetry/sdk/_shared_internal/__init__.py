@@ -6,12 +6,15 @@ from __future__ import annotations
 import collections
 import enum
 import inspect
+import itertools
 import logging
 import os
 import threading
 import time
 import weakref
 from abc import abstractmethod
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import (
     Generic,
     Protocol,
@@ -76,10 +79,90 @@ _logger = logging.getLogger(__name__)
 _logger.addFilter(DuplicateFilter())
 
 
+class _ShardedQueue(Generic[Telemetry]):
+    """A queue split into several bounded shards so that concurrent emitters
+    don't all append to the same deque.
+
+    Each emitting thread is pinned to one shard (assigned round-robin the first
+    time the thread emits) and appends to it until it is full. The worker
+    thread is the only consumer: when its backlog is empty it drains every
+    shard in bulk into the backlog and then pops from there, oldest first per
+    shard.
+
+    The shards together hold at most ``max_queue_size`` items, the backlog holds
+    what the worker has drained but not exported yet. There are never more
+    shards than ``max_queue_size``, so that each can hold at least one item.
+    """
+
+    def __init__(self, max_queue_size: int, num_shards: int):
+        self.num_shards = min(num_shards, max_queue_size)
+        shard_size, remainder = divmod(max_queue_size, self.num_shards)
+        # The first shards hold one more item each so that none of
+        # max_queue_size is lost when it doesn't divide evenly.
+        self._shards: list[collections.deque[Telemetry]] = [
+            collections.deque([], shard_size + 1 if index < remainder else shard_size)
+            for index in range(self.num_shards)
+        ]
+        self._backlog: collections.deque[Telemetry] = collections.deque()
+        self._next_shard = itertools.count()
+        self._local = threading.local()
+
+    def shard_for_append(self) -> collections.deque[Telemetry]:
+        """Returns the calling thread's shard, or another shard with room when
+        it is full so that fewer emitting threads than shards can still use the
+        whole capacity. Returns the full shard when every shard is full."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shards[next(self._next_shard) % len(self._shards)]
+            self._local.shard = shard
+        if len(shard) == shard.maxlen:
+            for other in self._shards:
+                if len(other) != other.maxlen:
+                    return other
+        return shard
+
+    def __len__(self) -> int:
+        return len(self._backlog) + sum(len(shard) for shard in self._shards)
+
+    def _drain(self) -> None:
+        for shard in self._shards:
+            # Emitters only append on the left, so popping the current length
+            # from the right can never race with them for the same item.
+            for _ in range(len(shard)):
+                self._backlog.appendleft(shard.pop())
+
+    def pop(self) -> Telemetry:
+        if not self._backlog:
+            self._drain()
+        return self._backlog.pop()
+
+    def peek(self) -> Telemetry:
+        """Returns the item the next `pop` returns, without removing it."""
+        if not self._backlog:
+            self._drain()
+        return self._backlog[-1]
+
+    def clear(self) -> None:
+        self._backlog.clear()
+        for shard in self._shards:
+            shard.clear()
+
+
 class BatchProcessor(Generic[Telemetry]):
     """This class can be used with exporter's that implement the above
     Exporter interface to buffer and send telemetry in batch through
-     the exporter."""
+     the exporter.
+
+    With ``max_concurrent_exports`` greater than 1 the worker thread hands each
+    batch to a pool of that many export threads instead of calling the exporter
+    itself, so a slow export doesn't stop the queue from being drained. Batches
+    may then reach the exporter out of order.
+
+    With ``max_export_batch_bytes`` set, the size of each item is estimated by
+    ``size_estimator`` when it is emitted, and batches are cut so that their
+    size stays within that budget as well. A single item larger than the budget
+    is exported on its own."""
 
     def __init__(
         self,
@@ -90,6 +173,10 @@ class BatchProcessor(Generic[Telemetry]):
         max_queue_size: int,
         exporting: str,
         metrics: ProcessorMetricsT,
+        queue_shards: int | None = None,
+        max_concurrent_exports: int = 1,
+        max_export_batch_bytes: int | None = None,
+        size_estimator: Callable[[Telemetry], int] | None = None,
     ):
         self._bsp_reset_once = Once()
         self._exporter = exporter
@@ -97,19 +184,38 @@ class BatchProcessor(Generic[Telemetry]):
         self._schedule_delay_millis = schedule_delay_millis
         self._schedule_delay = schedule_delay_millis / 1e3
         self._max_export_batch_size = max_export_batch_size
-        # Not used. No way currently to pass timeout to export.
-        # TODO(https://github.com/open-telemetry/opentelemetry-python/issues/4555): figure out what this should do.
+        self._max_export_batch_bytes = max_export_batch_bytes
+        self._size_estimator = size_estimator
+        # When set, the queue holds (item, estimated size) pairs.
+        self._queue_sizes = max_export_batch_bytes is not None and size_estimator is not None
+        # Passed to exporters whose export accepts a timeout, capped by the remaining
+        # force_flush/shutdown budget if there is one.
         self._export_timeout_millis = export_timeout_millis
+        self._export_accepts_timeout = "timeout_millis" in inspect.getfullargspec(exporter.export).args
         # Deque is thread safe.
-        self._queue = collections.deque([], max_queue_size)
+        self._queue: collections.deque[Telemetry] | _ShardedQueue[Telemetry]
+        if queue_shards is not None and queue_shards > 1:
+            self._queue = _ShardedQueue(max_queue_size, queue_shards)
+            self._shard_wake_threshold = max(1, max_export_batch_size // self._queue.num_shards)
+        else:
+            self._queue = collections.deque([], max_queue_size)
         self._worker_thread = threading.Thread(
             name=f"OtelBatch{exporting}RecordProcessor",
             target=self.worker,
             daemon=True,
         )
         self._exporting = exporting
+        self._max_concurrent_exports = max_concurrent_exports
+        self._export_executor: ThreadPoolExecutor | None = None
+        self._in_flight_exports: set[Future[None]] = set()
+        if max_concurrent_exports > 1:
+            self._export_executor = self._new_export_executor()
+            # Bounds the number of batches handed to the pool, the worker waits for
+            # a free slot so the queue still applies backpressure.
+            self._export_slots = threading.Semaphore(max_concurrent_exports)
 
         self._shutdown = False
+        self._shutdown_deadline: float | None = None
         self._shutdown_timeout_exceeded = False
         self._export_lock = threading.Lock()
         self._worker_awaken = threading.Event()
@@ -139,10 +245,21 @@ class BatchProcessor(Generic[Telemetry]):
             return num_iterations == 0
         return False
 
+    def _new_export_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self._max_concurrent_exports,
+            thread_name_prefix=f"OtelBatch{self._exporting}Export",
+        )
+
     def _at_fork_reinit(self):
         self._export_lock = threading.Lock()
         self._worker_awaken = threading.Event()
         self._queue.clear()
+        if self._export_executor is not None:
+            # The pool's threads don't exist in the child, its in-flight batches belong to the parent.
+            self._export_executor = self._new_export_executor()
+            self._export_slots = threading.Semaphore(self._max_concurrent_exports)
+            self._in_flight_exports = set()
         self._worker_thread = threading.Thread(
             name=f"OtelBatch{self._exporting}RecordProcessor",
             target=self.worker,
@@ -165,29 +282,105 @@ class BatchProcessor(Generic[Telemetry]):
                 else BatchExportStrategy.EXPORT_AT_LEAST_ONE_BATCH
             )
             self._worker_awaken.clear()
-        self._export(BatchExportStrategy.EXPORT_ALL)
+        self._export(BatchExportStrategy.EXPORT_ALL, self._shutdown_deadline)
 
-    def _export(self, batch_strategy: BatchExportStrategy) -> None:
-        with self._export_lock:
+    def _export(self, batch_strategy: BatchExportStrategy, deadline: float | None = None) -> bool:
+        """Exports batches according to ``batch_strategy``. Returns False if ``deadline``
+        (a `time.time()` value) passed before all the requested batches were exported,
+        the remaining ones are left in the queue."""
+        export_lock = self._export_lock
+        # Waiting for the lock is bounded by the deadline, which a `with` block cannot express.
+        # pylint: disable-next=consider-using-with
+        if not export_lock.acquire(timeout=-1 if deadline is None else max(0, deadline - time.time())):
+            return False
+        try:
             iteration = 0
             # We could see concurrent export calls from worker and force_flush. We call _should_export_batch
             # once the lock is obtained to see if we still need to make the requested export.
             while self._should_export_batch(batch_strategy, iteration):
+                timeout_millis = self._export_timeout_millis
+                if deadline is not None:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return False
+                    timeout_millis = min(timeout_millis, remaining * 1000)
+                # The slot is released by _export_done once the export finishes, on
+                # another thread, so it cannot be scoped with a `with` block.
+                # pylint: disable-next=consider-using-with
+                if self._export_executor is not None and not self._export_slots.acquire(
+                    timeout=None if deadline is None else timeout_millis / 1000
+                ):
+                    return False
                 iteration += 1
-                token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
-                count = min(
-                    self._max_export_batch_size,
-                    len(self._queue),
-                )
-                # Oldest records are at the back, so pop from there.
-                batch = [self._queue.pop() for _ in range(count)]
+                batch = self._pop_batch()
                 # Record on submission to the exporter.
-                self._metrics.finish_items(count)
+                self._metrics.finish_items(len(batch))
+                if self._export_executor is None:
+                    self._export_batch(batch, timeout_millis)
+                    continue
                 try:
-                    self._exporter.export(batch)
-                except Exception:  # pylint: disable=broad-exception-caught
-                    _logger.exception("Exception while exporting %s.", self._exporting)
-                detach(token)
+                    future = self._export_executor.submit(self._export_batch, batch, timeout_millis)
+                except RuntimeError:
+                    # Shutdown timed out and already shut the pool down.
+                    self._export_slots.release()
+                    return False
+                self._in_flight_exports.add(future)
+                future.add_done_callback(self._export_done)
+            return True
+        finally:
+            export_lock.release()
+
+    def _pop_batch(self) -> list[Telemetry]:
+        """Pops the next batch from the queue, cut by the batch size and by the
+        byte budget if there is one."""
+        queue = self._queue
+        count = min(self._max_export_batch_size, len(queue))
+        if not self._queue_sizes:
+            # Oldest records are at the back, so pop from there.
+            return [queue.pop() for _ in range(count)]
+
+        peek = queue.peek if isinstance(queue, _ShardedQueue) else lambda: queue[-1]
+        batch: list[Telemetry] = []
+        batch_bytes = 0
+        for _ in range(count):
+            item, item_bytes = peek()
+            if batch and batch_bytes + item_bytes > self._max_export_batch_bytes:
+                break
+            queue.pop()
+            batch.append(item)
+            batch_bytes += item_bytes
+        return batch
+
+    def _export_batch(self, batch: list[Telemetry], timeout_millis: float) -> None:
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        try:
+            if self._export_accepts_timeout:
+                self._exporter.export(batch, timeout_millis=timeout_millis)  # type: ignore
+            else:
+                self._exporter.export(batch)
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Exception while exporting %s.", self._exporting)
+        finally:
+            detach(token)
+
+    def _with_size(self, data: Telemetry) -> tuple[Telemetry, int]:
+        try:
+            return data, self._size_estimator(data)  # type: ignore[misc]
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Exception while estimating the size of %s.", self._exporting)
+            return data, 0
+
+    def _export_done(self, future: Future[None]) -> None:
+        self._in_flight_exports.discard(future)
+        self._export_slots.release()
+
+    def _wait_for_in_flight_exports(self, timeout: float | None = None) -> bool:
+        """Waits for the batches handed to the export pool so far, returns
+        whether they all finished before the timeout."""
+        if not self._in_flight_exports:
+            return True
+        _, not_done = wait(set(self._in_flight_exports), timeout)
+        return not not_done
 
     def emit(self, data: Telemetry) -> None:
         if self._shutdown:
@@ -196,6 +389,11 @@ class BatchProcessor(Generic[Telemetry]):
             return
         if self._pid != os.getpid():
             self._bsp_reset_once.do_once(self._at_fork_reinit)
+        if self._queue_sizes:
+            data = self._with_size(data)  # type: ignore[assignment]
+        if isinstance(self._queue, _ShardedQueue):
+            self._emit_sharded(data, self._queue)
+            return
         if len(self._queue) == self._max_queue_size:
             _logger.warning("Queue full, dropping %s.", self._exporting)
             self._metrics.drop_items(1)
@@ -204,10 +402,29 @@ class BatchProcessor(Generic[Telemetry]):
         if len(self._queue) >= self._max_export_batch_size and not self._worker_awaken.is_set():
             self._worker_awaken.set()
 
+    def _emit_sharded(self, data: Telemetry, queue: _ShardedQueue[Telemetry]) -> None:
+        shard = queue.shard_for_append()
+        if len(shard) == shard.maxlen:
+            _logger.warning("Queue full, dropping %s.", self._exporting)
+            self._metrics.drop_items(1)
+        # This will drop a log from the right side if the shard is at its maxlen.
+        shard.appendleft(data)
+        shard_len = len(shard)
+        # Summing up every shard on each emit would bring back the contention sharding
+        # avoids, so only do it each time this shard grew by another share of a batch.
+        if (
+            (shard_len % self._shard_wake_threshold == 0 or shard_len == shard.maxlen)
+            and len(queue) >= self._max_export_batch_size
+            and not self._worker_awaken.is_set()
+        ):
+            self._worker_awaken.set()
+
     def shutdown(self, timeout_millis: int = 30000):
         if self._shutdown:
             return
         shutdown_should_end = time.time() + (timeout_millis / 1000)
+        # The worker's last export stops starting new batches once this passes.
+        self._shutdown_deadline = shutdown_should_end
         # Causes emit to reject telemetry and makes force_flush a no-op.
         self._shutdown = True
         # Interrupts sleep in the worker if it's sleeping.
@@ -215,6 +432,14 @@ class BatchProcessor(Generic[Telemetry]):
         self._worker_thread.join(timeout_millis / 1000)
         # Stops worker thread from calling export again if queue is still not empty.
         self._shutdown_timeout_exceeded = True
+        # Whatever is still queued won't be exported anymore.
+        if abandoned := len(self._queue):
+            self._queue.clear()
+            _logger.warning("Shutdown timed out, dropping %d %s.", abandoned, self._exporting)
+            self._metrics.drop_items(abandoned, "timeout")
+        if self._export_executor is not None:
+            self._wait_for_in_flight_exports(max(0, shutdown_should_end - time.time()))
+            self._export_executor.shutdown(wait=False)
         # We want to shutdown immediately only if we already waited `timeout_secs`.
         # Otherwise we pass the remaining timeout to the exporter.
         # Some exporter's shutdown support a timeout param.
@@ -228,10 +453,15 @@ class BatchProcessor(Generic[Telemetry]):
         # call is ongoing and the thread isn't finished. In this case we will return instead of waiting on
         # the thread to finish.
 
-    # TODO: Fix force flush so the timeout is used https://github.com/open-telemetry/opentelemetry-python/issues/4568.
     def force_flush(self, timeout_millis: int | None = None) -> bool:
+        """Exports everything queued, returns False if that didn't finish within
+        ``timeout_millis``. Batches that weren't started in time stay queued for
+        the worker, without a timeout this blocks until everything is exported."""
         if self._shutdown:
             return False
-        # Blocking call to export.
-        self._export(BatchExportStrategy.EXPORT_ALL)
-        return True
+        if timeout_millis is None:
+            return self._export(BatchExportStrategy.EXPORT_ALL) and self._wait_for_in_flight_exports()
+        deadline = time.time() + (timeout_millis / 1000)
+        return self._export(BatchExportStrategy.EXPORT_ALL, deadline) and self._wait_for_in_flight_exports(
+            max(0, deadline - time.time())
+        )
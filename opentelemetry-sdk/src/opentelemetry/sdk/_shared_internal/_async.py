@@ -0,0 +1,309 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batching of telemetry for exporters running on an asyncio event loop.
+
+`AsyncBatchProcessor` is the asyncio counterpart of `BatchProcessor`: its
+worker is a task on the application's event loop instead of a thread and it
+awaits the exporter, so an export waiting on the network or on a retry
+backoff doesn't hold a thread of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import concurrent.futures
+import logging
+from abc import abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, Protocol, TypeVar
+
+from opentelemetry.context import (
+    _SUPPRESS_INSTRUMENTATION_KEY,
+    attach,
+    detach,
+    set_value,
+)
+from opentelemetry.sdk._shared_internal import (
+    BatchExportStrategy,
+    DuplicateFilter,
+    Telemetry,
+)
+from opentelemetry.sdk._shared_internal._processor_metrics import (
+    ProcessorMetricsT,
+)
+
+_T = TypeVar("_T")
+
+_logger = logging.getLogger(__name__)
+_logger.addFilter(DuplicateFilter())
+
+# The event loop only keeps weak references to its tasks, the ones scheduled
+# by run_from_thread are kept alive here until they are done.
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+class AsyncExporter(Protocol[Telemetry]):
+    @abstractmethod
+    async def export(self, batch: list[Telemetry], /):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def shutdown(self):
+        raise NotImplementedError
+
+
+def in_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    """Returns whether this is the thread running ``loop``."""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def call_in_loop(loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> None:
+    """Calls ``callback`` right away on the thread running ``loop``, or
+    schedules it on ``loop`` from any other thread."""
+    if in_loop_thread(loop):
+        callback()
+    else:
+        loop.call_soon_threadsafe(callback)
+
+
+def run_from_thread(
+    loop: asyncio.AbstractEventLoop,
+    coroutine_function: Callable[..., Awaitable[_T]],
+    *args: Any,
+    timeout: float | None,
+    default: _T,
+) -> _T:
+    """Runs ``coroutine_function(*args)`` on ``loop`` and waits at most
+    ``timeout`` seconds for its result, for the synchronous methods of the
+    processors and readers running on an event loop.
+
+    Waiting on the thread running ``loop`` would block the coroutine, there
+    it is only scheduled and ``default`` is returned. ``default`` is also
+    returned when ``loop`` doesn't run anymore and when the coroutine didn't
+    finish in time, it is then cancelled.
+    """
+    if in_loop_thread(loop):
+        task = loop.create_task(coroutine_function(*args))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return default
+    if not loop.is_running():
+        _logger.warning(
+            "The event loop isn't running anymore, %s cannot run.",
+            coroutine_function.__qualname__,
+        )
+        return default
+    future = asyncio.run_coroutine_threadsafe(coroutine_function(*args), loop)
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        return default
+
+
+class AsyncBatchProcessor(Generic[Telemetry]):
+    """This class can be used with exporter's that implement the above
+    AsyncExporter interface to buffer and send telemetry in batch through
+    the exporter, from a task on the event loop ``loop``.
+
+    ``loop`` defaults to the running event loop. `emit` can be called from
+    any thread, the coroutines have to be awaited on ``loop``. The exports
+    are cancelled when they exceed their timeout or the shutdown timeout.
+
+    Unlike `BatchProcessor` nothing is done at fork: an event loop can't be
+    used in a forked child either."""
+
+    def __init__(
+        self,
+        exporter: AsyncExporter[Telemetry],
+        schedule_delay_millis: float,
+        max_export_batch_size: int,
+        export_timeout_millis: float,
+        max_queue_size: int,
+        exporting: str,
+        metrics: ProcessorMetricsT,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._exporter = exporter
+        self._max_queue_size = max_queue_size
+        self._schedule_delay = schedule_delay_millis / 1e3
+        self._max_export_batch_size = max_export_batch_size
+        self._export_timeout = export_timeout_millis / 1e3
+        # Deque is thread safe.
+        self._queue: collections.deque[Telemetry] = collections.deque([], max_queue_size)
+        self._exporting = exporting
+
+        self._shutdown = False
+        self._shutdown_deadline: float | None = None
+        self._export_lock = asyncio.Lock()
+        self._worker_awaken = asyncio.Event()
+        # asyncio.Event isn't thread safe, emit schedules setting it once per wake up.
+        self._worker_awaken_scheduled = False
+        self._worker_task: asyncio.Task[None] | None = None
+        call_in_loop(self._loop, self._start_worker)
+
+        metrics.register_queue_size(lambda: len(self._queue))
+        self._metrics = metrics
+
+    def _start_worker(self) -> None:
+        if self._worker_task is None:
+            self._worker_task = self._loop.create_task(
+                self.worker(),
+                name=f"OtelBatch{self._exporting}RecordProcessor",
+            )
+
+    def _should_export_batch(self, batch_strategy: BatchExportStrategy, num_iterations: int) -> bool:
+        if not self._queue:
+            return False
+        # Always continue to export while queue length exceeds max batch size.
+        if len(self._queue) >= self._max_export_batch_size:
+            return True
+        if batch_strategy is BatchExportStrategy.EXPORT_ALL:
+            return True
+        if batch_strategy is BatchExportStrategy.EXPORT_AT_LEAST_ONE_BATCH:
+            return num_iterations == 0
+        return False
+
+    async def worker(self) -> None:
+        while not self._shutdown:
+            # Shutdown will interrupt this sleep. Emit will interrupt this sleep only if the queue is bigger then threshold.
+            try:
+                await asyncio.wait_for(self._worker_awaken.wait(), self._schedule_delay)
+                sleep_interrupted = True
+            except asyncio.TimeoutError:
+                sleep_interrupted = False
+            if self._shutdown:
+                break
+            await self._export(
+                BatchExportStrategy.EXPORT_WHILE_BATCH_EXCEEDS_THRESHOLD
+                if sleep_interrupted
+                else BatchExportStrategy.EXPORT_AT_LEAST_ONE_BATCH
+            )
+            self._worker_awaken.clear()
+            self._worker_awaken_scheduled = False
+        await self._export(BatchExportStrategy.EXPORT_ALL, self._shutdown_deadline)
+
+    async def _export(self, batch_strategy: BatchExportStrategy, deadline: float | None = None) -> bool:
+        """Exports batches according to ``batch_strategy``. Returns False if ``deadline``
+        (a ``loop.time()`` value) passed before all the requested batches were exported,
+        the remaining ones are left in the queue."""
+        if deadline is None:
+            await self._export_lock.acquire()
+        else:
+            try:
+                await asyncio.wait_for(self._export_lock.acquire(), max(0, deadline - self._loop.time()))
+            except asyncio.TimeoutError:
+                return False
+        try:
+            iteration = 0
+            # The worker and force_flush_async can both be waiting for the lock, check again
+            # once it is obtained whether the requested export is still needed.
+            while self._should_export_batch(batch_strategy, iteration):
+                timeout = self._export_timeout
+                if deadline is not None:
+                    remaining = deadline - self._loop.time()
+                    if remaining <= 0:
+                        return False
+                    timeout = min(timeout, remaining)
+                iteration += 1
+                count = min(self._max_export_batch_size, len(self._queue))
+                # Oldest records are at the back, so pop from there.
+                batch = [self._queue.pop() for _ in range(count)]
+                # Record on submission to the exporter.
+                self._metrics.finish_items(count)
+                await self._export_batch(batch, timeout)
+            return True
+        finally:
+            self._export_lock.release()
+
+    async def _export_batch(self, batch: list[Telemetry], timeout: float) -> None:
+        # The export runs in a task of its own, which copies this context.
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        try:
+            await asyncio.wait_for(self._exporter.export(batch), timeout)
+        except asyncio.TimeoutError:
+            _logger.warning("Timed out exporting %s.", self._exporting)
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Exception while exporting %s.", self._exporting)
+        finally:
+            detach(token)
+
+    def emit(self, data: Telemetry) -> None:
+        if self._shutdown:
+            _logger.info("Shutdown called, ignoring %s.", self._exporting)
+            self._metrics.drop_items(1, "already_shutdown")
+            return
+        if len(self._queue) == self._max_queue_size:
+            _logger.warning("Queue full, dropping %s.", self._exporting)
+            self._metrics.drop_items(1)
+        # This will drop a log from the right side if the queue is at _max_queue_size.
+        self._queue.appendleft(data)
+        if len(self._queue) >= self._max_export_batch_size and not self._worker_awaken_scheduled:
+            self._worker_awaken_scheduled = True
+            try:
+                self._loop.call_soon_threadsafe(self._worker_awaken.set)
+            except RuntimeError:
+                # The event loop is closed, the worker is gone with it.
+                pass
+
+    async def shutdown_async(self, timeout_millis: float = 30000) -> None:
+        if self._shutdown:
+            return
+        shutdown_should_end = self._loop.time() + timeout_millis / 1e3
+        # The worker's last export stops starting new batches once this passes.
+        self._shutdown_deadline = shutdown_should_end
+        # Causes emit to reject telemetry and makes force_flush a no-op.
+        self._shutdown = True
+        # Interrupts sleep in the worker if it's sleeping.
+        self._worker_awaken.set()
+        self._start_worker()
+        worker = self._worker_task
+        _, pending = await asyncio.wait({worker}, timeout=max(0, shutdown_should_end - self._loop.time()))
+        if pending:
+            # Cancels the export in progress so that the exporter can be shut down in time.
+            worker.cancel()
+            await asyncio.wait({worker})
+        # Whatever is still queued won't be exported anymore.
+        if abandoned := len(self._queue):
+            self._queue.clear()
+            _logger.warning("Shutdown timed out, dropping %d %s.", abandoned, self._exporting)
+            self._metrics.drop_items(abandoned, "timeout")
+        await self._exporter.shutdown()
+
+    async def force_flush_async(self, timeout_millis: float | None = None) -> bool:
+        """Exports everything queued, returns False if that didn't finish within
+        ``timeout_millis``. Batches that weren't started in time stay queued for
+        the worker, without a timeout this waits until everything is exported."""
+        if self._shutdown:
+            return False
+        if timeout_millis is None:
+            return await self._export(BatchExportStrategy.EXPORT_ALL)
+        return await self._export(BatchExportStrategy.EXPORT_ALL, self._loop.time() + timeout_millis / 1e3)
+
+    def shutdown(self, timeout_millis: float = 30000) -> None:
+        """Runs `shutdown_async` on the event loop, see `run_from_thread`."""
+        if self._shutdown:
+            return
+        run_from_thread(
+            self._loop,
+            self.shutdown_async,
+            timeout_millis,
+            timeout=timeout_millis / 1e3,
+            default=None,
+        )
+
+    def force_flush(self, timeout_millis: float | None = None) -> bool:
+        """Runs `force_flush_async` on the event loop, see `run_from_thread`."""
+        return run_from_thread(
+            self._loop,
+            self.force_flush_async,
+            timeout_millis,
+            timeout=None if timeout_millis is None else timeout_millis / 1e3,
+            default=False,
+        )
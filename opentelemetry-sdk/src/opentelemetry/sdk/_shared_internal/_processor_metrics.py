@@ -76,6 +76,11 @@ class ProcessorMetrics:
             ERROR_TYPE: "already_shutdown",
         }
 
+        self._timeout_attrs = {
+            **self._standard_attrs,
+            ERROR_TYPE: "timeout",
+        }
+
         if signal == "traces":
             create_processed = create_otel_sdk_processor_span_processed
             create_queue_capacity = create_otel_sdk_processor_span_queue_capacity
@@ -114,6 +119,8 @@ class ProcessorMetrics:
     def drop_items(self, count: int, error_type: str = "queue_full") -> None:
         if error_type == "already_shutdown":
             self._processed.add(count, self._already_shutdown_attrs)
+        elif error_type == "timeout":
+            self._processed.add(count, self._timeout_attrs)
         else:
             self._processed.add(count, self._dropped_attrs)
 
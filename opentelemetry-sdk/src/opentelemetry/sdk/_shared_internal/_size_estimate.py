@@ -0,0 +1,41 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Cheap estimates of the OTLP encoded size of telemetry, used to cut batches
+by bytes. They are deliberately approximate: strings are counted in UTF-8
+bytes, but per-field protobuf overhead is a flat number of bytes."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+# Tag, length prefix and wrapping message of a single key/value or array entry.
+_FIELD_OVERHEAD = 4
+# Encoded size of a bool/int/double value.
+_SCALAR_SIZE = 9
+
+
+def estimate_string_size(value: str) -> int:
+    # Encoding is only needed to size non-ASCII strings.
+    return len(value) if value.isascii() else len(value.encode("utf-8"))
+
+
+def estimate_value_size(value: Any) -> int:
+    if isinstance(value, str):
+        return estimate_string_size(value) + _FIELD_OVERHEAD
+    if isinstance(value, bytes):
+        return len(value) + _FIELD_OVERHEAD
+    if isinstance(value, Mapping):
+        return estimate_attributes_size(value) + _FIELD_OVERHEAD
+    if isinstance(value, Sequence):
+        return sum(estimate_value_size(element) for element in value) + _FIELD_OVERHEAD
+    return _SCALAR_SIZE
+
+
+def estimate_attributes_size(attributes: Mapping[str, Any] | None) -> int:
+    if not attributes:
+        return 0
+    return sum(
+        estimate_string_size(key) + estimate_value_size(value) + _FIELD_OVERHEAD for key, value in attributes.items()
+    )
@@ -97,7 +97,7 @@ OTEL_BLRP_EXPORT_TIMEOUT = "OTEL_BLRP_EXPORT_TIMEOUT"
 .. envvar:: OTEL_BLRP_EXPORT_TIMEOUT
 
 The :envvar:`OTEL_BLRP_EXPORT_TIMEOUT` represents the maximum allowed time to export data from the BatchLogRecordProcessor.
-This environment variable currently does nothing, see https://github.com/open-telemetry/opentelemetry-python/issues/4555.
+It is passed to exporters whose ``export`` accepts a ``timeout_millis`` argument.
 Default: 30000
 """
 
@@ -117,6 +117,14 @@ The :envvar:`OTEL_BLRP_MAX_EXPORT_BATCH_SIZE` represents the maximum batch size
 Default: 512
 """
 
+OTEL_BLRP_MAX_CONCURRENT_EXPORTS = "OTEL_BLRP_MAX_CONCURRENT_EXPORTS"
+"""
+.. envvar:: OTEL_BLRP_MAX_CONCURRENT_EXPORTS
+
+The :envvar:`OTEL_BLRP_MAX_CONCURRENT_EXPORTS` represents the maximum number of batches the BatchLogRecordProcessor exports concurrently.
+Default: 1
+"""
+
 OTEL_BSP_SCHEDULE_DELAY = "OTEL_BSP_SCHEDULE_DELAY"
 """
 .. envvar:: OTEL_BSP_SCHEDULE_DELAY
@@ -130,6 +138,7 @@ OTEL_BSP_EXPORT_TIMEOUT = "OTEL_BSP_EXPORT_TIMEOUT"
 .. envvar:: OTEL_BSP_EXPORT_TIMEOUT
 
 The :envvar:`OTEL_BSP_EXPORT_TIMEOUT` represents the maximum allowed time to export data from the BatchSpanProcessor.
+It is passed to exporters whose ``export`` accepts a ``timeout_millis`` argument.
 Default: 30000
 """
 
@@ -149,6 +158,14 @@ The :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE` represents the maximum batch size f
 Default: 512
 """
 
+OTEL_BSP_MAX_CONCURRENT_EXPORTS = "OTEL_BSP_MAX_CONCURRENT_EXPORTS"
+"""
+.. envvar:: OTEL_BSP_MAX_CONCURRENT_EXPORTS
+
+The :envvar:`OTEL_BSP_MAX_CONCURRENT_EXPORTS` represents the maximum number of batches the BatchSpanProcessor exports concurrently.
+Default: 1
+"""
+
 OTEL_ATTRIBUTE_COUNT_LIMIT = "OTEL_ATTRIBUTE_COUNT_LIMIT"
 """
 .. envvar:: OTEL_ATTRIBUTE_COUNT_LIMIT
@@ -861,3 +878,29 @@ The :envvar:`OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED` environment variable enab
 metrics emitted by the SDK about its own internal state.
 Default: "false"
 """
+
+_OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE = "OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE"
+"""
+.. envvar:: OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE
+
+The :envvar:`OTEL_PYTHON_EXPORTER_OTLP_ATTRIBUTE_CACHE_SIZE` sets the maximum number of attributes
+whose encoding is cached by the OTLP protobuf exporters. Attributes with a string, boolean, integer
+or bytes value are cached, the least recently used ones are evicted first. The cache helps when the
+same attribute keys and values are exported over and over, for example ``http.request.method=GET``.
+Default: 0, the cache is disabled.
+
+Note: This environment variable is experimental and subject to change.
+"""
+
+_OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES = "OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES"
+"""
+.. envvar:: OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES
+
+The :envvar:`OTEL_PYTHON_EXPORTER_OTLP_ENCODER_PROCESSES` sets the number of worker processes the OTLP
+protobuf span exporters serialize spans in, so that the serialization does not compete with the
+application threads for the GIL. The workers are started with the ``forkserver`` or ``spawn`` start
+method, the ``__main__`` module of the application must be importable without side effects.
+Default: 0, spans are serialized in the exporting thread.
+
+Note: This environment variable is experimental and subject to change.
+"""
@@ -396,6 +396,21 @@ class MeterProvider(APIMeterProvider):
         shutdown_on_exit: If true, registers an `atexit` handler to call
             `MeterProvider.shutdown`
         views: The views to configure the metric output the SDK
+        max_concurrent_callbacks: The maximum number of asynchronous instrument
+            callbacks run concurrently on a thread pool during a collection.
+            Each callback is then given the ``timeout_millis`` of its
+            `CallbackOptions`, the measurements of a callback that overruns it
+            are discarded without waiting for it. The default of 1 runs the
+            callbacks one after another on the collecting thread.
+        callback_cache_millis: The time during which the measurements returned
+            by the callbacks of an asynchronous instrument are reused instead
+            of calling them again, so that the collections of several metric
+            readers within this time call them once. Defaults to 0, the
+            callbacks are called by every collection.
+        uncached_instrument_names: The names of the asynchronous instruments
+            whose callbacks are called by every collection regardless of
+            ``callback_cache_millis``. Wild card characters are supported as
+            in the ``instrument_name`` of a view.
 
     .. code-block:: python
         :caption: Push-based export with PeriodicExportingMetricReader
@@ -438,6 +453,9 @@ class MeterProvider(APIMeterProvider):
         shutdown_on_exit: bool = True,
         views: Sequence["opentelemetry.sdk.metrics.view.View"] = (),
         *,
+        max_concurrent_callbacks: int = 1,
+        callback_cache_millis: float = 0,
+        uncached_instrument_names: Sequence[str] = (),
         _meter_configurator: _MeterConfiguratorT | None = None,
     ):
         self._lock = Lock()
@@ -456,6 +474,9 @@ class MeterProvider(APIMeterProvider):
         self._measurement_consumer = SynchronousMeasurementConsumer(
             sdk_config=self._sdk_config,
             metric_readers=metric_readers,
+            max_concurrent_callbacks=max_concurrent_callbacks,
+            callback_cache_millis=callback_cache_millis,
+            uncached_instrument_names=uncached_instrument_names,
         )
         disabled = environ.get(OTEL_SDK_DISABLED, "")
         self._disabled = disabled.lower().strip() == "true"
@@ -582,6 +603,8 @@ class MeterProvider(APIMeterProvider):
             except Exception as error:
                 metric_reader_error[metric_reader] = error
 
+        self._measurement_consumer.shutdown()
+
         if self._atexit_handler is not None:
             unregister(self._atexit_handler)
             self._atexit_handler = None
@@ -0,0 +1,49 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Interning of the attribute sets measurements are recorded with.
+
+Most measurements are recorded again and again with the same few attribute
+sets. Instead of cleaning and hashing the attributes on every measurement,
+they are identified by a cheap key that is used to look up the cleaned
+attributes here, and the aggregation in each `_ViewInstrumentMatch`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+from functools import lru_cache
+
+from opentelemetry.attributes import _clean_attribute_value
+from opentelemetry.util.types import AnyValue
+
+_ATTRIBUTE_SET_CACHE_SIZE = 2048
+
+_KEY_TYPES = frozenset((str,))
+# Only attribute sets made of these value types are interned: they are
+# hashable and cleaning them never changes their value. Other values may be
+# unhashable, nested or need to be converted.
+_VALUE_TYPES = frozenset((str, bool, int, float))
+
+# Key of the attribute set of measurements recorded without attributes.
+_EMPTY_ATTRIBUTE_SET_KEY = ((), ())
+
+
+def _attribute_set_key(attributes: Mapping[str, AnyValue]) -> Hashable | None:
+    """Returns a key identifying the attribute set, or None if it can't be interned."""
+    value_types = tuple(map(type, attributes.values()))
+    if not _VALUE_TYPES.issuperset(value_types) or not _KEY_TYPES.issuperset(map(type, attributes)):
+        return None
+    # Value types are part of the key because True == 1 == 1.0.
+    return tuple(attributes.items()), value_types
+
+
+@lru_cache(maxsize=_ATTRIBUTE_SET_CACHE_SIZE)
+def _intern_attribute_set(key: Hashable) -> Mapping[str, AnyValue]:
+    """Returns the cleaned attributes for a key of `_attribute_set_key`.
+
+    The returned mapping is shared by every measurement with the same attribute set
+    and must not be mutated.
+    """
+    items, _ = key
+    return _clean_attribute_value(dict(items), None)
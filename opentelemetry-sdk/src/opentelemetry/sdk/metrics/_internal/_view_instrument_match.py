@@ -1,15 +1,23 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import Mapping, Sequence
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from dataclasses import replace
+from functools import lru_cache, partial
 from logging import getLogger
 from threading import Lock
 from time import time_ns
 from types import NoneType
 from typing import TYPE_CHECKING, cast
+from weakref import WeakMethod
 
 from typing_extensions import assert_never
 
+from opentelemetry.sdk.metrics._internal._attribute_set_cache import (
+    _ATTRIBUTE_SET_CACHE_SIZE,
+    _intern_attribute_set,
+)
 from opentelemetry.sdk.metrics._internal.aggregation import (
     Aggregation,
     AggregationTemporality,
@@ -27,6 +35,12 @@ _logger = getLogger(__name__)
 
 _HashedAttributes = str | bool | int | float | bytes | None | tuple["_HashedAttributes", ...]
 
+# Default maximum number of metric points, including the overflow point, that
+# a metric stream keeps. Measurements with attribute sets beyond the limit are
+# aggregated into a single point with _OVERFLOW_ATTRIBUTES.
+_DEFAULT_AGGREGATION_CARDINALITY_LIMIT = 2000
+_OVERFLOW_ATTRIBUTES = {"otel.metric.overflow": True}
+
 
 # pylint: disable=inconsistent-return-statements
 def _hash_attributes(value: Attributes | AnyValue) -> _HashedAttributes:
@@ -48,17 +62,65 @@ def _hash_attributes(value: Attributes | AnyValue) -> _HashedAttributes:
         assert_never(value)
 
 
+_OVERFLOW_KEY = _hash_attributes(_OVERFLOW_ATTRIBUTES)
+
+
+def _interned_aggregations_cache(view_instrument_match: "_ViewInstrumentMatch"):
+    """Returns a per instance LRU cache of the aggregations of the interned
+    attribute sets of the view instrument match.
+
+    The cache is cleared when aggregations are evicted from
+    _attributes_aggregation so the cached ones remain valid. It only holds a
+    weak reference to the view instrument match, which would otherwise be
+    part of a reference cycle.
+    """
+    find_aggregation = WeakMethod(view_instrument_match._find_aggregation)  # pylint: disable=protected-access
+
+    @lru_cache(maxsize=_ATTRIBUTE_SET_CACHE_SIZE)
+    def find_interned_aggregation(attribute_set_key: Hashable) -> tuple[_Aggregation, bool]:
+        return find_aggregation()(_intern_attribute_set(attribute_set_key))  # type: ignore[misc]
+
+    return find_interned_aggregation
+
+
 class _ViewInstrumentMatch:
     def __init__(
         self,
         view: View,
         instrument: _Instrument,
         instrument_class_aggregation: dict[type, Aggregation],
+        aggregation_cardinality_limit: int = _DEFAULT_AGGREGATION_CARDINALITY_LIMIT,
+        record_overflow: Callable[[int], None] | None = None,
+        max_idle_collections: int | None = None,
+        record_evictions: Callable[[int], None] | None = None,
     ):
         self._view = view
         self._instrument = instrument
         self._attributes_aggregation: dict[_HashedAttributes, _Aggregation] = {}
+        # A view limit takes precedence over the limit of the reader.
+        self._aggregation_cardinality_limit = view._aggregation_cardinality_limit or aggregation_cardinality_limit
+        self._record_overflow = record_overflow
+        # A view value takes precedence over the value of the reader.
+        self._max_idle_collections = (
+            view._max_idle_collections if view._max_idle_collections is not None else max_idle_collections
+        )
+        self._record_evictions = record_evictions
+        self._interned_aggregations = _interned_aggregations_cache(self)
         self._lock = Lock()
+        # The aggregations updated since they were last collected, each one
+        # adds itself on its first update after being collected.
+        self._touched_aggregations: deque[_Aggregation] = deque()
+        self._previous_collection_start_nanos: int | None = None
+        # When idle aggregations are evicted, the collection in which each one
+        # was last updated, from the least to the most recently updated.
+        self._collections = 0
+        self._last_updated_collection: OrderedDict[_Aggregation, int] = OrderedDict()
+        # The aggregations bound instruments record to, never evicted.
+        self._bound_aggregations: set[_Aggregation] = set()
+        # When all the attribute sets are released on each collection, the
+        # start of the last collection, which starts the delta points of the
+        # aggregations created after it.
+        self._released_start_nanos: int | None = None
         self._instrument_class_aggregation = instrument_class_aggregation
         self._name = self._view._name or self._instrument.name
         self._description = self._view._description or self._instrument.description
@@ -105,53 +167,216 @@ class _ViewInstrumentMatch:
 
     # pylint: disable=protected-access
     def consume_measurement(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
-        attributes = {}
-        if measurement.attributes:
-            # Make a shallow copy since the user can mutate the dict after the fact.
-            # The user can still modify mutable attribute values (lists/dicts)
-            # leading to unexpected behavior, but deep copying is expensive.
-            attributes = dict(measurement.attributes)
+        self._find_consumed_aggregation(measurement.attributes, measurement._attribute_set_key).aggregate(
+            measurement, should_sample_exemplar
+        )
+
+    def consume_value(
+        self,
+        value: int | float,
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+    ) -> None:
+        """Consumes the value of a measurement that no exemplar reservoir
+        needs, see `SynchronousMeasurementConsumer.consume_value`."""
+        self._find_consumed_aggregation(attributes, attribute_set_key).aggregate_value(value)
+
+    def consume_values(
+        self,
+        values: Sequence[int | float],
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+        sampled_measurements: Sequence[Measurement],
+    ) -> None:
+        """Consumes several measurements sharing their attributes, see
+        `SynchronousMeasurementConsumer.consume_values`."""
+        self._find_consumed_aggregation(attributes, attribute_set_key, len(values)).aggregate_many(
+            values, sampled_measurements
+        )
+
+    def _find_consumed_aggregation(
+        self,
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+        measurement_count: int = 1,
+    ) -> _Aggregation:
+        if attribute_set_key is not None:
+            aggregation, overflowed = self._interned_aggregations(attribute_set_key)
+            if self._max_idle_collections is not None and aggregation._evicted:
+                # The aggregation was cached while it was being evicted.
+                self._interned_aggregations.cache_clear()
+                aggregation, overflowed = self._interned_aggregations(attribute_set_key)
+        else:
+            aggregation, overflowed = self._find_aggregation(attributes or {})
+
+        if overflowed and self._record_overflow is not None:
+            self._record_overflow(measurement_count)
+
+        return aggregation
+
+    def bind_aggregation(self, attributes: Attributes) -> tuple[_Aggregation, Callable[[int], None] | None]:
+        """Returns the aggregation a bound instrument with the attributes
+        records to and the callback to run with the number of its measurements
+        when the attribute set overflowed."""
+        aggregation, overflowed = self._find_aggregation(attributes or {})
+        while self._max_idle_collections is not None:
+            with self._lock:
+                if not aggregation._evicted:
+                    self._bound_aggregations.add(aggregation)
+                    break
+            aggregation, overflowed = self._find_aggregation(attributes or {})
+        return aggregation, self._record_overflow if overflowed else None
+
+    def _find_aggregation(self, attributes: Mapping[str, AnyValue]) -> tuple[_Aggregation, bool]:
+        """Returns the aggregation for the attributes and whether it is the overflow aggregation"""
         if self._view._attribute_keys is not None:
             attributes = {k: v for k, v in attributes.items() if k in self._view._attribute_keys}
 
         aggr_key = _hash_attributes(attributes)
+        aggregation = self._attributes_aggregation.get(aggr_key)
+        if aggregation is not None:
+            return aggregation, False
 
-        if aggr_key not in self._attributes_aggregation:
-            with self._lock:
-                if aggr_key not in self._attributes_aggregation:
-                    if not isinstance(self._view._aggregation, DefaultAggregation):
-                        aggregation = self._view._aggregation._create_aggregation(
-                            self._instrument,
-                            attributes,
-                            self._view._exemplar_reservoir_factory,
-                            time_ns(),
-                        )
-                    else:
-                        aggregation = self._instrument_class_aggregation[
-                            self._instrument.__class__
-                        ]._create_aggregation(
-                            self._instrument,
-                            attributes,
-                            self._view._exemplar_reservoir_factory,
-                            time_ns(),
+        with self._lock:
+            if aggr_key not in self._attributes_aggregation:
+                # One point is kept in reserve for the overflow attributes
+                # so that the stream never exceeds the limit.
+                if len(self._attributes_aggregation) >= self._aggregation_cardinality_limit - 1:
+                    if _OVERFLOW_KEY not in self._attributes_aggregation:
+                        self._attributes_aggregation[_OVERFLOW_KEY] = self._create_aggregation(
+                            dict(_OVERFLOW_ATTRIBUTES)
                         )
-                    self._attributes_aggregation[aggr_key] = aggregation
+                    return self._attributes_aggregation[_OVERFLOW_KEY], True
+                # Make a shallow copy since interned attributes are shared
+                # between measurements and exported data points must not
+                # alias them.
+                self._attributes_aggregation[aggr_key] = self._create_aggregation(dict(attributes))
+            return self._attributes_aggregation[aggr_key], False
 
-        self._attributes_aggregation[aggr_key].aggregate(measurement, should_sample_exemplar)
+    def _create_aggregation(self, attributes: Attributes) -> _Aggregation:
+        start_time_unix_nano = self._released_start_nanos or time_ns()
+        if not isinstance(self._view._aggregation, DefaultAggregation):
+            aggregation = self._view._aggregation._create_aggregation(
+                self._instrument,
+                attributes,
+                self._view._exemplar_reservoir_factory,
+                start_time_unix_nano,
+            )
+        else:
+            aggregation = self._instrument_class_aggregation[self._instrument.__class__]._create_aggregation(
+                self._instrument,
+                attributes,
+                self._view._exemplar_reservoir_factory,
+                start_time_unix_nano,
+            )
+        aggregation._on_touched = partial(self._touched_aggregations.append, aggregation)
+        return aggregation
 
     def collect(
         self,
         collection_aggregation_temporality: AggregationTemporality,
         collection_start_nanos: int,
     ) -> Sequence[DataPointT] | None:
-        data_points: list[DataPointT] = []
-        with self._lock:
-            for aggregation in self._attributes_aggregation.values():
-                data_point = aggregation.collect(collection_aggregation_temporality, collection_start_nanos)
+        collected_data_points = self._collect_touched_aggregations(
+            collection_aggregation_temporality, collection_start_nanos
+        )
+
+        if collection_aggregation_temporality is AggregationTemporality.DELTA:
+            data_points = [data_point for data_point in collected_data_points.values() if data_point is not None]
+        else:
+            # The cumulative points of the aggregations that were not updated
+            # are the ones they returned when they were last collected.
+            with self._lock:
+                aggregations = list(self._attributes_aggregation.values())
+
+            data_points = []
+            for aggregation in aggregations:
+                if aggregation in collected_data_points:
+                    data_point = collected_data_points[aggregation]
+                elif aggregation._previous_point is not None:
+                    data_point = replace(
+                        aggregation._previous_point,
+                        exemplars=[],
+                        time_unix_nano=collection_start_nanos,
+                    )
+                else:
+                    data_point = None
                 if data_point is not None:
                     data_points.append(data_point)
+            if self._max_idle_collections is not None:
+                # An evicted aggregation is still updated by the measurements
+                # that looked it up before its eviction.
+                for aggregation in collected_data_points.keys() - set(aggregations):
+                    data_point = collected_data_points[aggregation]
+                    if data_point is not None:
+                        data_points.append(data_point)
 
         # Returning here None instead of an empty list because the caller
         # does not consume a sequence and to be consistent with the rest of
         # collect methods that also return None.
         return data_points or None
+
+    def _collect_touched_aggregations(
+        self,
+        collection_aggregation_temporality: AggregationTemporality,
+        collection_start_nanos: int,
+    ) -> dict[_Aggregation, DataPointT | None]:
+        """Collects the aggregations updated since the previous collection,
+        then evicts the idle ones."""
+        # Only the aggregations updated since the previous collection are
+        # collected, the others would not return a delta point. The ones
+        # updated from here on add themselves again for the next collection.
+        touched_aggregations = self._touched_aggregations
+        previous_collection_start_nanos = self._previous_collection_start_nanos
+        self._previous_collection_start_nanos = collection_start_nanos
+        self._collections += 1
+
+        collected_data_points: dict[_Aggregation, DataPointT | None] = {}
+        for _ in range(len(touched_aggregations)):
+            aggregation = touched_aggregations.popleft()
+            if previous_collection_start_nanos is not None:
+                aggregation._skip_collections(previous_collection_start_nanos)
+            collected_data_points[aggregation] = aggregation.collect(
+                collection_aggregation_temporality, collection_start_nanos
+            )
+            if self._max_idle_collections is not None:
+                self._last_updated_collection[aggregation] = self._collections
+                self._last_updated_collection.move_to_end(aggregation)
+
+        if self._max_idle_collections is not None:
+            if not self._max_idle_collections:
+                self._released_start_nanos = collection_start_nanos
+            self._evict_idle_aggregations()
+
+        return collected_data_points
+
+    def _evict_idle_aggregations(self) -> None:
+        """Removes the aggregations that were not updated in the last
+        max_idle_collections collections from _attributes_aggregation. The
+        next measurement with their attributes creates a new aggregation,
+        which restarts a cumulative point with a new start time."""
+        last_idle_collection = self._collections - self._max_idle_collections
+        evicted_aggregations = 0
+        with self._lock:
+            while self._last_updated_collection:
+                aggregation, collection = next(iter(self._last_updated_collection.items()))
+                if collection > last_idle_collection:
+                    break
+                del self._last_updated_collection[aggregation]
+                # An aggregation updated since it was collected is collected
+                # again by the next collection, which tracks it from there on.
+                if aggregation._touched or aggregation in self._bound_aggregations:
+                    continue
+                aggregation_key = _hash_attributes(aggregation._attributes)
+                if self._attributes_aggregation.get(aggregation_key) is aggregation:
+                    del self._attributes_aggregation[aggregation_key]
+                aggregation._evicted = True
+                evicted_aggregations += 1
+            if evicted_aggregations:
+                self._interned_aggregations.cache_clear()
+
+        # Delta streams of synchronous instruments release all their attribute
+        # sets on each collection by default, which is not an eviction of idle
+        # points.
+        if evicted_aggregations and self._record_evictions is not None and self._max_idle_collections:
+            self._record_evictions(evicted_aggregations)
@@ -3,14 +3,17 @@
 
 # pylint: disable=too-many-lines
 
+import itertools
 import math
 from abc import ABC, abstractmethod
+from array import array
 from bisect import bisect_left
 from collections.abc import Callable, Sequence
 from enum import IntEnum
 from functools import partial
 from logging import getLogger
-from threading import Lock
+from operator import add
+from threading import Lock, local
 from typing import (
     Generic,
     TypeVar,
@@ -63,6 +66,159 @@ _DataPointVarT = TypeVar("_DataPointVarT", NumberDataPoint, HistogramDataPoint)
 
 _logger = getLogger(__name__)
 
+_stripe_local = local()
+_stripe_counter = itertools.count()
+
+
+def _current_stripe() -> int:
+    """Returns a number identifying the current thread, threads get
+    consecutive numbers so that they spread evenly over the stripes."""
+    try:
+        return _stripe_local.stripe
+    except AttributeError:
+        _stripe_local.stripe = stripe = next(_stripe_counter)
+        return stripe
+
+
+# The most values an exponential bucket histogram stripe buffers before they
+# are aggregated into the histogram.
+_EXPONENTIAL_STRIPE_BUFFER_SIZE = 512
+
+
+class _SumStripe:
+    """Accumulates the values aggregated in a stripe of a `_SumAggregation`."""
+
+    __slots__ = ("_lock", "_on_touched", "_value")
+
+    def __init__(self, on_touched: Callable[[], None]):
+        self._lock = Lock()
+        # Called when a value is added to the stripe after it was drained.
+        self._on_touched = on_touched
+        self._value: int | float | None = None
+
+    def add(self, value: int | float) -> None:
+        with self._lock:
+            if self._value is None:
+                self._value = 0
+                self._on_touched()
+
+            self._value = self._value + value
+
+    def drain(self) -> int | float | None:
+        """Returns the sum of the values added since the stripe was last
+        drained, None if there are none."""
+        with self._lock:
+            value = self._value
+            self._value = None
+        return value
+
+
+class _ExplicitBucketHistogramStripe:
+    """Accumulates the values aggregated in a stripe of an
+    `_ExplicitBucketHistogramAggregation`."""
+
+    __slots__ = (
+        "_lock",
+        "_on_touched",
+        "_boundaries",
+        "_record_min_max",
+        "_value",
+        "_sum",
+        "_min",
+        "_max",
+    )
+
+    def __init__(
+        self,
+        on_touched: Callable[[], None],
+        boundaries: tuple[float, ...],
+        record_min_max: bool,
+    ):
+        self._lock = Lock()
+        # Called when a value is added to the stripe after it was drained.
+        self._on_touched = on_touched
+        self._boundaries = boundaries
+        self._record_min_max = record_min_max
+        self._value = None
+        self._sum = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def add_values(self, values: Sequence[int | float]) -> None:
+        with self._lock:
+            if self._value is None:
+                self._value = array("Q", [0]) * (len(self._boundaries) + 1)
+                self._on_touched()
+
+            self._sum += sum(values)
+
+            if self._record_min_max:
+                self._min = min(self._min, *values)
+                self._max = max(self._max, *values)
+
+            bucket_counts = self._value
+            boundaries = self._boundaries
+            for value in values:
+                bucket_counts[bisect_left(boundaries, value)] += 1
+
+    def drain(self) -> tuple["array[int]", int | float, int | float, int | float] | None:
+        """Returns the bucket counts, sum, min and max of the values added
+        since the stripe was last drained, None if there are none."""
+        with self._lock:
+            if self._value is None:
+                return None
+
+            drained = (self._value, self._sum, self._min, self._max)
+
+            self._value = None
+            self._sum = 0
+            self._min = math.inf
+            self._max = -math.inf
+
+        return drained
+
+
+class _ExponentialBucketHistogramStripe:
+    """Buffers the values aggregated in a stripe of an
+    `_ExponentialBucketHistogramAggregation`.
+
+    The scale of the buckets can change with every value, so the values are
+    only bucketed by the histogram, when it drains the stripe or when the
+    buffer is full.
+    """
+
+    __slots__ = ("_lock", "_on_touched", "_values")
+
+    def __init__(self, on_touched: Callable[[], None]):
+        self._lock = Lock()
+        # Called when a value is added to the stripe after it was drained.
+        self._on_touched = on_touched
+        self._values: list[int | float] = []
+
+    def add_values(self, values: Sequence[int | float]) -> list[int | float] | None:
+        """Buffers the values, returns the buffered values instead when the
+        buffer is full."""
+        with self._lock:
+            buffered = self._values
+            if not buffered:
+                self._on_touched()
+
+            buffered.extend(values)
+
+            if len(buffered) < _EXPONENTIAL_STRIPE_BUFFER_SIZE:
+                return None
+
+            self._values = []
+
+        return buffered
+
+    def drain(self) -> list[int | float]:
+        """Returns the values added since the stripe was last drained."""
+        with self._lock:
+            values = self._values
+            self._values = []
+        return values
+
 
 class AggregationTemporality(IntEnum):
     """
@@ -85,9 +241,17 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
         self._lock = Lock()
         self._attributes = attributes
         self._reservoir = reservoir_builder()
+        # The last cumulative point collected for a synchronous instrument,
+        # it only changes when the aggregation is updated.
         self._previous_point = None
+        # Whether the aggregation was updated since it was last collected and
+        # the callback to run when it is, see _mark_touched.
+        self._touched = False
+        self._on_touched: Callable[[], None] | None = None
+        # Set when the aggregation is evicted from its metric stream after
+        # max_idle_collections collections without measurements.
+        self._evicted = False
 
-    @abstractmethod
     def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
         """Aggregate a measurement.
 
@@ -95,6 +259,77 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
             measurement: Measurement to aggregate
             should_sample_exemplar: Whether the measurement should be sampled by the exemplars reservoir or not.
         """
+        self.aggregate_value(measurement.value)
+        self._sample_exemplar(measurement, should_sample_exemplar)
+
+    @abstractmethod
+    def aggregate_value(self, value: int | float) -> None:
+        """Aggregate the value of a measurement without offering it to the
+        exemplars reservoir.
+
+        Args:
+            value: Measurement value to aggregate
+        """
+
+    def aggregate_many(
+        self,
+        values: Sequence[int | float],
+        sampled_measurements: Sequence[Measurement] = (),
+    ) -> None:
+        """Aggregate the values of several measurements at once.
+
+        Args:
+            values: Measurement values to aggregate
+            sampled_measurements: The measurements among them to offer to the exemplars reservoir.
+        """
+        self.aggregate_values(values)
+        for measurement in sampled_measurements:
+            self._sample_exemplar(measurement, True)
+
+    def aggregate_values(self, values: Sequence[int | float]) -> None:
+        """Aggregate several measurement values without offering them to the
+        exemplars reservoir.
+
+        Aggregations override it to take their lock once for all the values.
+
+        Args:
+            values: Measurement values to aggregate
+        """
+        for value in values:
+            self.aggregate_value(value)
+
+    def _mark_touched(self) -> None:
+        """Marks the aggregation as updated since it was last collected.
+
+        Aggregations call it, with their lock held, when they are updated and
+        are not marked yet, the owner of the aggregation is notified through
+        _on_touched so that it only collects the aggregations that changed.
+        """
+        self._touched = True
+        if self._on_touched is not None:
+            self._on_touched()
+
+    def _touch(self) -> None:
+        """Marks the aggregation as updated, its stripes call it when they are."""
+        with self._lock:
+            if not self._touched:
+                self._mark_touched()
+
+    def _skip_collections(self, collection_start_nano: int) -> None:
+        """Accounts for the collections the aggregation was left out of
+        because it was not updated, the last one started at
+        collection_start_nano. It is called before collecting it again.
+        """
+
+    def _start_collect(self) -> None:
+        """Called by collect before it reads the aggregated values.
+
+        The aggregation is unmarked so that any measurement aggregated from
+        this point on marks it again. Aggregations with stripes extend it to
+        move the values accumulated by their stripes into the aggregation.
+        """
+        with self._lock:
+            self._touched = False
 
     @abstractmethod
     def collect(
@@ -134,6 +369,16 @@ class _DropAggregation(_Aggregation):
     def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
         pass
 
+    def aggregate_value(self, value: int | float) -> None:
+        pass
+
+    def aggregate_many(
+        self,
+        values: Sequence[int | float],
+        sampled_measurements: Sequence[Measurement] = (),
+    ) -> None:
+        pass
+
     def collect(
         self,
         collection_aggregation_temporality: AggregationTemporality,
@@ -150,6 +395,7 @@ class _SumAggregation(_Aggregation[Sum]):
         instrument_aggregation_temporality: AggregationTemporality,
         start_time_unix_nano: int,
         reservoir_builder: ExemplarReservoirBuilder,
+        stripes: int = 1,
     ):
         super().__init__(attributes, reservoir_builder)
 
@@ -162,14 +408,64 @@ class _SumAggregation(_Aggregation[Sum]):
         self._previous_collection_start_nano = self._start_time_unix_nano
         self._previous_value = 0
 
-    def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
+        # Set when measurements are accumulated in per thread stripes instead
+        # of this aggregation, the stripes are drained into it on collect.
+        self._stripes: list[_SumStripe] | None = None
+        if stripes > 1:
+            self._stripes = [_SumStripe(self._touch) for _ in range(stripes)]
+
+    def aggregate_value(self, value: int | float) -> None:
+        stripes = self._stripes
+        if stripes is not None:
+            stripes[_current_stripe() % len(stripes)].add(value)
+            return
+
         with self._lock:
+            if not self._touched:
+                self._mark_touched()
+
             if self._value is None:
                 self._value = 0
 
-            self._value = self._value + measurement.value
+            self._value = self._value + value
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+    def aggregate_values(self, values: Sequence[int | float]) -> None:
+        stripes = self._stripes
+        if stripes is not None:
+            stripes[_current_stripe() % len(stripes)].add(sum(values))
+            return
+
+        with self._lock:
+            if not self._touched:
+                self._mark_touched()
+
+            if self._value is None:
+                self._value = 0
+
+            self._value = self._value + sum(values)
+
+    def _start_collect(self) -> None:
+        super()._start_collect()
+
+        if self._stripes is None:
+            return
+
+        for stripe in self._stripes:
+            value = stripe.drain()
+            if value is None:
+                continue
+
+            with self._lock:
+                if self._value is None:
+                    self._value = 0
+
+                self._value = self._value + value
+
+    def _skip_collections(self, collection_start_nano: int) -> None:
+        # The delta points of synchronous instruments start at the previous
+        # collection, the aggregation would have moved its start to it.
+        if self._instrument_aggregation_temporality is AggregationTemporality.DELTA:
+            self._previous_collection_start_nano = max(self._previous_collection_start_nano, collection_start_nano)
 
     def collect(
         self,
@@ -296,6 +592,8 @@ class _SumAggregation(_Aggregation[Sum]):
                       |----|
         """
 
+        self._start_collect()
+
         with self._lock:
             value = self._value
             self._value = None
@@ -323,13 +621,14 @@ class _SumAggregation(_Aggregation[Sum]):
 
                 self._previous_value = value + self._previous_value
 
-                return NumberDataPoint(
+                self._previous_point = NumberDataPoint(
                     attributes=self._attributes,
                     exemplars=self._collect_exemplars(),
                     start_time_unix_nano=self._start_time_unix_nano,
                     time_unix_nano=collection_start_nano,
                     value=self._previous_value,
                 )
+                return self._previous_point
 
             # This happens when the corresponding instrument for this
             # aggregation is asynchronous.
@@ -373,11 +672,16 @@ class _LastValueAggregation(_Aggregation[GaugePoint]):
         super().__init__(attributes, reservoir_builder)
         self._value = None
 
-    def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True):
+    def aggregate_value(self, value: int | float) -> None:
         with self._lock:
-            self._value = measurement.value
+            if not self._touched:
+                self._mark_touched()
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+            self._value = value
+
+    def aggregate_values(self, values: Sequence[int | float]) -> None:
+        if values:
+            self.aggregate_value(values[-1])
 
     def collect(
         self,
@@ -387,6 +691,8 @@ class _LastValueAggregation(_Aggregation[GaugePoint]):
         """
         Atomically return a point for the current value of the metric.
         """
+        self._start_collect()
+
         with self._lock:
             if self._value is None:
                 return None
@@ -432,6 +738,7 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         reservoir_builder: ExemplarReservoirBuilder,
         boundaries: Sequence[float] | None = None,
         record_min_max: bool = True,
+        stripes: int = 1,
     ):
         if boundaries is None:
             boundaries = _DEFAULT_EXPLICIT_BUCKET_HISTOGRAM_AGGREGATION_BOUNDARIES
@@ -463,15 +770,31 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
         self._previous_collection_start_nano = self._start_time_unix_nano
 
-    def _get_empty_bucket_counts(self) -> list[int]:
-        return [0] * (len(self._boundaries) + 1)
+        # Set when measurements are accumulated in per thread stripes instead
+        # of this aggregation, the stripes are drained into it on collect.
+        self._stripes: list[_ExplicitBucketHistogramStripe] | None = None
+        if stripes > 1:
+            self._stripes = [
+                _ExplicitBucketHistogramStripe(self._touch, self._boundaries, record_min_max) for _ in range(stripes)
+            ]
+
+    def _get_empty_bucket_counts(self) -> "array[int]":
+        return array("Q", [0]) * (len(self._boundaries) + 1)
+
+    def aggregate_value(self, value: int | float) -> None:
+        stripes = self._stripes
+        if stripes is not None:
+            stripes[_current_stripe() % len(stripes)].add_values((value,))
+            return
 
-    def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
         with self._lock:
+            if not self._touched:
+                self._mark_touched()
+
             if self._value is None:
                 self._value = self._get_empty_bucket_counts()
 
-            measurement_value = measurement.value
+            measurement_value = value
 
             self._sum += measurement_value
 
@@ -481,7 +804,58 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
             self._value[bisect_left(self._boundaries, measurement_value)] += 1
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+    def aggregate_values(self, values: Sequence[int | float]) -> None:
+        if not values:
+            return
+
+        stripes = self._stripes
+        if stripes is not None:
+            stripes[_current_stripe() % len(stripes)].add_values(values)
+            return
+
+        with self._lock:
+            if not self._touched:
+                self._mark_touched()
+
+            if self._value is None:
+                self._value = self._get_empty_bucket_counts()
+
+            self._sum += sum(values)
+
+            if self._record_min_max:
+                self._min = min(self._min, *values)
+                self._max = max(self._max, *values)
+
+            bucket_counts = self._value
+            boundaries = self._boundaries
+            for measurement_value in values:
+                bucket_counts[bisect_left(boundaries, measurement_value)] += 1
+
+    def _start_collect(self) -> None:
+        super()._start_collect()
+
+        if self._stripes is None:
+            return
+
+        for stripe in self._stripes:
+            drained = stripe.drain()
+            if drained is None:
+                continue
+
+            value, sum_, min_, max_ = drained
+            with self._lock:
+                if self._value is None:
+                    self._value = value
+                else:
+                    self._value = array("Q", map(add, self._value, value))
+
+                self._sum += sum_
+                self._min = min(self._min, min_)
+                self._max = max(self._max, max_)
+
+    def _skip_collections(self, collection_start_nano: int) -> None:
+        if self._instrument_aggregation_temporality is AggregationTemporality.DELTA:
+            self._previous_collection_start_nano = max(self._previous_collection_start_nano, collection_start_nano)
 
     def collect(
         self,
@@ -492,6 +866,8 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         Atomically return a point for the current value of the metric.
         """
 
+        self._start_collect()
+
         with self._lock:
             value = self._value
             sum_ = self._sum
@@ -532,18 +908,12 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                 if self._previous_value is None:
                     self._previous_value = self._get_empty_bucket_counts()
 
-                self._previous_value = [
-                    value_element + previous_value_element
-                    for (
-                        value_element,
-                        previous_value_element,
-                    ) in zip(value, self._previous_value)
-                ]
+                self._previous_value = array("Q", map(add, value, self._previous_value))
                 self._previous_min = min(min_, self._previous_min)
                 self._previous_max = max(max_, self._previous_max)
                 self._previous_sum = sum_ + self._previous_sum
 
-                return HistogramDataPoint(
+                self._previous_point = HistogramDataPoint(
                     attributes=self._attributes,
                     exemplars=self._collect_exemplars(),
                     start_time_unix_nano=self._start_time_unix_nano,
@@ -555,6 +925,7 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                     min=self._previous_min,
                     max=self._previous_max,
                 )
+                return self._previous_point
 
             return None
 
@@ -585,6 +956,8 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         max_size: int = 160,
         max_scale: int = 20,
         record_min_max: bool = True,
+        stripes: int = 1,
+        initial_scale: int | None = None,
     ):
         # max_size is the maximum capacity of the positive and negative
         # buckets.
@@ -644,18 +1017,34 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
         self._previous_collection_start_nano = self._start_time_unix_nano
 
-        self._mapping = self._new_mapping(self._max_scale)
+        # The scale only ever decreases, starting at a lower scale than
+        # max_scale avoids the downscaling of the first measurements when
+        # their range is known in advance.
+        self._mapping = self._new_mapping(self._max_scale if initial_scale is None else initial_scale)
 
-    def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
+        # Set when measurements are accumulated in per thread stripes instead
+        # of this aggregation, the stripes are drained into it on collect.
+        self._stripes: list[_ExponentialBucketHistogramStripe] | None = None
+        if stripes > 1:
+            self._stripes = [_ExponentialBucketHistogramStripe(self._touch) for _ in range(stripes)]
+
+    def aggregate_value(self, value: int | float) -> None:
         # pylint: disable=too-many-branches,too-many-statements, too-many-locals
 
+        if self._stripes is not None:
+            self.aggregate_values((value,))
+            return
+
         with self._lock:
+            if not self._touched:
+                self._mark_touched()
+
             if self._value_positive is None:
                 self._value_positive = Buckets()
             if self._value_negative is None:
                 self._value_negative = Buckets()
 
-            measurement_value = measurement.value
+            measurement_value = value
 
             self._sum += measurement_value
 
@@ -748,7 +1137,128 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
             # in _ExplicitBucketHistogramAggregation.aggregate
             value.increment_bucket(bucket_index)
 
-        self._sample_exemplar(measurement, should_sample_exemplar)
+    def aggregate_values(self, values: Sequence[int | float]) -> None:
+        if not values:
+            return
+
+        stripes = self._stripes
+        if stripes is not None:
+            values = stripes[_current_stripe() % len(stripes)].add_values(values)
+            if values is None:
+                return
+
+        self._aggregate_unstriped_values(values)
+
+    def _aggregate_unstriped_values(self, values: Sequence[int | float]) -> None:
+        """Aggregates the values into this aggregation rather than into one
+        of its stripes."""
+        with self._lock:
+            if not self._touched:
+                self._mark_touched()
+
+            if self._value_positive is None:
+                self._value_positive = Buckets()
+            if self._value_negative is None:
+                self._value_negative = Buckets()
+
+            self._sum += sum(values)
+
+            if self._record_min_max:
+                self._min = min(self._min, *values)
+                self._max = max(self._max, *values)
+
+            self._count += len(values)
+
+            positive_values = [value for value in values if value > 0]
+            negative_values = [-value for value in values if value < 0]
+
+            zero_count = len(values) - len(positive_values) - len(negative_values)
+            if zero_count:
+                self._zero_count += zero_count
+
+                if self._count == self._zero_count:
+                    self._scale = 0
+
+            if positive_values:
+                self._increment_buckets(self._value_positive, positive_values)
+            if negative_values:
+                self._increment_buckets(self._value_negative, negative_values)
+
+    def _increment_buckets(self, value: Buckets, measurement_values: list[int | float]) -> None:
+        """Increments the buckets of several absolute measurement values,
+        rescaling at most once, see `aggregate_value`."""
+        # The mapping is monotonic, so the extreme values are enough to find
+        # out if the buckets have to be rescaled to hold all the values.
+        low = self._mapping.map_to_index(min(measurement_values))
+        high = self._mapping.map_to_index(max(measurement_values))
+
+        if len(value) != 0:
+            low = min(low, value.index_start)
+            high = max(high, value.index_end)
+
+        if high - low >= self._max_size:
+            scale_change = self._get_scale_change(low, high)
+            self._downscale(
+                scale_change,
+                self._value_positive,
+                self._value_negative,
+            )
+            self._mapping = self._new_mapping(self._mapping.scale - scale_change)
+
+        self._scale = self._mapping.scale
+
+        map_to_index = self._mapping.map_to_index
+        index_counts: dict[int, int] = {}
+        for measurement_value in measurement_values:
+            index = map_to_index(measurement_value)
+            index_counts[index] = index_counts.get(index, 0) + 1
+
+        low = min(index_counts)
+        high = max(index_counts)
+
+        if len(value) == 0:
+            value.index_start = low
+            value.index_end = low
+            value.index_base = low
+
+        if low < value.index_start:
+            span = value.index_end - low
+
+            if span >= len(value.counts):
+                value.grow(span + 1, self._max_size)
+
+            value.index_start = low
+
+        if high > value.index_end:
+            span = high - value.index_start
+
+            if span >= len(value.counts):
+                value.grow(span + 1, self._max_size)
+
+            value.index_end = high
+
+        for index, count in index_counts.items():
+            bucket_index = index - value.index_base
+
+            if bucket_index < 0:
+                bucket_index += len(value.counts)
+
+            value.increment_bucket(bucket_index, count)
+
+    def _start_collect(self) -> None:
+        super()._start_collect()
+
+        if self._stripes is None:
+            return
+
+        for stripe in self._stripes:
+            values = stripe.drain()
+            if values:
+                self._aggregate_unstriped_values(values)
+
+    def _skip_collections(self, collection_start_nano: int) -> None:
+        if self._instrument_aggregation_temporality is AggregationTemporality.DELTA:
+            self._previous_collection_start_nano = max(self._previous_collection_start_nano, collection_start_nano)
 
     def collect(
         self,
@@ -760,6 +1270,8 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         """
 
         # pylint: disable=too-many-statements, too-many-locals
+        self._start_collect()
+
         with self._lock:
             value_positive = self._value_positive
             value_negative = self._value_negative
@@ -931,7 +1443,7 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                 self._previous_zero_count = zero_count + self._previous_zero_count
                 self._previous_scale = min_scale
 
-                return ExponentialHistogramDataPoint(
+                self._previous_point = ExponentialHistogramDataPoint(
                     attributes=self._attributes,
                     exemplars=self._collect_exemplars(),
                     start_time_unix_nano=self._start_time_unix_nano,
@@ -953,6 +1465,7 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                     min=self._previous_min,
                     max=self._previous_max,
                 )
+                return self._previous_point
 
             return None
 
@@ -984,7 +1497,7 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
     @staticmethod
     def _get_low_high(buckets, scale, min_scale):
-        if buckets.counts == [0]:
+        if len(buckets.counts) == 1 and buckets.counts[0] == 0:
             return 0, -1
 
         shift = scale - min_scale
@@ -1079,6 +1592,12 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
             previous_buckets.increment_bucket(bucket_index, increment=current_bucket)
 
 
+def _validate_stripes(stripes: int) -> int:
+    if not isinstance(stripes, int) or stripes < 1:
+        raise ValueError(f"stripes must be a positive integer, got {stripes!r}")
+    return stripes
+
+
 class Aggregation(ABC):
     """
     Base class for all aggregation types.
@@ -1195,6 +1714,10 @@ class ExponentialBucketHistogramAggregation(Aggregation):
         max_size: Maximum number of buckets in each of the positive and negative ranges, not counting the special zero bucket.
         max_scale: Maximum scale factor.
         record_min_max: Whether to record min and max.
+        stripes: Number of stripes measurements of synchronous instruments are accumulated in, see `SumAggregation`.
+        initial_scale: Scale factor to start at instead of ``max_scale``. The scale is only ever lowered to fit the
+            measurements in ``max_size`` buckets, starting at the scale the expected range of measurements needs
+            avoids rescaling the buckets while the first measurements are recorded.
     """
 
     def __init__(
@@ -1202,10 +1725,19 @@ class ExponentialBucketHistogramAggregation(Aggregation):
         max_size: int = 160,
         max_scale: int = 20,
         record_min_max: bool = True,
+        stripes: int = 1,
+        initial_scale: int | None = None,
     ):
+        if initial_scale is not None and not ExponentMapping._min_scale <= initial_scale <= max_scale:
+            raise ValueError(
+                f"initial_scale {initial_scale} must be between {ExponentMapping._min_scale} and max_scale {max_scale}"
+            )
+
         self._max_size = max_size
         self._max_scale = max_scale
         self._record_min_max = record_min_max
+        self._stripes = _validate_stripes(stripes)
+        self._initial_scale = initial_scale
 
     def _create_aggregation(
         self,
@@ -1215,8 +1747,10 @@ class ExponentialBucketHistogramAggregation(Aggregation):
         start_time_unix_nano: int,
     ) -> _Aggregation:
         instrument_aggregation_temporality = AggregationTemporality.UNSPECIFIED
+        stripes = 1
         if isinstance(instrument, Synchronous):
             instrument_aggregation_temporality = AggregationTemporality.DELTA
+            stripes = self._stripes
         elif isinstance(instrument, Asynchronous):
             instrument_aggregation_temporality = AggregationTemporality.CUMULATIVE
 
@@ -1228,6 +1762,8 @@ class ExponentialBucketHistogramAggregation(Aggregation):
             max_size=self._max_size,
             max_scale=self._max_scale,
             record_min_max=self._record_min_max,
+            stripes=stripes,
+            initial_scale=self._initial_scale,
         )
 
 
@@ -1243,15 +1779,18 @@ class ExplicitBucketHistogramAggregation(Aggregation):
     Args:
         boundaries: Array of increasing values representing explicit bucket boundary values.
         record_min_max: Whether to record min and max.
+        stripes: Number of stripes measurements of synchronous instruments are accumulated in, see `SumAggregation`.
     """
 
     def __init__(
         self,
         boundaries: Sequence[float] | None = None,
         record_min_max: bool = True,
+        stripes: int = 1,
     ) -> None:
         self._boundaries = boundaries
         self._record_min_max = record_min_max
+        self._stripes = _validate_stripes(stripes)
 
     def _create_aggregation(
         self,
@@ -1261,8 +1800,10 @@ class ExplicitBucketHistogramAggregation(Aggregation):
         start_time_unix_nano: int,
     ) -> _Aggregation:
         instrument_aggregation_temporality = AggregationTemporality.UNSPECIFIED
+        stripes = 1
         if isinstance(instrument, Synchronous):
             instrument_aggregation_temporality = AggregationTemporality.DELTA
+            stripes = self._stripes
         elif isinstance(instrument, Asynchronous):
             instrument_aggregation_temporality = AggregationTemporality.CUMULATIVE
 
@@ -1280,6 +1821,7 @@ class ExplicitBucketHistogramAggregation(Aggregation):
             reservoir_factory(_ExplicitBucketHistogramAggregation),
             boundaries,
             self._record_min_max,
+            stripes=stripes,
         )
 
 
@@ -1287,8 +1829,19 @@ class SumAggregation(Aggregation):
     """This aggregation informs the SDK to collect:
 
     - The arithmetic sum of Measurement values.
+
+    Args:
+        stripes: Number of stripes measurements of synchronous instruments are
+            accumulated in. Each thread records to one of the stripes, each
+            with its own lock, and the stripes are merged on collection. This
+            removes lock contention between threads recording the same
+            attributes in parallel, e.g. on free-threaded Python builds.
+            Asynchronous instruments always use a single stripe.
     """
 
+    def __init__(self, stripes: int = 1) -> None:
+        self._stripes = _validate_stripes(stripes)
+
     def _create_aggregation(
         self,
         instrument: _Instrument,
@@ -1297,8 +1850,10 @@ class SumAggregation(Aggregation):
         start_time_unix_nano: int,
     ) -> _Aggregation:
         instrument_aggregation_temporality = AggregationTemporality.UNSPECIFIED
+        stripes = 1
         if isinstance(instrument, Synchronous):
             instrument_aggregation_temporality = AggregationTemporality.DELTA
+            stripes = self._stripes
         elif isinstance(instrument, Asynchronous):
             instrument_aggregation_temporality = AggregationTemporality.CUMULATIVE
 
@@ -1308,6 +1863,7 @@ class SumAggregation(Aggregation):
             instrument_aggregation_temporality,
             start_time_unix_nano,
             reservoir_factory(_SumAggregation),
+            stripes=stripes,
         )
 
 
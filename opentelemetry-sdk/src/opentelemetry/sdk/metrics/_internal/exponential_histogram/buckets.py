@@ -1,6 +1,7 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+from array import array
 from math import ceil, log2
 
 
@@ -9,7 +10,9 @@ class Buckets:
     # class are only used in methods that are protected by locks themselves.
 
     def __init__(self):
-        self._counts = [0]
+        # The counts are kept in an unsigned 64 bit array, the same type the
+        # OTLP bucket counts have, instead of a list of int objects.
+        self._counts = array("Q", [0])
 
         # The term index refers to the number of the exponential histogram bucket
         # used to determine its boundaries. The lower boundary of a bucket is
@@ -63,7 +66,7 @@ class Buckets:
 
     def get_offset_counts(self):
         bias = self.__index_base - self.__index_start
-        return self._counts[-bias:] + self._counts[:-bias]
+        return (self._counts[-bias:] + self._counts[:-bias]).tolist()
 
     def grow(self, needed: int, max_size: int) -> None:
         size = len(self._counts)
@@ -84,7 +87,7 @@ class Buckets:
 
         new_positive_limit = new_size - bias
 
-        tmp = [0] * new_size
+        tmp = array("Q", [0]) * new_size
         tmp[new_positive_limit:] = self._counts[old_positive_limit:]
         tmp[0:old_positive_limit] = self._counts[0:old_positive_limit]
         self._counts = tmp
@@ -172,6 +175,6 @@ class Buckets:
         copy._Buckets__index_base = self._Buckets__index_base  # type: ignore[reportArgumentType]
         copy._Buckets__index_start = self._Buckets__index_start  # type: ignore[reportArgumentType]
         copy._Buckets__index_end = self._Buckets__index_end  # type: ignore[reportArgumentType]
-        copy._counts = [0 for _ in self._counts]
+        copy._counts = array("Q", [0]) * len(self._counts)
 
         return copy
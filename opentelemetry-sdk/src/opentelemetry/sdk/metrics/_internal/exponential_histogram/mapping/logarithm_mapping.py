@@ -1,7 +1,8 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-from math import exp, floor, ldexp, log
+from decimal import ROUND_FLOOR, Decimal, localcontext
+from math import exp, floor, frexp, ldexp, log
 from threading import Lock
 
 from opentelemetry.sdk.metrics._internal.exponential_histogram.mapping import (
@@ -12,11 +13,10 @@ from opentelemetry.sdk.metrics._internal.exponential_histogram.mapping.errors im
     MappingUnderflowError,
 )
 from opentelemetry.sdk.metrics._internal.exponential_histogram.mapping.ieee_754 import (
+    MANTISSA_WIDTH,
     MAX_NORMAL_EXPONENT,
     MIN_NORMAL_EXPONENT,
     MIN_NORMAL_VALUE,
-    get_ieee_754_exponent,
-    get_ieee_754_mantissa,
 )
 
 
@@ -30,6 +30,10 @@ class LogarithmMapping(Mapping):
     _min_scale = 1
     _max_scale = 20
 
+    # Scales up to _max_lookup_table_scale map values with a lookup table
+    # instead of a logarithm, the table for scale s has 2 ** (s + 1) entries.
+    _max_lookup_table_scale = 10
+
     def _get_min_scale(self):
         # _min_scale ensures that ExponentMapping is used for zero and negative
         # scale values.
@@ -84,6 +88,47 @@ class LogarithmMapping(Mapping):
         # containing values > 2 ** 1024.
         self._max_normal_lower_boundary_index = ((MAX_NORMAL_EXPONENT + 1) << self._scale) - 1
 
+        self._lookup_table = None
+        if scale <= self._max_lookup_table_scale:
+            self._init_lookup_table(scale)
+
+    def _init_lookup_table(self, scale: int) -> None:
+        # pylint: disable=attribute-defined-outside-init
+
+        # Every power of two is split in 2 ** scale buckets, the lower
+        # boundary of the bucket with index (exponent << scale) + i is
+        # 2 ** exponent * 2 ** (i / 2 ** scale). A value with an IEEE 754
+        # mantissa (as returned by get_ieee_754_mantissa) greater than
+        # self._boundaries[i] is greater than that lower boundary. The
+        # boundaries are calculated with enough precision to be exact.
+        subbuckets = 1 << scale
+        with localcontext() as context:
+            context.prec = 50
+            self._boundaries = [
+                int(
+                    ((Decimal(2) ** (Decimal(subbucket) / subbuckets) - 1) * (1 << MANTISSA_WIDTH)).to_integral_value(
+                        ROUND_FLOOR
+                    )
+                )
+                for subbucket in range(subbuckets)
+            ]
+        # This sentinel is larger than any mantissa.
+        self._boundaries.append(1 << MANTISSA_WIDTH)
+
+        # The lookup table splits the mantissas linearly in 2 ** (scale + 1)
+        # slots, which are narrow enough for each one of them to contain at
+        # most one boundary. self._lookup_table[slot] is the subbucket for the
+        # smallest mantissa in the slot, the mantissas in the slot that are
+        # greater than the next boundary belong in the next subbucket.
+        self._lookup_table_shift = MANTISSA_WIDTH - scale - 1
+        self._lookup_table = []
+        subbucket = -1
+        for slot in range(1 << (scale + 1)):
+            slot_mantissa = slot << self._lookup_table_shift
+            while self._boundaries[subbucket + 1] < slot_mantissa:
+                subbucket += 1
+            self._lookup_table.append(subbucket)
+
     def map_to_index(self, value: float) -> int:
         """
         Maps positive floating point values to indexes corresponding to scale.
@@ -93,10 +138,21 @@ class LogarithmMapping(Mapping):
         if value <= MIN_NORMAL_VALUE:
             return self._min_normal_lower_boundary_index - 1
 
+        # frexp returns a fraction in [0.5, 1) which is the IEEE 754 mantissa
+        # with its implicit leading bit, it is faster than
+        # get_ieee_754_mantissa and get_ieee_754_exponent.
+        fraction, exponent = frexp(value)
+
+        if self._lookup_table is not None:
+            mantissa = int(ldexp(fraction, MANTISSA_WIDTH + 1)) - (1 << MANTISSA_WIDTH)
+            subbucket = self._lookup_table[mantissa >> self._lookup_table_shift]
+            if mantissa > self._boundaries[subbucket + 1]:
+                subbucket += 1
+            return ((exponent - 1) << self._scale) + subbucket
+
         # value is an exact power of two.
-        if get_ieee_754_mantissa(value) == 0:
-            exponent = get_ieee_754_exponent(value)
-            return (exponent << self._scale) - 1
+        if fraction == 0.5:
+            return ((exponent - 1) << self._scale) - 1
 
         return min(
             floor(log(value) * self._scale_factor),
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import asyncio
 import math
 import os
 import weakref
@@ -26,6 +27,11 @@ from opentelemetry.context import (
     set_value,
 )
 from opentelemetry.metrics import MeterProvider, NoOpMeterProvider
+from opentelemetry.sdk._shared_internal._async import (
+    call_in_loop,
+    in_loop_thread,
+    run_from_thread,
+)
 from opentelemetry.sdk.environment_variables import (
     OTEL_METRIC_EXPORT_INTERVAL,
     OTEL_METRIC_EXPORT_TIMEOUT,
@@ -34,6 +40,9 @@ from opentelemetry.sdk.environment_variables import (
 from opentelemetry.sdk.environment_variables._internal import (
     parse_boolean_environment_variable,
 )
+from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _DEFAULT_AGGREGATION_CARDINALITY_LIMIT,
+)
 from opentelemetry.sdk.metrics._internal.aggregation import (
     AggregationTemporality,
     DefaultAggregation,
@@ -129,6 +138,61 @@ class MetricExporter(ABC):
         """
 
 
+class AsyncMetricExporter(ABC):
+    """Interface for exporting metrics from an asyncio event loop.
+
+    The asyncio counterpart of `MetricExporter`, its methods are coroutines
+    awaited on the event loop of the application by an
+    `AsyncPeriodicExportingMetricReader`.
+
+    Args:
+        preferred_temporality: Used by `opentelemetry.sdk.metrics.export.AsyncPeriodicExportingMetricReader` to
+            configure exporter level preferred temporality. See `opentelemetry.sdk.metrics.export.MetricReader` for
+            more details on what preferred temporality is.
+        preferred_aggregation: Used by `opentelemetry.sdk.metrics.export.AsyncPeriodicExportingMetricReader` to
+            configure exporter level preferred aggregation. See `opentelemetry.sdk.metrics.export.MetricReader` for
+            more details on what preferred aggregation is.
+    """
+
+    def __init__(
+        self,
+        preferred_temporality: dict[type, AggregationTemporality] | None = None,
+        preferred_aggregation: dict[type, opentelemetry.sdk.metrics.view.Aggregation] | None = None,
+    ) -> None:
+        self._preferred_temporality = preferred_temporality
+        self._preferred_aggregation = preferred_aggregation
+
+    @abstractmethod
+    async def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        """Exports a batch of telemetry data.
+
+        Args:
+            metrics: The list of `opentelemetry.sdk.metrics.export.Metric` objects to be exported
+
+        Returns:
+            The result of the export
+        """
+
+    @abstractmethod
+    async def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        """
+        Ensure that export of any metrics currently received by the exporter
+        are completed as soon as possible.
+        """
+
+    @abstractmethod
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        """Shuts down the exporter.
+
+        Called when the SDK is shut down.
+        """
+
+
 class ConsoleMetricExporter(MetricExporter):
     """Implementation of :class:`MetricExporter` that prints metrics to the
     console.
@@ -197,6 +261,28 @@ class MetricReader(ABC):
             default aggregations. The aggregation defined here will be
             overridden by an aggregation defined by a view that is not
             `DefaultAggregation`.
+        aggregation_cardinality_limit: The maximum number of metric points,
+            including the overflow point, each metric stream keeps. Measurements
+            with new attribute sets beyond the limit are aggregated into a
+            single point with the ``otel.metric.overflow=true`` attribute.
+            Defaults to 2000. The limit defined here is overridden by the
+            ``aggregation_cardinality_limit`` of a view. When the SDK internal
+            metrics are enabled, the overflowed measurements are counted by the
+            experimental ``otel.sdk.metric_reader.overflowed_measurements``
+            metric, which is not part of the semantic conventions.
+        max_idle_collections: The number of consecutive collections without
+            measurements after which the metric point of an attribute set is
+            evicted from its metric stream. A cumulative point recorded again
+            after its eviction restarts from zero with a new start time.
+            Defaults to `None`, the metric points of cumulative streams are
+            never evicted. Those of delta streams are released on each
+            collection for synchronous instruments, and after a collection in
+            which they were not observed for asynchronous instruments. The
+            value defined here is overridden by the ``max_idle_collections`` of
+            a view. When the SDK internal metrics are enabled, the evicted
+            metric points are counted by the experimental
+            ``otel.sdk.metric_reader.evicted_series`` metric, which is not part
+            of the semantic conventions.
 
     .. document protected _receive_metrics which is a intended to be overridden by subclass
     .. automethod:: _receive_metrics
@@ -208,6 +294,8 @@ class MetricReader(ABC):
         preferred_aggregation: dict[type, opentelemetry.sdk.metrics.view.Aggregation] | None = None,
         *,
         otel_component_type: OtelComponentTypeValues | None = None,
+        aggregation_cardinality_limit: int | None = None,
+        max_idle_collections: int | None = None,
     ) -> None:
         self._collect: (
             Callable[
@@ -287,12 +375,29 @@ class MetricReader(ABC):
                 else:
                     raise Exception(f"Invalid instrument class found {typ}")
 
+        self._init_series_limits(aggregation_cardinality_limit, max_idle_collections)
+
         self._otel_component_type = otel_component_type.value if otel_component_type else type(self).__qualname__
-        self._metrics = create_metric_reader_metrics(
-            self._otel_component_type,
-            NoOpMeterProvider(),
-            parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
-        )
+        self._set_meter_provider(NoOpMeterProvider())
+
+    def _init_series_limits(
+        self,
+        aggregation_cardinality_limit: int | None,
+        max_idle_collections: int | None,
+    ) -> None:
+        if aggregation_cardinality_limit is None:
+            aggregation_cardinality_limit = _DEFAULT_AGGREGATION_CARDINALITY_LIMIT
+        elif aggregation_cardinality_limit < 1:
+            raise Exception(f"Invalid aggregation cardinality limit found {aggregation_cardinality_limit}")
+        self._aggregation_cardinality_limit = aggregation_cardinality_limit
+        self._overflowed_measurements = 0
+        self._overflowed_measurements_lock = Lock()
+
+        if max_idle_collections is not None and max_idle_collections < 1:
+            raise Exception(f"Invalid max idle collections found {max_idle_collections}")
+        self._max_idle_collections = max_idle_collections
+        self._evicted_series = 0
+        self._evicted_series_lock = Lock()
 
     @final
     def collect(self, timeout_millis: float = 10_000) -> None:
@@ -352,8 +457,20 @@ class MetricReader(ABC):
             self._otel_component_type,
             meter_provider,
             parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
+            lambda: self._overflowed_measurements,
+            lambda: self._evicted_series,
         )
 
+    def _record_overflow(self, overflowed_measurements: int) -> None:
+        """Called with the number of measurements aggregated at once into an overflow point"""
+        with self._overflowed_measurements_lock:
+            self._overflowed_measurements += overflowed_measurements
+
+    def _record_evictions(self, evicted_series: int) -> None:
+        """Called with the number of metric points evicted by a collection"""
+        with self._evicted_series_lock:
+            self._evicted_series += evicted_series
+
     def force_flush(self, timeout_millis: float = 10_000) -> bool:
         self.collect(timeout_millis=timeout_millis)
         return True
@@ -382,10 +499,15 @@ class InMemoryMetricReader(MetricReader):
         self,
         preferred_temporality: dict[type, AggregationTemporality] | None = None,
         preferred_aggregation: dict[type, opentelemetry.sdk.metrics.view.Aggregation] | None = None,
+        *,
+        aggregation_cardinality_limit: int | None = None,
+        max_idle_collections: int | None = None,
     ) -> None:
         super().__init__(
             preferred_temporality=preferred_temporality,
             preferred_aggregation=preferred_aggregation,
+            aggregation_cardinality_limit=aggregation_cardinality_limit,
+            max_idle_collections=max_idle_collections,
         )
         self._lock = RLock()
         self._metrics_data: MetricsData | None = None
@@ -428,12 +550,17 @@ class PeriodicExportingMetricReader(MetricReader):
         exporter: MetricExporter,
         export_interval_millis: float | None = None,
         export_timeout_millis: float | None = None,
+        *,
+        aggregation_cardinality_limit: int | None = None,
+        max_idle_collections: int | None = None,
     ) -> None:
         # PeriodicExportingMetricReader defers to exporter for configuration
         super().__init__(
             preferred_temporality=exporter._preferred_temporality,
             preferred_aggregation=exporter._preferred_aggregation,
             otel_component_type=OtelComponentTypeValues.PERIODIC_METRIC_READER,
+            aggregation_cardinality_limit=aggregation_cardinality_limit,
+            max_idle_collections=max_idle_collections,
         )
 
         # This lock is held whenever calling self._exporter.export() to prevent concurrent
@@ -443,17 +570,9 @@ class PeriodicExportingMetricReader(MetricReader):
 
         self._exporter = exporter
         if export_interval_millis is None:
-            try:
-                export_interval_millis = float(environ.get(OTEL_METRIC_EXPORT_INTERVAL, 60000))
-            except ValueError:
-                _logger.warning("Found invalid value for export interval, using default")
-                export_interval_millis = 60000
+            export_interval_millis = PeriodicExportingMetricReader._default_export_interval_millis()
         if export_timeout_millis is None:
-            try:
-                export_timeout_millis = float(environ.get(OTEL_METRIC_EXPORT_TIMEOUT, 30000))
-            except ValueError:
-                _logger.warning("Found invalid value for export timeout, using default")
-                export_timeout_millis = 30000
+            export_timeout_millis = PeriodicExportingMetricReader._default_export_timeout_millis()
         self._export_interval_millis = export_interval_millis
         self._export_timeout_millis = export_timeout_millis
         self._shutdown = False
@@ -544,3 +663,205 @@ class PeriodicExportingMetricReader(MetricReader):
         super().force_flush(timeout_millis=timeout_millis)
         self._exporter.force_flush(timeout_millis=timeout_millis)
         return True
+
+    @staticmethod
+    def _default_export_interval_millis() -> float:
+        try:
+            return float(environ.get(OTEL_METRIC_EXPORT_INTERVAL, 60000))
+        except ValueError:
+            _logger.warning("Found invalid value for export interval, using default")
+            return 60000
+
+    @staticmethod
+    def _default_export_timeout_millis() -> float:
+        try:
+            return float(environ.get(OTEL_METRIC_EXPORT_TIMEOUT, 30000))
+        except ValueError:
+            _logger.warning("Found invalid value for export timeout, using default")
+            return 30000
+
+
+class AsyncPeriodicExportingMetricReader(MetricReader):
+    """`AsyncPeriodicExportingMetricReader` is the asyncio counterpart of
+    `PeriodicExportingMetricReader`: it collects metrics based on the same
+    time interval from a task on the event loop ``loop``, the running event loop
+    by default, and awaits their export by the configured `AsyncMetricExporter`.
+
+    The collections, and so the callbacks of the observable instruments, run
+    on the event loop too. `shutdown` and `force_flush` wait for the event loop,
+    on the thread running it they only schedule the work: await `shutdown_async`
+    and `force_flush_async` there instead.
+
+    The configured exporter's :py:meth:`~AsyncMetricExporter.export` method will not be called
+    concurrently.
+    """
+
+    def __init__(
+        self,
+        exporter: AsyncMetricExporter,
+        export_interval_millis: float | None = None,
+        export_timeout_millis: float | None = None,
+        *,
+        loop: asyncio.AbstractEventLoop | None = None,
+        aggregation_cardinality_limit: int | None = None,
+        max_idle_collections: int | None = None,
+    ) -> None:
+        # AsyncPeriodicExportingMetricReader defers to exporter for configuration
+        super().__init__(
+            preferred_temporality=exporter._preferred_temporality,
+            preferred_aggregation=exporter._preferred_aggregation,
+            otel_component_type=OtelComponentTypeValues.PERIODIC_METRIC_READER,
+            aggregation_cardinality_limit=aggregation_cardinality_limit,
+            max_idle_collections=max_idle_collections,
+        )
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+
+        # This lock is held whenever awaiting self._exporter.export() to prevent concurrent
+        # execution of AsyncMetricExporter.export()
+        self._export_lock = asyncio.Lock()
+        # The exports scheduled by collect, awaited by the coroutine that collected.
+        self._exports: set[asyncio.Task[None]] = set()
+
+        self._exporter = exporter
+        if export_interval_millis is None:
+            export_interval_millis = PeriodicExportingMetricReader._default_export_interval_millis()
+        if export_timeout_millis is None:
+            export_timeout_millis = PeriodicExportingMetricReader._default_export_timeout_millis()
+        self._export_interval_millis = export_interval_millis
+        self._export_timeout_millis = export_timeout_millis
+        self._shutdown = False
+        self._shutdown_event = asyncio.Event()
+        self._shutdown_once = Once()
+        self._ticker_task: asyncio.Task[None] | None = None
+        if self._export_interval_millis <= 0:
+            raise ValueError(
+                f"interval value {self._export_interval_millis} is invalid \
+                and needs to be larger than zero."
+            )
+        if self._export_interval_millis < math.inf:
+            call_in_loop(self._loop, self._start_ticker)
+
+    def _start_ticker(self) -> None:
+        if self._ticker_task is None:
+            self._ticker_task = self._loop.create_task(self._ticker(), name="OtelPeriodicExportingMetricReader")
+
+    async def _ticker(self) -> None:
+        interval_secs = self._export_interval_millis / 1e3
+        while True:
+            try:
+                await asyncio.wait_for(self._shutdown_event.wait(), interval_secs)
+                break
+            except asyncio.TimeoutError:
+                pass
+            try:
+                self.collect(timeout_millis=self._export_timeout_millis)
+            except MetricsTimeoutError:
+                _logger.warning(
+                    "Metric collection timed out. Will try again after %s seconds",
+                    interval_secs,
+                    exc_info=True,
+                )
+            await self._wait_for_exports()
+        # one last collection below before shutting down completely
+        try:
+            self.collect(timeout_millis=self._export_timeout_millis)
+        except MetricsTimeoutError:
+            _logger.warning(
+                "Metric collection timed out.",
+                exc_info=True,
+            )
+        await self._wait_for_exports()
+
+    def _receive_metrics(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> None:
+        if in_loop_thread(self._loop):
+            export = self._loop.create_task(self._export(metrics_data, timeout_millis))
+            self._exports.add(export)
+            export.add_done_callback(self._exports.discard)
+        else:
+            run_from_thread(
+                self._loop,
+                self._export,
+                metrics_data,
+                timeout_millis,
+                timeout=timeout_millis / 1e3,
+                default=None,
+            )
+
+    async def _export(self, metrics_data: MetricsData, timeout_millis: float) -> None:
+        # The export runs in a task of its own, which copies this context.
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        # pylint: disable=broad-exception-caught,invalid-name
+        try:
+            async with self._export_lock:
+                await asyncio.wait_for(
+                    self._exporter.export(metrics_data, timeout_millis=timeout_millis),
+                    timeout_millis / 1e3,
+                )
+        except asyncio.TimeoutError:
+            _logger.warning("Timed out exporting metrics.")
+        except Exception:
+            _logger.exception("Exception while exporting metrics")
+        finally:
+            detach(token)
+
+    async def _wait_for_exports(self) -> None:
+        if self._exports:
+            await asyncio.wait(set(self._exports))
+
+    async def shutdown_async(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        deadline = self._loop.time() + timeout_millis / 1e3
+
+        def _shutdown():
+            self._shutdown = True
+
+        did_set = self._shutdown_once.do_once(_shutdown)
+        if not did_set:
+            _logger.warning("Can't shutdown multiple times")
+            return
+
+        self._shutdown_event.set()
+        if self._export_interval_millis < math.inf:
+            self._start_ticker()
+            ticker = self._ticker_task
+            _, pending = await asyncio.wait({ticker}, timeout=max(0, deadline - self._loop.time()))
+            if pending:
+                # Cancels the exports in progress so that the exporter can be shut down in time.
+                ticker.cancel()
+                for export in self._exports:
+                    export.cancel()
+                await asyncio.wait({ticker, *self._exports})
+        await self._exporter.shutdown(timeout_millis=max(0, (deadline - self._loop.time()) * 1e3))
+
+    async def force_flush_async(self, timeout_millis: float = 10_000) -> bool:
+        self.collect(timeout_millis=timeout_millis)
+        await self._wait_for_exports()
+        await self._exporter.force_flush(timeout_millis=timeout_millis)
+        return True
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        """Runs `shutdown_async` on the event loop, see `run_from_thread`."""
+        if self._shutdown:
+            _logger.warning("Can't shutdown multiple times")
+            return
+        run_from_thread(
+            self._loop,
+            self.shutdown_async,
+            timeout_millis,
+            timeout=timeout_millis / 1e3,
+            default=None,
+        )
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        """Runs `force_flush_async` on the event loop, see `run_from_thread`."""
+        return run_from_thread(
+            self._loop,
+            self.force_flush_async,
+            timeout_millis,
+            timeout=timeout_millis / 1e3,
+            default=False,
+        )
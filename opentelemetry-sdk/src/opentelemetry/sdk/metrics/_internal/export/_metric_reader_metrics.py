@@ -2,9 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from collections import Counter
+from collections.abc import Callable
 from typing import Protocol
 
-from opentelemetry.metrics import MeterProvider
+from opentelemetry.metrics import CallbackOptions, MeterProvider, Observation
 from opentelemetry.semconv._incubating.attributes.otel_attributes import (
     OTEL_COMPONENT_NAME,
     OTEL_COMPONENT_TYPE,
@@ -26,7 +27,13 @@ class NoOpMetricReaderMetrics:
 
 
 class MetricReaderMetrics:
-    def __init__(self, component_type: str, meter_provider: MeterProvider) -> None:
+    def __init__(
+        self,
+        component_type: str,
+        meter_provider: MeterProvider,
+        get_overflowed_measurements: Callable[[], int],
+        get_evicted_series: Callable[[], int],
+    ) -> None:
         meter = meter_provider.get_meter("opentelemetry-sdk")
 
         count = _component_counter[component_type]
@@ -39,6 +46,41 @@ class MetricReaderMetrics:
 
         self._collection_duration = create_otel_sdk_metric_reader_collection_duration(meter)
 
+        def record_overflowed_measurements(
+            _options: CallbackOptions,
+        ) -> tuple[Observation, ...]:
+            # Only reported once a stream overflowed, overflow is expected to be rare.
+            overflowed_measurements = get_overflowed_measurements()
+            if not overflowed_measurements:
+                return ()
+            return (Observation(overflowed_measurements, self._standard_attrs),)
+
+        # The count is observed instead of recorded on every overflow so that
+        # overflowing its own metric stream can never recurse into the reader.
+        # This metric and the evicted series one are experimental, they are not
+        # defined by the semantic conventions and may be renamed or removed.
+        meter.create_observable_counter(
+            "otel.sdk.metric_reader.overflowed_measurements",
+            callbacks=(record_overflowed_measurements,),
+            unit="{measurement}",
+            description="The number of measurements aggregated into an overflow point because the metric stream reached its aggregation cardinality limit.",
+        )
+
+        def record_evicted_series(
+            _options: CallbackOptions,
+        ) -> tuple[Observation, ...]:
+            evicted_series = get_evicted_series()
+            if not evicted_series:
+                return ()
+            return (Observation(evicted_series, self._standard_attrs),)
+
+        meter.create_observable_counter(
+            "otel.sdk.metric_reader.evicted_series",
+            callbacks=(record_evicted_series,),
+            unit="{series}",
+            description="The number of metric points evicted from their metric stream because no measurement was recorded for them in max_idle_collections consecutive collections.",
+        )
+
     def record_collection(self, duration: float) -> None:
         self._collection_duration.record(duration, self._standard_attrs)
 
@@ -47,8 +89,10 @@ def create_metric_reader_metrics(
     component_type: str,
     meter_provider: MeterProvider,
     enabled: bool,
+    get_overflowed_measurements: Callable[[], int],
+    get_evicted_series: Callable[[], int],
 ) -> MetricReaderMetricsT:
     if not enabled:
         return NoOpMetricReaderMetrics()
 
-    return MetricReaderMetrics(component_type, meter_provider)
+    return MetricReaderMetrics(component_type, meter_provider, get_overflowed_measurements, get_evicted_series)
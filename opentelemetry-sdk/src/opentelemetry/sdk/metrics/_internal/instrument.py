@@ -18,6 +18,8 @@ from typing import (
 # This kind of import is needed to avoid Sphinx errors.
 from opentelemetry.context import Context, get_current
 from opentelemetry.metrics import Asynchronous, CallbackT, Synchronous
+from opentelemetry.metrics import BoundCounter as APIBoundCounter
+from opentelemetry.metrics import BoundHistogram as APIBoundHistogram
 from opentelemetry.metrics import Counter as APICounter
 from opentelemetry.metrics import Histogram as APIHistogram
 from opentelemetry.metrics import ObservableCounter as APIObservableCounter
@@ -31,7 +33,10 @@ from opentelemetry.metrics._internal.instrument import (
     CallbackOptions,
     _MetricsHistogramAdvisory,
 )
-from opentelemetry.sdk.metrics._internal.measurement import Measurement
+from opentelemetry.sdk.metrics._internal.measurement import (
+    Measurement,
+    _clean_measurement_attributes,
+)
 from opentelemetry.util.types import Attributes
 
 if TYPE_CHECKING:
@@ -40,6 +45,7 @@ if TYPE_CHECKING:
     )
     from opentelemetry.sdk.metrics._internal.measurement_consumer import (
         MeasurementConsumer,
+        _BoundAggregations,
     )
     from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 
@@ -51,6 +57,42 @@ _NAME_ERROR_MESSAGE = "Expected ASCII string of maximum length 255 characters bu
 _UNIT_ERROR_MESSAGE = "Expected ASCII string of maximum length 63 characters but got {}"
 
 
+def _non_negative_finite_amounts(
+    amounts: Sequence[int | float],
+    instrument_type: str,
+    instrument_name: str,
+) -> Sequence[int | float]:
+    """Returns the amounts of a batch recording as a sequence of Python
+    numbers, without the non-finite and negative ones."""
+    # A multidimensional memoryview or NumPy array would convert to nested
+    # lists instead of numbers.
+    ndim = getattr(amounts, "ndim", 1)
+    if ndim != 1:
+        _logger.warning(
+            "Ignoring %s-dimensional amounts on %s %s, expected a one-dimensional sequence.",
+            ndim,
+            instrument_type,
+            instrument_name,
+        )
+        return []
+
+    # array.array, memoryview and NumPy arrays convert all their items to
+    # Python numbers in a single call.
+    tolist = getattr(amounts, "tolist", None)
+    if tolist is not None:
+        amounts = tolist()
+
+    valid_amounts = [amount for amount in amounts if math.isfinite(amount) and amount >= 0]
+    if len(valid_amounts) != len(amounts):
+        _logger.warning(
+            "Ignoring %s non-finite or negative amounts on %s %s.",
+            len(amounts) - len(valid_amounts),
+            instrument_type,
+            instrument_name,
+        )
+    return valid_amounts
+
+
 @runtime_checkable
 class _Instrument(Protocol):
     name: str
@@ -160,24 +202,29 @@ class _Asynchronous(_Instrument, Asynchronous):
         if not self._is_enabled():
             return
         for callback in self._callbacks:
-            try:
-                for api_measurement in callback(callback_options):
-                    if not math.isfinite(api_measurement.value):
-                        _logger.warning(
-                            "Callback returned a non-finite value %s for instrument %s, ignoring measurement.",
-                            api_measurement.value,
-                            self.name,
-                        )
-                        continue
-                    yield Measurement(
+            yield from self._run_callback(callback, callback_options)
+
+    def _run_callback(self, callback: CallbackT, callback_options: CallbackOptions) -> Iterable[Measurement]:
+        """Yields the measurements of one of the callbacks of the
+        instrument, see `SynchronousMeasurementConsumer.collect`."""
+        try:
+            for api_measurement in callback(callback_options):
+                if not math.isfinite(api_measurement.value):
+                    _logger.warning(
+                        "Callback returned a non-finite value %s for instrument %s, ignoring measurement.",
                         api_measurement.value,
-                        time_unix_nano=time_ns(),
-                        instrument=self,
-                        context=api_measurement.context or get_current(),
-                        attributes=api_measurement.attributes,
+                        self.name,
                     )
-            except Exception:  # pylint: disable=broad-exception-caught
-                _logger.exception("Callback failed for instrument %s.", self.name)
+                    continue
+                yield Measurement(
+                    api_measurement.value,
+                    time_unix_nano=time_ns(),
+                    instrument=self,
+                    context=api_measurement.context or get_current(),
+                    attributes=api_measurement.attributes,
+                )
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Callback failed for instrument %s.", self.name)
 
 
 class Counter(_Synchronous, APICounter):
@@ -206,15 +253,68 @@ class Counter(_Synchronous, APICounter):
         if amount < 0:
             _logger.warning("Add amount must be non-negative on Counter %s.", self.name)
             return
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
+        self._measurement_consumer.consume_value(self, amount, attributes, context)
+
+    def add_many(
+        self,
+        amounts: Sequence[int | float],
+        attributes: Attributes = None,
+        context: Context | None = None,
+    ):
+        """Adds several amounts with the same attributes at once.
+
+        Args:
+            amounts: A sequence of amounts, or a one-dimensional buffer such as
+                an ``array.array``, a ``memoryview`` or a NumPy array.
+            attributes: Attributes of all the measurements.
+            context: Context of all the measurements.
+        """
+        if not self._is_enabled():
+            return
+
+        amounts = _non_negative_finite_amounts(amounts, "Counter", self.name)
+        if amounts:
+            self._measurement_consumer.consume_values(self, amounts, attributes, context)
+
+    def bind(self, attributes: Attributes = None) -> _BoundCounter:
+        return _BoundCounter(self, attributes)
+
+
+class _BoundCounter(APIBoundCounter):
+    def __init__(self, counter: Counter, attributes: Attributes) -> None:
+        self._counter = counter
+        # Cleaned once here instead of on every measurement, the cleaned
+        # attributes are a copy or an interned attribute set.
+        self._attributes, self._attribute_set_key = _clean_measurement_attributes(attributes)
+        self._bound_aggregations: _BoundAggregations | None = None
+
+    def add(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ):
+        counter = self._counter
+        # pylint: disable=protected-access
+        if not counter._is_enabled():
+            return
+
+        if not math.isfinite(amount):
+            _logger.warning(
+                "Add amount %s is not finite on Counter %s, ignoring measurement.",
                 amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
+                counter.name,
             )
+            return
+        if amount < 0:
+            _logger.warning("Add amount must be non-negative on Counter %s.", counter.name)
+            return
+        self._bound_aggregations = counter._measurement_consumer.consume_bound_value(
+            counter,
+            amount,
+            self._attributes,
+            self._attribute_set_key,
+            context,
+            self._bound_aggregations,
         )
 
 
@@ -241,16 +341,7 @@ class UpDownCounter(_Synchronous, APIUpDownCounter):
                 self.name,
             )
             return
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
-                amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
-            )
-        )
+        self._measurement_consumer.consume_value(self, amount, attributes, context)
 
 
 class ObservableCounter(_Asynchronous, APIObservableCounter):
@@ -317,15 +408,71 @@ class Histogram(_Synchronous, APIHistogram):
                 self.name,
             )
             return
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
+        self._measurement_consumer.consume_value(self, amount, attributes, context)
+
+    def record_many(
+        self,
+        amounts: Sequence[int | float],
+        attributes: Attributes = None,
+        context: Context | None = None,
+    ):
+        """Records several amounts with the same attributes at once.
+
+        Args:
+            amounts: A sequence of amounts, or a one-dimensional buffer such as
+                an ``array.array``, a ``memoryview`` or a NumPy array.
+            attributes: Attributes of all the measurements.
+            context: Context of all the measurements.
+        """
+        if not self._is_enabled():
+            return
+
+        amounts = _non_negative_finite_amounts(amounts, "Histogram", self.name)
+        if amounts:
+            self._measurement_consumer.consume_values(self, amounts, attributes, context)
+
+    def bind(self, attributes: Attributes = None) -> _BoundHistogram:
+        return _BoundHistogram(self, attributes)
+
+
+class _BoundHistogram(APIBoundHistogram):
+    def __init__(self, histogram: Histogram, attributes: Attributes) -> None:
+        self._histogram = histogram
+        # Cleaned once here instead of on every measurement, the cleaned
+        # attributes are a copy or an interned attribute set.
+        self._attributes, self._attribute_set_key = _clean_measurement_attributes(attributes)
+        self._bound_aggregations: _BoundAggregations | None = None
+
+    def record(
+        self,
+        amount: int | float,
+        context: Context | None = None,
+    ):
+        histogram = self._histogram
+        # pylint: disable=protected-access
+        if not histogram._is_enabled():
+            return
+
+        if not math.isfinite(amount):
+            _logger.warning(
+                "Record amount %s is not finite on Histogram %s, ignoring measurement.",
                 amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
+                histogram.name,
+            )
+            return
+        if amount < 0:
+            _logger.warning(
+                "Record amount must be non-negative on Histogram %s.",
+                histogram.name,
             )
+            return
+        self._bound_aggregations = histogram._measurement_consumer.consume_bound_value(
+            histogram,
+            amount,
+            self._attributes,
+            self._attribute_set_key,
+            context,
+            self._bound_aggregations,
         )
 
 
@@ -352,16 +499,7 @@ class Gauge(_Synchronous, APIGauge):
                 self.name,
             )
             return
-        time_unix_nano = time_ns()
-        self._measurement_consumer.consume_measurement(
-            Measurement(
-                amount,
-                time_unix_nano,
-                self,
-                context or get_current(),
-                attributes,
-            )
-        )
+        self._measurement_consumer.consume_value(self, amount, attributes, context)
 
 
 class ObservableGauge(_Asynchronous, APIObservableGauge):
@@ -3,13 +3,18 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from dataclasses import dataclass
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field
 from logging import getLogger
 from typing import TYPE_CHECKING
 
 from opentelemetry.attributes import _clean_attribute_value
 from opentelemetry.context import Context
+from opentelemetry.sdk.metrics._internal._attribute_set_cache import (
+    _EMPTY_ATTRIBUTE_SET_KEY,
+    _attribute_set_key,
+    _intern_attribute_set,
+)
 from opentelemetry.util.types import Attributes
 
 _logger = getLogger(__name__)
@@ -37,18 +42,54 @@ class Measurement:
     instrument: _Instrument
     context: Context
     attributes: Attributes = None
+    # Set when the attributes were interned, see _attribute_set_cache.
+    _attribute_set_key: Hashable | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        if self.attributes is not None:
-            if isinstance(self.attributes, Mapping):
-                object.__setattr__(
-                    self,
-                    "attributes",
-                    _clean_attribute_value(self.attributes, None),
-                )
-            else:
-                _logger.warning(
-                    "Invalid type '%s' for attributes. Expected a Mapping or None.",
-                    type(self.attributes),
-                )
-                object.__setattr__(self, "attributes", None)
+        attributes, attribute_set_key = _clean_measurement_attributes(self.attributes)
+        if attributes is not self.attributes:
+            object.__setattr__(self, "attributes", attributes)
+        object.__setattr__(self, "_attribute_set_key", attribute_set_key)
+
+    @classmethod
+    def _from_clean_attributes(
+        cls,
+        value: int | float,
+        time_unix_nano: int,
+        instrument: _Instrument,
+        context: Context,
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+    ) -> Measurement:
+        """Builds a measurement from attributes returned by
+        `_clean_measurement_attributes` without cleaning them again."""
+        measurement = object.__new__(cls)
+        # The dataclass is frozen, update the instance dict directly.
+        measurement.__dict__.update(
+            value=value,
+            time_unix_nano=time_unix_nano,
+            instrument=instrument,
+            context=context,
+            attributes=attributes,
+            _attribute_set_key=attribute_set_key,
+        )
+        return measurement
+
+
+def _clean_measurement_attributes(
+    attributes: Attributes,
+) -> tuple[Attributes, Hashable | None]:
+    """Returns the cleaned attributes of a measurement and their interned
+    attribute set key, if any."""
+    if attributes is None:
+        return None, _EMPTY_ATTRIBUTE_SET_KEY
+    if isinstance(attributes, Mapping):
+        attribute_set_key = _attribute_set_key(attributes)
+        if attribute_set_key is None:
+            return _clean_attribute_value(attributes, None), None
+        return _intern_attribute_set(attribute_set_key), attribute_set_key
+    _logger.warning(
+        "Invalid type '%s' for attributes. Expected a Mapping or None.",
+        type(attributes),
+    )
+    return None, None
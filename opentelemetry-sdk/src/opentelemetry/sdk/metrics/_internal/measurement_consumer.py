@@ -3,21 +3,55 @@
 
 # pylint: disable=unused-import
 
+import os
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+from fnmatch import fnmatchcase
+from logging import getLogger
 from threading import Lock
 from time import time_ns
 
 # This kind of import is needed to avoid Sphinx errors.
 import opentelemetry.sdk.metrics
 import opentelemetry.sdk.metrics._internal.instrument
+from opentelemetry.context import Context, get_current
+from opentelemetry.metrics import CallbackT
 from opentelemetry.metrics._internal.instrument import CallbackOptions
+from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _ViewInstrumentMatch,
+)
+from opentelemetry.sdk.metrics._internal.aggregation import _Aggregation
 from opentelemetry.sdk.metrics._internal.exceptions import MetricsTimeoutError
-from opentelemetry.sdk.metrics._internal.measurement import Measurement
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
+from opentelemetry.sdk.metrics._internal.measurement import (
+    Measurement,
+    _clean_measurement_attributes,
+)
 from opentelemetry.sdk.metrics._internal.metric_reader_storage import (
     MetricReaderStorage,
 )
 from opentelemetry.sdk.metrics._internal.point import MetricsData
+from opentelemetry.util.types import Attributes
+
+_logger = getLogger(__name__)
+
+# The timeout of an asynchronous instrument callback when the collection leaves
+# more time than this.
+_DEFAULT_CALLBACK_TIMEOUT_NS = 10000 * 1e6
+
+# The reader storages a bound instrument was resolved against and the
+# aggregations it records to, each with the callback to run when its attribute
+# set overflowed.
+_BoundAggregations = tuple[
+    Mapping["opentelemetry.sdk.metrics.export.MetricReader", MetricReaderStorage],
+    list[tuple[_Aggregation, Callable[[int], None] | None]],
+]
 
 
 class MeasurementConsumer(ABC):
@@ -25,6 +59,38 @@ class MeasurementConsumer(ABC):
     def consume_measurement(self, measurement: Measurement) -> None:
         pass
 
+    @abstractmethod
+    def consume_value(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        attributes: Attributes,
+        context: Context | None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def consume_values(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        values: Sequence[int | float],
+        attributes: Attributes,
+        context: Context | None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def consume_bound_value(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+        context: Context | None,
+        bound_aggregations: _BoundAggregations | None,
+    ) -> _BoundAggregations:
+        pass
+
     @abstractmethod
     def register_asynchronous_instrument(
         self,
@@ -46,7 +112,14 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
         self,
         sdk_config: "opentelemetry.sdk.metrics._internal.sdk_configuration.SdkConfiguration",
         metric_readers: Iterable["opentelemetry.sdk.metrics.MetricReader"],
+        max_concurrent_callbacks: int = 1,
+        callback_cache_millis: float = 0,
+        uncached_instrument_names: Sequence[str] = (),
     ) -> None:
+        if max_concurrent_callbacks < 1:
+            raise ValueError("max_concurrent_callbacks must be a positive integer.")
+        if callback_cache_millis < 0:
+            raise ValueError("callback_cache_millis must not be negative.")
         self._lock = Lock()
         self._sdk_config = sdk_config
         self._reader_storages: Mapping[opentelemetry.sdk.metrics.export.MetricReader, MetricReaderStorage] = {
@@ -54,10 +127,64 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
                 sdk_config,
                 reader._instrument_class_temporality,
                 reader._instrument_class_aggregation,
+                reader._aggregation_cardinality_limit,
+                reader._record_overflow,
+                reader._max_idle_collections,
+                reader._record_evictions,
             )
             for reader in metric_readers
         }
+        # The view instrument matches of every reader storage for each
+        # instrument with the reader storages they were resolved against, see
+        # _get_view_instrument_matches.
+        self._instrument_view_instrument_matches: dict[
+            opentelemetry.sdk.metrics._internal.instrument._Instrument,
+            tuple[
+                Mapping[opentelemetry.sdk.metrics.export.MetricReader, MetricReaderStorage],
+                list[_ViewInstrumentMatch],
+            ],
+        ] = {}
         self._async_instruments: list[opentelemetry.sdk.metrics._internal.instrument._Asynchronous] = []
+        # The timestamp and context of a measurement are only used by the
+        # exemplar reservoirs, see consume_value.
+        self._sample_exemplars = not isinstance(sdk_config.exemplar_filter, AlwaysOffExemplarFilter)
+        # With more than one concurrent callback, the callbacks of the
+        # asynchronous instruments run on a thread pool during collect, see
+        # _run_callbacks_concurrently.
+        self._max_concurrent_callbacks = max_concurrent_callbacks
+        self._callback_executor: ThreadPoolExecutor | None = None
+        self._running_callbacks: dict[tuple[object, CallbackT], Future] = {}
+        if max_concurrent_callbacks > 1:
+            self._callback_executor = self._new_callback_executor()
+            if hasattr(os, "register_at_fork"):
+                weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+
+                def _after_in_child() -> None:
+                    if reinit := weak_reinit():
+                        reinit()
+
+                os.register_at_fork(after_in_child=_after_in_child)
+        # The measurements of the last callbacks of each cached asynchronous
+        # instrument and when they started, reused by the collections of every
+        # reader within callback_cache_millis, see _cached_measurements.
+        self._callback_cache_ns = callback_cache_millis * 1e6
+        self._uncached_instrument_names = [name.lower() for name in uncached_instrument_names]
+        self._cached_instruments: set[opentelemetry.sdk.metrics._internal.instrument._Asynchronous] = set()
+        self._callback_cache: dict[
+            opentelemetry.sdk.metrics._internal.instrument._Asynchronous,
+            tuple[int, list[Measurement]],
+        ] = {}
+
+    def _new_callback_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self._max_concurrent_callbacks,
+            thread_name_prefix="OtelMetricsCallback",
+        )
+
+    def _at_fork_reinit(self) -> None:
+        # The worker threads of the executor do not survive a fork.
+        self._callback_executor = self._new_callback_executor()
+        self._running_callbacks = {}
 
     def consume_measurement(self, measurement: Measurement) -> None:
         should_sample_exemplar = self._sdk_config.exemplar_filter.should_sample(
@@ -66,11 +193,160 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
             measurement.attributes,
             measurement.context,
         )
-        # `_reader_storages` is replaced (never mutated in place) by
-        # `add_metric_reader` and `remove_metric_reader`, so it is safe
-        # to iterate over without a lock.
-        for reader_storage in self._reader_storages.values():
-            reader_storage.consume_measurement(measurement, should_sample_exemplar)
+        for view_instrument_match in self._get_view_instrument_matches(measurement.instrument):
+            view_instrument_match.consume_measurement(measurement, should_sample_exemplar)
+
+    def _get_view_instrument_matches(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Instrument",
+    ) -> list[_ViewInstrumentMatch]:
+        """Returns the view instrument matches of the instrument across all
+        the reader storages.
+
+        `_reader_storages` is replaced (never mutated in place) by
+        `add_metric_reader` and `remove_metric_reader`, so the matches are
+        resolved again when it is not the mapping they were resolved
+        against. The view instrument matches of an instrument never change
+        within a reader storage.
+        """
+        reader_storages = self._reader_storages
+        view_instrument_matches = self._instrument_view_instrument_matches.get(instrument)
+        if view_instrument_matches is not None and view_instrument_matches[0] is reader_storages:
+            return view_instrument_matches[1]
+
+        view_instrument_matches = (
+            reader_storages,
+            [
+                view_instrument_match
+                for reader_storage in reader_storages.values()
+                # pylint: disable-next=protected-access
+                for view_instrument_match in reader_storage._get_or_init_view_instrument_match(instrument)
+            ],
+        )
+        self._instrument_view_instrument_matches[instrument] = view_instrument_matches
+        return view_instrument_matches[1]
+
+    def consume_value(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        attributes: Attributes,
+        context: Context | None,
+    ) -> None:
+        """Consumes a measurement of a synchronous instrument.
+
+        When exemplars are disabled, no `Measurement` is built and neither the
+        timestamp nor the context are captured, the value goes straight into
+        the aggregations.
+        """
+        if self._sample_exemplars:
+            self.consume_measurement(
+                Measurement(
+                    value,
+                    time_ns(),
+                    instrument,
+                    context or get_current(),
+                    attributes,
+                )
+            )
+            return
+
+        attributes, attribute_set_key = _clean_measurement_attributes(attributes)
+        for view_instrument_match in self._get_view_instrument_matches(instrument):
+            view_instrument_match.consume_value(value, attributes, attribute_set_key)
+
+    def consume_values(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        values: Sequence[int | float],
+        attributes: Attributes,
+        context: Context | None,
+    ) -> None:
+        """Consumes several measurements of a synchronous instrument that
+        share their attributes and context.
+
+        The attributes are cleaned once and the values are aggregated in bulk.
+        A `Measurement` is only built for the values the exemplar filter
+        samples, they share a single timestamp.
+        """
+        attributes, attribute_set_key = _clean_measurement_attributes(attributes)
+
+        sampled_measurements: list[Measurement] = []
+        if self._sample_exemplars:
+            time_unix_nano = time_ns()
+            context = context or get_current()
+            should_sample = self._sdk_config.exemplar_filter.should_sample
+            sampled_measurements = [
+                # pylint: disable-next=protected-access
+                Measurement._from_clean_attributes(
+                    value,
+                    time_unix_nano,
+                    instrument,
+                    context,
+                    attributes,
+                    attribute_set_key,
+                )
+                for value in values
+                if should_sample(value, time_unix_nano, attributes, context)
+            ]
+
+        for view_instrument_match in self._get_view_instrument_matches(instrument):
+            view_instrument_match.consume_values(values, attributes, attribute_set_key, sampled_measurements)
+
+    def consume_bound_value(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Synchronous",
+        value: int | float,
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+        context: Context | None,
+        bound_aggregations: _BoundAggregations | None,
+    ) -> _BoundAggregations:
+        """Consumes a measurement of a bound instrument.
+
+        The attributes must have been cleaned by `_clean_measurement_attributes`.
+        Their aggregations are resolved once and returned for the caller to
+        pass back with its next measurement, they are resolved again when a
+        reader has been added or removed since.
+        """
+        reader_storages = self._reader_storages
+        if bound_aggregations is None or bound_aggregations[0] is not reader_storages:
+            bound_aggregations = (
+                reader_storages,
+                [
+                    bound_aggregation
+                    for reader_storage in reader_storages.values()
+                    for bound_aggregation in reader_storage.bind_aggregations(instrument, attributes)
+                ],
+            )
+
+        if not self._sample_exemplars:
+            for aggregation, record_overflow in bound_aggregations[1]:
+                if record_overflow is not None:
+                    record_overflow(1)
+                aggregation.aggregate_value(value)
+            return bound_aggregations
+
+        # pylint: disable-next=protected-access
+        measurement = Measurement._from_clean_attributes(
+            value,
+            time_ns(),
+            instrument,
+            context or get_current(),
+            attributes,
+            attribute_set_key,
+        )
+        should_sample_exemplar = self._sdk_config.exemplar_filter.should_sample(
+            measurement.value,
+            measurement.time_unix_nano,
+            measurement.attributes,
+            measurement.context,
+        )
+        for aggregation, record_overflow in bound_aggregations[1]:
+            if record_overflow is not None:
+                record_overflow(1)
+            aggregation.aggregate(measurement, should_sample_exemplar)
+        return bound_aggregations
 
     def register_asynchronous_instrument(
         self,
@@ -78,6 +354,21 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
     ) -> None:
         with self._lock:
             self._async_instruments.append(instrument)
+            if self._callback_cache_ns and not any(
+                fnmatchcase(instrument.name, name) for name in self._uncached_instrument_names
+            ):
+                self._cached_instruments.add(instrument)
+
+    def _cached_measurements(
+        self,
+        instrument: "opentelemetry.sdk.metrics._internal.instrument._Asynchronous",
+    ) -> list[Measurement] | None:
+        """Returns the measurements of the last callbacks of the instrument if
+        they started within callback_cache_millis, `None` otherwise."""
+        cached_callbacks = self._callback_cache.get(instrument)
+        if cached_callbacks is None or time_ns() - cached_callbacks[0] >= self._callback_cache_ns:
+            return None
+        return cached_callbacks[1]
 
     def collect(
         self,
@@ -86,35 +377,154 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
     ) -> MetricsData | None:
         with self._lock:
             metric_reader_storage = self._reader_storages[metric_reader]
-            # for now, just use the defaults
-            callback_options = CallbackOptions()
             deadline_ns = time_ns() + (timeout_millis * 1e6)
 
-            default_timeout_ns = 10000 * 1e6
+            if self._callback_executor is not None:
+                for measurements in self._run_callbacks_concurrently(deadline_ns):
+                    self._consume_callback_measurements(metric_reader_storage, measurements)
+                return metric_reader_storage.collect()
+
+            # for now, just use the defaults
+            callback_options = CallbackOptions()
 
             for async_instrument in self._async_instruments:
+                cached = async_instrument in self._cached_instruments
+                if cached:
+                    measurements = self._cached_measurements(async_instrument)
+                    if measurements is not None:
+                        self._consume_callback_measurements(metric_reader_storage, measurements)
+                        continue
+
                 remaining_time = deadline_ns - time_ns()
 
-                if remaining_time < default_timeout_ns:
+                if remaining_time < _DEFAULT_CALLBACK_TIMEOUT_NS:
                     callback_options = CallbackOptions(timeout_millis=remaining_time / 1e6)
 
-                measurements = async_instrument.callback(callback_options)
+                if cached:
+                    callback_start_ns = time_ns()
+                    measurements = list(async_instrument.callback(callback_options))
+                    self._callback_cache[async_instrument] = (callback_start_ns, measurements)
+                else:
+                    measurements = async_instrument.callback(callback_options)
                 if time_ns() >= deadline_ns:
                     raise MetricsTimeoutError("Timed out while executing callback")
 
-                for measurement in measurements:
-                    should_sample_exemplar = self._sdk_config.exemplar_filter.should_sample(
-                        measurement.value,
-                        measurement.time_unix_nano,
-                        measurement.attributes,
-                        measurement.context,
-                    )
-                    metric_reader_storage.consume_measurement(measurement, should_sample_exemplar)
+                self._consume_callback_measurements(metric_reader_storage, measurements)
 
             result = self._reader_storages[metric_reader].collect()
 
         return result
 
+    def _consume_callback_measurements(
+        self,
+        metric_reader_storage: MetricReaderStorage,
+        measurements: Iterable[Measurement],
+    ) -> None:
+        for measurement in measurements:
+            should_sample_exemplar = self._sdk_config.exemplar_filter.should_sample(
+                measurement.value,
+                measurement.time_unix_nano,
+                measurement.attributes,
+                measurement.context,
+            )
+            metric_reader_storage.consume_measurement(measurement, should_sample_exemplar)
+
+    def _run_callbacks_concurrently(self, deadline_ns: float) -> list[list[Measurement]]:
+        """Runs every callback of the asynchronous instruments on the callback
+        executor and returns the measurements of the ones that completed
+        within their timeout, in the order of the callbacks.
+
+        The timeout of a callback is the one passed in its `CallbackOptions`.
+        A callback that overruns it is not waited for and its measurements
+        are discarded. It is not run again until it returns, so callbacks
+        never run concurrently with themselves.
+
+        Raises `MetricsTimeoutError` once the deadline of the collection has
+        passed, as when the callbacks run on the collecting thread.
+        """
+        # The instruments, with either their cached measurements or the
+        # futures of their callbacks and whether none was skipped.
+        submitted_instruments = []
+        for async_instrument in self._async_instruments:
+            # pylint: disable=protected-access
+            if not async_instrument._is_enabled():
+                continue
+            if async_instrument in self._cached_instruments:
+                measurements = self._cached_measurements(async_instrument)
+                if measurements is not None:
+                    submitted_instruments.append((async_instrument, measurements, [], 0, False))
+                    continue
+            callback_start_ns = time_ns()
+            futures = []
+            all_submitted = True
+            for callback in async_instrument._callbacks:
+                running_callback = self._running_callbacks.get((async_instrument, callback))
+                if running_callback is not None and not running_callback.done():
+                    _logger.warning(
+                        "Callback of instrument %s is still running since a previous collection, skipping it.",
+                        async_instrument.name,
+                    )
+                    all_submitted = False
+                    continue
+                callback_deadline_ns = min(deadline_ns, time_ns() + _DEFAULT_CALLBACK_TIMEOUT_NS)
+                future = self._callback_executor.submit(
+                    # Callbacks see the context of the collection, as when
+                    # they run on the collecting thread.
+                    copy_context().run,
+                    self._run_callback,
+                    async_instrument,
+                    callback,
+                    callback_deadline_ns,
+                )
+                self._running_callbacks[(async_instrument, callback)] = future
+                futures.append((future, callback_deadline_ns))
+            submitted_instruments.append((async_instrument, None, futures, callback_start_ns, all_submitted))
+
+        callback_measurements = []
+        for async_instrument, measurements, futures, callback_start_ns, completed in submitted_instruments:
+            if measurements is not None:
+                callback_measurements.append(measurements)
+                continue
+            measurements = []
+            for future, callback_deadline_ns in futures:
+                try:
+                    measurements.extend(future.result(timeout=max(callback_deadline_ns - time_ns(), 0) / 1e9))
+                except FutureTimeoutError as error:
+                    if time_ns() >= deadline_ns:
+                        raise MetricsTimeoutError("Timed out while executing callback") from error
+                    completed = False
+                    _logger.warning(
+                        "Timed out while executing callback of instrument %s, discarding its measurements.",
+                        async_instrument.name,
+                    )
+            # Only the measurements of all the callbacks of an instrument are
+            # cached.
+            if completed and async_instrument in self._cached_instruments:
+                self._callback_cache[async_instrument] = (callback_start_ns, measurements)
+            callback_measurements.append(measurements)
+        return callback_measurements
+
+    @staticmethod
+    def _run_callback(
+        async_instrument: "opentelemetry.sdk.metrics._internal.instrument._Asynchronous",
+        callback: CallbackT,
+        callback_deadline_ns: float,
+    ) -> list[Measurement]:
+        # The timeout is computed once the callback starts since it may have
+        # waited for a worker thread.
+        callback_options = CallbackOptions(timeout_millis=max(callback_deadline_ns - time_ns(), 0) / 1e6)
+        # pylint: disable-next=protected-access
+        return list(async_instrument._run_callback(callback, callback_options))
+
+    def shutdown(self) -> None:
+        """Stops the threads running the callbacks of the asynchronous
+        instruments, without waiting for the running callbacks. Later
+        collections run the callbacks on the collecting thread."""
+        with self._lock:
+            if self._callback_executor is not None:
+                self._callback_executor.shutdown(wait=False, cancel_futures=True)
+                self._callback_executor = None
+
     def add_metric_reader(self, metric_reader: "opentelemetry.sdk.metrics.MetricReader") -> None:
         """Registers a new metric reader."""
         # Build a new mapping and swap it in atomically so that
@@ -128,6 +538,14 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
                 metric_reader._instrument_class_temporality,
                 # pylint: disable-next=protected-access
                 metric_reader._instrument_class_aggregation,
+                # pylint: disable-next=protected-access
+                metric_reader._aggregation_cardinality_limit,
+                # pylint: disable-next=protected-access
+                metric_reader._record_overflow,
+                # pylint: disable-next=protected-access
+                metric_reader._max_idle_collections,
+                # pylint: disable-next=protected-access
+                metric_reader._record_evictions,
             )
             self._reader_storages = new_reader_storages
 
@@ -1,6 +1,7 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+from collections.abc import Callable, Hashable, Sequence
 from logging import getLogger
 from threading import RLock
 from time import time_ns
@@ -11,12 +12,14 @@ from opentelemetry.metrics import (
     ObservableCounter,
 )
 from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _DEFAULT_AGGREGATION_CARDINALITY_LIMIT,
     _ViewInstrumentMatch,
 )
 from opentelemetry.sdk.metrics._internal.aggregation import (
     Aggregation,
     AggregationTemporality,
     ExplicitBucketHistogramAggregation,
+    _Aggregation,
     _DropAggregation,
     _ExplicitBucketHistogramAggregation,
     _ExponentialBucketHistogramAggregation,
@@ -38,8 +41,9 @@ from opentelemetry.sdk.metrics._internal.point import (
 from opentelemetry.sdk.metrics._internal.sdk_configuration import (
     SdkConfiguration,
 )
-from opentelemetry.sdk.metrics._internal.view import View
+from opentelemetry.sdk.metrics._internal.view import View, _ViewIndex
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.util.types import Attributes
 
 _logger = getLogger(__name__)
 
@@ -54,12 +58,24 @@ class MetricReaderStorage:
         sdk_config: SdkConfiguration,
         instrument_class_temporality: dict[type, AggregationTemporality],
         instrument_class_aggregation: dict[type, Aggregation],
+        aggregation_cardinality_limit: int = _DEFAULT_AGGREGATION_CARDINALITY_LIMIT,
+        record_overflow: Callable[[int], None] | None = None,
+        max_idle_collections: int | None = None,
+        record_evictions: Callable[[int], None] | None = None,
     ) -> None:
         self._lock = RLock()
         self._sdk_config = sdk_config
         self._instrument_view_instrument_matches: dict[_Instrument, list[_ViewInstrumentMatch]] = {}
+        self._view_index = _ViewIndex(sdk_config.views)
+        # The view instrument matches of every instrument by the identity of
+        # their metric stream, only the ones sharing it can conflict.
+        self._view_instrument_matches_by_identity: dict[tuple[str, str, type], list[_ViewInstrumentMatch]] = {}
         self._instrument_class_temporality = instrument_class_temporality
         self._instrument_class_aggregation = instrument_class_aggregation
+        self._aggregation_cardinality_limit = aggregation_cardinality_limit
+        self._record_overflow = record_overflow
+        self._max_idle_collections = max_idle_collections
+        self._record_evictions = record_evictions
 
     def _get_or_init_view_instrument_match(self, instrument: _Instrument) -> list[_ViewInstrumentMatch]:
         # Optimistically get the relevant views for the given instrument. Once set for a given
@@ -85,16 +101,87 @@ class MetricReaderStorage:
                         view=_DEFAULT_VIEW,
                         instrument=instrument,
                         instrument_class_aggregation=(self._instrument_class_aggregation),
+                        aggregation_cardinality_limit=self._aggregation_cardinality_limit,
+                        record_overflow=self._record_overflow,
+                        max_idle_collections=self._instrument_max_idle_collections(instrument),
+                        record_evictions=self._record_evictions,
                     )
                 )
             self._instrument_view_instrument_matches[instrument] = view_instrument_matches
+            for view_instrument_match in view_instrument_matches:
+                self._view_instrument_matches_by_identity.setdefault(
+                    self._metric_stream_identity(view_instrument_match), []
+                ).append(view_instrument_match)
 
             return view_instrument_matches
 
+    def _instrument_max_idle_collections(self, instrument: _Instrument) -> int | None:
+        """Returns the max_idle_collections of the metric streams of the
+        instrument when their views don't set one.
+
+        Unless the reader sets one, the attribute sets of delta streams are
+        released so that the sets an application stops recording don't count
+        against the cardinality limit forever. The points of synchronous
+        instruments are reset by each collection, so are their attribute sets.
+        Asynchronous instruments keep their previous observation to compute
+        their deltas, their attribute sets are released once not observed in a
+        collection.
+        """
+        if (
+            self._max_idle_collections is not None
+            or self._instrument_class_temporality[instrument.__class__] is not AggregationTemporality.DELTA
+        ):
+            return self._max_idle_collections
+        if isinstance(instrument, Asynchronous):
+            return 1
+        return 0
+
+    @staticmethod
+    def _metric_stream_identity(view_instrument_match: _ViewInstrumentMatch) -> tuple[str, str, type]:
+        # The part of the identity `_ViewInstrumentMatch.conflicts` compares
+        # first, view instrument matches that differ in it never conflict.
+        # pylint: disable=protected-access
+        return (
+            view_instrument_match._name,
+            view_instrument_match._instrument.unit,
+            view_instrument_match._aggregation.__class__,
+        )
+
     def consume_measurement(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
         for view_instrument_match in self._get_or_init_view_instrument_match(measurement.instrument):
             view_instrument_match.consume_measurement(measurement, should_sample_exemplar)
 
+    def consume_value(
+        self,
+        instrument: _Instrument,
+        value: int | float,
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+    ) -> None:
+        for view_instrument_match in self._get_or_init_view_instrument_match(instrument):
+            view_instrument_match.consume_value(value, attributes, attribute_set_key)
+
+    def consume_values(
+        self,
+        instrument: _Instrument,
+        values: Sequence[int | float],
+        attributes: Attributes,
+        attribute_set_key: Hashable | None,
+        sampled_measurements: Sequence[Measurement],
+    ) -> None:
+        for view_instrument_match in self._get_or_init_view_instrument_match(instrument):
+            view_instrument_match.consume_values(values, attributes, attribute_set_key, sampled_measurements)
+
+    def bind_aggregations(
+        self, instrument: _Instrument, attributes: Attributes
+    ) -> list[tuple[_Aggregation, Callable[[int], None] | None]]:
+        """Resolves the aggregations of every view matching the instrument for
+        a fixed set of attributes, see `_ViewInstrumentMatch.bind_aggregation`."""
+        return [
+            view_instrument_match.bind_aggregation(attributes)
+            for view_instrument_match in self._get_or_init_view_instrument_match(instrument)
+        ]
+
     def collect(self) -> MetricsData | None:
         # Use a list instead of yielding to prevent a slow reader from holding
         # SDK locks
@@ -210,11 +297,7 @@ class MetricReaderStorage:
         instrument: _Instrument,
         view_instrument_matches: list["_ViewInstrumentMatch"],
     ) -> None:
-        for view in self._sdk_config.views:
-            # pylint: disable=protected-access
-            if not view._match(instrument):
-                continue
-
+        for view in self._view_index.match(instrument):
             if not self._check_view_instrument_compatibility(view, instrument):
                 continue
 
@@ -222,16 +305,22 @@ class MetricReaderStorage:
                 view=view,
                 instrument=instrument,
                 instrument_class_aggregation=(self._instrument_class_aggregation),
+                aggregation_cardinality_limit=self._aggregation_cardinality_limit,
+                record_overflow=self._record_overflow,
+                max_idle_collections=self._instrument_max_idle_collections(instrument),
+                record_evictions=self._record_evictions,
             )
 
-            for existing_view_instrument_matches in self._instrument_view_instrument_matches.values():
-                for existing_view_instrument_match in existing_view_instrument_matches:
-                    if existing_view_instrument_match.conflicts(new_view_instrument_match):
-                        _logger.warning(
-                            "Views %s and %s will cause conflicting metrics identities",
-                            existing_view_instrument_match._view,
-                            new_view_instrument_match._view,
-                        )
+            for existing_view_instrument_match in self._view_instrument_matches_by_identity.get(
+                self._metric_stream_identity(new_view_instrument_match), ()
+            ):
+                if existing_view_instrument_match.conflicts(new_view_instrument_match):
+                    # pylint: disable=protected-access
+                    _logger.warning(
+                        "Views %s and %s will cause conflicting metrics identities",
+                        existing_view_instrument_match._view,
+                        new_view_instrument_match._view,
+                    )
 
             view_instrument_matches.append(new_view_instrument_match)
 
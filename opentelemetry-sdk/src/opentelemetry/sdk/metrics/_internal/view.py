@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from collections.abc import Callable
-from fnmatch import fnmatchcase
+import re
+from collections.abc import Callable, Sequence
+from fnmatch import fnmatchcase, translate
 from logging import getLogger
 
 from opentelemetry.metrics import Instrument
@@ -88,6 +89,20 @@ class View:
         instrument_unit: This is an instrument matching attribute: the unit the
             instrument must have to match the view.
 
+        aggregation_cardinality_limit: This is a metric stream customizing
+            attribute: the maximum number of metric points, including the
+            overflow point, the metric stream keeps. Measurements with new
+            attribute sets beyond the limit are aggregated into a single point
+            with the ``otel.metric.overflow=true`` attribute. If `None`, the
+            limit of the metric reader will be used.
+
+        max_idle_collections: This is a metric stream customizing attribute:
+            the number of consecutive collections without measurements after
+            which the metric point of an attribute set is evicted. A cumulative
+            point recorded again after its eviction restarts from zero with a
+            new start time. If `None`, the value of the metric reader will be
+            used.
+
     This class is not intended to be subclassed by the user.
     """
 
@@ -106,6 +121,8 @@ class View:
         aggregation: Aggregation | None = None,
         exemplar_reservoir_factory: Callable[[type[_Aggregation]], ExemplarReservoirBuilder] | None = None,
         instrument_unit: str | None = None,
+        aggregation_cardinality_limit: int | None = None,
+        max_idle_collections: int | None = None,
     ):
         if (
             instrument_type
@@ -123,8 +140,17 @@ class View:
             # pylint: disable=broad-exception-raised
             raise Exception(f"View {name} declared with wildcard characters in instrument_name")
 
-        # _name, _description, _aggregation, _exemplar_reservoir_factory and
-        # _attribute_keys will be accessed when instantiating a _ViewInstrumentMatch.
+        if aggregation_cardinality_limit is not None and aggregation_cardinality_limit < 1:
+            # pylint: disable=broad-exception-raised
+            raise Exception(f"View {name} declared with a non-positive aggregation_cardinality_limit")
+
+        if max_idle_collections is not None and max_idle_collections < 1:
+            # pylint: disable=broad-exception-raised
+            raise Exception(f"View {name} declared with a non-positive max_idle_collections")
+
+        # _name, _description, _aggregation, _exemplar_reservoir_factory,
+        # _attribute_keys, _aggregation_cardinality_limit and
+        # _max_idle_collections will be accessed when instantiating a _ViewInstrumentMatch.
         self._name = name
         self._instrument_type = instrument_type
         self._instrument_name = instrument_name
@@ -137,6 +163,8 @@ class View:
         self._attribute_keys = attribute_keys
         self._aggregation = aggregation or self._default_aggregation
         self._exemplar_reservoir_factory = exemplar_reservoir_factory or _default_reservoir_factory
+        self._aggregation_cardinality_limit = aggregation_cardinality_limit
+        self._max_idle_collections = max_idle_collections
 
     # pylint: disable=too-many-return-statements
     # pylint: disable=too-many-branches
@@ -172,3 +200,59 @@ class View:
                 return False
 
         return True
+
+
+class _ViewIndex:
+    """The views of a `MeterProvider` compiled to find the ones matching an
+    instrument without evaluating each of them.
+
+    Views selecting an exact instrument name are indexed by that name, views
+    selecting instrument names with wild card characters are compiled into a
+    single regular expression and views selecting no instrument name are
+    indexed by their meter name when they have one. Only the views left,
+    which select neither, are evaluated for every instrument.
+    """
+
+    def __init__(self, views: Sequence[View]):
+        self._views = list(views)
+        self._views_by_instrument_name: dict[str, list[int]] = {}
+        self._views_by_meter_name: dict[str, list[int]] = {}
+        self._unindexed_views: list[int] = []
+        wildcard_patterns = []
+
+        # pylint: disable=protected-access
+        for index, view in enumerate(self._views):
+            if view._instrument_name is not None:
+                instrument_name = view._instrument_name.lower()
+                if any(character in instrument_name for character in "*?["):
+                    # Every alternative is an empty match or a lookahead, so
+                    # matching the expression sets the group of each pattern
+                    # matching the name.
+                    wildcard_patterns.append(f"(?:(?=(?P<view{index}>{translate(instrument_name)}))|)")
+                else:
+                    self._views_by_instrument_name.setdefault(instrument_name, []).append(index)
+            elif view._meter_name is not None:
+                self._views_by_meter_name.setdefault(view._meter_name, []).append(index)
+            else:
+                self._unindexed_views.append(index)
+
+        self._wildcard_views = re.compile("".join(wildcard_patterns)) if wildcard_patterns else None
+
+    def match(self, instrument: _Instrument) -> list[View]:
+        """Returns the views matching the instrument in the order they were
+        given."""
+        candidates = [
+            *self._views_by_instrument_name.get(instrument.name, ()),
+            *self._views_by_meter_name.get(instrument.instrumentation_scope.name, ()),
+            *self._unindexed_views,
+        ]
+        if self._wildcard_views is not None:
+            candidates.extend(
+                int(group[len("view") :])
+                for group, value in self._wildcard_views.match(instrument.name).groupdict().items()
+                if value is not None
+            )
+        # The index only narrows down the views, the ones found are matched
+        # against all their criteria.
+        # pylint: disable=protected-access
+        return [self._views[index] for index in sorted(candidates) if self._views[index]._match(instrument)]
@@ -6,6 +6,8 @@ from opentelemetry.sdk.metrics._internal.aggregation import (
     AggregationTemporality,
 )
 from opentelemetry.sdk.metrics._internal.export import (
+    AsyncMetricExporter,
+    AsyncPeriodicExportingMetricReader,
     ConsoleMetricExporter,
     InMemoryMetricReader,
     MetricExporter,
@@ -34,6 +36,8 @@ from opentelemetry.sdk.metrics._internal.point import (  # noqa: F401
 
 __all__ = [
     "AggregationTemporality",
+    "AsyncMetricExporter",
+    "AsyncPeriodicExportingMetricReader",
     "Buckets",
     "ConsoleMetricExporter",
     "InMemoryMetricReader",
@@ -164,6 +164,7 @@ class Resource:
         if schema_url is None:
             schema_url = ""
         self._schema_url = schema_url
+        self._hash: int | None = None
 
     @staticmethod
     def create(
@@ -253,7 +254,11 @@ class Resource:
         return self._attributes == other._attributes and self._schema_url == other._schema_url
 
     def __hash__(self) -> int:
-        return hash(f"{dumps(self._attributes.copy(), sort_keys=True)}|{self._schema_url}")
+        # Exporters group their batches by resource, the hash of this
+        # immutable resource is only computed once.
+        if self._hash is None:
+            self._hash = hash(f"{dumps(self._attributes.copy(), sort_keys=True)}|{self._schema_url}")
+        return self._hash
 
     def to_json(self, indent: int | None = 4) -> str:
         return dumps(
@@ -5,6 +5,7 @@
 import abc
 import atexit
 import concurrent.futures
+import copy
 import json
 import logging
 import os
@@ -33,7 +34,7 @@ from typing_extensions import deprecated
 from opentelemetry import context as context_api
 from opentelemetry import metrics as metrics_api
 from opentelemetry import trace as trace_api
-from opentelemetry.attributes import BoundedAttributes
+from opentelemetry.attributes import BoundedAttributes, _LazyBoundedAttributes
 from opentelemetry.sdk import util
 from opentelemetry.sdk.environment_variables import (
     OTEL_ATTRIBUTE_COUNT_LIMIT,
@@ -127,6 +128,9 @@ class SpanProcessor:
         This method is called synchronously on the thread that ends the
         span, therefore it should not block or throw an exception.
 
+        The span is passed itself rather than a copy of it. Its mutators are
+        no-ops once it has ended, so it can be held after this call.
+
         Args:
             span: The :class:`opentelemetry.trace.Span` that just ended.
         """
@@ -321,6 +325,8 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
 
 
 class EventBase(abc.ABC):
+    __slots__ = ("_name", "_timestamp")
+
     def __init__(self, name: str, timestamp: int | None = None) -> None:
         self._name = name
         if timestamp is None:
@@ -353,6 +359,8 @@ class Event(EventBase):
             automatically.
     """
 
+    __slots__ = ("_attributes",)
+
     def __init__(
         self,
         name: str,
@@ -401,6 +409,22 @@ class ReadableSpan:
 
     """
 
+    __slots__ = (
+        "_name",
+        "_context",
+        "_kind",
+        "_instrumentation_info",
+        "_instrumentation_scope",
+        "_parent",
+        "_start_time",
+        "_end_time",
+        "_attributes",
+        "_events",
+        "_links",
+        "_resource",
+        "_status",
+    )
+
     def __init__(
         self,
         name: str,
@@ -762,6 +786,17 @@ class Span(trace_api.Span, ReadableSpan):
         limits: `SpanLimits` instance that was passed to the `TracerProvider`
     """
 
+    __slots__ = (
+        "_sampler",
+        "_trace_config",
+        "_record_exception",
+        "_set_status_on_exception",
+        "_span_processor",
+        "_limits",
+        "_lock",
+        "_record_end_metrics",
+    )
+
     def __new__(cls, *args, **kwargs):
         if cls is Span:
             raise TypeError("Span must be instantiated via a tracer.")
@@ -807,17 +842,20 @@ class Span(trace_api.Span, ReadableSpan):
         self._span_processor = span_processor
         self._limits = limits
         self._lock = threading.Lock()
-        self._attributes = BoundedAttributes(
+        self._attributes = _LazyBoundedAttributes(
             self._limits.max_span_attributes,
             attributes,
             immutable=False,
             max_value_len=self._limits.max_span_attribute_length,
         )
-        self._events = self._new_events()
+        # Most spans never get events or links, so their bounded lists are only
+        # allocated on first use.
+        self._events = ()
         if events:
+            self._events = self._new_events()
             for event in events:
                 # Immutable set to true so attributes cannot be added or removed after creation.
-                event._attributes = BoundedAttributes(
+                event._attributes = _LazyBoundedAttributes(
                     self._limits.max_event_attributes,
                     event.attributes,
                     max_value_len=self._limits.max_attribute_length,
@@ -832,19 +870,45 @@ class Span(trace_api.Span, ReadableSpan):
     def __repr__(self):
         return f'{type(self).__name__}(name="{self._name}", context={self._context})'
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # The lock can't be copied, the copy gets its own in __setstate__.
+        state = {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in cls.__dict__.get("__slots__", ())
+            if slot != "_lock" and hasattr(self, slot)
+        }
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo: dict[int, typing.Any]) -> "Span":
+        # The span processor and sampler belong to the tracer provider the span
+        # was created by, they are shared with the copy instead of copied.
+        state = self.__getstate__()
+        shared = {name: state.pop(name) for name in ("_span_processor", "_sampler")}
+        span_copy = object.__new__(type(self))
+        memo[id(self)] = span_copy
+        span_copy.__setstate__({**copy.deepcopy(state, memo), **shared})
+        return span_copy
+
     def _new_events(self):
         return BoundedList(self._limits.max_events)
 
     def _new_links(self, links: Sequence[trace_api.Link]):
         if not links:
-            return BoundedList(self._limits.max_links)
+            return ()
 
         valid_links = []
         for link in links:
             if link and _is_valid_link(link.context, link.attributes):
                 # Immutable set to true so attributes cannot be added or removed after creation.
                 # pylint: disable=protected-access
-                link._attributes = BoundedAttributes(
+                link._attributes = _LazyBoundedAttributes(
                     self._limits.max_link_attributes,
                     link.attributes,
                     max_value_len=self._limits.max_attribute_length,
@@ -875,6 +939,8 @@ class Span(trace_api.Span, ReadableSpan):
 
     @_check_span_ended
     def _add_event(self, event: EventBase) -> None:
+        if not isinstance(self._events, BoundedList):
+            self._events = self._new_events()
         self._events.append(event)
 
     def add_event(
@@ -884,7 +950,7 @@ class Span(trace_api.Span, ReadableSpan):
         timestamp: int | None = None,
     ) -> None:
         # Immutable set to true so attributes cannot be added or removed after creation.
-        attributes = BoundedAttributes(
+        attributes = _LazyBoundedAttributes(
             self._limits.max_event_attributes,
             attributes,
             max_value_len=self._limits.max_attribute_length,
@@ -900,6 +966,8 @@ class Span(trace_api.Span, ReadableSpan):
 
     @_check_span_ended
     def _add_link(self, link: trace_api.Link) -> None:
+        if not isinstance(self._links, BoundedList):
+            self._links = BoundedList(self._limits.max_links)
         self._links.append(link)
 
     def add_link(
@@ -910,7 +978,7 @@ class Span(trace_api.Span, ReadableSpan):
         if not _is_valid_link(context, attributes):
             return
         # Immutable set to true so attributes cannot be added or removed after creation.
-        attributes = BoundedAttributes(
+        attributes = _LazyBoundedAttributes(
             self._limits.max_link_attributes,
             attributes,
             max_value_len=self._limits.max_attribute_length,
@@ -923,23 +991,6 @@ class Span(trace_api.Span, ReadableSpan):
             )
         )
 
-    def _readable_span(self) -> ReadableSpan:
-        return ReadableSpan(
-            name=self._name,
-            context=self._context,
-            parent=self._parent,
-            resource=self._resource,
-            attributes=self._attributes,
-            events=self._events,
-            links=self._links,
-            kind=self.kind,
-            status=self._status,
-            start_time=self._start_time,
-            end_time=self._end_time,
-            instrumentation_info=self._instrumentation_info,
-            instrumentation_scope=self._instrumentation_scope,
-        )
-
     def start(
         self,
         start_time: int | None = None,
@@ -966,9 +1017,12 @@ class Span(trace_api.Span, ReadableSpan):
 
         if self._record_end_metrics:
             self._record_end_metrics()
+            self._record_end_metrics = None
         # pylint: disable=protected-access
         self._span_processor._on_ending(self)
-        self._span_processor.on_end(self._readable_span())
+        # Once ended, every mutator is a no-op, so the span itself is handed to
+        # processors as the ReadableSpan instead of a copy.
+        self._span_processor.on_end(self)
 
     @_check_span_ended
     def update_name(self, name: str) -> None:
@@ -1053,6 +1107,8 @@ class _Span(Span):
     by other mechanisms than through the `Tracer`.
     """
 
+    __slots__ = ()
+
 
 @dataclass
 class _TracerConfig:
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import logging
 import sys
@@ -20,11 +21,19 @@ from opentelemetry.metrics import MeterProvider, get_meter_provider
 from opentelemetry.sdk._shared_internal import (
     BatchProcessor,
 )
+from opentelemetry.sdk._shared_internal._async import (
+    AsyncBatchProcessor,
+)
 from opentelemetry.sdk._shared_internal._processor_metrics import (
     create_processor_metrics,
 )
+from opentelemetry.sdk._shared_internal._size_estimate import (
+    estimate_attributes_size,
+    estimate_string_size,
+)
 from opentelemetry.sdk.environment_variables import (
     OTEL_BSP_EXPORT_TIMEOUT,
+    OTEL_BSP_MAX_CONCURRENT_EXPORTS,
     OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BSP_MAX_QUEUE_SIZE,
     OTEL_BSP_SCHEDULE_DELAY,
@@ -42,11 +51,30 @@ _DEFAULT_SCHEDULE_DELAY_MILLIS = 5000
 _DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
 _DEFAULT_EXPORT_TIMEOUT_MILLIS = 30000
 _DEFAULT_MAX_QUEUE_SIZE = 2048
+_DEFAULT_MAX_CONCURRENT_EXPORTS = 1
 _ENV_VAR_INT_VALUE_ERROR_MESSAGE = "Unable to parse value for %s as integer. Defaulting to %s."
+# Estimated encoded size of the fixed-size fields of a span, an event and a link:
+# ids, timestamps, kind, flags and status code.
+_SPAN_FIXED_SIZE = 64
+_EVENT_FIXED_SIZE = 16
+_LINK_FIXED_SIZE = 40
 
 logger = logging.getLogger(__name__)
 
 
+def _estimate_span_size(span: ReadableSpan) -> int:
+    """Cheap estimate of the OTLP encoded size of a span, excluding its resource
+    and instrumentation scope which are shared by the whole batch."""
+    size = _SPAN_FIXED_SIZE + estimate_string_size(span.name) + estimate_attributes_size(span.attributes)
+    for event in span.events:
+        size += _EVENT_FIXED_SIZE + estimate_string_size(event.name) + estimate_attributes_size(event.attributes)
+    for link in span.links:
+        size += _LINK_FIXED_SIZE + estimate_attributes_size(link.attributes)
+    if span.status.description:
+        size += estimate_string_size(span.status.description)
+    return size
+
+
 class SpanExportResult(Enum):
     SUCCESS = 0
     FAILURE = 1
@@ -85,6 +113,39 @@ class SpanExporter:
         """
 
 
+class AsyncSpanExporter:
+    """Interface for exporting spans from an asyncio event loop.
+
+    The asyncio counterpart of `SpanExporter`, its methods are coroutines
+    awaited on the event loop of the application.
+
+    To export data this MUST be registered to the :class`opentelemetry.sdk.trace.Tracer` using an
+    `AsyncBatchSpanProcessor`.
+    """
+
+    async def export(self, spans: collections.abc.Sequence[ReadableSpan]) -> SpanExportResult:  # pyright: ignore[reportReturnType]
+        """Exports a batch of telemetry data.
+
+        Args:
+            spans: The list of `opentelemetry.trace.Span` objects to be exported
+
+        Returns:
+            The result of the export
+        """
+
+    async def shutdown(self) -> None:
+        """Shuts down the exporter.
+
+        Called when the SDK is shut down.
+        """
+
+    async def force_flush(self, timeout_millis: int = 30000) -> bool:  # pyright: ignore[reportReturnType]
+        """Hint to ensure that the export of any spans the exporter has received
+        prior to the call to ForceFlush SHOULD be completed as soon as possible, preferably
+        before returning from this method.
+        """
+
+
 class SimpleSpanProcessor(SpanProcessor):
     """Simple SpanProcessor implementation.
 
@@ -153,8 +214,17 @@ class BatchSpanProcessor(SpanProcessor):
     - :envvar:`OTEL_BSP_MAX_QUEUE_SIZE`
     - :envvar:`OTEL_BSP_MAX_EXPORT_BATCH_SIZE`
     - :envvar:`OTEL_BSP_EXPORT_TIMEOUT`
+    - :envvar:`OTEL_BSP_MAX_CONCURRENT_EXPORTS`
 
     All the logic for emitting spans, shutting down etc. resides in the `BatchProcessor` class.
+
+    Passing ``queue_shards`` greater than 1 splits the queue into that many
+    bounded shards, each emitting thread appending to its own shard, which
+    reduces contention when many threads end spans concurrently.
+
+    Passing ``max_export_batch_bytes`` additionally splits each batch into chunks
+    whose estimated OTLP encoded size stays within that many bytes, to keep
+    export requests under the receiver's message size limits.
     """
 
     def __init__(
@@ -166,6 +236,9 @@ class BatchSpanProcessor(SpanProcessor):
         export_timeout_millis: float | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        queue_shards: int | None = None,
+        max_concurrent_exports: int | None = None,
+        max_export_batch_bytes: int | None = None,
     ):
         if max_queue_size is None:
             max_queue_size = BatchSpanProcessor._default_max_queue_size()
@@ -176,11 +249,20 @@ class BatchSpanProcessor(SpanProcessor):
         if max_export_batch_size is None:
             max_export_batch_size = BatchSpanProcessor._default_max_export_batch_size()
 
-        # Not used. No way currently to pass timeout to export.
         if export_timeout_millis is None:
             export_timeout_millis = BatchSpanProcessor._default_export_timeout_millis()
 
-        BatchSpanProcessor._validate_arguments(max_queue_size, schedule_delay_millis, max_export_batch_size)
+        if max_concurrent_exports is None:
+            max_concurrent_exports = BatchSpanProcessor._default_max_concurrent_exports()
+
+        BatchSpanProcessor._validate_arguments(
+            max_queue_size,
+            schedule_delay_millis,
+            max_export_batch_size,
+            queue_shards,
+            max_concurrent_exports,
+            max_export_batch_bytes,
+        )
 
         self._batch_processor = BatchProcessor(
             span_exporter,
@@ -196,6 +278,10 @@ class BatchSpanProcessor(SpanProcessor):
                 capacity=max_queue_size,
                 enabled=parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
             ),
+            queue_shards=queue_shards,
+            max_concurrent_exports=max_concurrent_exports,
+            max_export_batch_bytes=max_export_batch_bytes,
+            size_estimator=_estimate_span_size,
         )
 
     # Added for backward compatibility. Not recommended to directly access/use underlying exporter.
@@ -274,7 +360,31 @@ class BatchSpanProcessor(SpanProcessor):
             return _DEFAULT_EXPORT_TIMEOUT_MILLIS
 
     @staticmethod
-    def _validate_arguments(max_queue_size, schedule_delay_millis, max_export_batch_size):
+    def _default_max_concurrent_exports():
+        try:
+            return int(
+                environ.get(
+                    OTEL_BSP_MAX_CONCURRENT_EXPORTS,
+                    _DEFAULT_MAX_CONCURRENT_EXPORTS,
+                )
+            )
+        except ValueError:
+            logger.exception(
+                _ENV_VAR_INT_VALUE_ERROR_MESSAGE,
+                OTEL_BSP_MAX_CONCURRENT_EXPORTS,
+                _DEFAULT_MAX_CONCURRENT_EXPORTS,
+            )
+            return _DEFAULT_MAX_CONCURRENT_EXPORTS
+
+    @staticmethod
+    def _validate_arguments(
+        max_queue_size,
+        schedule_delay_millis,
+        max_export_batch_size,
+        queue_shards=None,
+        max_concurrent_exports=1,
+        max_export_batch_bytes=None,
+    ):
         if max_queue_size <= 0:
             raise ValueError("max_queue_size must be a positive integer.")
 
@@ -287,6 +397,102 @@ class BatchSpanProcessor(SpanProcessor):
         if max_export_batch_size > max_queue_size:
             raise ValueError("max_export_batch_size must be less than or equal to max_queue_size.")
 
+        if queue_shards is not None and queue_shards <= 0:
+            raise ValueError("queue_shards must be a positive integer.")
+
+        if max_concurrent_exports <= 0:
+            raise ValueError("max_concurrent_exports must be a positive integer.")
+
+        if max_export_batch_bytes is not None and max_export_batch_bytes <= 0:
+            raise ValueError("max_export_batch_bytes must be a positive integer.")
+
+
+class AsyncBatchSpanProcessor(SpanProcessor):
+    """Batch span processor for asyncio applications.
+
+    `AsyncBatchSpanProcessor` batches ended spans like `BatchSpanProcessor`
+    and pushes them to the configured `AsyncSpanExporter` from a task on the
+    event loop ``loop``, the running event loop by default. It is configured
+    by the same environment variables as `BatchSpanProcessor`.
+
+    Spans can be ended on any thread. `shutdown` and `force_flush` wait for the
+    event loop, on the thread running it they only schedule the work: await
+    `shutdown_async` and `force_flush_async` there instead. Spans still queued
+    when the event loop stops are lost, await `shutdown_async` before it
+    stops to export them.
+
+    All the logic for emitting spans, shutting down etc. resides in the `AsyncBatchProcessor` class.
+    """
+
+    def __init__(
+        self,
+        span_exporter: AsyncSpanExporter,
+        max_queue_size: int | None = None,
+        schedule_delay_millis: float | None = None,
+        max_export_batch_size: int | None = None,
+        export_timeout_millis: float | None = None,
+        *,
+        meter_provider: MeterProvider | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        if max_queue_size is None:
+            max_queue_size = BatchSpanProcessor._default_max_queue_size()
+
+        if schedule_delay_millis is None:
+            schedule_delay_millis = BatchSpanProcessor._default_schedule_delay_millis()
+
+        if max_export_batch_size is None:
+            max_export_batch_size = BatchSpanProcessor._default_max_export_batch_size()
+
+        if export_timeout_millis is None:
+            export_timeout_millis = BatchSpanProcessor._default_export_timeout_millis()
+
+        BatchSpanProcessor._validate_arguments(max_queue_size, schedule_delay_millis, max_export_batch_size)
+
+        self._batch_processor = AsyncBatchProcessor(
+            span_exporter,
+            schedule_delay_millis,
+            max_export_batch_size,
+            export_timeout_millis,
+            max_queue_size,
+            "Span",
+            create_processor_metrics(
+                "traces",
+                OtelComponentTypeValues.BATCHING_SPAN_PROCESSOR,
+                meter_provider or get_meter_provider(),
+                capacity=max_queue_size,
+                enabled=parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
+            ),
+            loop=loop,
+        )
+
+    @property
+    def span_exporter(self):
+        return self._batch_processor._exporter  # pylint: disable=protected-access
+
+    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
+        pass
+
+    def _on_ending(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if not (span.context and span.context.trace_flags.sampled):
+            return
+        self._batch_processor.emit(span)
+
+    def shutdown(self):
+        return self._batch_processor.shutdown()
+
+    def force_flush(self, timeout_millis: int | None = None) -> bool:
+        return self._batch_processor.force_flush(timeout_millis)
+
+    async def shutdown_async(self) -> None:
+        await self._batch_processor.shutdown_async()
+
+    async def force_flush_async(self, timeout_millis: int | None = None) -> bool:
+        return await self._batch_processor.force_flush_async(timeout_millis)
+
 
 class ConsoleSpanExporter(SpanExporter):
     """Implementation of :class:`SpanExporter` that prints spans to the
@@ -35,6 +35,8 @@ class BoundedList(Sequence):
     not enough room.
     """
 
+    __slots__ = ("dropped", "_dq", "_lock")
+
     def __init__(self, maxlen: int | None):
         self.dropped = 0
         self._dq = deque(maxlen=maxlen)  # type: deque
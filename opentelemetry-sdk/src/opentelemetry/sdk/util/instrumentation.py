@@ -78,7 +78,7 @@ class InstrumentationScope:
     properties.
     """
 
-    __slots__ = ("_name", "_version", "_schema_url", "_attributes")
+    __slots__ = ("_name", "_version", "_schema_url", "_attributes", "__weakref__")
 
     def __init__(
         self,
@@ -26,7 +26,10 @@ from opentelemetry.sdk._logs import (
     ReadableLogRecord,
     ReadWriteLogRecord,
 )
-from opentelemetry.sdk._logs._internal.export import _logger
+from opentelemetry.sdk._logs._internal.export import (
+    _estimate_log_record_size,
+    _logger,
+)
 from opentelemetry.sdk._logs.export import (
     BatchLogRecordProcessor,
     ConsoleLogRecordExporter,
@@ -37,6 +40,7 @@ from opentelemetry.sdk._logs.export import (
 )
 from opentelemetry.sdk.environment_variables import (
     OTEL_BLRP_EXPORT_TIMEOUT,
+    OTEL_BLRP_MAX_CONCURRENT_EXPORTS,
     OTEL_BLRP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BLRP_MAX_QUEUE_SIZE,
     OTEL_BLRP_SCHEDULE_DELAY,
@@ -483,6 +487,7 @@ class TestBatchLogRecordProcessor(unittest.TestCase):
             OTEL_BLRP_SCHEDULE_DELAY: "2500",
             OTEL_BLRP_MAX_EXPORT_BATCH_SIZE: "256",
             OTEL_BLRP_EXPORT_TIMEOUT: "15000",
+            OTEL_BLRP_MAX_CONCURRENT_EXPORTS: "2",
         },
     )
     def test_env_vars(self):
@@ -493,6 +498,7 @@ class TestBatchLogRecordProcessor(unittest.TestCase):
         self.assertEqual(log_record_processor._batch_processor._schedule_delay, 2.5)
         self.assertEqual(log_record_processor._batch_processor._max_export_batch_size, 256)
         self.assertEqual(log_record_processor._batch_processor._export_timeout_millis, 15000)
+        self.assertEqual(log_record_processor._batch_processor._max_concurrent_exports, 2)
         log_record_processor.shutdown()
 
     def test_args_defaults(self):
@@ -503,6 +509,7 @@ class TestBatchLogRecordProcessor(unittest.TestCase):
         self.assertEqual(log_record_processor._batch_processor._schedule_delay, 1)
         self.assertEqual(log_record_processor._batch_processor._max_export_batch_size, 512)
         self.assertEqual(log_record_processor._batch_processor._export_timeout_millis, 30000)
+        self.assertEqual(log_record_processor._batch_processor._max_concurrent_exports, 1)
         log_record_processor.shutdown()
 
     @patch.dict(
@@ -512,6 +519,7 @@ class TestBatchLogRecordProcessor(unittest.TestCase):
             OTEL_BLRP_SCHEDULE_DELAY: " ",
             OTEL_BLRP_MAX_EXPORT_BATCH_SIZE: "One",
             OTEL_BLRP_EXPORT_TIMEOUT: "@",
+            OTEL_BLRP_MAX_CONCURRENT_EXPORTS: "many",
         },
     )
     def test_args_env_var_value_error(self):
@@ -524,6 +532,7 @@ class TestBatchLogRecordProcessor(unittest.TestCase):
         self.assertEqual(log_record_processor._batch_processor._schedule_delay, 1)
         self.assertEqual(log_record_processor._batch_processor._max_export_batch_size, 512)
         self.assertEqual(log_record_processor._batch_processor._export_timeout_millis, 30000)
+        self.assertEqual(log_record_processor._batch_processor._max_concurrent_exports, 1)
         log_record_processor.shutdown()
 
     def test_args_none_defaults(self):
@@ -766,6 +775,17 @@ class TestBatchLogRecordProcessor(unittest.TestCase):
 
         provider.shutdown()
 
+    def test_estimate_log_record_size(self):
+        def readable(body, attributes=None):
+            return ReadableLogRecord(
+                LogRecord(body=body, attributes=attributes),
+                resource=SDKResource.create({}),
+            )
+
+        bare_size = _estimate_log_record_size(readable(None))
+        size = _estimate_log_record_size(readable({"message": "x" * 100, "tags": ["a", "b"]}, {"key": "value"}))
+        self.assertGreater(size, bare_size + 100)
+
 
 class TestConsoleLogExporter(unittest.TestCase):
     def test_export(self):  # pylint: disable=no-self-use
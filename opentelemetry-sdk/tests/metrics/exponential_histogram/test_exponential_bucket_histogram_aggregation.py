@@ -4,18 +4,22 @@
 # pylint: disable=protected-access,too-many-lines,invalid-name
 # pylint: disable=consider-using-enumerate,no-self-use,too-many-public-methods
 
+from array import array
+from collections.abc import Sequence
 from inspect import currentframe
 from itertools import permutations
 from logging import WARNING
 from math import inf, ldexp
 from random import Random, randrange
 from sys import float_info, maxsize
+from threading import Thread
 from time import time_ns
 from types import MethodType
 from unittest.mock import Mock, patch
 
 from opentelemetry.context import Context
 from opentelemetry.sdk.metrics._internal.aggregation import (
+    _EXPONENTIAL_STRIPE_BUFFER_SIZE,
     AggregationTemporality,
     _ExponentialBucketHistogramAggregation,
 )
@@ -52,6 +56,13 @@ def get_counts(buckets: Buckets) -> int:
     return counts
 
 
+def _trim_bucket_counts(bucket_counts: Sequence[int]) -> list[int]:
+    bucket_counts = list(bucket_counts)
+    while bucket_counts and not bucket_counts[-1]:
+        bucket_counts.pop()
+    return bucket_counts
+
+
 def center_val(mapping: ExponentMapping, index: int) -> float:
     return (mapping.get_lower_boundary(index) + mapping.get_lower_boundary(index + 1)) / 2
 
@@ -103,6 +114,47 @@ class TestExponentialBucketHistogramAggregation(TestCase):
 
         mock_logarithm_mapping.assert_called_with(100)
 
+    @patch("opentelemetry.sdk.metrics._internal.aggregation.LogarithmMapping")
+    def test_create_aggregation_initial_scale(self, mock_logarithm_mapping):
+        exponential_bucket_histogram_aggregation = (
+            ExponentialBucketHistogramAggregation(initial_scale=4)
+        )._create_aggregation(Mock(), Mock(), Mock(), Mock())
+
+        self.assertEqual(exponential_bucket_histogram_aggregation._max_scale, 20)
+
+        mock_logarithm_mapping.assert_called_with(4)
+
+        for initial_scale in (-11, 21):
+            with self.subTest(initial_scale=initial_scale):
+                with self.assertRaises(ValueError):
+                    ExponentialBucketHistogramAggregation(initial_scale=initial_scale)
+
+    def test_initial_scale(self):
+        exponential_histogram_aggregation = _ExponentialBucketHistogramAggregation(
+            Mock(),
+            _default_reservoir_factory(_ExponentialBucketHistogramAggregation),
+            AggregationTemporality.DELTA,
+            0,
+            max_size=4,
+            initial_scale=1,
+        )
+
+        # These values fit in 4 buckets at scale 1, they are not downscaled.
+        exponential_histogram_aggregation.aggregate_values([1.5, 2.5, 3.5, 5])
+
+        self.assertEqual(exponential_histogram_aggregation._mapping.scale, 1)
+
+        collection = exponential_histogram_aggregation.collect(AggregationTemporality.DELTA, 1)
+
+        self.assertEqual(collection.scale, 1)
+        self.assertEqual(collection.positive.offset, 1)
+        self.assertEqual(collection.positive.bucket_counts, [1, 1, 1, 1])
+
+        # Values that do not fit are downscaled as usual.
+        exponential_histogram_aggregation.aggregate_values([1.5, 10])
+
+        self.assertEqual(exponential_histogram_aggregation._mapping.scale, 0)
+
     def test_create_aggregation_record_min_max(self):
         for record_min_max, expected in [
             (None, True),
@@ -1003,6 +1055,153 @@ class TestExponentialBucketHistogramAggregation(TestCase):
 
         collect_and_validate(values, histogram)
 
+    def test_aggregate_values_with_random_data(self) -> None:
+        now = time_ns()
+        ctx = Context()
+
+        seed = randrange(maxsize)
+        # This test case is executed with random values every time. In order to
+        # run this test case with the same values used in a previous execution,
+        # check the value printed by that previous execution of this test case
+        # and use the same value for the seed variable in the line below.
+        # seed = 3373389994391084876
+
+        random_generator = Random(seed)
+        print(f"seed for {currentframe().f_code.co_name} is {seed}")
+
+        for max_size in (4, 20, 160):
+            with self.subTest(max_size=max_size):
+                histogram = _ExponentialBucketHistogramAggregation(
+                    Mock(),
+                    _default_reservoir_factory(_ExponentialBucketHistogramAggregation),
+                    AggregationTemporality.DELTA,
+                    Mock(),
+                    max_size=max_size,
+                )
+                bulk_histogram = _ExponentialBucketHistogramAggregation(
+                    Mock(),
+                    _default_reservoir_factory(_ExponentialBucketHistogramAggregation),
+                    AggregationTemporality.DELTA,
+                    Mock(),
+                    max_size=max_size,
+                )
+
+                for _ in range(10):
+                    values = [
+                        random_generator.choice((-1, 0, 1))
+                        * ldexp(random_generator.random(), random_generator.randint(-20, 20))
+                        for _ in range(random_generator.randint(0, 50))
+                    ]
+                    for value in values:
+                        histogram.aggregate(Measurement(value, now, Mock(), ctx))
+                    bulk_histogram.aggregate_values(values)
+
+                result = histogram.collect(AggregationTemporality.CUMULATIVE, 0)
+                bulk_result = bulk_histogram.collect(AggregationTemporality.CUMULATIVE, 0)
+                # The sums only differ by the order of the float additions.
+                self.assertAlmostEqual(bulk_result.sum, result.sum, delta=abs(result.sum) * 1e-12)
+                for field in ("count", "scale", "zero_count", "min", "max"):
+                    self.assertEqual(getattr(bulk_result, field), getattr(result, field), field)
+                # The backing arrays may have grown to different sizes, only
+                # their trailing empty buckets differ.
+                for field in ("positive", "negative"):
+                    buckets = getattr(result, field)
+                    bulk_buckets = getattr(bulk_result, field)
+                    self.assertEqual(bulk_buckets.offset, buckets.offset, field)
+                    self.assertEqual(
+                        _trim_bucket_counts(bulk_buckets.bucket_counts),
+                        _trim_bucket_counts(buckets.bucket_counts),
+                        field,
+                    )
+
+    def test_striped_aggregation_with_random_data(self) -> None:
+        seed = randrange(maxsize)
+        # This test case is executed with random values every time. In order to
+        # run this test case with the same values used in a previous execution,
+        # check the value printed by that previous execution of this test case
+        # and use the same value for the seed variable in the line below.
+        # seed = 3373389994391084876
+
+        random_generator = Random(seed)
+        print(f"seed for {currentframe().f_code.co_name} is {seed}")
+
+        for max_size in (4, 20, 160):
+            with self.subTest(max_size=max_size):
+                histogram = _ExponentialBucketHistogramAggregation(
+                    Mock(),
+                    _default_reservoir_factory(_ExponentialBucketHistogramAggregation),
+                    AggregationTemporality.DELTA,
+                    Mock(),
+                    max_size=max_size,
+                )
+                striped_histogram = _ExponentialBucketHistogramAggregation(
+                    Mock(),
+                    _default_reservoir_factory(_ExponentialBucketHistogramAggregation),
+                    AggregationTemporality.DELTA,
+                    Mock(),
+                    max_size=max_size,
+                    stripes=4,
+                )
+
+                for _ in range(5):
+                    values_per_thread = [
+                        [
+                            random_generator.choice((-1, 0, 1))
+                            * ldexp(random_generator.random(), random_generator.randint(-20, 20))
+                            for _ in range(random_generator.randint(0, 30))
+                        ]
+                        for _ in range(6)
+                    ]
+                    threads = [
+                        Thread(target=striped_histogram.aggregate_values, args=(values,))
+                        for values in values_per_thread
+                    ]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                    for values in values_per_thread:
+                        histogram.aggregate_values(values)
+
+                    result = histogram.collect(AggregationTemporality.CUMULATIVE, 0)
+                    striped_result = striped_histogram.collect(AggregationTemporality.CUMULATIVE, 0)
+
+                    self.assertAlmostEqual(striped_result.sum, result.sum, delta=abs(result.sum) * 1e-12)
+                    for field in ("count", "scale", "zero_count", "min", "max"):
+                        self.assertEqual(getattr(striped_result, field), getattr(result, field), field)
+                    for field in ("positive", "negative"):
+                        buckets = getattr(result, field)
+                        striped_buckets = getattr(striped_result, field)
+                        self.assertEqual(striped_buckets.offset, buckets.offset, field)
+                        self.assertEqual(
+                            _trim_bucket_counts(striped_buckets.bucket_counts),
+                            _trim_bucket_counts(buckets.bucket_counts),
+                            field,
+                        )
+
+    def test_striped_values_aggregated_when_buffer_is_full(self):
+        striped_histogram = _ExponentialBucketHistogramAggregation(
+            Mock(),
+            _default_reservoir_factory(_ExponentialBucketHistogramAggregation),
+            AggregationTemporality.DELTA,
+            Mock(),
+            stripes=2,
+        )
+
+        striped_histogram.aggregate_values([1.0] * (_EXPONENTIAL_STRIPE_BUFFER_SIZE - 1))
+        self.assertEqual(striped_histogram._count, 0)
+
+        striped_histogram.aggregate_value(2.0)
+        self.assertEqual(striped_histogram._count, _EXPONENTIAL_STRIPE_BUFFER_SIZE)
+        for stripe in striped_histogram._stripes:
+            self.assertEqual(stripe.drain(), [])
+
+        striped_histogram.aggregate_value(-1.0)
+        result = striped_histogram.collect(AggregationTemporality.DELTA, 0)
+        self.assertEqual(result.count, _EXPONENTIAL_STRIPE_BUFFER_SIZE + 1)
+        self.assertEqual(result.min, -1.0)
+        self.assertEqual(result.max, 2.0)
+
     def test_merge_collect_cumulative(self):
         now = time_ns()
         ctx = Context()
@@ -1022,7 +1221,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         self.assertEqual(exponential_histogram_aggregation._value_positive.offset, 0)
         self.assertEqual(
             exponential_histogram_aggregation._value_positive.counts,
-            [1, 1, 1, 1],
+            array("Q", [1, 1, 1, 1]),
         )
 
         result_0 = exponential_histogram_aggregation.collect(
@@ -1039,7 +1238,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         self.assertEqual(exponential_histogram_aggregation._value_positive.offset, -4)
         self.assertEqual(
             exponential_histogram_aggregation._value_positive.counts,
-            [1, 1, 1, 1],
+            array("Q", [1, 1, 1, 1]),
         )
 
         result_1 = exponential_histogram_aggregation.collect(
@@ -1068,7 +1267,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         self.assertEqual(exponential_histogram_aggregation._value_positive.offset, 0)
         self.assertEqual(
             exponential_histogram_aggregation._value_positive.counts,
-            [1, 1, 1, 1],
+            array("Q", [1, 1, 1, 1]),
         )
 
         result = exponential_histogram_aggregation.collect(
@@ -1083,7 +1282,7 @@ class TestExponentialBucketHistogramAggregation(TestCase):
         self.assertEqual(exponential_histogram_aggregation._value_positive.offset, -4)
         self.assertEqual(
             exponential_histogram_aggregation._value_positive.counts,
-            [1, 1, 1, 1],
+            array("Q", [1, 1, 1, 1]),
         )
 
         result_1 = exponential_histogram_aggregation.collect(
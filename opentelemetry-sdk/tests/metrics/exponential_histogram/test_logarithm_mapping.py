@@ -3,7 +3,9 @@
 
 # pylint: disable=protected-access
 
-from math import sqrt
+from fractions import Fraction
+from math import ldexp, nextafter, sqrt
+from random import Random
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -22,6 +24,19 @@ from opentelemetry.sdk.metrics._internal.exponential_histogram.mapping.logarithm
 )
 
 
+def exact_index(scale: int, value: float) -> int:
+    # The bucket with index i holds the values in (2 ** (i / 2 ** scale),
+    # 2 ** ((i + 1) / 2 ** scale)], that is, the values whose 2 ** scale
+    # power is in (2 ** i, 2 ** (i + 1)].
+    power = Fraction(value) ** (1 << scale)
+    index = power.numerator.bit_length() - power.denominator.bit_length()
+    if Fraction(2) ** index >= power:
+        index -= 1
+    elif Fraction(2) ** (index + 1) < power:
+        index += 1
+    return index
+
+
 def left_boundary(scale: int, index: int) -> float:
     # This is implemented in this way to avoid using a third-party bigfloat
     # package. The Go implementation uses a bigfloat package that is part of
@@ -105,6 +120,34 @@ class TestLogarithmMapping(TestCase):
 
                 self.assertInEpsilon(lower_boundary, left_boundary(scale, index), 1e-9)
 
+    def test_lookup_table(self):
+        random = Random(0)
+
+        self.assertIsNone(LogarithmMapping(LogarithmMapping._max_lookup_table_scale + 1)._lookup_table)
+
+        for scale in range(LogarithmMapping._min_scale, 7):
+            logarithm_mapping = LogarithmMapping(scale)
+
+            self.assertIsNotNone(logarithm_mapping._lookup_table)
+
+            values = [ldexp(random.uniform(1, 2), random.randint(-50, 50)) for _ in range(200)]
+            for index in range(-20, 20):
+                lower_boundary = logarithm_mapping.get_lower_boundary(index)
+                values.extend(
+                    (
+                        nextafter(lower_boundary, 0),
+                        lower_boundary,
+                        nextafter(lower_boundary, MAX_NORMAL_VALUE),
+                    )
+                )
+
+            for value in values:
+                with self.subTest(scale=scale, value=value):
+                    self.assertEqual(
+                        logarithm_mapping.map_to_index(value),
+                        exact_index(scale, value),
+                    )
+
     def test_logarithm_index_max(self):
         for scale in range(LogarithmMapping._min_scale, LogarithmMapping._max_scale + 1):
             logarithm_mapping = LogarithmMapping(scale)
@@ -0,0 +1,97 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from array import array
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+    AlwaysOnExemplarFilter,
+)
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import (
+    ExponentialBucketHistogramAggregation,
+    View,
+)
+
+
+class TestBatchRecording(TestCase):
+    @staticmethod
+    def _metrics(reader):
+        return {
+            metric.name: metric.data.data_points[0]
+            for metric in reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+        }
+
+    @staticmethod
+    def _trim(bucket_counts):
+        bucket_counts = list(bucket_counts)
+        while bucket_counts and not bucket_counts[-1]:
+            bucket_counts.pop()
+        return bucket_counts
+
+    def _assert_batch_matches_single(self, metrics):
+        self.assertEqual(metrics["batch_counter"].value, metrics["counter"].value)
+        self.assertEqual(metrics["batch_counter"].attributes, {"route": "/"})
+        for name in ("histogram", "exponential_histogram"):
+            data_point = metrics[name]
+            batch_data_point = metrics[f"batch_{name}"]
+            self.assertEqual(batch_data_point.count, data_point.count)
+            self.assertEqual(batch_data_point.sum, data_point.sum)
+            self.assertEqual(batch_data_point.min, data_point.min)
+            self.assertEqual(batch_data_point.max, data_point.max)
+            self.assertEqual(
+                len(batch_data_point.exemplars),
+                len(data_point.exemplars),
+            )
+        self.assertEqual(
+            metrics["batch_histogram"].bucket_counts,
+            metrics["histogram"].bucket_counts,
+        )
+        # The backing arrays may have grown to different sizes, only their
+        # trailing empty buckets differ.
+        positive = metrics["exponential_histogram"].positive
+        batch_positive = metrics["batch_exponential_histogram"].positive
+        self.assertEqual(batch_positive.offset, positive.offset)
+        self.assertEqual(
+            self._trim(batch_positive.bucket_counts),
+            self._trim(positive.bucket_counts),
+        )
+
+    def test_batch_recording_matches_single_recording(self):
+        values = [0.5, 3.0, 7.0, 12.0, 250.0, 1000.5]
+        for exemplar_filter in (AlwaysOffExemplarFilter(), AlwaysOnExemplarFilter()):
+            with self.subTest(exemplar_filter=exemplar_filter):
+                readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+                meter_provider = MeterProvider(
+                    metric_readers=readers,
+                    exemplar_filter=exemplar_filter,
+                    views=[
+                        View(instrument_name="*"),
+                        View(
+                            instrument_name="batch_histogram",
+                            name="batch_exponential_histogram",
+                            aggregation=ExponentialBucketHistogramAggregation(),
+                        ),
+                        View(
+                            instrument_name="histogram",
+                            name="exponential_histogram",
+                            aggregation=ExponentialBucketHistogramAggregation(),
+                        ),
+                    ],
+                )
+                meter = meter_provider.get_meter("testmeter")
+                counter = meter.create_counter("counter")
+                batch_counter = meter.create_counter("batch_counter")
+                histogram = meter.create_histogram("histogram")
+                batch_histogram = meter.create_histogram("batch_histogram")
+
+                for value in values:
+                    counter.add(value, {"route": "/"})
+                    histogram.record(value, {"route": "/"})
+                batch_counter.add_many(array("d", values), {"route": "/"})
+                batch_histogram.record_many(memoryview(array("d", values)), {"route": "/"})
+
+                for reader in readers:
+                    self._assert_batch_matches_single(self._metrics(reader))
@@ -0,0 +1,159 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics._internal import _MeterConfig
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import View
+
+
+class TestBoundInstruments(TestCase):
+    @staticmethod
+    def _data_points(reader, name):
+        metrics_data = reader.get_metrics_data()
+        if metrics_data is None:
+            return None
+        for scope_metrics in metrics_data.resource_metrics[0].scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == name:
+                    return {
+                        tuple(sorted(data_point.attributes.items())): data_point
+                        for data_point in metric.data.data_points
+                    }
+        return None
+
+    def test_bound_counter(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        attributes = {"route": "/"}
+        bound_counter = counter.bind(attributes)
+        attributes["route"] = "/other"
+        bound_counter.add(1)
+        bound_counter.add(2)
+        counter.add(3, {"route": "/"})
+
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(list(data_points), [(("route", "/"),)])
+        self.assertEqual(data_points[(("route", "/"),)].value, 6)
+
+    def test_bound_histogram(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        histogram = meter_provider.get_meter("testmeter").create_histogram("testhistogram")
+
+        bound_histogram = histogram.bind({"route": "/"})
+        bound_histogram.record(1)
+        bound_histogram.record(3)
+
+        data_point = self._data_points(reader, "testhistogram")[(("route", "/"),)]
+        self.assertEqual(data_point.count, 2)
+        self.assertEqual(data_point.sum, 4)
+
+    def test_bound_instruments_without_exemplars(self):
+        readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+        meter_provider = MeterProvider(metric_readers=readers, exemplar_filter=AlwaysOffExemplarFilter())
+        meter = meter_provider.get_meter("testmeter")
+        bound_counter = meter.create_counter("testcounter").bind({"route": "/"})
+        bound_histogram = meter.create_histogram("testhistogram").bind({"route": "/"})
+
+        bound_counter.add(1)
+        bound_counter.add(2)
+        bound_histogram.record(5)
+
+        for reader in readers:
+            metrics_data = reader.get_metrics_data()
+            counter_point, histogram_point = (
+                metric.data.data_points[0] for metric in metrics_data.resource_metrics[0].scope_metrics[0].metrics
+            )
+            self.assertEqual(counter_point.value, 3)
+            self.assertEqual(counter_point.exemplars, [])
+            self.assertEqual(histogram_point.sum, 5)
+            self.assertEqual(histogram_point.exemplars, [])
+
+    def test_invalid_amounts_are_dropped(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter("testmeter")
+        bound_counter = meter.create_counter("testcounter").bind()
+        bound_histogram = meter.create_histogram("testhistogram").bind()
+
+        with self.assertLogs(level="WARNING"):
+            bound_counter.add(-1)
+        with self.assertLogs(level="WARNING"):
+            bound_counter.add(float("nan"))
+        with self.assertLogs(level="WARNING"):
+            bound_histogram.record(-1)
+        with self.assertLogs(level="WARNING"):
+            bound_histogram.record(float("inf"))
+
+        self.assertIsNone(reader.get_metrics_data())
+
+    def test_views_apply_to_bound_instruments(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            views=[
+                View(instrument_name="testcounter", attribute_keys={"route"}),
+                View(instrument_name="testcounter", name="renamed"),
+            ],
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        counter.bind({"route": "/", "user": "0"}).add(1)
+
+        self.assertEqual(list(self._data_points(reader, "testcounter")), [(("route", "/"),)])
+        self.assertEqual(
+            list(self._data_points(reader, "renamed")),
+            [(("route", "/"), ("user", "0"))],
+        )
+
+    def test_reader_added_after_bind(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        bound_counter = meter_provider.get_meter("testmeter").create_counter("testcounter").bind({"route": "/"})
+        bound_counter.add(1)
+
+        other_reader = InMemoryMetricReader()
+        meter_provider.add_metric_reader(other_reader)
+        bound_counter.add(2)
+
+        self.assertEqual(self._data_points(reader, "testcounter")[(("route", "/"),)].value, 3)
+        self.assertEqual(self._data_points(other_reader, "testcounter")[(("route", "/"),)].value, 2)
+
+        meter_provider.remove_metric_reader(other_reader)
+        bound_counter.add(4)
+
+        self.assertEqual(self._data_points(reader, "testcounter")[(("route", "/"),)].value, 7)
+
+    def test_bound_attribute_set_overflow(self):
+        reader = InMemoryMetricReader(aggregation_cardinality_limit=2)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        counter.add(1, {"user": "0"})
+        counter.bind({"user": "1"}).add(2)
+
+        self.assertEqual(
+            {key: data_point.value for key, data_point in self._data_points(reader, "testcounter").items()},
+            {(("user", "0"),): 1, (("otel.metric.overflow", True),): 2},
+        )
+
+    def test_disabled_meter(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter("testmeter")
+        bound_counter = meter.create_counter("testcounter").bind()
+
+        meter._set_meter_config(_MeterConfig(is_enabled=False))
+        bound_counter.add(1)
+
+        self.assertIsNone(reader.get_metrics_data())
@@ -0,0 +1,132 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from opentelemetry.sdk.environment_variables import (
+    OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED,
+)
+from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+)
+from opentelemetry.sdk.metrics.view import View
+
+
+class TestCardinalityLimit(TestCase):
+    @staticmethod
+    def _data_points(reader, name):
+        metrics_data = reader.get_metrics_data()
+        for scope_metrics in metrics_data.resource_metrics[0].scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == name:
+                    return {
+                        tuple(sorted(data_point.attributes.items())): data_point.value
+                        for data_point in metric.data.data_points
+                    }
+        return None
+
+    def test_overflow_attribute_set(self):
+        reader = InMemoryMetricReader(aggregation_cardinality_limit=3)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        for user in range(10):
+            counter.add(1, {"user": str(user)})
+        counter.add(1, {"user": "0"})
+
+        self.assertEqual(
+            self._data_points(reader, "testcounter"),
+            {
+                (("user", "0"),): 2,
+                (("user", "1"),): 1,
+                (("otel.metric.overflow", True),): 8,
+            },
+        )
+
+    def test_view_limit_overrides_reader_limit(self):
+        reader = InMemoryMetricReader(aggregation_cardinality_limit=3)
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            views=[View(instrument_name="testcounter", aggregation_cardinality_limit=5)],
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        for user in range(10):
+            counter.add(1, {"user": str(user)})
+
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(len(data_points), 5)
+        self.assertEqual(data_points[(("otel.metric.overflow", True),)], 6)
+
+    def test_default_limit_bounds_series(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        for user in range(5000):
+            counter.add(1, {"user": str(user)})
+
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(len(data_points), 2000)
+        self.assertEqual(data_points[(("otel.metric.overflow", True),)], 3001)
+
+    def test_delta_attribute_sets_released_across_collections(self):
+        reader = InMemoryMetricReader(
+            preferred_temporality={Counter: AggregationTemporality.DELTA},
+            aggregation_cardinality_limit=3,
+        )
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        # Every collection interval records new attribute sets, the sets of
+        # the previous intervals no longer count against the limit.
+        for interval in range(4):
+            counter.add(1, {"user": f"{interval}-a"})
+            counter.add(1, {"user": f"{interval}-b"})
+            self.assertEqual(
+                self._data_points(reader, "testcounter"),
+                {(("user", f"{interval}-a"),): 1, (("user", f"{interval}-b"),): 1},
+            )
+
+    def test_cumulative_attribute_sets_not_released_across_collections(self):
+        reader = InMemoryMetricReader(aggregation_cardinality_limit=3)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        counter.add(1, {"user": "0"})
+        counter.add(1, {"user": "1"})
+        reader.get_metrics_data()
+        counter.add(1, {"user": "2"})
+
+        self.assertEqual(
+            self._data_points(reader, "testcounter"),
+            {
+                (("user", "0"),): 1,
+                (("user", "1"),): 1,
+                (("otel.metric.overflow", True),): 1,
+            },
+        )
+
+    @patch.dict("os.environ", {OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED: "true"})
+    def test_overflowed_measurements_metric(self):
+        reader = InMemoryMetricReader(aggregation_cardinality_limit=2)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        for user in range(4):
+            counter.add(1, {"user": str(user)})
+
+        data_points = self._data_points(reader, "otel.sdk.metric_reader.overflowed_measurements")
+        self.assertEqual(len(data_points), 1)
+        ((attributes, value),) = data_points.items()
+        self.assertEqual(value, 3)
+        self.assertIn(("otel.component.type", "InMemoryMetricReader"), attributes)
+
+    def test_invalid_limit(self):
+        with self.assertRaises(Exception):
+            InMemoryMetricReader(aggregation_cardinality_limit=0)
+        with self.assertRaises(Exception):
+            View(instrument_name="testcounter", aggregation_cardinality_limit=0)
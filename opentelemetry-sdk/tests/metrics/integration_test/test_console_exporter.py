@@ -76,7 +76,7 @@ class TestConsoleExporter(TestCase):
         self.assertEqual(actual, expected)
 
     @patch(
-        "opentelemetry.sdk.metrics._internal.instrument.time_ns",
+        "opentelemetry.sdk.metrics._internal.measurement_consumer.time_ns",
         Mock(return_value=TEST_TIMESTAMP),
     )
     def test_console_exporter_with_exemplars(self):
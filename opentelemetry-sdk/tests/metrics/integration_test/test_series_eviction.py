@@ -0,0 +1,153 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from opentelemetry.sdk.environment_variables import (
+    OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED,
+)
+from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+)
+from opentelemetry.sdk.metrics.view import View
+
+
+class TestSeriesEviction(TestCase):
+    @staticmethod
+    def _data_points(reader, name):
+        metrics_data = reader.get_metrics_data()
+        if metrics_data is None:
+            return {}
+        for scope_metrics in metrics_data.resource_metrics[0].scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == name:
+                    return {
+                        tuple(sorted(data_point.attributes.items())): data_point
+                        for data_point in metric.data.data_points
+                    }
+        return {}
+
+    def test_cumulative_series_evicted(self):
+        reader = InMemoryMetricReader(max_idle_collections=2)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        counter.add(1, {"pod": "a"})
+        counter.add(1, {"pod": "b"})
+        first_data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(len(first_data_points), 2)
+
+        counter.add(1, {"pod": "a"})
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(data_points[(("pod", "a"),)].value, 2)
+        self.assertEqual(data_points[(("pod", "b"),)].value, 1)
+
+        counter.add(1, {"pod": "a"})
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(list(data_points), [(("pod", "a"),)])
+        self.assertEqual(data_points[(("pod", "a"),)].value, 3)
+
+        # An evicted series restarts from zero with a new start time.
+        counter.add(5, {"pod": "b"})
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(data_points[(("pod", "b"),)].value, 5)
+        self.assertGreater(
+            data_points[(("pod", "b"),)].start_time_unix_nano,
+            first_data_points[(("pod", "b"),)].time_unix_nano,
+        )
+        self.assertEqual(
+            data_points[(("pod", "a"),)].start_time_unix_nano,
+            first_data_points[(("pod", "a"),)].start_time_unix_nano,
+        )
+
+    def test_delta_series_evicted(self):
+        reader = InMemoryMetricReader(
+            preferred_temporality={Counter: AggregationTemporality.DELTA},
+            max_idle_collections=1,
+        )
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter("testmeter")
+        counter = meter.create_counter("testcounter")
+        view_instrument_match = meter_provider._measurement_consumer._reader_storages[
+            reader
+        ]._get_or_init_view_instrument_match(counter)[0]
+
+        for connection in range(100):
+            counter.add(1, {"connection": connection})
+        self.assertEqual(len(self._data_points(reader, "testcounter")), 100)
+        self.assertEqual(len(view_instrument_match._attributes_aggregation), 100)
+
+        counter.add(1, {"connection": 0})
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(list(data_points), [(("connection", 0),)])
+        self.assertEqual(len(view_instrument_match._attributes_aggregation), 1)
+
+        counter.add(1, {"connection": 1})
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(data_points[(("connection", 1),)].value, 1)
+
+    def test_view_value_overrides_reader_value(self):
+        reader = InMemoryMetricReader(max_idle_collections=1)
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            views=[View(instrument_name="testcounter", max_idle_collections=3)],
+        )
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        counter.add(1, {"pod": "a"})
+        for _ in range(3):
+            self.assertEqual(len(self._data_points(reader, "testcounter")), 1)
+        self.assertEqual(self._data_points(reader, "testcounter"), {})
+
+    def test_series_not_evicted_by_default(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        counter.add(1, {"pod": "a"})
+        for _ in range(10):
+            self.assertEqual(len(self._data_points(reader, "testcounter")), 1)
+
+    def test_bound_series_not_evicted(self):
+        reader = InMemoryMetricReader(max_idle_collections=1)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+        bound_counter = counter.bind({"pod": "a"})
+
+        bound_counter.add(1)
+        counter.add(1, {"pod": "b"})
+        self._data_points(reader, "testcounter")
+        self._data_points(reader, "testcounter")
+
+        bound_counter.add(1)
+        data_points = self._data_points(reader, "testcounter")
+        self.assertEqual(list(data_points), [(("pod", "a"),)])
+        self.assertEqual(data_points[(("pod", "a"),)].value, 2)
+
+    @patch.dict("os.environ", {OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED: "true"})
+    def test_evicted_series_metric(self):
+        reader = InMemoryMetricReader(max_idle_collections=1)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("testmeter").create_counter("testcounter")
+
+        for pod in range(3):
+            counter.add(1, {"pod": pod})
+        self._data_points(reader, "testcounter")
+        self._data_points(reader, "testcounter")
+
+        data_points = self._data_points(reader, "otel.sdk.metric_reader.evicted_series")
+        self.assertEqual(len(data_points), 1)
+        ((attributes, data_point),) = data_points.items()
+        self.assertEqual(data_point.value, 3)
+        self.assertIn(("otel.component.type", "InMemoryMetricReader"), attributes)
+
+    def test_invalid_max_idle_collections(self):
+        with self.assertRaises(Exception):
+            InMemoryMetricReader(max_idle_collections=0)
+        with self.assertRaises(Exception):
+            View(instrument_name="testcounter", max_idle_collections=0)
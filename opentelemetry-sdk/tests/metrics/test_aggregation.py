@@ -3,7 +3,9 @@
 
 # pylint: disable=protected-access
 
+from array import array
 from math import inf
+from threading import Thread
 from time import sleep, time_ns
 from unittest import TestCase
 from unittest.mock import Mock
@@ -86,6 +88,21 @@ class TestSynchronousSumAggregation(TestCase):
 
         self.assertEqual(synchronous_sum_aggregation._value, 2)
 
+    def test_aggregate_values(self):
+        synchronous_sum_aggregation = _SumAggregation(
+            Mock(),
+            True,
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_SumAggregation),
+        )
+
+        synchronous_sum_aggregation.aggregate_values([1, 2, 3])
+        synchronous_sum_aggregation.aggregate_values([])
+        synchronous_sum_aggregation.aggregate_values([4.5])
+
+        self.assertEqual(synchronous_sum_aggregation._value, 10.5)
+
     def test_aggregate_cumulative(self):
         """
         `SynchronousSumAggregation` aggregates data for sum metric points
@@ -301,6 +318,27 @@ class TestExplicitBucketHistogramAggregation(TestCase):
         histo = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.CUMULATIVE, 1)
         self.assertEqual(histo.sum, 14)
 
+    def test_aggregate_values(self):
+        explicit_bucket_histogram_aggregation = _ExplicitBucketHistogramAggregation(
+            Mock(),
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_ExplicitBucketHistogramAggregation),
+            boundaries=[0, 2, 4],
+        )
+
+        explicit_bucket_histogram_aggregation.aggregate_values([-1, 0, 1, 2])
+        explicit_bucket_histogram_aggregation.aggregate_values([])
+        explicit_bucket_histogram_aggregation.aggregate_values([3, 4, 5])
+
+        self.assertEqual(explicit_bucket_histogram_aggregation._value, array("Q", [2, 2, 2, 1]))
+        self.assertEqual(explicit_bucket_histogram_aggregation._min, -1)
+        self.assertEqual(explicit_bucket_histogram_aggregation._max, 5)
+
+        histo = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.CUMULATIVE, 1)
+        self.assertEqual(histo.sum, 14)
+        self.assertEqual(histo.count, 7)
+
     def test_min_max(self):
         """
         `record_min_max` indicates the aggregator to record the minimum and
@@ -466,6 +504,142 @@ class TestExplicitBucketHistogramAggregation(TestCase):
             )
 
 
+def aggregate_in_threads(aggregation, values_per_thread):
+    threads = [Thread(target=aggregation.aggregate_values, args=(values,)) for values in values_per_thread]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestStripedAggregations(TestCase):
+    def test_striped_sum_aggregation(self):
+        synchronous_sum_aggregation = _SumAggregation(
+            Mock(),
+            True,
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_SumAggregation),
+            stripes=4,
+        )
+        self.assertEqual(len(synchronous_sum_aggregation._stripes), 4)
+
+        aggregate_in_threads(synchronous_sum_aggregation, [[1, 2], [3], [4, 5], [6], [7]])
+        synchronous_sum_aggregation.aggregate(measurement(8))
+
+        self.assertEqual(
+            synchronous_sum_aggregation.collect(AggregationTemporality.CUMULATIVE, 1).value,
+            36,
+        )
+
+        synchronous_sum_aggregation.aggregate(measurement(4))
+        aggregate_in_threads(synchronous_sum_aggregation, [[1], [2]])
+
+        self.assertEqual(
+            synchronous_sum_aggregation.collect(AggregationTemporality.CUMULATIVE, 2).value,
+            43,
+        )
+        self.assertIsNone(synchronous_sum_aggregation.collect(AggregationTemporality.DELTA, 3))
+
+    def test_striped_explicit_bucket_histogram_aggregation(self):
+        explicit_bucket_histogram_aggregation = _ExplicitBucketHistogramAggregation(
+            Mock(),
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_ExplicitBucketHistogramAggregation),
+            boundaries=[0, 2, 4],
+            stripes=3,
+        )
+
+        aggregate_in_threads(explicit_bucket_histogram_aggregation, [[-1, 0], [1, 2, 3], [4], [5]])
+
+        histo = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.DELTA, 1)
+        self.assertEqual(histo.bucket_counts, (2, 2, 2, 1))
+        self.assertEqual(histo.sum, 14)
+        self.assertEqual(histo.count, 7)
+        self.assertEqual(histo.min, -1)
+        self.assertEqual(histo.max, 5)
+
+        for stripe in explicit_bucket_histogram_aggregation._stripes:
+            self.assertIsNone(stripe._value)
+
+    def test_stripes_only_for_synchronous_instruments(self):
+        factory = SumAggregation(stripes=4)
+
+        aggregation = factory._create_aggregation(
+            _Counter("name", Mock(), Mock()), Mock(), _default_reservoir_factory, 0
+        )
+        self.assertEqual(len(aggregation._stripes), 4)
+
+        aggregation = factory._create_aggregation(
+            _ObservableCounter("name", Mock(), Mock(), None), Mock(), _default_reservoir_factory, 0
+        )
+        self.assertIsNone(aggregation._stripes)
+
+        aggregation = ExplicitBucketHistogramAggregation(stripes=2)._create_aggregation(
+            _Histogram("name", Mock(), Mock()), Mock(), _default_reservoir_factory, 0
+        )
+        self.assertEqual(len(aggregation._stripes), 2)
+
+    def test_invalid_stripes(self):
+        for stripes in (0, -1, 1.5):
+            with self.subTest(stripes=stripes):
+                with self.assertRaises(ValueError):
+                    SumAggregation(stripes=stripes)
+                with self.assertRaises(ValueError):
+                    ExplicitBucketHistogramAggregation(stripes=stripes)
+
+
+class TestTouchedAggregations(TestCase):
+    def test_touched_once_per_collection(self):
+        for stripes in (1, 3):
+            with self.subTest(stripes=stripes):
+                synchronous_sum_aggregation = _SumAggregation(
+                    Mock(),
+                    True,
+                    AggregationTemporality.DELTA,
+                    0,
+                    _default_reservoir_factory(_SumAggregation),
+                    stripes=stripes,
+                )
+                on_touched = Mock()
+                synchronous_sum_aggregation._on_touched = on_touched
+
+                aggregate_in_threads(synchronous_sum_aggregation, [[1, 2], [3], [4]])
+                synchronous_sum_aggregation.aggregate(measurement(5))
+
+                on_touched.assert_called_once_with()
+                self.assertTrue(synchronous_sum_aggregation._touched)
+
+                synchronous_sum_aggregation.collect(AggregationTemporality.DELTA, 1)
+
+                self.assertFalse(synchronous_sum_aggregation._touched)
+                on_touched.assert_called_once_with()
+
+                synchronous_sum_aggregation.aggregate(measurement(1))
+
+                self.assertEqual(on_touched.call_count, 2)
+
+    def test_previous_point_is_last_cumulative_point(self):
+        explicit_bucket_histogram_aggregation = _ExplicitBucketHistogramAggregation(
+            Mock(),
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_ExplicitBucketHistogramAggregation),
+            boundaries=[0, 2, 4],
+        )
+
+        explicit_bucket_histogram_aggregation.aggregate(measurement(1))
+        explicit_bucket_histogram_aggregation.collect(AggregationTemporality.DELTA, 1)
+
+        self.assertIsNone(explicit_bucket_histogram_aggregation._previous_point)
+
+        explicit_bucket_histogram_aggregation.aggregate(measurement(3))
+        collection = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.CUMULATIVE, 2)
+
+        self.assertIs(explicit_bucket_histogram_aggregation._previous_point, collection)
+
+
 class TestAggregationFactory(TestCase):
     def test_sum_factory(self):
         counter = _Counter("name", Mock(), Mock())
@@ -664,6 +838,21 @@ class TestExemplarsFromAggregations(TestCase):
         self.assertGreater(len(datapoint.exemplars), 0)
         self.assertLessEqual(len(datapoint.exemplars), 3)
 
+    def test_aggregate_many_samples_only_sampled_measurements(self):
+        synchronous_sum_aggregation = _SumAggregation(
+            Mock(),
+            True,
+            AggregationTemporality.DELTA,
+            0,
+            lambda: SimpleFixedSizeExemplarReservoir(size=3),
+        )
+
+        synchronous_sum_aggregation.aggregate_many([1, 2, 3], [measurement(2)])
+
+        datapoint = synchronous_sum_aggregation.collect(AggregationTemporality.CUMULATIVE, 0)
+        self.assertEqual(datapoint.value, 6)
+        self.assertEqual([exemplar.value for exemplar in datapoint.exemplars], [2])
+
     def test_collection_simple_fixed_size_reservoir_with_default_reservoir(
         self,
     ):
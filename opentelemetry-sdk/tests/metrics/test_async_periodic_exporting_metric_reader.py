@@ -0,0 +1,202 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access,invalid-name,no-self-use
+
+import asyncio
+import math
+import unittest
+from logging import WARNING
+
+from opentelemetry.context import _SUPPRESS_INSTRUMENTATION_KEY, get_value
+from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.sdk.metrics._internal import _Counter
+from opentelemetry.sdk.metrics._internal.point import MetricsData
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    AsyncMetricExporter,
+    AsyncPeriodicExportingMetricReader,
+    MetricExportResult,
+)
+
+
+class FakeAsyncMetricsExporter(AsyncMetricExporter):
+    def __init__(self, wait=0, preferred_temporality=None, preferred_aggregation=None):
+        self.wait = wait
+        self.metrics: list[MetricsData] = []
+        self.suppressed: list[bool] = []
+        self.cancelled = False
+        self.flushed = False
+        self._shutdown = False
+        super().__init__(
+            preferred_temporality=preferred_temporality,
+            preferred_aggregation=preferred_aggregation,
+        )
+
+    async def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        self.suppressed.append(bool(get_value(_SUPPRESS_INSTRUMENTATION_KEY)))
+        try:
+            await asyncio.sleep(self.wait)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        self.metrics.append(metrics_data)
+        return MetricExportResult.SUCCESS
+
+    async def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        self._shutdown = True
+
+    async def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        self.flushed = True
+        return True
+
+
+def _create_reader(exporter, interval=60000, timeout=30000, metrics_data=None, loop=None):
+    reader = AsyncPeriodicExportingMetricReader(
+        exporter,
+        export_interval_millis=interval,
+        export_timeout_millis=timeout,
+        loop=loop,
+    )
+    reader._set_collect_callback(lambda reader, timeout_millis: metrics_data or MetricsData(resource_metrics=[]))
+    return reader
+
+
+class TestAsyncPeriodicExportingMetricReader(unittest.IsolatedAsyncioTestCase):
+    async def test_defaults(self):
+        reader = AsyncPeriodicExportingMetricReader(FakeAsyncMetricsExporter())
+        self.assertEqual(reader._export_interval_millis, 60000)
+        self.assertEqual(reader._export_timeout_millis, 30000)
+        await reader.shutdown_async()
+
+    async def test_ticker_collects_metrics(self):
+        exporter = FakeAsyncMetricsExporter()
+        reader = _create_reader(exporter, interval=10)
+
+        while len(exporter.metrics) < 2:
+            await asyncio.sleep(0.01)
+        self.assertEqual(exporter.metrics[0], MetricsData(resource_metrics=[]))
+        self.assertTrue(all(exporter.suppressed))
+        await reader.shutdown_async()
+
+    async def test_ticker_not_started_on_infinity(self):
+        exporter = FakeAsyncMetricsExporter()
+        reader = _create_reader(exporter, interval=math.inf)
+        await asyncio.sleep(0.01)
+
+        self.assertIsNone(reader._ticker_task)
+        await reader.shutdown_async()
+        self.assertEqual(exporter.metrics, [])
+        self.assertTrue(exporter._shutdown)
+
+    def test_ticker_value_exception_on_zero_and_negative(self):
+        loop = asyncio.new_event_loop()
+        try:
+            for interval in (0, -100):
+                with self.subTest(interval=interval):
+                    with self.assertRaises(ValueError):
+                        AsyncPeriodicExportingMetricReader(
+                            FakeAsyncMetricsExporter(), export_interval_millis=interval, loop=loop
+                        )
+        finally:
+            loop.close()
+
+    async def test_shutdown_collects_and_exports(self):
+        exporter = FakeAsyncMetricsExporter()
+        reader = _create_reader(exporter)
+
+        await reader.shutdown_async()
+
+        self.assertEqual(exporter.metrics, [MetricsData(resource_metrics=[])])
+        self.assertTrue(reader._shutdown)
+        self.assertTrue(exporter._shutdown)
+        with self.assertLogs(level=WARNING) as logs:
+            await reader.shutdown_async()
+        self.assertIn("Can't shutdown multiple times", logs.output[0])
+        with self.assertLogs(level=WARNING):
+            reader.shutdown()
+
+    async def test_shutdown_cancels_export_after_timeout(self):
+        exporter = FakeAsyncMetricsExporter(wait=10)
+        reader = _create_reader(exporter)
+
+        await reader.shutdown_async(timeout_millis=50)
+
+        self.assertTrue(exporter.cancelled)
+        self.assertTrue(exporter._shutdown)
+        self.assertTrue(reader._ticker_task.done())
+        self.assertEqual(reader._exports, set())
+
+    async def test_export_timeout_logged(self):
+        exporter = FakeAsyncMetricsExporter(wait=10)
+        reader = _create_reader(exporter, timeout=10)
+
+        with self.assertLogs(level=WARNING) as logs:
+            self.assertTrue(await reader.force_flush_async(timeout_millis=10))
+        self.assertIn("Timed out exporting metrics.", logs.output[0])
+        self.assertTrue(exporter.cancelled)
+        exporter.wait = 0
+        await reader.shutdown_async()
+
+    async def test_force_flush_async(self):
+        exporter = FakeAsyncMetricsExporter()
+        reader = _create_reader(exporter)
+
+        self.assertTrue(await reader.force_flush_async())
+
+        self.assertEqual(exporter.metrics, [MetricsData(resource_metrics=[])])
+        self.assertTrue(exporter.flushed)
+        await reader.shutdown_async()
+
+    async def test_sync_methods_wait_from_other_threads(self):
+        exporter = FakeAsyncMetricsExporter()
+        reader = _create_reader(exporter)
+
+        self.assertTrue(await asyncio.to_thread(reader.force_flush))
+        self.assertEqual(len(exporter.metrics), 1)
+        self.assertTrue(exporter.flushed)
+        await asyncio.to_thread(reader.shutdown)
+        self.assertEqual(len(exporter.metrics), 2)
+        self.assertTrue(exporter._shutdown)
+
+    async def test_collect_from_other_thread_waits_for_export(self):
+        exporter = FakeAsyncMetricsExporter()
+        reader = _create_reader(exporter)
+
+        await asyncio.to_thread(reader.collect)
+
+        self.assertEqual(len(exporter.metrics), 1)
+        await reader.shutdown_async()
+
+    async def test_meter_provider(self):
+        exporter = FakeAsyncMetricsExporter()
+        reader = AsyncPeriodicExportingMetricReader(exporter, export_interval_millis=math.inf)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter_provider.get_meter("meter").create_counter("counter").add(1)
+
+        await reader.force_flush_async()
+        await asyncio.to_thread(meter_provider.shutdown)
+
+        self.assertEqual(len(exporter.metrics), 1)
+        (metric,) = exporter.metrics[0].resource_metrics[0].scope_metrics[0].metrics
+        self.assertEqual(metric.name, "counter")
+        self.assertTrue(exporter._shutdown)
+
+    async def test_exporter_temporality_preference(self):
+        exporter = FakeAsyncMetricsExporter(
+            preferred_temporality={
+                Counter: AggregationTemporality.DELTA,
+            },
+        )
+        reader = AsyncPeriodicExportingMetricReader(exporter)
+        for key, value in reader._instrument_class_temporality.items():
+            if key is not _Counter:
+                self.assertEqual(value, AggregationTemporality.CUMULATIVE)
+            else:
+                self.assertEqual(value, AggregationTemporality.DELTA)
+        await reader.shutdown_async()
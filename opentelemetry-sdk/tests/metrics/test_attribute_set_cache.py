@@ -0,0 +1,62 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+from time import time_ns
+from unittest import TestCase
+from unittest.mock import Mock
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.metrics._internal._attribute_set_cache import (
+    _EMPTY_ATTRIBUTE_SET_KEY,
+    _attribute_set_key,
+    _intern_attribute_set,
+)
+from opentelemetry.sdk.metrics._internal.measurement import Measurement
+
+
+class TestAttributeSetCache(TestCase):
+    def test_attribute_set_key(self):
+        self.assertEqual(
+            _attribute_set_key({"a": "b", "c": 1}),
+            ((("a", "b"), ("c", 1)), (str, int)),
+        )
+        self.assertNotEqual(_attribute_set_key({"a": True}), _attribute_set_key({"a": 1}))
+        self.assertNotEqual(_attribute_set_key({"a": 1}), _attribute_set_key({"a": 1.0}))
+
+    def test_attribute_set_key_not_internable(self):
+        self.assertIsNone(_attribute_set_key({"a": [1, 2]}))
+        self.assertIsNone(_attribute_set_key({"a": (1, 2)}))
+        self.assertIsNone(_attribute_set_key({"a": {"b": "c"}}))
+        self.assertIsNone(_attribute_set_key({"a": None}))
+        self.assertIsNone(_attribute_set_key({1: "a"}))
+
+    def test_intern_attribute_set(self):
+        key = _attribute_set_key({"a": "b", "": "c"})
+        interned = _intern_attribute_set(key)
+
+        self.assertEqual(interned, {"a": "b"})
+        self.assertIs(_intern_attribute_set(key), interned)
+
+    def test_measurement_attributes_interned(self):
+        def measurement(attributes):
+            return Measurement(
+                value=1,
+                time_unix_nano=time_ns(),
+                instrument=Mock(),
+                context=Context(),
+                attributes=attributes,
+            )
+
+        attributes = {"a": "b"}
+        first = measurement(attributes)
+        second = measurement(dict(attributes))
+
+        self.assertIs(first.attributes, second.attributes)
+        self.assertIsNot(first.attributes, attributes)
+        self.assertEqual(first._attribute_set_key, _attribute_set_key(attributes))
+        self.assertEqual(measurement(None)._attribute_set_key, _EMPTY_ATTRIBUTE_SET_KEY)
+
+        not_interned = measurement({"a": ["b"]})
+        self.assertEqual(not_interned.attributes, {"a": ("b",)})
+        self.assertIsNone(not_interned._attribute_set_key)
@@ -3,6 +3,7 @@
 
 # pylint: disable=no-self-use
 
+from array import array
 from logging import WARNING
 
 # from time import time_ns
@@ -42,28 +43,46 @@ class TestCounter(TestCase):
         mc = Mock()
         counter = _Counter("name", Mock(), mc)
         counter.add(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_add_non_monotonic(self):
         mc = Mock()
         counter = _Counter("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             counter.add(-1.0)
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_add_nan(self):
         mc = Mock()
         counter = _Counter("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             counter.add(float("nan"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_add_inf(self):
         mc = Mock()
         counter = _Counter("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             counter.add(float("inf"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
+
+    def test_add_many(self):
+        mc = Mock()
+        counter = _Counter("name", Mock(), mc)
+        counter.add_many([1, 2.5, 3], {"key": "value"})
+        mc.consume_values.assert_called_once_with(counter, [1, 2.5, 3], {"key": "value"}, None)
+
+    def test_add_many_drops_invalid_amounts(self):
+        mc = Mock()
+        counter = _Counter("name", Mock(), mc)
+        with self.assertLogs(level=WARNING):
+            counter.add_many([1, -1, float("nan"), float("inf"), 2])
+        mc.consume_values.assert_called_once_with(counter, [1, 2], None, None)
+
+        mc.reset_mock()
+        with self.assertLogs(level=WARNING):
+            counter.add_many([-1])
+        mc.consume_values.assert_not_called()
 
     def test_disallow_direct_counter_creation(self):
         with self.assertRaises(TypeError):
@@ -76,27 +95,27 @@ class TestUpDownCounter(TestCase):
         mc = Mock()
         counter = _UpDownCounter("name", Mock(), mc)
         counter.add(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_add_non_monotonic(self):
         mc = Mock()
         counter = _UpDownCounter("name", Mock(), mc)
         counter.add(-1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_add_nan(self):
         mc = Mock()
         counter = _UpDownCounter("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             counter.add(float("nan"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_add_inf(self):
         mc = Mock()
         counter = _UpDownCounter("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             counter.add(float("inf"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_disallow_direct_up_down_counter_creation(self):
         with self.assertRaises(TypeError):
@@ -434,21 +453,21 @@ class TestGauge(TestCase):
         mc = Mock()
         gauge = _Gauge("name", Mock(), mc)
         gauge.set(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_set_nan(self):
         mc = Mock()
         gauge = _Gauge("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             gauge.set(float("nan"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_set_inf(self):
         mc = Mock()
         gauge = _Gauge("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             gauge.set(float("inf"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_disallow_direct_counter_creation(self):
         with self.assertRaises(TypeError):
@@ -532,28 +551,56 @@ class TestHistogram(TestCase):
         mc = Mock()
         hist = _Histogram("name", Mock(), mc)
         hist.record(1.0)
-        mc.consume_measurement.assert_called_once()
+        mc.consume_value.assert_called_once()
 
     def test_record_non_monotonic(self):
         mc = Mock()
         hist = _Histogram("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             hist.record(-1.0)
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_record_nan(self):
         mc = Mock()
         hist = _Histogram("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             hist.record(float("nan"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
 
     def test_record_inf(self):
         mc = Mock()
         hist = _Histogram("name", Mock(), mc)
         with self.assertLogs(level=WARNING):
             hist.record(float("inf"))
-        mc.consume_measurement.assert_not_called()
+        mc.consume_value.assert_not_called()
+
+    def test_record_many_buffers(self):
+        mc = Mock()
+        hist = _Histogram("name", Mock(), mc)
+        for amounts in (
+            (1.0, 2.0),
+            array("d", [1.0, 2.0]),
+            memoryview(array("d", [1.0, 2.0])),
+        ):
+            with self.subTest(amounts=amounts):
+                mc.reset_mock()
+                hist.record_many(amounts)
+                mc.consume_values.assert_called_once_with(hist, [1.0, 2.0], None, None)
+
+    def test_record_many_drops_invalid_amounts(self):
+        mc = Mock()
+        hist = _Histogram("name", Mock(), mc)
+        with self.assertLogs(level=WARNING):
+            hist.record_many(array("d", [1.0, -1.0, float("nan")]))
+        mc.consume_values.assert_called_once_with(hist, [1.0], None, None)
+
+    def test_record_many_drops_multidimensional_amounts(self):
+        mc = Mock()
+        hist = _Histogram("name", Mock(), mc)
+        amounts = memoryview(array("d", [1.0, 2.0, 3.0, 4.0])).cast("B").cast("d", (2, 2))
+        with self.assertLogs(level=WARNING):
+            hist.record_many(amounts)
+        mc.consume_values.assert_not_called()
 
     def test_disallow_direct_histogram_creation(self):
         with self.assertRaises(TypeError):
@@ -1,13 +1,19 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-# pylint: disable=invalid-name,no-self-use
+# pylint: disable=invalid-name,no-self-use,protected-access
 
-from threading import Event, Thread
-from time import sleep
+from threading import Barrier, Event, Thread
+from time import perf_counter, sleep
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock, patch
 
+from opentelemetry.context import Context
+from opentelemetry.sdk.metrics import MetricsTimeoutError
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+    AlwaysOnExemplarFilter,
+)
 from opentelemetry.sdk.metrics._internal.measurement_consumer import (
     MeasurementConsumer,
     SynchronousMeasurementConsumer,
@@ -38,9 +44,13 @@ class TestSynchronousMeasurementConsumer(TestCase):
         )
         self.assertEqual(len(MockMetricReaderStorage.mock_calls), 5)
 
+    @staticmethod
+    def _reader_storage_mock():
+        return Mock(**{"_get_or_init_view_instrument_match.return_value": [Mock()]})
+
     def test_measurements_passed_to_each_reader_storage(self, MockMetricReaderStorage):
         reader_mocks = [Mock() for _ in range(5)]
-        reader_storage_mocks = [Mock() for _ in range(5)]
+        reader_storage_mocks = [self._reader_storage_mock() for _ in range(5)]
         MockMetricReaderStorage.side_effect = reader_storage_mocks
 
         consumer = SynchronousMeasurementConsumer(
@@ -55,7 +65,121 @@ class TestSynchronousMeasurementConsumer(TestCase):
         consumer.consume_measurement(measurement_mock)
 
         for rs_mock in reader_storage_mocks:
-            rs_mock.consume_measurement.assert_called_once_with(measurement_mock, False)
+            rs_mock._get_or_init_view_instrument_match.assert_called_once_with(measurement_mock.instrument)
+            (view_instrument_match_mock,) = rs_mock._get_or_init_view_instrument_match.return_value
+            view_instrument_match_mock.consume_measurement.assert_called_once_with(measurement_mock, False)
+
+    def test_view_instrument_matches_resolved_once(self, MockMetricReaderStorage):
+        reader_mocks = [Mock() for _ in range(3)]
+        reader_storage_mocks = [self._reader_storage_mock() for _ in range(3)]
+        MockMetricReaderStorage.side_effect = reader_storage_mocks
+
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=Mock(should_sample=Mock(return_value=False)),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=reader_mocks[:2],
+        )
+        measurement_mock = Mock()
+        consumer.consume_measurement(measurement_mock)
+        consumer.consume_measurement(measurement_mock)
+
+        for rs_mock in reader_storage_mocks[:2]:
+            rs_mock._get_or_init_view_instrument_match.assert_called_once_with(measurement_mock.instrument)
+            (view_instrument_match_mock,) = rs_mock._get_or_init_view_instrument_match.return_value
+            self.assertEqual(view_instrument_match_mock.consume_measurement.call_count, 2)
+
+        # They are resolved again against the new reader storages.
+        consumer.add_metric_reader(reader_mocks[2])
+        consumer.remove_metric_reader(reader_mocks[0])
+        consumer.consume_measurement(measurement_mock)
+
+        for rs_mock, consume_measurement_count in zip(reader_storage_mocks, (2, 3, 1)):
+            (view_instrument_match_mock,) = rs_mock._get_or_init_view_instrument_match.return_value
+            self.assertEqual(view_instrument_match_mock.consume_measurement.call_count, consume_measurement_count)
+
+    def test_values_passed_to_each_reader_storage_without_exemplars(self, MockMetricReaderStorage):
+        """With exemplars disabled no Measurement should be built"""
+        reader_mocks = [Mock() for _ in range(5)]
+        reader_storage_mocks = [self._reader_storage_mock() for _ in range(5)]
+        MockMetricReaderStorage.side_effect = reader_storage_mocks
+
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=AlwaysOffExemplarFilter(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=reader_mocks,
+        )
+        instrument_mock = Mock()
+        with patch("opentelemetry.sdk.metrics._internal.measurement_consumer.get_current") as get_current_mock:
+            consumer.consume_value(instrument_mock, 1, {"key": "value"}, None)
+
+        get_current_mock.assert_not_called()
+        for rs_mock in reader_storage_mocks:
+            rs_mock._get_or_init_view_instrument_match.assert_called_once_with(instrument_mock)
+            (view_instrument_match_mock,) = rs_mock._get_or_init_view_instrument_match.return_value
+            view_instrument_match_mock.consume_measurement.assert_not_called()
+            view_instrument_match_mock.consume_value.assert_called_once()
+            value, attributes, _ = view_instrument_match_mock.consume_value.call_args.args
+            self.assertEqual(value, 1)
+            self.assertEqual(attributes, {"key": "value"})
+
+    def test_values_passed_as_measurements_with_exemplars(self, MockMetricReaderStorage):
+        reader_storage_mock = self._reader_storage_mock()
+        (view_instrument_match_mock,) = reader_storage_mock._get_or_init_view_instrument_match.return_value
+        MockMetricReaderStorage.side_effect = [reader_storage_mock]
+
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=AlwaysOnExemplarFilter(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[Mock()],
+        )
+        instrument_mock = Mock()
+        context = Context({"key": "value"})
+        consumer.consume_value(instrument_mock, 1, {"key": "value"}, context)
+
+        view_instrument_match_mock.consume_value.assert_not_called()
+        view_instrument_match_mock.consume_measurement.assert_called_once()
+        measurement, should_sample_exemplar = view_instrument_match_mock.consume_measurement.call_args.args
+        self.assertIs(measurement.instrument, instrument_mock)
+        self.assertEqual(measurement.value, 1)
+        self.assertEqual(measurement.attributes, {"key": "value"})
+        self.assertIs(measurement.context, context)
+        self.assertTrue(should_sample_exemplar)
+
+    def test_values_passed_with_sampled_measurements(self, MockMetricReaderStorage):
+        reader_storage_mock = self._reader_storage_mock()
+        (view_instrument_match_mock,) = reader_storage_mock._get_or_init_view_instrument_match.return_value
+        MockMetricReaderStorage.side_effect = [reader_storage_mock]
+
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=AlwaysOnExemplarFilter(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[Mock()],
+        )
+        instrument_mock = Mock()
+        context = Context({"key": "value"})
+        consumer.consume_values(instrument_mock, [1, 2], {"key": "value"}, context)
+
+        reader_storage_mock._get_or_init_view_instrument_match.assert_called_once_with(instrument_mock)
+        view_instrument_match_mock.consume_values.assert_called_once()
+        values, attributes, _, sampled_measurements = view_instrument_match_mock.consume_values.call_args.args
+        self.assertEqual(values, [1, 2])
+        self.assertEqual(attributes, {"key": "value"})
+        self.assertEqual([measurement.value for measurement in sampled_measurements], [1, 2])
+        self.assertEqual(len({measurement.time_unix_nano for measurement in sampled_measurements}), 1)
+        for measurement in sampled_measurements:
+            self.assertIs(measurement.context, context)
 
     def test_collect_passed_to_reader_stage(self, MockMetricReaderStorage):
         """Its collect() method should defer to the underlying MetricReaderStorage"""
@@ -167,6 +291,192 @@ class TestSynchronousMeasurementConsumer(TestCase):
             10000,
         )
 
+    @staticmethod
+    def _async_instrument(*callbacks):
+        return Mock(
+            _callbacks=list(callbacks),
+            **{
+                "_is_enabled.return_value": True,
+                "_run_callback.side_effect": lambda callback, options: callback(options),
+            },
+        )
+
+    def test_collect_runs_callbacks_concurrently(self, MockMetricReaderStorage):
+        reader_mock = Mock()
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=Mock(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[reader_mock],
+            max_concurrent_callbacks=2,
+        )
+        barrier = Barrier(2, timeout=5)
+        callback_options = []
+
+        def callback(measurement):
+            def inner(options):
+                callback_options.append(options)
+                # Only returns when both callbacks run at the same time.
+                barrier.wait()
+                return [measurement]
+
+            return inner
+
+        measurement_1, measurement_2 = Mock(), Mock()
+        consumer.register_asynchronous_instrument(self._async_instrument(callback(measurement_1)))
+        consumer.register_asynchronous_instrument(self._async_instrument(callback(measurement_2)))
+        consumer.collect(reader_mock, timeout_millis=5000)
+
+        self.assertEqual(
+            [call.args[0] for call in reader_storage_mock.consume_measurement.call_args_list],
+            [measurement_1, measurement_2],
+        )
+        for options in callback_options:
+            self.assertLessEqual(options.timeout_millis, 5000)
+        reader_storage_mock.collect.assert_called_once()
+        consumer.shutdown()
+
+    def test_collect_timeout_with_concurrent_callbacks(self, MockMetricReaderStorage):
+        reader_mock = Mock()
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=Mock(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[reader_mock],
+            max_concurrent_callbacks=2,
+        )
+        release = Event()
+        consumer.register_asynchronous_instrument(self._async_instrument(lambda options: release.wait(5) and []))
+
+        with self.assertRaises(MetricsTimeoutError) as error:
+            consumer.collect(reader_mock, timeout_millis=10)
+
+        self.assertIn("Timed out while executing callback", error.exception.args[0])
+        reader_storage_mock.collect.assert_not_called()
+        release.set()
+        consumer.shutdown()
+
+    # A callback overrunning its own timeout within the deadline of the
+    # collection is discarded.
+    @patch(
+        "opentelemetry.sdk.metrics._internal.measurement_consumer._DEFAULT_CALLBACK_TIMEOUT_NS",
+        1e8,
+    )
+    def test_collect_discards_overrunning_callback(self, MockMetricReaderStorage):
+        reader_mock = Mock()
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=Mock(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[reader_mock],
+            max_concurrent_callbacks=2,
+        )
+        release = Event()
+        slow_measurement, fast_measurement = Mock(), Mock()
+        slow_callback = Mock(side_effect=lambda options: release.wait(5) and [slow_measurement])
+        consumer.register_asynchronous_instrument(self._async_instrument(slow_callback))
+        consumer.register_asynchronous_instrument(self._async_instrument(lambda options: [fast_measurement]))
+
+        start = perf_counter()
+        with self.assertLogs(level="WARNING") as logs:
+            consumer.collect(reader_mock, timeout_millis=5000)
+            # A callback still running is not run again.
+            consumer.collect(reader_mock, timeout_millis=5000)
+        self.assertLess(perf_counter() - start, 5)
+        self.assertIn("Timed out while executing callback", logs.output[0])
+        self.assertIn("still running", logs.output[1])
+
+        release.set()
+        consumer.shutdown()
+
+        self.assertEqual(slow_callback.call_count, 1)
+        self.assertEqual(
+            [call.args[0] for call in reader_storage_mock.consume_measurement.call_args_list],
+            [fast_measurement, fast_measurement],
+        )
+
+    @patch("opentelemetry.sdk.metrics._internal.measurement_consumer.time_ns")
+    def test_collect_caches_callbacks_across_readers(self, mock_time_ns, MockMetricReaderStorage):
+        for max_concurrent_callbacks in (1, 2):
+            with self.subTest(max_concurrent_callbacks=max_concurrent_callbacks):
+                mock_time_ns.return_value = 0
+                reader_1, reader_2 = Mock(), Mock()
+                reader_storage_1, reader_storage_2 = Mock(), Mock()
+                MockMetricReaderStorage.side_effect = [reader_storage_1, reader_storage_2]
+                consumer = SynchronousMeasurementConsumer(
+                    SdkConfiguration(
+                        exemplar_filter=Mock(),
+                        resource=Mock(),
+                        views=Mock(),
+                    ),
+                    metric_readers=[reader_1, reader_2],
+                    max_concurrent_callbacks=max_concurrent_callbacks,
+                    callback_cache_millis=1000,
+                    uncached_instrument_names=["uncached.*"],
+                )
+                cached_callback = Mock(return_value=[Mock()])
+                uncached_callback = Mock(return_value=[Mock()])
+                for name, callback in (("cached", cached_callback), ("Uncached.Gauge", uncached_callback)):
+                    instrument = self._async_instrument(callback)
+                    instrument.name = name.lower()
+                    instrument.callback.side_effect = lambda options, callback=callback: callback(options)
+                    consumer.register_asynchronous_instrument(instrument)
+
+                consumer.collect(reader_1)
+                mock_time_ns.return_value = 999 * 10**6
+                consumer.collect(reader_2)
+
+                self.assertEqual(cached_callback.call_count, 1)
+                self.assertEqual(uncached_callback.call_count, 2)
+                for reader_storage in (reader_storage_1, reader_storage_2):
+                    self.assertEqual(
+                        [call.args[0] for call in reader_storage.consume_measurement.call_args_list],
+                        [cached_callback.return_value[0], uncached_callback.return_value[0]],
+                    )
+
+                # The cached measurements are reused until they are older than
+                # callback_cache_millis.
+                mock_time_ns.return_value = 1000 * 10**6
+                consumer.collect(reader_1)
+                self.assertEqual(cached_callback.call_count, 2)
+                consumer.shutdown()
+
+    def test_collect_does_not_cache_callbacks_by_default(self, MockMetricReaderStorage):
+        reader_1, reader_2 = Mock(), Mock()
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=Mock(),
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[reader_1, reader_2],
+        )
+        async_instrument = Mock(**{"callback.return_value": []})
+        consumer.register_asynchronous_instrument(async_instrument)
+
+        consumer.collect(reader_1)
+        consumer.collect(reader_2)
+
+        self.assertEqual(async_instrument.callback.call_count, 2)
+
+    def test_invalid_max_concurrent_callbacks(self, _):
+        with self.assertRaises(ValueError):
+            SynchronousMeasurementConsumer(MagicMock(), metric_readers=(), max_concurrent_callbacks=0)
+        with self.assertRaises(ValueError):
+            SynchronousMeasurementConsumer(MagicMock(), metric_readers=(), callback_cache_millis=-1)
+
 
 class TestSynchronousMeasurementConsumerConcurrency(TestCase):
     def test_consume_measurement_does_not_acquire_lock(self):
@@ -203,7 +513,7 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
                 resource=MagicMock(),
                 views=MagicMock(),
             ),
-            metric_readers=[MagicMock()],
+            metric_readers=[MagicMock(_aggregation_cardinality_limit=2000)],
         )
 
         def _hooked_iter(iterable):
@@ -241,7 +551,7 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
                 t = Thread(target=mutate)
                 t.start()
                 try:
-                    consumer.consume_measurement(MagicMock())
+                    consumer.consume_measurement(MagicMock(_attribute_set_key=None))
                 finally:
                     t.join()
             self.assertEqual("dictionary changed size during iteration", str(cm.exception))
@@ -275,7 +585,7 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
             t = Thread(target=add_and_remove_readers)
             t.start()
             try:
-                consumer.consume_measurement(MagicMock())
+                consumer.consume_measurement(MagicMock(_attribute_set_key=None))
             finally:
                 t.join()
             self.assertIsNone(failure)
@@ -38,7 +38,9 @@ from opentelemetry.test.concurrency_test import ConcurrencyTestBase, MockFunc
 
 
 def mock_view_matching(name, *instruments) -> Mock:
-    mock = Mock(name=name)
+    # Views selecting neither an instrument nor a meter name are not indexed,
+    # they are matched against every instrument.
+    mock = Mock(name=name, _instrument_name=None, _meter_name=None)
     mock._match.side_effect = lambda instrument: instrument in instruments
     return mock
 
@@ -90,9 +92,12 @@ class TestMetricReaderStorage(ConcurrencyTestBase):
 
     @patch("opentelemetry.sdk.metrics._internal.metric_reader_storage._ViewInstrumentMatch")
     def test_forwards_calls_to_view_instrument_match(self, MockViewInstrumentMatch: Mock):
-        view_instrument_match1 = Mock(_aggregation=_LastValueAggregation({}, Mock()))
-        view_instrument_match2 = Mock(_aggregation=_LastValueAggregation({}, Mock()))
-        view_instrument_match3 = Mock(_aggregation=_LastValueAggregation({}, Mock()))
+        # The view instrument matches share their metric stream identity, so
+        # they are checked for conflicts with each other.
+        stream_identity = {"_name": "name", "_instrument.unit": "unit"}
+        view_instrument_match1 = Mock(_aggregation=_LastValueAggregation({}, Mock()), **stream_identity)
+        view_instrument_match2 = Mock(_aggregation=_LastValueAggregation({}, Mock()), **stream_identity)
+        view_instrument_match3 = Mock(_aggregation=_LastValueAggregation({}, Mock()), **stream_identity)
         MockViewInstrumentMatch.side_effect = [
             view_instrument_match1,
             view_instrument_match2,
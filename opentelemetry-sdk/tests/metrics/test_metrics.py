@@ -435,7 +435,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         counter.add(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     @patch("opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer")
     def test_consume_measurement_up_down_counter(self, mock_sync_measurement_consumer):
@@ -445,7 +445,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         counter.add(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     @patch("opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer")
     def test_consume_measurement_histogram(self, mock_sync_measurement_consumer):
@@ -455,7 +455,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         counter.record(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     def test_meter_provider_with_disabled_configurator(self):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
@@ -520,7 +520,7 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
 
         gauge.set(1)
 
-        sync_consumer_instance.consume_measurement.assert_called()
+        sync_consumer_instance.consume_value.assert_called()
 
     def test_addition_of_metric_reader(self):
         internal_logger = "opentelemetry.sdk.metrics._internal"
@@ -820,7 +820,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         counter = mp.get_meter("test").create_counter("c")
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     @patch("opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer")
     def test_disabled_meter_up_down_counter_skips_measurement(self, mock_sync_measurement_consumer):
@@ -828,7 +828,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         counter = mp.get_meter("test").create_up_down_counter("udc")
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     @patch("opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer")
     def test_disabled_meter_histogram_skips_measurement(self, mock_sync_measurement_consumer):
@@ -836,7 +836,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         histogram = mp.get_meter("test").create_histogram("h")
         histogram.record(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     @patch("opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer")
     def test_disabled_meter_gauge_skips_measurement(self, mock_sync_measurement_consumer):
@@ -844,7 +844,7 @@ class TestMeter(TestCase):
         mp = MeterProvider(_meter_configurator=_disable_meter_configurator)
         gauge = mp.get_meter("test").create_gauge("g")
         gauge.set(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
     def test_disabled_meter_observable_counter_skips_callback(self):
         cb = Mock()
@@ -876,17 +876,17 @@ class TestMeter(TestCase):
         counter = meter.create_counter("c")
 
         counter.add(1)
-        self.assertEqual(sync_consumer_instance.consume_measurement.call_count, 1)
+        self.assertEqual(sync_consumer_instance.consume_value.call_count, 1)
 
         counter.add(2)
-        self.assertEqual(sync_consumer_instance.consume_measurement.call_count, 2)
+        self.assertEqual(sync_consumer_instance.consume_value.call_count, 2)
 
         mp._set_meter_configurator(meter_configurator=_disable_meter_configurator)
         self.assertFalse(meter._is_enabled())
 
         counter.add(3)
         counter.add(4)
-        self.assertEqual(sync_consumer_instance.consume_measurement.call_count, 2)
+        self.assertEqual(sync_consumer_instance.consume_value.call_count, 2)
 
     @patch("opentelemetry.sdk.metrics._internal.SynchronousMeasurementConsumer")
     def test_reenable_meter_after_disable(self, mock_sync_measurement_consumer):
@@ -896,12 +896,12 @@ class TestMeter(TestCase):
         counter = meter.create_counter("c")
 
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_not_called()
+        sync_consumer_instance.consume_value.assert_not_called()
 
         mp._set_meter_configurator(meter_configurator=_default_meter_configurator)
         self.assertTrue(meter._is_enabled())
         counter.add(1)
-        sync_consumer_instance.consume_measurement.assert_called_once()
+        sync_consumer_instance.consume_value.assert_called_once()
 
 
 class InMemoryMetricExporter(MetricExporter):
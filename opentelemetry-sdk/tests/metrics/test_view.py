@@ -6,6 +6,7 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
+from opentelemetry.sdk.metrics._internal.view import _ViewIndex
 from opentelemetry.sdk.metrics.view import View
 
 
@@ -107,3 +108,44 @@ class TestView(TestCase):
     def test_view_name(self):
         with self.assertRaises(Exception):
             View(name="name", instrument_name="instrument_name*")
+
+
+class TestViewIndex(TestCase):
+    @staticmethod
+    def _instrument(name, meter_name="meter", unit=""):
+        # name is an argument of Mock itself, it has to be configured afterwards.
+        instrument = Mock(**{"unit": unit, "instrumentation_scope.name": meter_name})
+        instrument.configure_mock(name=name)
+        return instrument
+
+    def test_match(self):
+        views = [
+            View(instrument_name="http.server.duration"),
+            View(instrument_name="HTTP.*"),
+            View(instrument_name="*.duration", instrument_unit="s"),
+            View(meter_name="db"),
+            View(instrument_type=Mock),
+            View(instrument_name="db.[cq]*", meter_name="db"),
+            View(instrument_name="http.server.duration", meter_name="other"),
+            View(instrument_name="db.query?"),
+        ]
+        view_index = _ViewIndex(views)
+
+        for instrument in (
+            self._instrument("http.server.duration"),
+            self._instrument("http.server.duration", unit="s"),
+            self._instrument("http.server.duration", meter_name="other"),
+            self._instrument("db.query", meter_name="db"),
+            self._instrument("db.queryx", meter_name="db"),
+            self._instrument("db.query1"),
+            self._instrument("rpc.duration", unit="s"),
+            self._instrument("other"),
+        ):
+            with self.subTest(name=instrument.name):
+                self.assertEqual(
+                    view_index.match(instrument),
+                    [view for view in views if view._match(instrument)],
+                )
+
+    def test_match_without_views(self):
+        self.assertEqual(_ViewIndex([]).match(self._instrument("name")), [])
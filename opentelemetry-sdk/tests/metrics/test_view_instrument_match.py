@@ -1,16 +1,23 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-# pylint: disable=protected-access
+# pylint: disable=protected-access,too-many-lines
 from __future__ import annotations
 
+import gc
+import weakref
 from collections.abc import Callable, Sequence
+from threading import Thread
 from time import time_ns
 from unittest import TestCase
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 from opentelemetry.context import Context
+from opentelemetry.sdk.metrics._internal._attribute_set_cache import (
+    _attribute_set_key,
+)
 from opentelemetry.sdk.metrics._internal._view_instrument_match import (
+    _OVERFLOW_ATTRIBUTES,
     _hash_attributes,
     _ViewInstrumentMatch,
 )
@@ -60,10 +67,19 @@ def generalized_reservoir_factory(
     return factory
 
 
+def touching_aggregation(**kwargs) -> Mock:
+    """Returns a mock aggregation that marks itself as touched when it
+    aggregates, like the aggregations do, so that it is collected."""
+    aggregation = Mock(_previous_point=None, **kwargs)
+    aggregation.aggregate.side_effect = lambda *args, **kwargs: aggregation._on_touched()
+    return aggregation
+
+
 class Test_ViewInstrumentMatch(TestCase):  # pylint: disable=invalid-name
     @classmethod
     def setUpClass(cls):
         cls.mock_aggregation_factory = Mock()
+        cls.mock_aggregation_factory._create_aggregation.return_value = touching_aggregation()
         cls.mock_created_aggregation = cls.mock_aggregation_factory._create_aggregation()
         cls.mock_resource = Mock()
         cls.mock_instrumentation_scope = Mock()
@@ -406,16 +422,13 @@ class Test_ViewInstrumentMatch(TestCase):  # pylint: disable=invalid-name
                 **{
                     "__getitem__.return_value": Mock(
                         **{
-                            "_create_aggregation.return_value": Mock(
-                                **{
-                                    "collect.side_effect": [
-                                        Mock(),
-                                        Mock(),
-                                        None,
-                                        Mock(),
-                                    ]
-                                }
-                            )
+                            "_create_aggregation.side_effect": [
+                                Mock(),
+                                touching_aggregation(**{"collect.return_value": Mock()}),
+                                touching_aggregation(**{"collect.return_value": Mock()}),
+                                touching_aggregation(**{"collect.return_value": None}),
+                                touching_aggregation(**{"collect.return_value": Mock()}),
+                            ]
                         }
                     )
                 }
@@ -498,6 +511,47 @@ class Test_ViewInstrumentMatch(TestCase):  # pylint: disable=invalid-name
             _LastValueAggregation,
         )
 
+    def test_consume_measurement_cardinality_limit(self):
+        instrument1 = Mock(name="instrument1")
+        record_overflow = Mock()
+        view_instrument_match = _ViewInstrumentMatch(
+            view=View(instrument_name="instrument1", aggregation=self.mock_aggregation_factory),
+            instrument=instrument1,
+            instrument_class_aggregation=MagicMock(**{"__getitem__.return_value": DefaultAggregation()}),
+            aggregation_cardinality_limit=3,
+            record_overflow=record_overflow,
+        )
+
+        for value in ("a", "b", "c", "d", "a"):
+            view_instrument_match.consume_measurement(
+                Measurement(
+                    value=0,
+                    time_unix_nano=time_ns(),
+                    instrument=instrument1,
+                    context=Context(),
+                    attributes={"key": value},
+                )
+            )
+
+        self.assertEqual(
+            set(view_instrument_match._attributes_aggregation),
+            {
+                _hash_attributes({"key": "a"}),
+                _hash_attributes({"key": "b"}),
+                _hash_attributes(_OVERFLOW_ATTRIBUTES),
+            },
+        )
+        self.assertEqual(record_overflow.call_args_list, [call(1), call(1)])
+
+        view_instrument_match.consume_values(
+            [1, 2, 3],
+            {"key": "e"},
+            None,
+            (),
+        )
+        record_overflow.assert_called_with(3)
+        self.assertEqual(record_overflow.call_count, 3)
+
     def test_hash_attributes_works_as_stable_hash_key(self):
         attributes = {
             "a": [1, 2],
@@ -654,6 +708,140 @@ class Test_ViewInstrumentMatch(TestCase):  # pylint: disable=invalid-name
         expected_key = _hash_attributes(attrs1)
         self.assertIn(expected_key, view_instrument_match._attributes_aggregation)
 
+    def _counter_view_instrument_match(self) -> _ViewInstrumentMatch:
+        instrument = _Counter("instrument1", Mock(), Mock())
+        instrument.instrumentation_scope = self.mock_instrumentation_scope
+        return _ViewInstrumentMatch(
+            view=View(instrument_name="instrument1"),
+            instrument=instrument,
+            instrument_class_aggregation={_Counter: DefaultAggregation()},
+        )
+
+    def test_not_kept_alive_by_reference_cycle(self):
+        view_instrument_match = self._counter_view_instrument_match()
+        view_instrument_match.consume_value(1, {"a": "b"}, _attribute_set_key({"a": "b"}))
+        view_instrument_match_ref = weakref.ref(view_instrument_match)
+
+        gc.disable()
+        try:
+            del view_instrument_match
+            self.assertIsNone(view_instrument_match_ref())
+        finally:
+            gc.enable()
+
+    def test_collect_skips_untouched_aggregations(self):
+        view_instrument_match = self._counter_view_instrument_match()
+
+        view_instrument_match.consume_value(1, {"a": "b"}, None)
+        view_instrument_match.consume_value(2, {"c": "d"}, None)
+
+        data_points = view_instrument_match.collect(AggregationTemporality.DELTA, 1)
+        self.assertEqual([data_point.value for data_point in data_points], [1, 2])
+
+        untouched_aggregation = view_instrument_match._attributes_aggregation[_hash_attributes({"c": "d"})]
+        with patch.object(untouched_aggregation, "collect", wraps=untouched_aggregation.collect) as collect:
+            view_instrument_match.consume_value(3, {"a": "b"}, None)
+            data_points = view_instrument_match.collect(AggregationTemporality.DELTA, 2)
+
+            collect.assert_not_called()
+
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].attributes, {"a": "b"})
+        self.assertEqual(data_points[0].value, 3)
+        self.assertEqual(data_points[0].start_time_unix_nano, 1)
+
+        self.assertIsNone(view_instrument_match.collect(AggregationTemporality.DELTA, 3))
+
+        # The point of an aggregation left out of collections starts at the
+        # last one, as if it had been collected in it.
+        view_instrument_match.consume_value(4, {"c": "d"}, None)
+        data_points = view_instrument_match.collect(AggregationTemporality.DELTA, 4)
+
+        self.assertEqual(len(data_points), 1)
+        self.assertEqual(data_points[0].attributes, {"c": "d"})
+        self.assertEqual(data_points[0].value, 4)
+        self.assertEqual(data_points[0].start_time_unix_nano, 3)
+        self.assertEqual(data_points[0].time_unix_nano, 4)
+
+    def test_collect_reemits_untouched_cumulative_points(self):
+        view_instrument_match = self._counter_view_instrument_match()
+
+        view_instrument_match.consume_value(1, {"a": "b"}, None)
+        view_instrument_match.consume_value(2, {"c": "d"}, None)
+        first_data_points = view_instrument_match.collect(AggregationTemporality.CUMULATIVE, 1)
+
+        untouched_aggregation = view_instrument_match._attributes_aggregation[_hash_attributes({"c": "d"})]
+        with patch.object(untouched_aggregation, "collect", wraps=untouched_aggregation.collect) as collect:
+            view_instrument_match.consume_value(3, {"a": "b"}, None)
+            data_points = view_instrument_match.collect(AggregationTemporality.CUMULATIVE, 2)
+
+            collect.assert_not_called()
+
+        self.assertEqual(
+            [(data_point.attributes, data_point.value) for data_point in data_points],
+            [({"a": "b"}, 4), ({"c": "d"}, 2)],
+        )
+        self.assertEqual(data_points[1].start_time_unix_nano, first_data_points[1].start_time_unix_nano)
+        self.assertEqual(data_points[1].time_unix_nano, 2)
+
+    def test_collect_evicted_aggregation_updated(self):
+        instrument = _Counter("instrument1", Mock(), Mock())
+        instrument.instrumentation_scope = self.mock_instrumentation_scope
+        record_evictions = Mock()
+        view_instrument_match = _ViewInstrumentMatch(
+            view=View(instrument_name="instrument1"),
+            instrument=instrument,
+            instrument_class_aggregation={_Counter: DefaultAggregation()},
+            max_idle_collections=1,
+            record_evictions=record_evictions,
+        )
+
+        view_instrument_match.consume_value(1, {"a": "b"}, None)
+        view_instrument_match.collect(AggregationTemporality.CUMULATIVE, 1)
+        evicted_aggregation = view_instrument_match._attributes_aggregation[_hash_attributes({"a": "b"})]
+
+        self.assertIsNone(view_instrument_match.collect(AggregationTemporality.CUMULATIVE, 2))
+        record_evictions.assert_called_once_with(1)
+        self.assertTrue(evicted_aggregation._evicted)
+        self.assertEqual(view_instrument_match._attributes_aggregation, {})
+
+        # A measurement that looked up the aggregation before its eviction is
+        # still collected, the next ones start a new point.
+        evicted_aggregation.aggregate_value(2)
+        view_instrument_match.consume_value(5, {"a": "b"}, None)
+        data_points = view_instrument_match.collect(AggregationTemporality.CUMULATIVE, 3)
+
+        self.assertEqual(sorted(data_point.value for data_point in data_points), [3, 5])
+
+    def test_collect_concurrently_with_measurements(self):
+        view_instrument_match = self._counter_view_instrument_match()
+        attributes = [{"thread": thread} for thread in range(4)]
+
+        def consume_values(attributes):
+            for _ in range(10000):
+                view_instrument_match.consume_value(1, attributes, None)
+
+        threads = [Thread(target=consume_values, args=(thread_attributes,)) for thread_attributes in attributes]
+        for thread in threads:
+            thread.start()
+
+        totals = dict.fromkeys(range(4), 0)
+        collection = 0
+        while any(thread.is_alive() for thread in threads):
+            collection += 1
+            for data_point in view_instrument_match.collect(AggregationTemporality.DELTA, collection) or ():
+                totals[data_point.attributes["thread"]] += data_point.value
+
+        for thread in threads:
+            thread.join()
+
+        for data_point in view_instrument_match.collect(AggregationTemporality.DELTA, collection + 1) or ():
+            totals[data_point.attributes["thread"]] += data_point.value
+
+        # No measurement is lost when aggregations are updated while the
+        # touched ones are collected.
+        self.assertEqual(totals, dict.fromkeys(range(4), 10000))
+
 
 class TestSimpleFixedSizeExemplarReservoir(TestCase):
     def test_consume_measurement_with_custom_reservoir_factory(self):
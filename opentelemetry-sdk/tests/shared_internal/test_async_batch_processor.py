@@ -0,0 +1,266 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+import asyncio
+import threading
+import unittest
+from typing import Any
+from unittest.mock import Mock
+
+from opentelemetry._logs import LogRecord
+from opentelemetry.context import _SUPPRESS_INSTRUMENTATION_KEY, get_value
+from opentelemetry.sdk._logs import ReadWriteLogRecord
+from opentelemetry.sdk._logs.export import AsyncBatchLogRecordProcessor
+from opentelemetry.sdk._shared_internal._async import (
+    AsyncBatchProcessor,
+    run_from_thread,
+)
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import AsyncBatchSpanProcessor
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.trace import SpanContext, TraceFlags
+
+EMPTY_LOG = ReadWriteLogRecord(
+    log_record=LogRecord(),
+    instrumentation_scope=InstrumentationScope("example", "example"),
+)
+
+SAMPLED_SPAN = ReadableSpan(
+    "MySpan",
+    context=SpanContext(1, 1, is_remote=False, trace_flags=TraceFlags(TraceFlags.SAMPLED)),
+    instrumentation_scope=InstrumentationScope("example", "example"),
+)
+
+
+class AsyncExporterForTesting:
+    def __init__(self, export_sleep: float = 0):
+        self.export_sleep = export_sleep
+        self.batches: list[list[Any]] = []
+        self.suppressed: list[bool] = []
+        self.cancelled = False
+        self.is_shutdown = False
+
+    async def export(self, batch: list[Any]):
+        self.batches.append(batch)
+        self.suppressed.append(bool(get_value(_SUPPRESS_INSTRUMENTATION_KEY)))
+        try:
+            await asyncio.sleep(self.export_sleep)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+    async def force_flush(self, timeout_millis: int = 30000):
+        return not self.is_shutdown
+
+    async def shutdown(self):
+        self.is_shutdown = True
+
+
+async def _wait_for(condition, timeout: float = 5):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.001)
+
+
+PROCESSORS = [
+    (AsyncBatchLogRecordProcessor, "on_emit", EMPTY_LOG),
+    (AsyncBatchSpanProcessor, "on_end", SAMPLED_SPAN),
+]
+
+
+class TestAsyncBatchProcessor(unittest.IsolatedAsyncioTestCase):
+    async def test_telemetry_exported_on_schedule(self):
+        for processor_class, emit, telemetry in PROCESSORS:
+            with self.subTest(processor=processor_class.__name__):
+                exporter = AsyncExporterForTesting()
+                processor = processor_class(exporter, schedule_delay_millis=10)
+                for _ in range(3):
+                    getattr(processor, emit)(telemetry)
+
+                await _wait_for(lambda exporter=exporter: exporter.batches)
+                self.assertEqual(len(exporter.batches[0]), 3)
+                self.assertEqual(exporter.suppressed, [True])
+                await processor.shutdown_async()
+                self.assertTrue(exporter.is_shutdown)
+
+    async def test_worker_awakened_by_full_batch_from_other_thread(self):
+        exporter = AsyncExporterForTesting()
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000, max_export_batch_size=2)
+
+        thread = threading.Thread(target=lambda: [processor.on_end(SAMPLED_SPAN) for _ in range(5)])
+        thread.start()
+        thread.join()
+
+        await _wait_for(lambda: sum(len(batch) for batch in exporter.batches) >= 4)
+        self.assertEqual([len(batch) for batch in exporter.batches[:2]], [2, 2])
+        await processor.shutdown_async()
+        self.assertEqual(sum(len(batch) for batch in exporter.batches), 5)
+
+    async def test_force_flush_async(self):
+        exporter = AsyncExporterForTesting()
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000, max_export_batch_size=2)
+        for _ in range(3):
+            processor.on_end(SAMPLED_SPAN)
+
+        self.assertTrue(await processor.force_flush_async())
+        self.assertEqual([len(batch) for batch in exporter.batches], [2, 1])
+        await processor.shutdown_async()
+        self.assertFalse(await processor.force_flush_async())
+
+    async def test_force_flush_async_times_out(self):
+        exporter = AsyncExporterForTesting(export_sleep=10)
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000, max_export_batch_size=1)
+        for _ in range(2):
+            processor.on_end(SAMPLED_SPAN)
+
+        self.assertFalse(await processor.force_flush_async(timeout_millis=50))
+        self.assertTrue(exporter.cancelled)
+        # The batch that wasn't started in time stays queued.
+        self.assertEqual(len(processor._batch_processor._queue), 1)
+        exporter.export_sleep = 0
+        await processor.shutdown_async()
+
+    async def test_export_timeout_logged(self):
+        exporter = AsyncExporterForTesting(export_sleep=10)
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000, export_timeout_millis=10)
+        processor.on_end(SAMPLED_SPAN)
+
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertTrue(await processor.force_flush_async())
+        self.assertIn("Timed out exporting Span.", logs.output[0])
+        self.assertTrue(exporter.cancelled)
+        exporter.export_sleep = 0
+        await processor.shutdown_async()
+
+    async def test_export_exception_logged(self):
+        exporter = AsyncExporterForTesting()
+        exporter.export = Mock(side_effect=ValueError("export failed"))
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000)
+        processor.on_end(SAMPLED_SPAN)
+
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertTrue(await processor.force_flush_async())
+        self.assertIn("Exception while exporting Span.", logs.output[0])
+        await processor.shutdown_async()
+
+    async def test_shutdown_exports_queued_telemetry(self):
+        exporter = AsyncExporterForTesting()
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000)
+        processor.on_end(SAMPLED_SPAN)
+
+        await processor.shutdown_async()
+
+        self.assertEqual(len(exporter.batches), 1)
+        self.assertTrue(exporter.is_shutdown)
+        self.assertTrue(processor._batch_processor._worker_task.done())
+        processor.on_end(SAMPLED_SPAN)
+        self.assertEqual(len(processor._batch_processor._queue), 0)
+        # A second shutdown is a no-op.
+        exporter.is_shutdown = False
+        await processor.shutdown_async()
+        processor.shutdown()
+        self.assertFalse(exporter.is_shutdown)
+
+    async def test_shutdown_cancels_export_after_timeout(self):
+        exporter = AsyncExporterForTesting(export_sleep=10)
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000, max_export_batch_size=1)
+        for _ in range(3):
+            processor.on_end(SAMPLED_SPAN)
+
+        with self.assertLogs(level="WARNING") as logs:
+            await processor._batch_processor.shutdown_async(timeout_millis=50)
+
+        self.assertTrue(exporter.cancelled)
+        self.assertTrue(exporter.is_shutdown)
+        self.assertEqual(len(exporter.batches), 1)
+        self.assertIn("Shutdown timed out, dropping 2 Span.", logs.output[-1])
+        self.assertEqual(len(processor._batch_processor._queue), 0)
+
+    async def test_sync_methods_wait_from_other_threads(self):
+        exporter = AsyncExporterForTesting()
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000)
+        processor.on_end(SAMPLED_SPAN)
+
+        self.assertTrue(await asyncio.to_thread(processor.force_flush))
+        self.assertEqual(len(exporter.batches), 1)
+        await asyncio.to_thread(processor.shutdown)
+        self.assertTrue(exporter.is_shutdown)
+
+    async def test_sync_methods_scheduled_on_loop_thread(self):
+        exporter = AsyncExporterForTesting()
+        processor = AsyncBatchSpanProcessor(exporter, schedule_delay_millis=30000)
+        processor.on_end(SAMPLED_SPAN)
+
+        self.assertFalse(processor.force_flush())
+        await _wait_for(lambda: exporter.batches)
+        processor.shutdown()
+        await _wait_for(lambda: exporter.is_shutdown)
+
+    async def test_processor_started_from_other_thread(self):
+        loop = asyncio.get_running_loop()
+        exporter = AsyncExporterForTesting()
+        processor = await asyncio.to_thread(AsyncBatchSpanProcessor, exporter, schedule_delay_millis=10, loop=loop)
+        processor.on_end(SAMPLED_SPAN)
+
+        await _wait_for(lambda: exporter.batches)
+        self.assertEqual(processor._batch_processor._worker_task.get_loop(), loop)
+        await processor.shutdown_async()
+
+
+class TestAsyncBatchProcessorWithoutRunningLoop(unittest.TestCase):
+    def test_loop_required(self):
+        with self.assertRaises(RuntimeError):
+            AsyncBatchSpanProcessor(AsyncExporterForTesting())
+
+    def test_sync_methods_after_loop_closed(self):
+        loop = asyncio.new_event_loop()
+        exporter = AsyncExporterForTesting()
+        processor = AsyncBatchSpanProcessor(exporter, loop=loop)
+        loop.close()
+
+        processor.on_end(SAMPLED_SPAN)
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertFalse(processor.force_flush())
+            processor.shutdown()
+        self.assertIn("AsyncBatchProcessor.force_flush_async cannot run", logs.output[0])
+        self.assertFalse(exporter.is_shutdown)
+
+    def test_run_from_thread_cancels_after_timeout(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        cancelled = threading.Event()
+
+        async def _hang():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        try:
+            self.assertEqual(run_from_thread(loop, _hang, timeout=0.01, default="default"), "default")
+            self.assertTrue(cancelled.wait(5))
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_batch_processor_metrics(self):
+        loop = asyncio.new_event_loop()
+        metrics = Mock()
+        processor = AsyncBatchProcessor(AsyncExporterForTesting(), 10, 2, 1000, 2, "Span", metrics, loop=loop)
+        try:
+            for _ in range(3):
+                processor.emit(SAMPLED_SPAN)
+            metrics.drop_items.assert_called_once_with(1)
+            ((get_queue_size,), _) = metrics.register_queue_size.call_args
+            self.assertEqual(get_queue_size(), 2)
+            loop.run_until_complete(processor.force_flush_async())
+            metrics.finish_items.assert_called_once_with(2)
+        finally:
+            loop.run_until_complete(processor.shutdown_async())
+            loop.close()
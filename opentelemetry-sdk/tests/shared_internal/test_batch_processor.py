@@ -274,6 +274,8 @@ class TestBatchProcessor:
         processor._batch_processor.emit(telemetry)
         processor._batch_processor.emit(telemetry)
         processor._batch_processor.emit(telemetry)
+        metrics = Mock()
+        processor._batch_processor._metrics = metrics
         before = time.time()
         processor._batch_processor.shutdown(timeout_millis=3000)
         # Shutdown does not kill the thread.
@@ -287,6 +289,218 @@ class TestBatchProcessor:
         # Expect the second call to be interrupted by shutdown, and the third call to never be made.
         assert exporter.sleep_interrupted is True
         assert 2 == exporter.num_export_calls
+        # The third item never got exported and is reported as dropped.
+        metrics.drop_items.assert_called_once_with(1, "timeout")
+        assert len(processor._batch_processor._queue) == 0
+
+    def test_force_flush_stops_at_timeout(self, batch_processor_class, telemetry):
+        exporter = MockExporterForTesting(export_sleep=0.4)
+        processor = batch_processor_class(
+            exporter,
+            max_queue_size=200,
+            max_export_batch_size=1,
+            schedule_delay_millis=30000,
+        )
+        for _ in range(5):
+            processor._batch_processor.emit(telemetry)
+        before = time.time()
+        assert processor.force_flush(timeout_millis=600) is False
+        assert time.time() - before < 1.5
+        # Batches that weren't started in time stay queued.
+        assert exporter.num_export_calls == 2
+        assert len(processor._batch_processor._queue) == 3
+        assert processor.force_flush() is True
+        assert exporter.num_export_calls == 5
+        processor.shutdown()
+
+    def test_force_flush_passes_remaining_timeout_to_exporter(self, batch_processor_class, telemetry):
+        timeouts = []
+
+        class TimeoutExporter:
+            def export(self, batch, timeout_millis=None):  # pylint: disable=no-self-use
+                timeouts.append(timeout_millis)
+
+            def shutdown(self):
+                pass
+
+        processor = batch_processor_class(
+            TimeoutExporter(),
+            max_queue_size=200,
+            max_export_batch_size=10,
+            schedule_delay_millis=30000,
+            export_timeout_millis=5000,
+        )
+        processor._batch_processor.emit(telemetry)
+        assert processor.force_flush(timeout_millis=1000) is True
+        assert len(timeouts) == 1
+        assert 0 < timeouts[0] <= 1000
+        processor._batch_processor.emit(telemetry)
+        assert processor.force_flush() is True
+        assert 4000 < timeouts[1] <= 5000
+        processor.shutdown()
+
+    def test_sharded_queue_exports_telemetry_from_all_threads(self, batch_processor_class, telemetry):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=400,
+            max_export_batch_size=16,
+            schedule_delay_millis=30000,
+            queue_shards=4,
+        )
+
+        def emit():
+            for _ in range(50):
+                batch_processor._batch_processor.emit(telemetry)
+
+        threads = [threading.Thread(target=emit) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batch_processor.force_flush()
+
+        batches = [call.args[0] for call in exporter.export.call_args_list]
+        assert all(len(batch) <= 16 for batch in batches)
+        assert sum(len(batch) for batch in batches) == 400
+        assert len(batch_processor._batch_processor._queue) == 0
+        batch_processor.shutdown()
+
+    def test_sharded_queue_drops_when_all_shards_full(self, batch_processor_class, telemetry):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=20,
+            max_export_batch_size=20,
+            schedule_delay_millis=30000,
+            queue_shards=2,
+        )
+        metrics = Mock()
+        batch_processor._batch_processor._metrics = metrics
+        # A single thread spills over into the other shard once its own is full,
+        # so it only drops once every shard is full. Holding the export lock keeps
+        # the worker from draining the shards while we emit.
+        with batch_processor._batch_processor._export_lock:
+            for _ in range(22):
+                batch_processor._batch_processor.emit(telemetry)
+        assert metrics.drop_items.call_count == 2
+        batch_processor.force_flush()
+        exporter.export.assert_called_once_with([telemetry for _ in range(20)])
+        batch_processor.shutdown()
+
+    def test_sharded_queue_capacity_spread_over_shards(self, batch_processor_class, telemetry):
+        batch_processor = batch_processor_class(Mock(), max_queue_size=10, max_export_batch_size=10, queue_shards=4)
+        queue = batch_processor._batch_processor._queue
+        assert [shard.maxlen for shard in queue._shards] == [3, 3, 2, 2]
+        batch_processor.shutdown()
+
+    def test_sharded_queue_shard_count_capped_by_queue_size(self, batch_processor_class, telemetry):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=3,
+            max_export_batch_size=3,
+            schedule_delay_millis=30000,
+            queue_shards=8,
+        )
+        queue = batch_processor._batch_processor._queue
+        assert [shard.maxlen for shard in queue._shards] == [1, 1, 1]
+        metrics = Mock()
+        batch_processor._batch_processor._metrics = metrics
+        with batch_processor._batch_processor._export_lock:
+            for _ in range(5):
+                batch_processor._batch_processor.emit(telemetry)
+        assert metrics.drop_items.call_count == 2
+        batch_processor.force_flush()
+        exporter.export.assert_called_once_with([telemetry for _ in range(3)])
+        batch_processor.shutdown()
+
+    def test_sharded_queue_invalid_shard_count(self, batch_processor_class, telemetry):
+        with pytest.raises(ValueError):
+            batch_processor_class(Mock(), queue_shards=0)
+
+    def test_concurrent_exports(self, batch_processor_class, telemetry):
+        release_exports = threading.Event()
+        exports_started = threading.Barrier(2, timeout=5)
+
+        def export(_):
+            # Only returns once two batches are being exported at the same time.
+            exports_started.wait()
+            release_exports.wait(5)
+
+        exporter = Mock()
+        exporter.export.side_effect = export
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=10,
+            max_export_batch_size=2,
+            schedule_delay_millis=30000,
+            max_concurrent_exports=2,
+        )
+        for _ in range(4):
+            batch_processor._batch_processor.emit(telemetry)
+        flushed = []
+        flush_thread = threading.Thread(target=lambda: flushed.append(batch_processor.force_flush()))
+        flush_thread.start()
+        time.sleep(0.1)
+        # force_flush waits for the batches that are still being exported.
+        assert flush_thread.is_alive()
+        release_exports.set()
+        flush_thread.join(5)
+        assert flushed == [True]
+        assert exporter.export.call_count == 2
+        assert not exports_started.broken
+        batch_processor.shutdown()
+
+    def test_concurrent_exports_invalid_count(self, batch_processor_class, telemetry):
+        with pytest.raises(ValueError):
+            batch_processor_class(Mock(), max_concurrent_exports=0)
+
+    def test_batches_split_by_estimated_size(self, batch_processor_class, telemetry):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=20,
+            max_export_batch_size=10,
+            schedule_delay_millis=30000,
+            max_export_batch_bytes=1,
+        )
+        item_size = batch_processor._batch_processor._size_estimator(telemetry)
+        assert item_size > 0
+        # Items larger than the budget are exported on their own.
+        for _ in range(3):
+            batch_processor._batch_processor.emit(telemetry)
+        batch_processor.force_flush()
+        assert [len(call.args[0]) for call in exporter.export.call_args_list] == [1, 1, 1]
+
+        exporter.reset_mock()
+        batch_processor._batch_processor._max_export_batch_bytes = 2 * item_size
+        for _ in range(5):
+            batch_processor._batch_processor.emit(telemetry)
+        batch_processor.force_flush()
+        assert [len(call.args[0]) for call in exporter.export.call_args_list] == [2, 2, 1]
+        batch_processor.shutdown()
+
+    def test_size_estimator_exception_does_not_stop_exports(self, batch_processor_class, telemetry):
+        exporter = Mock()
+        batch_processor = batch_processor_class(
+            exporter,
+            max_queue_size=20,
+            max_export_batch_size=10,
+            schedule_delay_millis=30000,
+            max_export_batch_bytes=1,
+        )
+        batch_processor._batch_processor._size_estimator = Mock(side_effect=ValueError("Cannot size"))
+        batch_processor._batch_processor.emit(telemetry)
+        batch_processor._batch_processor.emit(telemetry)
+        batch_processor.force_flush()
+        # Items that cannot be sized count as empty.
+        assert [len(call.args[0]) for call in exporter.export.call_args_list] == [2]
+        batch_processor.shutdown()
+
+    def test_max_export_batch_bytes_invalid(self, batch_processor_class, telemetry):
+        with pytest.raises(ValueError):
+            batch_processor_class(Mock(), max_export_batch_bytes=0)
 
 
 class TestCommonFuncs(unittest.TestCase):
@@ -14,6 +14,7 @@ from opentelemetry.metrics import NoOpMeterProvider
 from opentelemetry.sdk import trace
 from opentelemetry.sdk.environment_variables import (
     OTEL_BSP_EXPORT_TIMEOUT,
+    OTEL_BSP_MAX_CONCURRENT_EXPORTS,
     OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
     OTEL_BSP_MAX_QUEUE_SIZE,
     OTEL_BSP_SCHEDULE_DELAY,
@@ -231,6 +232,7 @@ class TestBatchSpanProcessor(unittest.TestCase):
             OTEL_BSP_SCHEDULE_DELAY: "2",
             OTEL_BSP_MAX_EXPORT_BATCH_SIZE: "3",
             OTEL_BSP_EXPORT_TIMEOUT: "4",
+            OTEL_BSP_MAX_CONCURRENT_EXPORTS: "2",
         },
     )
     def test_args_env_var(self):
@@ -240,6 +242,7 @@ class TestBatchSpanProcessor(unittest.TestCase):
         self.assertEqual(batch_span_processor._batch_processor._schedule_delay_millis, 2)
         self.assertEqual(batch_span_processor._batch_processor._max_export_batch_size, 3)
         self.assertEqual(batch_span_processor._batch_processor._export_timeout_millis, 4)
+        self.assertEqual(batch_span_processor._batch_processor._max_concurrent_exports, 2)
         batch_span_processor.shutdown()
 
     def test_args_env_var_defaults(self):
@@ -249,6 +252,7 @@ class TestBatchSpanProcessor(unittest.TestCase):
         self.assertEqual(batch_span_processor._batch_processor._schedule_delay_millis, 5000)
         self.assertEqual(batch_span_processor._batch_processor._max_export_batch_size, 512)
         self.assertEqual(batch_span_processor._batch_processor._export_timeout_millis, 30000)
+        self.assertEqual(batch_span_processor._batch_processor._max_concurrent_exports, 1)
         batch_span_processor.shutdown()
 
     @mock.patch.dict(
@@ -258,6 +262,7 @@ class TestBatchSpanProcessor(unittest.TestCase):
             OTEL_BSP_SCHEDULE_DELAY: " ",
             OTEL_BSP_MAX_EXPORT_BATCH_SIZE: "One",
             OTEL_BSP_EXPORT_TIMEOUT: "@",
+            OTEL_BSP_MAX_CONCURRENT_EXPORTS: "many",
         },
     )
     def test_args_env_var_value_error(self):
@@ -269,6 +274,7 @@ class TestBatchSpanProcessor(unittest.TestCase):
         self.assertEqual(batch_span_processor._batch_processor._schedule_delay_millis, 5000)
         self.assertEqual(batch_span_processor._batch_processor._max_export_batch_size, 512)
         self.assertEqual(batch_span_processor._batch_processor._export_timeout_millis, 30000)
+        self.assertEqual(batch_span_processor._batch_processor._max_concurrent_exports, 1)
         batch_span_processor.shutdown()
 
     def test_on_start_accepts_parent_context(self):
@@ -544,6 +550,23 @@ class TestBatchSpanProcessor(unittest.TestCase):
 
         provider.shutdown()
 
+    def test_estimate_span_size(self):
+        tracer = trace.TracerProvider().get_tracer(__name__)
+        span = tracer.start_span("span")
+        span.end()
+        bare_size = export._estimate_span_size(span)
+
+        span = tracer.start_span("span", attributes={"key": "value" * 100})
+        span.add_event("event", {"event.key": (1, 2, 3)})
+        span.end()
+        size = export._estimate_span_size(span)
+        self.assertGreater(size, bare_size + len("value" * 100))
+
+        span = tracer.start_span("spän")
+        span.end()
+        # Strings are sized in UTF-8 bytes, not characters.
+        self.assertEqual(export._estimate_span_size(span), bare_size + 1)
+
 
 class TestConsoleSpanExporter(unittest.TestCase):
     def test_export(self):  # pylint: disable=no-self-use
@@ -44,6 +44,10 @@ from opentelemetry.sdk.trace import (
     _RuleBasedTracerConfigurator,
     _TracerConfig,
 )
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
 from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 from opentelemetry.sdk.trace.sampling import (
     ALWAYS_OFF,
@@ -1002,6 +1006,17 @@ class TestSpan(unittest.TestCase):
             with self.assertRaises(TypeError):
                 event.attributes["name"] = "hello"
 
+    def test_attribute_values_copied_on_creation(self):
+        values = [1, 2]
+        with self.tracer.start_as_current_span("root", attributes={"key": values}) as root:
+            root.add_event("event0", {"event_key": values})
+            root.add_link(trace_api.INVALID_SPAN_CONTEXT, {"link_key": values})
+            values.append(3)
+
+        self.assertEqual(root.attributes["key"], (1, 2))
+        self.assertEqual(root.events[0].attributes["event_key"], (1, 2))
+        self.assertEqual(root.links[0].attributes["link_key"], (1, 2))
+
     def test_setting_event_attributes(self):
         self.assertEqual(trace_api.get_current_span(), trace_api.INVALID_SPAN)
 
@@ -1238,6 +1253,87 @@ class TestSpan(unittest.TestCase):
             root.set_status(new_status)
         self.assertEqual(root.status.status_code, trace_api.StatusCode.UNSET)
 
+    def test_ended_span_is_passed_to_on_end(self):
+        span_processor = mock.Mock(spec=trace.SpanProcessor)
+        tracer_provider = trace.TracerProvider()
+        tracer_provider.add_span_processor(span_processor)
+
+        span = tracer_provider.get_tracer(__name__).start_span("root")
+        span.end()
+
+        span_processor.on_end.assert_called_once_with(span)
+        self.assertIsInstance(span, trace.ReadableSpan)
+        self.assertFalse(hasattr(trace.ReadableSpan("span"), "__dict__"))
+        self.assertTrue(span._attributes._immutable)  # pylint: disable=protected-access
+
+    def test_queued_span_unchanged_after_end(self):
+        exporter = InMemorySpanExporter()
+        span_processor = BatchSpanProcessor(exporter)
+        tracer_provider = trace.TracerProvider()
+        tracer_provider.add_span_processor(span_processor)
+        link_context = trace_api.SpanContext(1, 2, is_remote=False)
+
+        span = tracer_provider.get_tracer(__name__).start_span("root", attributes={"key": "value"})
+        span.add_event("event", {"event_key": "value"})
+        span.add_link(link_context, {"link_key": "value"})
+        span.end()
+
+        with self.assertLogs(level=WARNING):
+            span.set_attribute("key", "other")
+            span.set_attributes({"other_key": "value"})
+            span.add_event("other_event")
+            span.add_link(link_context)
+            span.set_status(Status(StatusCode.ERROR))
+            span.update_name("other")
+        span_processor.force_flush()
+
+        (exported,) = exporter.get_finished_spans()
+        self.assertEqual(exported.name, "root")
+        self.assertEqual(dict(exported.attributes), {"key": "value"})
+        self.assertEqual([event.name for event in exported.events], ["event"])
+        self.assertEqual(len(exported.links), 1)
+        self.assertEqual(exported.status.status_code, StatusCode.UNSET)
+        span_processor.shutdown()
+
+    def test_exported_span_deepcopy(self):
+        exporter = InMemorySpanExporter()
+        span_processor = SimpleSpanProcessor(exporter)
+        tracer_provider = trace.TracerProvider()
+        tracer_provider.add_span_processor(span_processor)
+
+        span = tracer_provider.get_tracer(__name__).start_span("root", attributes={"key": ["value"]})
+        span.add_event("event", {"event_key": "value"})
+        span.end()
+
+        (exported,) = exporter.get_finished_spans()
+        span_copy = copy.deepcopy(exported)
+
+        self.assertIsNot(span_copy, exported)
+        self.assertEqual(span_copy.name, "root")
+        self.assertEqual(span_copy.end_time, exported.end_time)
+        self.assertEqual(dict(span_copy.attributes), {"key": ("value",)})
+        self.assertEqual([event.name for event in span_copy.events], ["event"])
+        # pylint: disable=protected-access
+        self.assertIsNot(span_copy._lock, exported._lock)
+        self.assertIs(span_copy._span_processor, exported._span_processor)
+        with self.assertLogs(level=WARNING):
+            span_copy.set_attribute("other_key", "value")
+        self.assertNotIn("other_key", span_copy.attributes)
+
+    def test_events_and_links_allocated_on_first_use(self):
+        span = self.tracer.start_span("root")
+        # pylint: disable=protected-access
+        self.assertEqual(span._events, ())
+        self.assertEqual(span._links, ())
+
+        span.add_event("event")
+        span.add_link(trace_api.SpanContext(0x1, 0x2, is_remote=False))
+
+        self.assertIsInstance(span._events, BoundedList)
+        self.assertIsInstance(span._links, BoundedList)
+        self.assertEqual(len(span.events), 1)
+        self.assertEqual(len(span.links), 1)
+
     def test_error_status(self):
         def error_status_test(context):
             with self.assertRaises(AssertionError):